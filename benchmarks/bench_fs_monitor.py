@@ -0,0 +1,104 @@
+"""
+Benchmarks of the file system monitor: event routing through the
+dispatcher, debouncing of event bursts and .gitignore filtering.
+"""
+
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+from harness import Measurement, benchmark, import_source, timed
+from synthetic import generate_repo
+
+
+def _counting_listener(pattern: str, expected: int, debounce_ms: int):
+    """Build a listener counting modifications and signalling once expected is reached."""
+    listener_module = import_source("dbp.fs_monitor.core.listener")
+    done = threading.Event()
+
+    class CountingListener(listener_module.BaseFileSystemEventListener):
+        def __init__(self):
+            self.count = 0
+
+        @property
+        def path_pattern(self) -> str:
+            return pattern
+
+        @property
+        def debounce_delay_ms(self) -> int:
+            return debounce_ms
+
+        def on_file_modified(self, path: str) -> None:
+            self.count += 1
+            if self.count >= expected:
+                done.set()
+
+    return CountingListener(), done
+
+
+def _start_dispatcher(workdir: Path, listeners: int, events: int, debounce_ms: int = 0):
+    """Start a dispatcher with listeners on the files *.<index>.py under workdir."""
+    watch_manager = import_source("dbp.fs_monitor.watch_manager").WatchManager()
+    dispatcher_module = import_source("dbp.fs_monitor.dispatch.event_dispatcher")
+    counters = []
+    for index in range(listeners):
+        listener, done = _counting_listener(str(workdir / "**" / f"*.{index}.py"), events, debounce_ms)
+        watch_manager.register_listener(listener)
+        counters.append((listener, done))
+    dispatcher = dispatcher_module.EventDispatcher(watch_manager)
+    dispatcher._debouncer.set_default_debounce_ms(0)
+    dispatcher.start()
+    return dispatcher, counters
+
+
+@benchmark("fs_monitor.dispatch_throughput", noise=0.15, events=250, listeners=4)
+def dispatch_throughput(workdir: Path, events: int, listeners: int) -> Measurement:
+    """Route modification events of distinct paths to their listener, end to end."""
+    event_types = import_source("dbp.fs_monitor.core.event_types")
+    dispatcher, counters = _start_dispatcher(workdir, listeners, events)
+    paths = [str(workdir / f"dir_{index % 50}" / f"file_{index}.{index % listeners}.py")
+             for index in range(events * listeners)]
+    try:
+        def run():
+            for path in paths:
+                dispatcher.dispatch_event(event_types.FileSystemEvent(event_types.EventType.FILE_MODIFIED, path))
+            for _, done in counters:
+                if not done.wait(60):
+                    raise RuntimeError("Dispatcher did not deliver all events within 60s")
+        seconds = timed(run)
+    finally:
+        dispatcher.stop()
+    return Measurement(seconds, len(paths))
+
+
+@benchmark("fs_monitor.debounce_burst", noise=0.15, paths=200, repeats=25, debounce_ms=20)
+def debounce_burst(workdir: Path, paths: int, repeats: int, debounce_ms: int) -> Measurement:
+    """Coalesce bursts of events on the same paths, as editors and git checkouts produce."""
+    event_types = import_source("dbp.fs_monitor.core.event_types")
+    dispatcher, counters = _start_dispatcher(workdir, 1, paths, debounce_ms)
+    burst = [str(workdir / "src" / f"file_{index}.0.py") for index in range(paths)]
+    try:
+        def run():
+            for _ in range(repeats):
+                for path in burst:
+                    dispatcher.dispatch_event(event_types.FileSystemEvent(event_types.EventType.FILE_MODIFIED, path))
+            if not counters[0][1].wait(60):
+                raise RuntimeError("Dispatcher did not deliver the debounced events within 60s")
+        seconds = timed(run)
+    finally:
+        dispatcher.stop()
+    return Measurement(seconds, paths * repeats, {"delivered": float(counters[0][0].count)})
+
+
+@benchmark("fs_monitor.gitignore_filter", noise=0.2, files=2000, depth=4, gitignore_rules=18)
+def gitignore_filter(workdir: Path, files: int, depth: int, gitignore_rules: int) -> Measurement:
+    """Check every file of a synthetic repository against its .gitignore rules, cold then cached."""
+    git_filter = import_source("dbp.fs_monitor.git_filter")
+    repo = generate_repo(workdir / "repo", files=files, depth=depth, gitignore_rules=gitignore_rules)
+    config = SimpleNamespace(fs_monitor=SimpleNamespace(ignore_patterns=[".git/", "*.bak"]))
+    ignore_filter = git_filter.GitIgnoreFilter(config, str(repo.root))
+    paths = [str(path) for path in repo.files + repo.ignored]
+
+    cold = timed(lambda: [ignore_filter.should_ignore(path) for path in paths])
+    cached = timed(lambda: [ignore_filter.should_ignore(path) for path in paths])
+    return Measurement(cold, len(paths), {"cached_s": cached})
@@ -0,0 +1,84 @@
+"""
+Benchmarks of the HSTC pipeline around the LLM calls: scanning a tree for
+directories to update, extracting source file headers, reading files
+through DBPFile and applying the changes of a response to a source file.
+"""
+
+import random
+import re
+from pathlib import Path
+
+from harness import Measurement, benchmark, import_source, timed
+from synthetic import FUNCTION_TEMPLATE, generate_repo
+
+
+@benchmark("hstc.scan_for_updates", noise=0.25, files=2000, depth=4)
+def scan_for_updates(workdir: Path, files: int, depth: int) -> Measurement:
+    """Scan a synthetic repository for missing, outdated and flagged HSTC.md files."""
+    scanner = import_source("dbp.hstc.scanner")
+    repo = generate_repo(workdir / "repo", files=files, depth=depth)
+    result = {}
+    seconds = timed(lambda: result.update(scanner.HSTCScanner().scan_for_updates(repo.root)))
+    return Measurement(seconds, len(repo.dirs), {"files_scanned": float(files)})
+
+
+@benchmark("hstc.extract_file_headers", noise=0.25, files=400, depth=1, fanout=4)
+def extract_file_headers(workdir: Path, files: int, depth: int, fanout: int) -> Measurement:
+    """Extract the GenAI headers of every source file, one directory at a time."""
+    processor_module = import_source("dbp.hstc.hstc_processor")
+    file_access = import_source("dbp.core.file_access")
+    repo = generate_repo(workdir / "repo", files=files, depth=depth, fanout=fanout)
+    processor = processor_module.HSTCFileProcessor()
+    file_access.clear_dbp_file_cache()
+
+    extracted = []
+    seconds = timed(lambda: [extracted.append(processor._extract_file_headers(directory)) for directory in repo.dirs])
+    if sum(len(headers) for headers in extracted) < files:
+        raise RuntimeError("Not every synthetic source file had its header extracted")
+    return Measurement(seconds, files)
+
+
+@benchmark("hstc.dbp_file_read", noise=0.3, files=500, rounds=4)
+def dbp_file_read(workdir: Path, files: int, rounds: int) -> Measurement:
+    """Read files through the DBPFile cache, cold then repeatedly."""
+    file_access = import_source("dbp.core.file_access")
+    repo = generate_repo(workdir / "repo", files=files, depth=2)
+    file_access.clear_dbp_file_cache()
+
+    cold = timed(lambda: [file_access.get_dbp_file(path).get_content() for path in repo.files])
+    warm = timed(lambda: [file_access.get_dbp_file(path).get_content()
+                          for _ in range(rounds) for path in repo.files])
+    return Measurement(cold, files, {"warm_per_read_s": warm / (files * rounds)})
+
+
+@benchmark("hstc.anchor_lookup", noise=0.3, changes=100, size=1_000_000)
+def anchor_lookup(workdir: Path, changes: int, size: int) -> Measurement:
+    """Apply the changes of a response to a large source file, locating their anchors through AnchorLookupCache."""
+    processor_module = import_source("dbp.hstc.source_processor")
+    functions = []
+    while len(functions) * len(FUNCTION_TEMPLATE) < size:
+        functions.append(FUNCTION_TEMPLATE.format(index=0, number=len(functions)))
+    content = "".join(functions)
+    numbers = random.Random(0).sample(range(len(functions)), changes)
+    # Anchors are indented code lines, as in the responses of the LLM
+    response = [{"context_before": f"    for item in range(value):\n        total += item * {number}\n",
+                 "original_text": "    return total\n",
+                 "replacement_text": "    return total + 1\n"} for number in numbers]
+    processor = processor_module.SourceCodeProcessor()
+
+    result = []
+    seconds = timed(lambda: result.append(processor._apply_changes(content, response)))
+    if result[0].count("return total + 1\n") != changes:
+        raise RuntimeError("Not every change was applied")
+
+    # Reference: every anchor located by one scan of a compiled alternation
+    anchors = sorted({change["context_before"] + change["original_text"] for change in response}, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, anchors)) + "))")
+
+    def scan():
+        pending = set(anchors)
+        for match in pattern.finditer(content):
+            pending.discard(match.group(1))
+            if not pending:
+                break
+    return Measurement(seconds, changes, {"regex_scan_s": timed(scan)})
@@ -0,0 +1,66 @@
+"""
+Benchmarks of the LLM plumbing without a model: prompt rendering through
+PromptManager and Bedrock invocations against a stub runtime client.
+"""
+
+import asyncio
+from pathlib import Path
+
+from harness import Measurement, benchmark, import_source, timed
+from synthetic import StubBedrockRuntime
+
+PROMPT_TEMPLATE = """# File analysis
+
+Analyze the file {{file_path}} of the project {{project}}.
+
+## Content
+
+{{content}}
+
+## Expected output
+
+Return the documentation of every function as JSON, following {{schema}}.
+"""
+
+
+@benchmark("llm.prompt_render", noise=0.1, prompts=2000, distinct=200, content_kb=8)
+def prompt_render(workdir: Path, prompts: int, distinct: int, content_kb: int) -> Measurement:
+    """Render a file analysis prompt for a cycle of distinct files, hitting and missing the cache."""
+    prompt_manager = import_source("dbp.llm.common.prompt_manager")
+    prompts_dir = workdir / "prompts"
+    prompts_dir.mkdir()
+    (prompts_dir / "file_analysis.md").write_text(PROMPT_TEMPLATE)
+    manager = prompt_manager.PromptManager(prompts_dir=str(prompts_dir), cache_size=distinct // 2)
+
+    contents = [f"def function_{index}():\n    pass\n" * (content_kb * 1024 // 32) for index in range(distinct)]
+    variables = [{"file_path": f"src/module_{index}.py", "project": "bench",
+                  "content": contents[index], "schema": "the documentation schema"} for index in range(distinct)]
+    seconds = timed(lambda: [manager.get_prompt("file_analysis", variables[index % distinct]) for index in range(prompts)])
+    stats = manager.get_cache_stats()
+    return Measurement(seconds, prompts, {"hit_ratio": stats["hits"] / max(stats["hits"] + stats["misses"], 1)})
+
+
+@benchmark("llm.bedrock_invoke", noise=0.25, requests=200, concurrency=16, latency_ms=5, output_tokens=200)
+def bedrock_invoke(workdir: Path, requests: int, concurrency: int, latency_ms: int, output_tokens: int) -> Measurement:
+    """Invoke a stub Bedrock model concurrently, non-streaming then streaming, through invoke_bedrock_model."""
+    client_common = import_source("dbp.llm.bedrock.client_common")
+    runtime = StubBedrockRuntime(latency=latency_ms / 1000.0, output_tokens=output_tokens)
+    body = {"messages": [{"role": "user", "content": [{"text": "Summarize the module."}]}],
+            "inferenceConfig": {"maxTokens": output_tokens}}
+    model_id = "bench.stub-model-v1"
+
+    async def call(semaphore, stream):
+        async with semaphore:
+            response = await client_common.invoke_bedrock_model(runtime, model_id, body, stream=stream)
+            if stream:
+                return sum(1 for event in response if "contentBlockDelta" in event)
+            return response["usage"]["outputTokens"]
+
+    async def run(stream):
+        semaphore = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(call(semaphore, stream) for _ in range(requests)))
+
+    converse = timed(lambda: asyncio.run(run(False)))
+    converse_stream = timed(lambda: asyncio.run(run(True)))
+    return Measurement(converse + converse_stream, 2 * requests,
+                       {"converse_s": converse, "converse_stream_s": converse_stream})
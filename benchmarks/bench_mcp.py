@@ -0,0 +1,41 @@
+"""
+Benchmarks of the MCP server request path, in process through the ASGI
+application: no socket, no worker processes. scripts/benchmark_mcp_server.py
+load-tests a running server over HTTP instead.
+"""
+
+import statistics
+import time
+from pathlib import Path
+
+from harness import Measurement, benchmark, import_source
+
+
+def _latencies(client, path: str, requests: int):
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = client.get(path)
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            raise RuntimeError(f"GET {path} answered {response.status_code}")
+    return latencies
+
+
+@benchmark("mcp.request_latency", noise=0.2, requests=500)
+def request_latency(workdir: Path, requests: int) -> Measurement:
+    """Serve the health and metrics endpoints, reporting latency percentiles."""
+    server_module = import_source("dbp.mcp_server.server")
+    testclient = import_source("fastapi.testclient")
+    server = server_module.MCPServer(name="bench", description="Benchmark server", version="0.0.0",
+                                     host="127.0.0.1", port=0, profile_dir=str(workdir / "profiles"))
+
+    with testclient.TestClient(server.app) as client:
+        health = _latencies(client, "/health", requests)
+        metrics = _latencies(client, "/metrics", requests)
+    health.sort()
+    return Measurement(sum(health) + sum(metrics), 2 * requests, {
+        "health_p50_s": statistics.median(health),
+        "health_p99_s": health[int(len(health) * 0.99) - 1],
+        "metrics_p50_s": statistics.median(metrics),
+    })
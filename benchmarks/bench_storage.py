@@ -0,0 +1,72 @@
+"""
+Benchmarks of the metadata database: bulk writes of the functions of many
+documents through the repositories, on a SQLite file database.
+"""
+
+import datetime
+from pathlib import Path
+
+from harness import Measurement, benchmark, import_source, timed
+
+
+def _database(workdir: Path):
+    """
+    Create a SQLite database with the current schema.
+
+    The tables are created from the models instead of the Alembic
+    migrations, which need the component system; the session setup is the
+    one of DatabaseManager.initialize().
+    """
+    sqlalchemy_orm = import_source("sqlalchemy.orm")
+    config_schema = import_source("dbp.config.config_schema")
+    database = import_source("dbp.database.database")
+    models = import_source("dbp.database.models")
+
+    config = config_schema.AppConfig()
+    config.database.path = str(workdir / "bench.db")
+    manager = database.DatabaseManager(config)
+    manager._initialize_sqlite()
+    models.Base.metadata.create_all(manager.engine)
+    manager.Session = sqlalchemy_orm.scoped_session(sqlalchemy_orm.sessionmaker(bind=manager.engine))
+    manager.initialized = True
+    return manager
+
+
+def _functions(document: int, count: int, revision: int):
+    return [{
+        "name": f"function_{document}_{number}",
+        "intent": f"Transform value {number} of document {document}, revision {revision}.",
+        "designPrinciples": ["Keep functions pure", "Validate inputs"],
+        "implementationDetails": "Iterates over the range of the value.",
+        "parameters": ["value"],
+        "start_line": number * 12,
+        "end_line": number * 12 + 10,
+    } for number in range(count)]
+
+
+@benchmark("storage.function_bulk_write", noise=0.15, documents=100, functions=20)
+def function_bulk_write(workdir: Path, documents: int, functions: int) -> Measurement:
+    """Create then update the functions of every document with bulk_create_or_update."""
+    repositories = import_source("dbp.database.repositories")
+    models = import_source("dbp.database.models")
+    manager = _database(workdir)
+    try:
+        # The repositories return instances expired by the commit, the IDs are read back in one session
+        repositories.ProjectRepository(manager).create("bench", str(workdir))
+        document_repository = repositories.DocumentRepository(manager)
+        now = datetime.datetime.now()
+        with manager.get_session() as session:
+            project_id = session.query(models.Project.id).scalar()
+        for index in range(documents):
+            document_repository.create(f"src/module_{index}.py", "code", project_id, now)
+        with manager.get_session() as session:
+            document_ids = [row.id for row in session.query(models.Document.id).order_by(models.Document.id)]
+        function_repository = repositories.FunctionRepository(manager)
+
+        created = timed(lambda: [function_repository.bulk_create_or_update(document_id, _functions(document_id, functions, 0))
+                                 for document_id in document_ids])
+        updated = timed(lambda: [function_repository.bulk_create_or_update(document_id, _functions(document_id, functions, 1))
+                                 for document_id in document_ids])
+    finally:
+        manager.engine.dispose()
+    return Measurement(created + updated, 2 * documents * functions, {"create_s": created, "update_s": updated})
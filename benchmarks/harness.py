@@ -0,0 +1,160 @@
+"""
+Benchmark registry, measurement and comparison for the dbp benchmark suite.
+
+A benchmark is a function registered with @benchmark. It receives a scratch
+directory and its parameters, prepares its inputs, times the operation
+under test itself and returns a Measurement. Timing inside the benchmark
+keeps setup (synthetic repositories, databases, servers) out of the
+figures; the runner only repeats the benchmark and aggregates the runs.
+"""
+
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+# Version of the results file layout, bumped when it changes incompatibly
+RESULTS_FORMAT_VERSION = 1
+
+
+@dataclass
+class Measurement:
+    """Duration of one run of a benchmark and the number of operations it performed."""
+    seconds: float
+    ops: int
+    extra: Dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class Benchmark:
+    """A registered benchmark with its parameters and noise tolerance."""
+    name: str
+    function: Callable[..., Measurement]
+    params: Dict[str, Any]
+    # Smallest regression threshold meaningful for this benchmark (timing noise)
+    noise: float
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+class BenchmarkSkipped(Exception):
+    """Raised by a benchmark whose dependencies are not available."""
+
+
+def benchmark(name: str, noise: float = 0.0, **params) -> Callable:
+    """Register a benchmark function under name with fixed parameters."""
+    def register(function: Callable[..., Measurement]) -> Callable[..., Measurement]:
+        BENCHMARKS[name] = Benchmark(name, function, params, noise)
+        return function
+    return register
+
+
+def timed(function: Callable[[], Any]) -> float:
+    """Run function once and return its duration in seconds."""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def run_benchmark(bench: Benchmark, repeat: int, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Run a benchmark warmup + repeat times, each time in a fresh scratch
+    directory, and aggregate the timed runs.
+    """
+    runs: List[Measurement] = []
+    for index in range(warmup + repeat):
+        workdir = Path(tempfile.mkdtemp(prefix=f"dbp-bench-{bench.name}-"))
+        try:
+            measurement = bench.function(workdir, **bench.params)
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        if index >= warmup:
+            runs.append(measurement)
+
+    seconds = [run.seconds for run in runs]
+    median = statistics.median(seconds)
+    result = {
+        "params": bench.params,
+        "repeat": repeat,
+        "ops": runs[0].ops,
+        "median_s": median,
+        "min_s": min(seconds),
+        "max_s": max(seconds),
+        "ops_per_s": runs[0].ops / median if median else 0.0,
+        "noise": bench.noise,
+    }
+    for key in runs[0].extra:
+        result[key] = statistics.median(run.extra[key] for run in runs)
+    return result
+
+
+def environment() -> Dict[str, Any]:
+    """Describe the commit and machine the results were produced on."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(__file__), check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True, cwd=os.path.dirname(__file__)).stdout)
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return {
+        "format_version": RESULTS_FORMAT_VERSION,
+        "commit": commit,
+        "dirty": dirty,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+    }
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[Dict[str, Any]]:
+    """
+    Compare the median times of the benchmarks present in both result sets.
+
+    A benchmark regresses when its median grows by more than the larger of
+    threshold and its own noise tolerance, and improves when it shrinks by
+    as much. Benchmarks whose parameters changed are not compared.
+    """
+    rows = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or "median_s" not in current or "median_s" not in previous:
+            continue
+        if previous.get("params") != current.get("params"):
+            rows.append({"name": name, "status": "incomparable", "ratio": None})
+            continue
+        ratio = current["median_s"] / previous["median_s"] if previous["median_s"] else float("inf")
+        limit = max(threshold, current.get("noise", 0.0))
+        if ratio > 1 + limit:
+            status = "regression"
+        elif ratio < 1 - limit:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        rows.append({"name": name, "status": status, "ratio": ratio, "threshold": limit,
+                     "baseline_s": previous["median_s"], "current_s": current["median_s"]})
+    return rows
+
+
+def import_source(module: str) -> Any:
+    """Import a module of the src tree, turning a missing dependency into a skip."""
+    import importlib
+    if SRC_DIR not in sys.path:
+        sys.path.insert(0, SRC_DIR)
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise BenchmarkSkipped(f"{module} unavailable: {e}")
+
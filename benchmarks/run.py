@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark suite for the hot paths of dbp.
+Runs the registered benchmarks on synthetic inputs (generated repositories,
+stub Bedrock client), writes the results with the commit and machine they
+were produced on, and compares them with the results of another commit:
+the run fails when a benchmark is slower than the baseline by more than the
+threshold.
+"""
+
+import argparse
+import fnmatch
+import json
+import logging
+import sys
+
+import bench_fs_monitor  # noqa: F401 - registers benchmarks
+import bench_hstc  # noqa: F401
+import bench_llm  # noqa: F401
+import bench_mcp  # noqa: F401
+import bench_storage  # noqa: F401
+from harness import BENCHMARKS, RESULTS_FORMAT_VERSION, BenchmarkSkipped, compare, environment, run_benchmark
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--only", action="append", default=[], metavar="PATTERN",
+                        help="Run the benchmarks matching a glob pattern, e.g. 'hstc.*' (repeatable)")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark, the median is kept")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs before the timed ones")
+    parser.add_argument("--output", help="Write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare with the results JSON file of another run")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Relative slowdown of the median counted as a regression")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    # Component warnings (missing optional platform libraries) would interleave with the table
+    logging.basicConfig(level=logging.ERROR)
+
+    selected = [name for name in sorted(BENCHMARKS)
+                if not args.only or any(fnmatch.fnmatch(name, pattern) for pattern in args.only)]
+    if args.list:
+        for name in selected:
+            print(f"{name:<34} {BENCHMARKS[name].params}")
+        return 0
+
+    results, skipped = {}, {}
+    for name in selected:
+        try:
+            results[name] = run_benchmark(BENCHMARKS[name], args.repeat, args.warmup)
+        except BenchmarkSkipped as e:
+            skipped[name] = str(e)
+            continue
+        if not args.json:
+            result = results[name]
+            print(f"{name:<34} {result['median_s'] * 1000:10.2f} ms  {result['ops_per_s']:12.1f} ops/s"
+                  f"  (min {result['min_s'] * 1000:.2f}, max {result['max_s'] * 1000:.2f})")
+    report = {"environment": environment(), "results": results, "skipped": skipped}
+
+    rows = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("environment", {}).get("format_version") != RESULTS_FORMAT_VERSION:
+            print(f"{args.compare} is not a results file of format version {RESULTS_FORMAT_VERSION}", file=sys.stderr)
+            return 2
+        rows = compare(results, baseline["results"], args.threshold)
+        for key in ("python", "implementation", "platform", "cpu_count"):
+            if baseline["environment"].get(key) != report["environment"][key]:
+                print(f"warning: baseline {key} {baseline['environment'].get(key)} differs from "
+                      f"{report['environment'][key]}, timings are not comparable", file=sys.stderr)
+        report["comparison"] = {"baseline": baseline["environment"], "threshold": args.threshold, "rows": rows}
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, reason in skipped.items():
+            print(f"{name:<34} skipped: {reason}")
+        if rows:
+            print(f"\nCompared with {baseline['environment'].get('commit')} (threshold {args.threshold:.0%}):")
+        for row in rows:
+            ratio = f"{row['ratio']:.2f}x" if row["ratio"] is not None else "-"
+            print(f"{row['status'].upper():<12} {row['name']:<34} {ratio}")
+    return 1 if any(row["status"] == "regression" for row in rows) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
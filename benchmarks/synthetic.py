@@ -0,0 +1,190 @@
+"""
+Synthetic inputs for the dbp benchmark suite: generated source repositories
+and a stub Bedrock runtime client.
+
+Everything is derived from a seed, so two runs with the same parameters
+produce byte-identical repositories with identical modification times.
+"""
+
+import os
+import random
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+# Fixed modification time base, so that scans compare the same timestamps on every run
+MTIME_BASE = 1_700_000_000
+
+HEADER_TEMPLATE = """###############################################################################
+# [Source file intent]
+# {intent}
+###############################################################################
+# [Source file design principles]
+# - {principle_a}
+# - {principle_b}
+###############################################################################
+# [Source file constraints]
+# - {constraint}
+###############################################################################
+# [Dependencies]
+# codebase:{dependency}
+# system:os
+###############################################################################
+# [GenAI tool change history]
+# 2026-01-01T00:00:00Z : Generated by the benchmark suite by CodeAssistant
+# * Synthetic file {index}
+###############################################################################
+"""
+
+FUNCTION_TEMPLATE = '''
+
+def function_{index}_{number}(value):
+    """
+    [Function intent]
+    Transform value number {number} of module {index}.
+    """
+    total = 0
+    for item in range(value):
+        total += item * {number}
+    return total
+'''
+
+# Ignore rules of the generated root .gitignore, exercising globs, directories and negations
+ROOT_GITIGNORE_RULES = [
+    "*.log", "*.tmp", "build/", "dist/", "*.pyc", "__pycache__/", ".cache/",
+    "generated_*.py", "!generated_keep.py", "coverage/", "*.egg-info/", "node_modules/",
+    "**/fixtures/*.json", "docs/_build/", "*.swp", ".env", "tmp_*", "!tmp_keep.txt",
+]
+
+WORDS = ["parse", "index", "cache", "render", "stream", "filter", "scan", "merge", "route", "store"]
+
+
+@dataclass
+class SyntheticRepo:
+    """A generated repository: its root, source files, directories and ignored paths."""
+    root: Path
+    files: List[Path] = field(default_factory=list)
+    dirs: List[Path] = field(default_factory=list)
+    ignored: List[Path] = field(default_factory=list)
+
+
+def generate_repo(root: Path, files: int = 500, depth: int = 4, fanout: int = 3,
+                  gitignore_rules: int = 12, functions_per_file: int = 8, seed: int = 0) -> SyntheticRepo:
+    """
+    Generate a repository of source files with GenAI headers.
+
+    Directories form a tree of the given depth and fanout; source files are
+    spread round-robin over it. The root .gitignore holds the first
+    gitignore_rules rules of ROOT_GITIGNORE_RULES and every second directory
+    of the first level has its own .gitignore. Ignored files and directories
+    are created next to the source files. Half of the directories get an
+    HSTC.md, a tenth an HSTC_REQUIRES_UPDATE.md, and a quarter of the
+    HSTC.md files are older than the sources of their directory.
+    """
+    rng = random.Random(seed)
+    repo = SyntheticRepo(root=root)
+    root.mkdir(parents=True, exist_ok=True)
+
+    level = [root]
+    repo.dirs.append(root)
+    for depth_index in range(depth):
+        next_level = []
+        for parent in level:
+            for child in range(fanout):
+                directory = parent / f"{rng.choice(WORDS)}_{depth_index}_{child}"
+                directory.mkdir()
+                next_level.append(directory)
+        repo.dirs.extend(next_level)
+        level = next_level
+
+    (root / ".gitignore").write_text("\n".join(ROOT_GITIGNORE_RULES[:gitignore_rules]) + "\n")
+    for index, directory in enumerate(repo.dirs[1:fanout + 1]):
+        if index % 2 == 0:
+            (directory / ".gitignore").write_text("local_*.py\n!local_keep.py\nfixtures/\n")
+
+    for index in range(files):
+        directory = repo.dirs[index % len(repo.dirs)]
+        path = directory / f"module_{index}.py"
+        header = HEADER_TEMPLATE.format(
+            intent=f"{rng.choice(WORDS).capitalize()}s the records of module {index}.",
+            principle_a=f"{rng.choice(WORDS).capitalize()} before {rng.choice(WORDS)}",
+            principle_b="Keep functions pure",
+            constraint=f"Inputs are at most {rng.randint(1, 1000)} items",
+            dependency=f"src/module_{rng.randrange(max(files, 1))}.py",
+            index=index,
+        )
+        body = "".join(FUNCTION_TEMPLATE.format(index=index, number=number) for number in range(functions_per_file))
+        path.write_text(header + body)
+        os.utime(path, (MTIME_BASE + index, MTIME_BASE + index))
+        repo.files.append(path)
+
+    for index, directory in enumerate(repo.dirs):
+        if index % 2 == 0:
+            hstc = directory / "HSTC.md"
+            hstc.write_text(f"# Hierarchical Semantic Tree Context: {directory.name}\n")
+            # A quarter of the HSTC.md files predate the sources of their directory
+            stamp = MTIME_BASE - 1 if index % 4 == 0 else MTIME_BASE + files + index
+            os.utime(hstc, (stamp, stamp))
+        if index % 10 == 0:
+            (directory / "HSTC_REQUIRES_UPDATE.md").write_text("pending\n")
+        for ignored_name in ("run.log", "generated_code.py", "tmp_data"):
+            ignored = directory / ignored_name
+            ignored.write_text("ignored\n")
+            repo.ignored.append(ignored)
+        if index % 5 == 0:
+            build = directory / "build"
+            build.mkdir()
+            (build / "artifact.py").write_text("ignored = True\n")
+            repo.ignored.append(build / "artifact.py")
+    return repo
+
+
+class StubBedrockRuntime:
+    """
+    Stand-in for a boto3 bedrock-runtime client answering the Converse API
+    with canned responses after a fixed latency, so that the code around
+    Bedrock calls is measured without network or credentials.
+    """
+
+    def __init__(self, latency: float = 0.0, output_tokens: int = 50, chunk_words: int = 5):
+        self.latency = latency
+        self.output_tokens = output_tokens
+        self.chunk_words = chunk_words
+        self.calls = 0
+
+    def _text(self) -> str:
+        return " ".join(f"token{index}" for index in range(self.output_tokens))
+
+    def _input_tokens(self, messages: List[Dict[str, Any]]) -> int:
+        return sum(len(block.get("text", "").split()) for message in messages for block in message["content"])
+
+    def converse(self, modelId: str, messages: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return {
+            "output": {"message": {"role": "assistant", "content": [{"text": self._text()}]}},
+            "stopReason": "end_turn",
+            "usage": {"inputTokens": self._input_tokens(messages), "outputTokens": self.output_tokens,
+                      "totalTokens": self._input_tokens(messages) + self.output_tokens},
+            "metrics": {"latencyMs": int(self.latency * 1000)},
+        }
+
+    def converse_stream(self, modelId: str, messages: List[Dict[str, Any]], **kwargs) -> Dict[str, Any]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return {"stream": self._events(self._input_tokens(messages))}
+
+    def _events(self, input_tokens: int) -> Iterator[Dict[str, Any]]:
+        words = self._text().split()
+        yield {"messageStart": {"role": "assistant"}}
+        for start in range(0, len(words), self.chunk_words):
+            yield {"contentBlockDelta": {"contentBlockIndex": 0,
+                                         "delta": {"text": " ".join(words[start:start + self.chunk_words]) + " "}}}
+        yield {"contentBlockStop": {"contentBlockIndex": 0}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+        yield {"metadata": {"usage": {"inputTokens": input_tokens, "outputTokens": self.output_tokens,
+                                      "totalTokens": input_tokens + self.output_tokens},
+                            "metrics": {"latencyMs": int(self.latency * 1000)}}}
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for SourceCodeProcessor._apply_changes.
+Applies 100 LLM-style changes to a synthetic 1 MB source file and compares the
+anchor index and one-pass assembly with the previous splice-per-change approach.
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+from dbp.hstc.source_processor import SourceCodeProcessor
+
+
+def build_source(size: int) -> str:
+    """Build a synthetic Python source file of at least the given size."""
+    blocks = []
+    total = 0
+    i = 0
+    while total < size:
+        block = (f"def function_{i}(value):\n"
+                 f"    result = value * {i}\n"
+                 f"    return result + {i % 7}\n\n")
+        blocks.append(block)
+        total += len(block)
+        i += 1
+    return "".join(blocks)
+
+
+def build_changes(content: str, count: int) -> List[Dict[str, Any]]:
+    """Build documentation changes spread evenly over the source file."""
+    functions = content.count("def function_")
+    step = max(1, functions // count)
+    changes = []
+    for n in range(count):
+        i = n * step
+        if n % 2:
+            changes.append({
+                "context_before": f"def function_{i}(value):\n",
+                "original_text": "",
+                "replacement_text": f"    \"\"\"Documentation of function_{i}.\"\"\"\n",
+            })
+        else:
+            changes.append({
+                "context_before": f"def function_{i}(value):\n",
+                "original_text": f"    result = value * {i}\n",
+                "replacement_text": f"    # Scale the value\n    result = value * {i}\n",
+            })
+    return changes
+
+
+def apply_changes_per_anchor(content: str, changes: List[Dict[str, Any]]) -> str:
+    """Previous approach: one search per change, then one string splice per change."""
+    positions = []
+    for change in changes:
+        context = change["context_before"]
+        original = change["original_text"]
+        pos = content.find(context + original)
+        if pos >= 0:
+            positions.append((pos + len(context), original, change["replacement_text"]))
+    positions.sort(key=lambda x: x[0], reverse=True)
+    for start, original, replacement in positions:
+        content = content[:start] + replacement + content[start + len(original):]
+    return content
+
+
+def measure(function, repeat: int) -> float:
+    """Return the best wall time of several runs, in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1024 * 1024, help="Source size in bytes")
+    parser.add_argument("--changes", type=int, default=100, help="Number of changes")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    content = build_source(args.size)
+    changes = build_changes(content, args.changes)
+    processor = SourceCodeProcessor(logger=logging.getLogger("benchmark"))
+    logging.getLogger("benchmark").setLevel(logging.ERROR)
+
+    expected = apply_changes_per_anchor(content, changes)
+    if processor._apply_changes(content, changes) != expected:
+        print("ERROR: outputs differ between implementations")
+        return 1
+
+    baseline = measure(lambda: apply_changes_per_anchor(content, changes), args.repeat)
+    current = measure(lambda: processor._apply_changes(content, changes), args.repeat)
+
+    print(f"Source size:       {len(content)} bytes")
+    print(f"Changes:           {len(changes)}")
+    print(f"Splice per change: {baseline:8.2f} ms")
+    print(f"One-pass assembly: {current:8.2f} ms")
+    print(f"Speedup:           {baseline / current:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
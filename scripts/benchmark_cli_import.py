@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the dbp Click CLI.
+Runs `dbp --help` and `dbp version` under `python -X importtime` in fresh
+interpreters, reports the cumulative import time and the most expensive
+modules, and fails when a run exceeds the time budget or imports a module
+that must only be loaded by the command using it.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+SCENARIOS = {
+    "dbp --help": ["--help"],
+    "dbp version": ["version"],
+}
+
+# Heavy dependencies of individual commands that the CLI startup must not import
+FORBIDDEN_PREFIXES = ("agno", "boto3", "botocore", "langchain", "dbp_cli.commands.hstc_agno")
+
+
+def run_importtime(cli_args: List[str]) -> List[Tuple[str, int, int]]:
+    """Run the CLI with -X importtime and return (module, self us, cumulative us) rows."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [SRC_DIR, os.environ.get("PYTHONPATH")])))
+    completed = subprocess.run(
+        # Same code path as the `dbp` console script (dbp_cli.cli_click.main:main)
+        [sys.executable, "-X", "importtime", "-c",
+         "import sys; from dbp_cli.cli_click.main import main; sys.exit(main())", *cli_args],
+        capture_output=True, text=True, env=env,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"CLI exited with {completed.returncode}: {completed.stderr[-2000:]}")
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        # Keep the indentation of the module name: it encodes the import nesting
+        rows.append((module[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def measure(cli_args: List[str], repeat: int, top: int) -> Dict:
+    """Return the best total import time of several runs with its top modules and forbidden imports."""
+    best = None
+    for _ in range(repeat):
+        rows = run_importtime(cli_args)
+        # Top-level imports are the unindented ones; their cumulative times add up to the total
+        total_us = sum(cumulative for module, _, cumulative in rows if module == module.lstrip())
+        if best is None or total_us < best[0]:
+            best = (total_us, rows)
+    total_us, rows = best
+    modules = {module.strip() for module, _, _ in rows}
+    return {
+        "total_ms": total_us / 1000,
+        "top_modules": [
+            {"module": module.strip(), "cumulative_ms": cumulative / 1000}
+            for module, _, cumulative in sorted(rows, key=lambda row: row[2], reverse=True)[:top]
+        ],
+        "forbidden_imports": sorted(m for m in modules if m.startswith(FORBIDDEN_PREFIXES)),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=1000.0,
+                        help="Maximum cumulative import time of each scenario")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario, the best one is kept")
+    parser.add_argument("--top", type=int, default=10, help="Number of most expensive modules to report")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    results = {label: measure(cli_args, args.repeat, args.top) for label, cli_args in SCENARIOS.items()}
+    failures = []
+    for label, result in results.items():
+        if result["total_ms"] > args.budget_ms:
+            failures.append(f"{label}: {result['total_ms']:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        if result["forbidden_imports"]:
+            failures.append(f"{label}: imports {', '.join(result['forbidden_imports'])}")
+
+    if args.json:
+        print(json.dumps({"budget_ms": args.budget_ms, "results": results, "failures": failures}, indent=2))
+    else:
+        for label, result in results.items():
+            print(f"{label:<14} {result['total_ms']:9.1f} ms (budget {args.budget_ms:.0f} ms)")
+            for entry in result["top_modules"]:
+                print(f"    {entry['cumulative_ms']:9.1f} ms  {entry['module']}")
+        for failure in failures:
+            print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Load-test benchmark for the MCP server deployment modes.
+Serves a CPU-bound endpoint with MCPServer in single-worker and multi-worker
+mode and measures throughput and latency under concurrent clients. With --url
+the clients target an already running server instead.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import requests
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src")))
+
+
+def cpu_work(iterations: int) -> int:
+    """CPU-bound work standing in for header parsing or diagram generation."""
+    total = 0
+    for i in range(iterations):
+        total = (total * 31 + i) % 1_000_003
+    return total
+
+
+def load_test(url: str, clients: int, requests_per_client: int, payload: Dict) -> Dict[str, float]:
+    """Send requests from concurrent clients and return throughput and latency figures."""
+    latencies: List[float] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def client() -> None:
+        nonlocal errors
+        session = requests.Session()
+        for _ in range(requests_per_client):
+            start = time.perf_counter()
+            try:
+                response = session.post(url, json=payload, timeout=60)
+                ok = response.status_code == 200
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+                errors += 0 if ok else 1
+        session.close()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        for _ in range(clients):
+            pool.submit(client)
+    wall = time.perf_counter() - start
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "requests": count,
+        "errors": errors,
+        "seconds": wall,
+        "requests_per_second": count / wall if wall else 0.0,
+        "p50_ms": latencies[count // 2] * 1000 if count else 0.0,
+        "p99_ms": latencies[min(count - 1, int(count * 0.99))] * 1000 if count else 0.0,
+    }
+
+
+def run_server_mode(workers: int, port: int, args: argparse.Namespace) -> Dict[str, float]:
+    """Start an MCPServer with the benchmark endpoint, load it, and stop it."""
+    from dbp.mcp_server.server import MCPServer
+
+    server = MCPServer(
+        name="benchmark", description="MCP server load test", version="0",
+        host="127.0.0.1", port=port, workers=workers,
+    )
+
+    @server.app.post("/benchmark/cpu")
+    async def cpu_endpoint(request: Dict) -> Dict:
+        return {"result": cpu_work(int(request.get("iterations", 0)))}
+
+    server.start()
+    server.start_workers()
+    try:
+        return load_test(f"http://127.0.0.1:{port}/benchmark/cpu", args.clients,
+                         args.requests, {"iterations": args.iterations})
+    finally:
+        server.stop()
+
+
+def print_result(label: str, result: Dict[str, float]) -> None:
+    print(f"{label:<18} {result['requests_per_second']:9.1f} req/s  "
+          f"p50 {result['p50_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  "
+          f"errors {result['errors']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4, help="Workers of the multi-worker run")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--requests", type=int, default=50, help="Requests per client")
+    parser.add_argument("--iterations", type=int, default=200_000, help="CPU work per request")
+    parser.add_argument("--port", type=int, default=6331, help="First port used by the benchmark servers")
+    parser.add_argument("--url", help="Load-test this endpoint of a running server (POST, JSON body)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    if args.url:
+        results = {"external": load_test(args.url, args.clients, args.requests,
+                                         {"iterations": args.iterations})}
+    else:
+        results = {
+            "1 worker": run_server_mode(1, args.port, args),
+            f"{args.workers} workers": run_server_mode(args.workers, args.port + 1, args),
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"Clients: {args.clients}, requests per client: {args.requests}, "
+              f"iterations: {args.iterations}")
+        for label, result in results.items():
+            print_result(label, result)
+    return 0 if all(result["errors"] == 0 for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
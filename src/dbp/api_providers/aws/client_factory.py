@@ -32,6 +32,7 @@
 ###############################################################################
 # [Dependencies]
 # codebase:src/dbp/api_providers/aws/exceptions.py
+# codebase:src/dbp/api_providers/aws/runtime_pool.py
 # system:boto3
 # system:botocore
 # system:hashlib
@@ -39,6 +40,10 @@
 # system:logging
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T09:05:00Z : Added Bedrock runtime-client pool mode by CodeAssistant
+# * Added configure_runtime_pool, get_runtime_client and prewarm_runtime_clients
+# * Added get_runtime_pool_stats exposing saturation and wait-time statistics
+# * clear_cache now also drops pooled runtime clients
 # 2025-05-03T11:31:12Z : Initial implementation by CodeAssistant
 # * Created AWSClientFactory singleton class
 # * Added thread-safe client and session caching
@@ -63,6 +68,12 @@ from .exceptions import (
     AWSRegionError,
     AWSServiceError
 )
+from .runtime_pool import (
+    RUNTIME_SERVICE_NAME,
+    RuntimeClientPool,
+    RuntimePoolStats,
+    prewarm_in_background
+)
 
 
 class AWSClientFactory:
@@ -89,6 +100,10 @@ class AWSClientFactory:
     _instance = None
     _lock = threading.Lock()
     
+    # Default number of pooled connections for Bedrock runtime clients when no
+    # concurrency has been configured (matches botocore's own default)
+    DEFAULT_RUNTIME_POOL_SIZE = 10
+    
     # Default configurations for different service types
     DEFAULT_CONFIGS = {
         # Standard services like S3, DynamoDB
@@ -179,6 +194,7 @@ class AWSClientFactory:
         self._session_cache = {}
         self._cache_lock = threading.Lock()
         self.logger = logging.getLogger(__name__)
+        self._runtime_pool = RuntimeClientPool(self.DEFAULT_RUNTIME_POOL_SIZE, self.logger)
     
     def get_client(self, 
                   service_name: str, 
@@ -372,6 +388,143 @@ class AWSClientFactory:
                     original_error=e
                 ) from e
     
+    def configure_runtime_pool(self, max_pool_connections: int) -> None:
+        """
+        [Method intent]
+        Size the Bedrock runtime-client pool to the concurrency of the caller.
+        
+        [Design principles]
+        - Pool size follows the configured number of parallel workers
+        - No-op when the size is unchanged, so repeated calls are cheap
+        
+        [Implementation details]
+        - Replaces the pool when the size changes; clients already handed out stay
+          valid, new callers get clients with the new connection pool size
+        
+        Args:
+            max_pool_connections: Number of concurrent Bedrock requests to support
+            
+        Raises:
+            ValueError: If max_pool_connections is lower than 1
+        """
+        with self._cache_lock:
+            if self._runtime_pool.pool_size == max_pool_connections:
+                return
+            self._runtime_pool = RuntimeClientPool(max_pool_connections, self.logger)
+        self.logger.debug(f"Bedrock runtime client pool sized to {max_pool_connections} connections")
+    
+    def get_runtime_client(self,
+                          region_name: Optional[str] = None,
+                          profile_name: Optional[str] = None,
+                          credentials: Optional[Dict[str, Any]] = None,
+                          connect_timeout: int = 10,
+                          read_timeout: int = 900,
+                          max_attempts: int = 3) -> Any:
+        """
+        [Method intent]
+        Get the shared, pooled bedrock-runtime client for a region and credentials.
+        All model invocation call sites should use this instead of get_client().
+        
+        [Design principles]
+        - One thread-safe client shared by all workers for the same region/credentials
+        - Connection pool sized to the configured concurrency
+        - Saturation and wait-time statistics collected for every request
+        
+        [Implementation details]
+        - Reuses the cached session for credentials resolution
+        - The timeouts and retries only apply when the client is first created
+        
+        Args:
+            region_name: AWS region name
+            profile_name: AWS profile name for credentials
+            credentials: Explicit credentials dict (overrides profile)
+            connect_timeout: Connection timeout in seconds
+            read_timeout: Read timeout in seconds
+            max_attempts: Maximum retry attempts
+            
+        Returns:
+            boto3.client: Shared bedrock-runtime client
+            
+        Raises:
+            AWSCredentialError: For credential-related issues
+            AWSClientError: If the client cannot be created
+        """
+        key = self._generate_session_key(region_name, profile_name, credentials)
+        
+        def _create_client(config: Config) -> Any:
+            session = self.get_session(region_name, profile_name, credentials)
+            try:
+                return session.client(RUNTIME_SERVICE_NAME, region_name=region_name, config=config)
+            except Exception as e:
+                raise AWSClientError(
+                    f"Failed to create AWS client: {str(e)}",
+                    service_name=RUNTIME_SERVICE_NAME,
+                    region_name=region_name,
+                    original_error=e
+                ) from e
+        
+        return self._runtime_pool.get_client(
+            key,
+            _create_client,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_attempts=max_attempts
+        )
+    
+    def prewarm_runtime_clients(self,
+                               region_names: List[Optional[str]],
+                               connections: int = 2,
+                               profile_name: Optional[str] = None,
+                               credentials: Optional[Dict[str, Any]] = None,
+                               background: bool = True) -> Optional[threading.Thread]:
+        """
+        [Method intent]
+        Create the pooled runtime clients for the given regions and open their first
+        connections so the first model invocations skip TLS handshakes.
+        
+        [Design principles]
+        - Intended to be called once at component start
+        - Best-effort: failures are logged and never raised
+        
+        [Implementation details]
+        - Client creation happens on the caller thread (no network involved)
+        - Connection opening runs in a daemon thread unless background is False
+        
+        Args:
+            region_names: Regions to pre-warm (None means the default region)
+            connections: Connections to open per region client
+            profile_name: AWS profile name for credentials
+            credentials: Explicit credentials dict (overrides profile)
+            background: Whether to open the connections asynchronously
+            
+        Returns:
+            Optional[threading.Thread]: Pre-warm thread when running in background
+        """
+        clients = []
+        for region_name in region_names:
+            try:
+                clients.append(self.get_runtime_client(region_name, profile_name, credentials))
+            except Exception as e:
+                self.logger.warning(f"Cannot pre-warm Bedrock runtime client for region {region_name}: {e}")
+        
+        if not clients:
+            return None
+        if background:
+            return prewarm_in_background(self._runtime_pool, clients, connections, self.logger)
+        for client in clients:
+            self._runtime_pool.prewarm(client, connections)
+        return None
+    
+    def get_runtime_pool_stats(self) -> RuntimePoolStats:
+        """
+        [Method intent]
+        Get the usage statistics of the Bedrock runtime-client pool.
+        
+        Returns:
+            RuntimePoolStats: Pool size, in-flight peak, saturation and wait times
+        """
+        return self._runtime_pool.get_stats()
+    
     def clear_cache(self, 
                    service_name: Optional[str] = None,
                    region_name: Optional[str] = None) -> None:
@@ -398,6 +551,7 @@ class AWSClientFactory:
                 # Clear all caches
                 self._clients_cache.clear()
                 self._session_cache.clear()
+                self._runtime_pool.clear()
             else:
                 # Selectively clear caches
                 # For clients, we need to check both service and region
@@ -416,6 +570,10 @@ class AWSClientFactory:
                 for key in client_keys_to_remove:
                     del self._clients_cache[key]
                 
+                # Pooled runtime clients are cheap to recreate, drop them all
+                if service_name in (None, RUNTIME_SERVICE_NAME):
+                    self._runtime_pool.clear()
+                
                 # For sessions, only region matters
                 if region_name is not None:
                     session_keys_to_remove = []
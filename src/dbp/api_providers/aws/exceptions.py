@@ -33,6 +33,8 @@
 # system:botocore.exceptions
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T04:00:00Z : Added AWSRuntimePoolTimeoutError by CodeAssistant
+# * Added AWSRuntimePoolTimeoutError raised when a runtime pool slot wait expires
 # 2025-05-03T11:30:20Z : Initial implementation by CodeAssistant
 # * Created base AWSClientError exception
 # * Added specialized exception types for credentials, region, and service errors
@@ -198,3 +200,20 @@ class AWSThrottlingError(AWSServiceError):
     - Can be caught specifically for implementing backoff strategies
     """
     pass
+
+
+class AWSRuntimePoolTimeoutError(AWSClientError):
+    """
+    [Class intent]
+    Exception raised when a Bedrock runtime request waited longer than allowed
+    for a connection slot of the shared runtime client pool.
+
+    [Design principles]
+    - Bounded backpressure: a saturated pool fails the request instead of
+      blocking the calling thread forever
+
+    [Implementation details]
+    - Raised from the pool's before-send hook, before any HTTP request is sent
+    - Uses "RuntimePoolTimeout" as error code
+    """
+    pass
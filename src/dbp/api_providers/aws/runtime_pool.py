@@ -0,0 +1,443 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides the runtime-client pool mode of the AWS client factory: a small set of
+# shared, thread-safe Bedrock runtime clients whose urllib3 connection pools are
+# sized to the configured concurrency, pre-warmed at component start, and
+# instrumented with saturation and wait-time statistics.
+###############################################################################
+# [Source file design principles]
+# - One shared boto3 client per (region, credentials) instead of one per caller
+# - Connection pool size follows the configured worker concurrency
+# - Backpressure instead of silently discarding surplus connections
+# - Statistics collected through botocore event hooks, no call-site changes needed
+# - Pre-warming is best-effort and never blocks or fails component startup
+###############################################################################
+# [Source file constraints]
+# - Must only be used through AWSClientFactory (get_runtime_client and friends)
+# - boto3 clients are thread-safe, sessions are not: sessions stay in the factory
+# - Hook handlers run on the calling thread and must stay cheap
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/api_providers/aws/client_factory.py
+# codebase:src/dbp/api_providers/aws/exceptions.py
+# system:botocore
+# system:threading
+# system:time
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T04:00:00Z : Bounded the runtime pool slot wait by CodeAssistant
+# * Slot acquire waits at most the client's read timeout and raises AWSRuntimePoolTimeoutError
+# * Added acquire_timeouts to RuntimePoolStats
+# 2026-10-18T09:05:00Z : Initial implementation by CodeAssistant
+# * Added RuntimeClientPool with pool-sized botocore Config and shared clients
+# * Added semaphore-based backpressure with saturation and wait-time statistics
+# * Added best-effort connection pre-warming
+###############################################################################
+
+import functools
+import logging
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Dict, List, Optional
+
+from botocore.awsrequest import AWSRequest
+from botocore.config import Config
+
+from .exceptions import AWSRuntimePoolTimeoutError
+
+
+# Service name used for model invocation (converse, converse_stream, invoke_model)
+RUNTIME_SERVICE_NAME = "bedrock-runtime"
+
+
+@dataclass
+class RuntimePoolStats:
+    """
+    [Class intent]
+    Snapshot of the runtime client pool usage statistics.
+
+    [Design principles]
+    - Plain data object safe to serialize into health and debug reports
+
+    [Implementation details]
+    - Wait times are measured around the pool semaphore acquisition
+    - A saturated request is one that could not get a connection slot immediately
+    - An acquire timeout is a saturated request that gave up waiting for a slot
+    """
+    pool_size: int
+    clients: int
+    in_flight: int
+    peak_in_flight: int
+    total_requests: int
+    saturated_requests: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+    prewarmed_connections: int
+    acquire_timeouts: int
+
+    @property
+    def saturation_ratio(self) -> float:
+        """
+        [Method intent]
+        Fraction of requests that had to wait for a free connection slot.
+
+        Returns:
+            float: Ratio between 0.0 and 1.0
+        """
+        if self.total_requests == 0:
+            return 0.0
+        return self.saturated_requests / self.total_requests
+
+    @property
+    def average_wait_seconds(self) -> float:
+        """
+        [Method intent]
+        Average time a request waited for a connection slot.
+
+        Returns:
+            float: Average wait in seconds over all requests
+        """
+        if self.total_requests == 0:
+            return 0.0
+        return self.total_wait_seconds / self.total_requests
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        [Method intent]
+        Convert the statistics to a dictionary including derived values.
+
+        Returns:
+            Dict[str, Any]: Serializable statistics
+        """
+        result = asdict(self)
+        result["saturation_ratio"] = self.saturation_ratio
+        result["average_wait_seconds"] = self.average_wait_seconds
+        return result
+
+
+class RuntimeClientPool:
+    """
+    [Class intent]
+    Owns the shared Bedrock runtime clients and the connection-slot accounting for
+    them. Every client created by the pool shares one bounded semaphore whose size
+    matches the urllib3 connection pool, so parallel workers queue for a slot
+    instead of opening throw-away connections.
+
+    [Design principles]
+    - Shared thread-safe clients, created once per (region, credentials) key
+    - Explicit backpressure with measured wait time
+    - Statistics gathered with botocore event hooks for all call sites
+
+    [Implementation details]
+    - before-send hook acquires a slot, response-received hook releases it
+    - The slot wait is bounded by the client's read timeout, a request still
+      waiting after that long fails with AWSRuntimePoolTimeoutError
+    - Both hooks run on the same thread, a thread-local counter pairs them
+    - Resizing the pool drops cached clients; callers holding an old client keep
+      a valid client, new callers get one with the new pool size
+    """
+
+    def __init__(self, pool_size: int, logger: Optional[logging.Logger] = None):
+        """
+        [Method intent]
+        Initialize an empty runtime client pool.
+
+        [Implementation details]
+        - Clients are created lazily through get_client()
+
+        Args:
+            pool_size: Number of connections per client and concurrent request slots
+            logger: Optional logger instance
+        """
+        if pool_size < 1:
+            raise ValueError(f"Runtime pool size must be at least 1, got {pool_size}")
+        self.logger = logger or logging.getLogger(__name__)
+        self._pool_size = pool_size
+        self._clients: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._local = threading.local()
+
+        # Statistics, updated under _stats_lock
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._total_requests = 0
+        self._saturated_requests = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._prewarmed = 0
+        self._acquire_timeouts = 0
+
+    @property
+    def pool_size(self) -> int:
+        """
+        [Method intent]
+        Get the number of connection slots of this pool.
+
+        Returns:
+            int: Pool size
+        """
+        return self._pool_size
+
+    def build_config(self,
+                     connect_timeout: int = 10,
+                     read_timeout: int = 900,
+                     max_attempts: int = 3) -> Config:
+        """
+        [Method intent]
+        Build the botocore Config used by runtime clients of this pool.
+
+        [Implementation details]
+        - max_pool_connections matches the pool size
+        - TCP keep-alive keeps idle pre-warmed connections usable
+
+        Args:
+            connect_timeout: Connection timeout in seconds
+            read_timeout: Read timeout in seconds (long for large documents)
+            max_attempts: Maximum retry attempts
+
+        Returns:
+            Config: botocore client configuration
+        """
+        return Config(
+            retries={"max_attempts": max_attempts, "mode": "standard"},
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_pool_connections=self._pool_size,
+            tcp_keepalive=True
+        )
+
+    def get_client(self, key: str, create_client: Callable[[Config], Any], **config_kwargs) -> Any:
+        """
+        [Method intent]
+        Get the shared runtime client for a key, creating it on first use.
+
+        [Design principles]
+        - Single client creation per key even under concurrent first access
+
+        [Implementation details]
+        - Client creation happens under the pool lock: it is rare and cheap compared
+          to the duplicate TLS handshakes it avoids
+        - Event hooks are registered once when the client is created, bound to the
+          read timeout of the client's Config as slot acquire timeout
+
+        Args:
+            key: Cache key identifying region and credentials
+            create_client: Callable receiving the Config and returning a boto3 client
+            **config_kwargs: Overrides passed to build_config()
+
+        Returns:
+            Any: Shared boto3 bedrock-runtime client
+        """
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                config = self.build_config(**config_kwargs)
+                client = create_client(config)
+                self._register_hooks(client, config.read_timeout)
+                self._clients[key] = client
+        return client
+
+    def clear(self) -> None:
+        """
+        [Method intent]
+        Drop all cached runtime clients.
+        """
+        with self._lock:
+            self._clients.clear()
+
+    def prewarm(self, client: Any, connections: int) -> int:
+        """
+        [Method intent]
+        Open connections to the client endpoint so the first model calls skip the
+        TCP and TLS handshakes.
+
+        [Design principles]
+        - Best-effort: failures are logged at debug level and ignored
+
+        [Implementation details]
+        - Sends unsigned GET requests through the client's own HTTP session in
+          parallel threads; the responses (access errors) are read completely so
+          the connections return to the client's pool
+
+        Args:
+            client: Runtime client created by this pool
+            connections: Number of connections to open (capped at pool size)
+
+        Returns:
+            int: Number of connections successfully opened
+        """
+        connections = max(0, min(connections, self._pool_size))
+        if connections == 0:
+            return 0
+
+        opened = []
+        url = client.meta.endpoint_url
+        http_session = client._endpoint.http_session
+
+        def _open_connection():
+            try:
+                response = http_session.send(AWSRequest(method="GET", url=url).prepare())
+                # Consume the body to release the connection back to the pool
+                response.content
+                opened.append(True)
+            except Exception as e:
+                self.logger.debug(f"Runtime client pre-warm request to {url} failed: {e}")
+
+        threads = [threading.Thread(target=_open_connection, daemon=True) for _ in range(connections)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with self._stats_lock:
+            self._prewarmed += len(opened)
+        return len(opened)
+
+    def get_stats(self) -> RuntimePoolStats:
+        """
+        [Method intent]
+        Get a consistent snapshot of the pool statistics.
+
+        Returns:
+            RuntimePoolStats: Current statistics
+        """
+        with self._stats_lock:
+            return RuntimePoolStats(
+                pool_size=self._pool_size,
+                clients=len(self._clients),
+                in_flight=self._in_flight,
+                peak_in_flight=self._peak_in_flight,
+                total_requests=self._total_requests,
+                saturated_requests=self._saturated_requests,
+                total_wait_seconds=self._total_wait,
+                max_wait_seconds=self._max_wait,
+                prewarmed_connections=self._prewarmed,
+                acquire_timeouts=self._acquire_timeouts
+            )
+
+    def _register_hooks(self, client: Any, acquire_timeout: Optional[float]) -> None:
+        """
+        [Method intent]
+        Attach the slot accounting handlers to a newly created client.
+
+        Args:
+            client: boto3 client to instrument
+            acquire_timeout: Maximum slot wait in seconds for requests of this client
+        """
+        events = client.meta.events
+        events.register(f"before-send.{RUNTIME_SERVICE_NAME}",
+                        functools.partial(self._on_before_send, acquire_timeout=acquire_timeout))
+        events.register(f"response-received.{RUNTIME_SERVICE_NAME}", self._on_response_received)
+
+    def _on_before_send(self, acquire_timeout: Optional[float] = None, **kwargs) -> None:
+        """
+        [Method intent]
+        Acquire a connection slot before an HTTP request is sent.
+
+        [Implementation details]
+        - Tries a non-blocking acquire first so unsaturated requests pay no clock reads
+        - A saturated request waits at most acquire_timeout seconds (None waits forever)
+        - Must return None, a non-None value would replace the HTTP response
+
+        Args:
+            acquire_timeout: Maximum slot wait in seconds, bound at hook registration
+            **kwargs: botocore event arguments
+
+        Raises:
+            AWSRuntimePoolTimeoutError: If no slot became free within acquire_timeout
+        """
+        saturated = not self._slots.acquire(blocking=False)
+        wait = 0.0
+        if saturated:
+            start = time.monotonic()
+            acquired = self._slots.acquire(timeout=acquire_timeout)
+            wait = time.monotonic() - start
+            if not acquired:
+                with self._stats_lock:
+                    self._acquire_timeouts += 1
+                raise AWSRuntimePoolTimeoutError(
+                    f"No runtime pool connection slot became free within {acquire_timeout}s "
+                    f"({self._pool_size} slot(s) in use)",
+                    error_code="RuntimePoolTimeout"
+                )
+        self._local.held = getattr(self._local, "held", 0) + 1
+
+        with self._stats_lock:
+            self._total_requests += 1
+            self._in_flight += 1
+            if self._in_flight > self._peak_in_flight:
+                self._peak_in_flight = self._in_flight
+            if saturated:
+                self._saturated_requests += 1
+                self._total_wait += wait
+                if wait > self._max_wait:
+                    self._max_wait = wait
+        return None
+
+    def _on_response_received(self, **kwargs) -> None:
+        """
+        [Method intent]
+        Release the connection slot acquired by the matching before-send hook.
+
+        [Implementation details]
+        - Streaming responses keep their socket while the event stream is consumed;
+          the slot is released on headers, so accounting is an upper bound on reuse
+        """
+        held = getattr(self._local, "held", 0)
+        if held == 0:
+            return None
+        self._local.held = held - 1
+        with self._stats_lock:
+            self._in_flight -= 1
+        self._slots.release()
+        return None
+
+
+def prewarm_in_background(pool: RuntimeClientPool, clients: List[Any], connections: int,
+                          logger: Optional[logging.Logger] = None) -> threading.Thread:
+    """
+    [Function intent]
+    Pre-warm a set of runtime clients without blocking the caller.
+
+    [Design principles]
+    - Component start must not wait for network round trips
+
+    [Implementation details]
+    - Runs pool.prewarm() for each client in one daemon thread
+
+    Args:
+        pool: Pool owning the clients
+        clients: Clients to pre-warm
+        connections: Connections to open per client
+        logger: Optional logger for the summary message
+
+    Returns:
+        threading.Thread: The started pre-warm thread
+    """
+    logger = logger or logging.getLogger(__name__)
+
+    def _run():
+        opened = sum(pool.prewarm(client, connections) for client in clients)
+        logger.debug(f"Pre-warmed {opened} Bedrock runtime connection(s)")
+
+    thread = threading.Thread(target=_run, name="BedrockRuntimePrewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,173 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the Bedrock runtime-client pool mode of AWSClientFactory.
+# Validates client sharing, pool sizing and the saturation/wait-time statistics.
+###############################################################################
+# [Source file design principles]
+# - Exercise the botocore event hooks without any network access
+# - Tests must be isolated from the factory singleton
+###############################################################################
+# [Source file constraints]
+# - Must not depend on actual AWS services
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/api_providers/aws/runtime_pool.py
+# codebase:src/dbp/api_providers/aws/client_factory.py
+# system:pytest
+# system:botocore
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T04:00:00Z : Added slot acquire timeout test by CodeAssistant
+# * Added test for AWSRuntimePoolTimeoutError and acquire_timeouts statistics
+# 2026-10-18T09:05:00Z : Created runtime pool tests by CodeAssistant
+# * Added tests for shared clients, pool configuration and pool statistics
+###############################################################################
+
+"""
+Tests for the Bedrock runtime client pool.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.hooks import HierarchicalEmitter
+
+from ..client_factory import AWSClientFactory
+from ..exceptions import AWSRuntimePoolTimeoutError
+from ..runtime_pool import RuntimeClientPool
+
+
+def _fake_client(config):
+    """Create a client stand-in exposing the event emitter used by the pool hooks."""
+    client = MagicMock()
+    client.meta.events = HierarchicalEmitter()
+    client.test_config = config
+    return client
+
+
+def _send(client, hold_seconds=0.0):
+    """Emit the before-send/response-received pair of one Bedrock call."""
+    client.meta.events.emit("before-send.bedrock-runtime.Converse", request=None)
+    time.sleep(hold_seconds)
+    client.meta.events.emit("response-received.bedrock-runtime.Converse", context={})
+
+
+class TestRuntimeClientPool:
+    """Test suite for RuntimeClientPool."""
+
+    def test_client_is_shared_per_key(self):
+        """Clients are created once per key and configured with the pool size."""
+        pool = RuntimeClientPool(4)
+        factory = MagicMock(side_effect=_fake_client)
+
+        first = pool.get_client("us-east-1|default", factory)
+        second = pool.get_client("us-east-1|default", factory)
+        other = pool.get_client("us-west-2|default", factory)
+
+        assert first is second
+        assert first is not other
+        assert factory.call_count == 2
+        assert first.test_config.max_pool_connections == 4
+        assert pool.get_stats().clients == 2
+
+    def test_statistics_without_saturation(self):
+        """Sequential calls never wait for a connection slot."""
+        pool = RuntimeClientPool(2)
+        client = pool.get_client("key", _fake_client)
+
+        for _ in range(5):
+            _send(client)
+
+        stats = pool.get_stats()
+        assert stats.total_requests == 5
+        assert stats.saturated_requests == 0
+        assert stats.in_flight == 0
+        assert stats.peak_in_flight == 1
+        assert stats.saturation_ratio == 0.0
+
+    def test_saturation_waits_for_free_slot(self):
+        """Calls beyond the pool size wait for a slot and are reported as saturated."""
+        pool = RuntimeClientPool(1)
+        client = pool.get_client("key", _fake_client)
+
+        threads = [threading.Thread(target=_send, args=(client, 0.05)) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = pool.get_stats()
+        assert stats.total_requests == 3
+        assert stats.peak_in_flight == 1
+        assert stats.saturated_requests == 2
+        assert stats.max_wait_seconds > 0.0
+        assert stats.in_flight == 0
+
+    def test_slot_wait_times_out_after_read_timeout(self):
+        """A saturated call gives up after the client's read timeout and is counted."""
+        pool = RuntimeClientPool(1)
+        client = pool.get_client("key", _fake_client, read_timeout=0.05)
+
+        client.meta.events.emit("before-send.bedrock-runtime.Converse", request=None)
+        with pytest.raises(AWSRuntimePoolTimeoutError):
+            client.meta.events.emit("before-send.bedrock-runtime.Converse", request=None)
+        client.meta.events.emit("response-received.bedrock-runtime.Converse", context={})
+
+        stats = pool.get_stats()
+        assert stats.acquire_timeouts == 1
+        assert stats.total_requests == 1
+        assert stats.in_flight == 0
+        _send(client)
+        assert pool.get_stats().total_requests == 2
+
+    def test_invalid_pool_size(self):
+        """Pool size must be positive."""
+        with pytest.raises(ValueError):
+            RuntimeClientPool(0)
+
+
+class TestAWSClientFactoryRuntimePool:
+    """Test suite for the runtime pool mode of AWSClientFactory."""
+
+    @pytest.fixture
+    def factory(self):
+        """Provide a fresh factory instance outside of the singleton."""
+        saved = AWSClientFactory._instance
+        AWSClientFactory._instance = None
+        instance = AWSClientFactory.get_instance()
+        yield instance
+        AWSClientFactory._instance = saved
+
+    def test_runtime_client_shared_and_resized(self, factory):
+        """Runtime clients are shared until the pool is resized."""
+        factory.configure_runtime_pool(3)
+        client = factory.get_runtime_client(region_name="us-east-1")
+
+        assert factory.get_runtime_client(region_name="us-east-1") is client
+        assert client.meta.config.max_pool_connections == 3
+        assert factory.get_runtime_pool_stats().pool_size == 3
+
+        factory.configure_runtime_pool(6)
+        resized = factory.get_runtime_client(region_name="us-east-1")
+        assert resized is not client
+        assert resized.meta.config.max_pool_connections == 6
+
+    def test_clear_cache_drops_runtime_clients(self, factory):
+        """Clearing the bedrock-runtime cache recreates pooled clients."""
+        client = factory.get_runtime_client(region_name="us-east-1")
+        factory.clear_cache(service_name="bedrock-runtime")
+        assert factory.get_runtime_client(region_name="us-east-1") is not client
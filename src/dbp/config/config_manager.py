@@ -25,6 +25,8 @@
 # - Handles environment variables with a specific prefix (`DBP_`).
 # - Parses command-line arguments for overrides.
 # - Provides methods for getting/setting values and loading project-specific configs.
+# - Template variables are resolved in a single pass in dependency order.
+# - The resolved configuration is snapshotted and reused while its sources are unchanged.
 # - Design Decision: Singleton Pattern (2025-04-14)
 #   * Rationale: Ensures consistent configuration access across the application without passing instances around.
 #   * Alternatives considered: Global variable (less controlled), Dependency injection (more complex for simple config access).
@@ -46,6 +48,10 @@
 # codebase:doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:10:00Z : Added dependency-ordered template resolution and resolved configuration snapshot by CodeAssistant
+# * Replaced multi-pass template resolution with a topological single pass detecting cycles
+# * Templates now resolve against the configuration being built instead of the previous one
+# * Added snapshot of the resolved configuration keyed by file stats, DBP_ variables and arguments
 # 2025-04-25T10:01:49Z : Deprecated get() method in favor of get_typed_config() by CodeAssistant
 # * Replaced get() method implementation to raise DeprecatedMethodError
 # * Added proper migration guidance to use get_typed_config() with direct attribute access
@@ -61,20 +67,18 @@
 # * Added _resolve_templates_single_pass method to track changes and enable incremental resolution
 # * Fixed issue with templated variables inside other templated variables not being resolved
 # * Improved debug logging to show resolution progress across multiple passes
-# 2025-04-18T07:39:00Z : Added automatic template variable resolution by CodeAssistant
-# * Implemented _resolve_all_template_variables to recursively process all configuration values
-# * Modified _apply_configuration_hierarchy to resolve all templates before marking config as ready
-# * Updated get() method to expect pre-resolved values with backward compatibility support
-# * Improved logging for template resolution activities
 ###############################################################################
 
 import os
+import sys
 import json
 import yaml # Requires PyYAML
 import logging
 import argparse
+import functools
+import hashlib
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 import threading
 
@@ -96,6 +100,23 @@ DEFAULT_SYSTEM_CONFIG_DIR = Path("/etc/dbp")
 DEFAULT_USER_CONFIG_DIR = Path.home() / ".config" / "dbp"
 DEFAULT_PROJECT_CONFIG_DIR = Path(".dbp") # Relative to project root
 
+# System-wide then user configuration files
+STANDARD_CONFIG_PATHS = [
+    DEFAULT_SYSTEM_CONFIG_DIR / "config.json",
+    DEFAULT_SYSTEM_CONFIG_DIR / "config.yaml",
+    DEFAULT_SYSTEM_CONFIG_DIR / "config.yml",
+    DEFAULT_USER_CONFIG_DIR / "config.json",
+    DEFAULT_USER_CONFIG_DIR / "config.yaml",
+    DEFAULT_USER_CONFIG_DIR / "config.yml",
+]
+
+# Template variable reference: ${key.in.dot.notation}
+TEMPLATE_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Resolved configuration of the last run, reused while its sources are unchanged
+DEFAULT_SNAPSHOT_FILE = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dbp" / "config_snapshot.json"
+SNAPSHOT_FORMAT_VERSION = 1
+
 class ConfigurationManager:
     """
     Manages loading, validation, and access to application configuration
@@ -104,6 +125,7 @@ class ConfigurationManager:
     """
     _instance = None
     _lock = threading.RLock() # Use RLock for reentrant locking if needed
+    snapshot_file: Optional[Path] = DEFAULT_SNAPSHOT_FILE # None disables the snapshot
 
     def __new__(cls, *args, **kwargs):
         # Ensure only one instance is created
@@ -157,6 +179,14 @@ class ConfigurationManager:
 
             logger.info("Initializing configuration...")
             try:
+                # 0. Reuse the resolved configuration of a previous run when
+                # none of its sources changed
+                snapshot_key = self._snapshot_key(args, project_root)
+                if snapshot_key and self._load_snapshot(snapshot_key):
+                    self.initialized_flag = True
+                    logger.info("Configuration initialized from snapshot.")
+                    return
+                
                 # 1. Load configuration from standard file locations
                 self._load_standard_config_files()
 
@@ -172,6 +202,9 @@ class ConfigurationManager:
 
                 # 5. Apply hierarchy and validate
                 self._apply_configuration_hierarchy()
+                
+                if snapshot_key:
+                    self._save_snapshot(snapshot_key)
 
                 self.initialized_flag = True # Mark public init complete
                 logger.info("Configuration initialized successfully.")
@@ -185,23 +218,135 @@ class ConfigurationManager:
     def _load_standard_config_files(self):
         """Loads configuration from system-wide and user-specific files."""
         logger.debug("Loading standard configuration files...")
-        config_paths = [
-            # System-wide configuration
-            DEFAULT_SYSTEM_CONFIG_DIR / "config.json",
-            DEFAULT_SYSTEM_CONFIG_DIR / "config.yaml",
-            DEFAULT_SYSTEM_CONFIG_DIR / "config.yml",
-            # User configuration
-            DEFAULT_USER_CONFIG_DIR / "config.json",
-            DEFAULT_USER_CONFIG_DIR / "config.yaml",
-            DEFAULT_USER_CONFIG_DIR / "config.yml",
-        ]
-
-        for path in config_paths:
+        for path in STANDARD_CONFIG_PATHS:
             if path.exists() and path.is_file():
                 self._load_and_store_config_file(path)
             else:
                 logger.debug(f"Configuration file not found or not a file: {path}")
 
+    def _snapshot_key(self, args: Optional[List[str]], project_root: Optional[str]) -> Optional[str]:
+        """
+        [Function intent]
+        Computes the key identifying the sources of the configuration, under which
+        its resolved form is stored in the snapshot.
+        
+        [Implementation details]
+        Hashes the modification time and size of every candidate configuration
+        file (standard, project and --config), of the modules defining the schema
+        and defaults, the DBP_ environment variables, the command-line arguments
+        and the working directory, which relative paths are expanded against.
+        Only stats files: nothing is read.
+        
+        [Design principles]
+        Any change of a source yields a different key, a stale snapshot is never used.
+        No snapshot without configuration files: resolving defaults is cheaper.
+        
+        Args:
+            args: Command-line arguments given to initialize()
+            project_root: Project root given to initialize()
+            
+        Returns:
+            Optional[str]: The key, or None if the snapshot is disabled or not worth it
+        """
+        if self.snapshot_file is None:
+            return None
+        args = sys.argv[1:] if args is None else list(args)
+        
+        candidates = list(STANDARD_CONFIG_PATHS)
+        if project_root:
+            project_config_dir = Path(project_root) / DEFAULT_PROJECT_CONFIG_DIR
+            candidates.extend(project_config_dir / f"config.{ext}" for ext in ["json", "yaml", "yml"])
+        parser = argparse.ArgumentParser(add_help=False)
+        parser.add_argument('--config')
+        config_arg = parser.parse_known_args(args)[0].config
+        if config_arg:
+            candidates.append(Path(config_arg))
+        
+        def stat(path: Path) -> Optional[Tuple[str, int, int]]:
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+            return (str(path.absolute()), st.st_mtime_ns, st.st_size)
+        
+        config_files = [entry for entry in map(stat, candidates) if entry]
+        if not config_files:
+            return None
+        module_dir = Path(__file__).parent
+        modules = [stat(module_dir / name) for name in ("config_manager.py", "config_schema.py", "default_config.py")]
+        env_vars = sorted((key, value) for key, value in os.environ.items() if key.startswith("DBP_"))
+        payload = json.dumps([SNAPSHOT_FORMAT_VERSION, os.getcwd(), modules, config_files, env_vars, args])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def _load_snapshot(self, key: str) -> bool:
+        """
+        [Function intent]
+        Restores the configuration from the snapshot if it was stored under the given key.
+        
+        [Implementation details]
+        One file read: the snapshot holds the resolved configuration and the raw
+        sources later needed by load_project_config(). The configuration is
+        validated again when rebuilt.
+        
+        Args:
+            key: Key of the current configuration sources
+            
+        Returns:
+            bool: True if the configuration was restored
+        """
+        try:
+            with open(self.snapshot_file, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get("key") != key:
+                logger.debug("Configuration snapshot is stale")
+                return False
+            config = AppConfig(**snapshot["config"])
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError, KeyError, TypeError, ValidationError) as e:
+            logger.debug(f"Ignoring unusable configuration snapshot {self.snapshot_file}: {e}")
+            return False
+        
+        self._config_files_data = snapshot["files"]
+        self._env_vars = snapshot["env_vars"]
+        self._cli_args = snapshot["cli_args"]
+        self._config = config
+        self._raw_config_dict = config.dict()
+        return True
+    
+    def _save_snapshot(self, key: str) -> None:
+        """
+        [Function intent]
+        Stores the resolved configuration and its raw sources under the given key.
+        
+        [Implementation details]
+        Written to a temporary file then renamed, readable by the owner only as the
+        configuration may hold credentials. Failures are logged and ignored.
+        
+        Args:
+            key: Key of the configuration sources
+        """
+        snapshot = {
+            "key": key,
+            "config": self._raw_config_dict,
+            "files": self._config_files_data,
+            "env_vars": self._env_vars,
+            "cli_args": self._cli_args,
+        }
+        tmp_path = f"{self.snapshot_file}.{os.getpid()}.tmp"
+        try:
+            self.snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, default=str)
+            os.replace(tmp_path, self.snapshot_file)
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write configuration snapshot {self.snapshot_file}: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
     def _load_and_store_config_file(self, path: Path):
         """Loads data from a single config file and stores it."""
         try:
@@ -428,219 +573,154 @@ class ConfigurationManager:
         return value # Return non-string values as is
 
 
-    def _resolve_all_template_variables(self, config, path="", max_passes=5):
+    def _resolve_all_template_variables(self, config: AppConfig) -> None:
         """
         [Function intent]
-        Recursively resolves all template variables in the config object, including nested templates.
+        Resolves all template variables in the config object, including templates
+        referencing other templates.
         
         [Implementation details]
-        Traverses the entire Pydantic model structure and resolves any string 
-        values that contain template variables in the ${key} format. Uses multiple passes
-        to handle nested template references (templates inside templates).
+        Walks the Pydantic model structure once to collect the string values
+        containing ${key} references, builds the graph of references between them
+        and resolves them in topological order against the configuration being
+        built, so every referenced template is already resolved when used.
+        Templates on a reference cycle, or depending on one, are left unresolved
+        and reported.
         
         [Design principles]
         Deep resolution to ensure all nested templates are resolved before clients access configuration.
-        Multiple passes to handle nested template references properly.
-        Comprehensive approach that ensures complete resolution of deeply nested variables.
+        Single walk of the configuration regardless of template nesting depth.
+        Clear diagnostics for circular and unknown references.
         
         Args:
-            config: The configuration object or sub-object to process
-            path: Current path in the configuration hierarchy (for logging)
-            max_passes: Maximum number of resolution passes to handle nested templates
+            config: The configuration object to process
         """
-        # Skip None values
-        if config is None:
+        # 1. Collect templated values with the setter writing them back
+        templates: Dict[str, Tuple[str, Callable[[str], None]]] = {}
+        self._collect_templates(config, "", templates)
+        if not templates:
             return
         
-        # Make multiple passes to handle nested template references
-        total_changes = 0
-        for pass_num in range(max_passes):
-            logger.debug(f"Template resolution pass {pass_num+1}/{max_passes}")
-            changes_made = self._resolve_templates_single_pass(config, path, pass_num+1)
-            total_changes += 1 if changes_made else 0
-            
-            # If no changes were made in this pass, we've resolved everything
-            if not changes_made:
-                logger.debug(f"No more templates to resolve after pass {pass_num+1}")
-                break
-        
-        # Check if we possibly have unresolved templates after all passes
-        if total_changes >= max_passes:
-            logger.warning(f"Reached maximum template resolution passes ({max_passes}). Some templates may remain unresolved.")
-            # Perform one final deep scan to identify any remaining unresolved templates
-            self._check_for_unresolved_templates(config)
-            
-    def _check_for_unresolved_templates(self, config, path=""):
+        # 2. A template depends on the templates at or below the keys it references
+        dependencies: Dict[str, List[str]] = {}
+        for path, (value, _) in templates.items():
+            references = {match.group(1) for match in TEMPLATE_PATTERN.finditer(value)}
+            dependencies[path] = [
+                other for other in templates
+                if other != path and any(other == ref or other.startswith(ref + ".") for ref in references)
+            ]
+        
+        # 3. Topological order (Kahn); what is never ordered is on or behind a cycle
+        dependents: Dict[str, List[str]] = {path: [] for path in templates}
+        remaining = {path: len(deps) for path, deps in dependencies.items()}
+        for path, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(path)
+        ready = [path for path, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            path = ready.pop()
+            order.append(path)
+            for dependent in dependents[path]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        circular = [path for path in templates if remaining[path] > 0]
+        if circular:
+            logger.warning(f"Circular template references, left unresolved: {', '.join(sorted(circular))}")
+        
+        # 4. Resolve in dependency order
+        for path in order:
+            value, setter = templates[path]
+            resolved = TEMPLATE_PATTERN.sub(lambda match: self._lookup_template_value(config, match), value)
+            if resolved != value:
+                logger.debug(f"Resolved template in {path}: {value} → {resolved}")
+                setter(resolved)
+            if "${" in resolved:
+                logger.warning(f"Unresolved template variable found: {path}: {resolved}")
+    
+    def _collect_templates(self, config: Any, path: str, templates: Dict[str, Tuple[str, Callable[[str], None]]]) -> None:
         """
         [Function intent]
-        Scans the configuration for any remaining unresolved template variables and logs warnings.
+        Collects the string values containing template variables in a configuration
+        object, keyed by their dotted path.
         
         [Implementation details]
-        Traverses the entire configuration structure, looking for strings containing '${' patterns
-        that indicate unresolved template variables. Records detailed paths for debugging.
-        
-        [Design principles]
-        Comprehensive error detection to assist with debugging template resolution issues.
-        Provides clear diagnostic information without disrupting configuration loading.
+        Recurses into Pydantic models, dictionaries and lists. Each entry holds the
+        templated value and a setter storing the resolved value in place.
         
         Args:
-            config: The configuration object or sub-object to check
-            path: Current path in the configuration hierarchy (for logging)
+            config: The configuration object or sub-object to scan
+            path: Path of the object in the configuration hierarchy
+            templates: Collected templates, updated in place
         """
-        if config is None:
-            return
-        
-        # Track unresolved templates found
-        unresolved_templates = []
-        
-        # Handle different types of configuration objects
         if isinstance(config, BaseModel):
-            # Process each field in the Pydantic model
-            for field_name, field_value in config.__dict__.items():
-                field_path = f"{path}.{field_name}" if path else field_name
-                
-                if isinstance(field_value, BaseModel):
-                    # Recursively process nested models
-                    self._check_for_unresolved_templates(field_value, field_path)
-                elif isinstance(field_value, dict):
-                    # Process dictionary values
-                    for key, value in field_value.items():
-                        dict_path = f"{field_path}.{key}"
-                        if isinstance(value, str) and "${" in value:
-                            unresolved_templates.append(f"{dict_path}: {value}")
-                        elif isinstance(value, (dict, list, BaseModel)):
-                            self._check_for_unresolved_templates(value, dict_path)
-                elif isinstance(field_value, list):
-                    # Process list values
-                    for i, item in enumerate(field_value):
-                        item_path = f"{field_path}[{i}]"
-                        if isinstance(item, str) and "${" in item:
-                            unresolved_templates.append(f"{item_path}: {item}")
-                        elif isinstance(item, (dict, list, BaseModel)):
-                            self._check_for_unresolved_templates(item, item_path)
-                elif isinstance(field_value, str) and "${" in field_value:
-                    # Record unresolved string templates
-                    unresolved_templates.append(f"{field_path}: {field_value}")
+            entries = [(f"{path}.{name}" if path else name, value, functools.partial(setattr, config, name))
+                       for name, value in config.__dict__.items()]
         elif isinstance(config, dict):
-            # Process dictionary objects
-            for key, value in list(config.items()):
-                dict_path = f"{path}.{key}" if path else key
-                if isinstance(value, str) and "${" in value:
-                    unresolved_templates.append(f"{dict_path}: {value}")
-                elif isinstance(value, (dict, list, BaseModel)):
-                    self._check_for_unresolved_templates(value, dict_path)
+            entries = [(f"{path}.{key}" if path else str(key), value, functools.partial(config.__setitem__, key))
+                       for key, value in config.items()]
         elif isinstance(config, list):
-            # Process list objects
-            for i, item in enumerate(config):
-                item_path = f"{path}[{i}]" if path else f"[{i}]"
-                if isinstance(item, str) and "${" in item:
-                    unresolved_templates.append(f"{item_path}: {item}")
-                elif isinstance(item, (dict, list, BaseModel)):
-                    self._check_for_unresolved_templates(item, item_path)
-        
-        # Log any unresolved templates found
-        if unresolved_templates:
-            for template in unresolved_templates:
-                logger.warning(f"Unresolved template variable found: {template}")
-            
-            # Log potential circular references if appropriate
-            if len(unresolved_templates) > 1:
-                logger.warning("Multiple unresolved templates detected. Check for potential circular references.")
-                
-    def _resolve_templates_single_pass(self, config, path="", pass_num=1):
+            entries = [(f"{path}[{i}]", value, functools.partial(config.__setitem__, i))
+                       for i, value in enumerate(config)]
+        else:
+            return
+        
+        for child_path, value, setter in entries:
+            if isinstance(value, str):
+                if "${" in value:
+                    templates[child_path] = (value, setter)
+            elif isinstance(value, (BaseModel, dict, list)):
+                self._collect_templates(value, child_path, templates)
+    
+    def _lookup_template_value(self, config: Any, match: "re.Match") -> str:
         """
         [Function intent]
-        Performs a single pass of template variable resolution across the configuration object.
+        Returns the replacement of one ${key} reference found in a template.
         
         [Implementation details]
-        Helper method for _resolve_all_template_variables that processes one level of
-        template resolution and tracks whether any changes were made.
-        
-        [Design principles]
-        Separation of concerns for clearer code structure.
-        Tracks changes to determine if additional passes are needed.
+        Unknown keys keep the reference text unchanged.
         
         Args:
-            config: The configuration object or sub-object to process
-            path: Current path in the configuration hierarchy (for logging)
-            pass_num: Current resolution pass number (for logging)
+            config: The configuration model the key is looked up in
+            match: Regular expression match of the reference
             
         Returns:
-            bool: True if any templates were resolved, False otherwise
+            str: The referenced value as a string, or the reference itself if not found
+        """
+        key = match.group(1)
+        try:
+            value = self._lookup_config_value(config, key)
+        except (AttributeError, KeyError):
+            logger.debug(f"Template variable '${{{key}}}' not found during resolution")
+            return match.group(0)
+        return value if isinstance(value, str) else str(value)
+    
+    @staticmethod
+    def _lookup_config_value(config: Any, key: str) -> Any:
         """
-        changes_made = False
+        [Function intent]
+        Navigates a configuration model to the value of a dotted key.
         
-        # Handle different types of configuration objects
-        if isinstance(config, BaseModel):
-            # Process each field in the Pydantic model
-            for field_name, field_value in config.__dict__.items():
-                field_path = f"{path}.{field_name}" if path else field_name
-                
-                if isinstance(field_value, BaseModel):
-                    # Recursively process nested models
-                    sub_changes = self._resolve_templates_single_pass(field_value, field_path, pass_num)
-                    changes_made = changes_made or sub_changes
-                elif isinstance(field_value, dict):
-                    # Process dictionary values
-                    for key, value in field_value.items():
-                        dict_path = f"{field_path}.{key}"
-                        if isinstance(value, str) and "${" in value:
-                            resolved_value = self.resolve_template_string(value)
-                            if resolved_value != value:
-                                logger.debug(f"Pass {pass_num}: Resolved template in {dict_path}: {value} → {resolved_value}")
-                                field_value[key] = resolved_value
-                                changes_made = True
-                        elif isinstance(value, (dict, list, BaseModel)):
-                            sub_changes = self._resolve_templates_single_pass(value, dict_path, pass_num)
-                            changes_made = changes_made or sub_changes
-                elif isinstance(field_value, list):
-                    # Process list values
-                    for i, item in enumerate(field_value):
-                        item_path = f"{field_path}[{i}]"
-                        if isinstance(item, str) and "${" in item:
-                            resolved_item = self.resolve_template_string(item)
-                            if resolved_item != item:
-                                logger.debug(f"Pass {pass_num}: Resolved template in {item_path}: {item} → {resolved_item}")
-                                field_value[i] = resolved_item
-                                changes_made = True
-                        elif isinstance(item, (dict, list, BaseModel)):
-                            sub_changes = self._resolve_templates_single_pass(item, item_path, pass_num)
-                            changes_made = changes_made or sub_changes
-                elif isinstance(field_value, str) and "${" in field_value:
-                    # Resolve string templates
-                    resolved_value = self.resolve_template_string(field_value)
-                    if resolved_value != field_value:
-                        logger.debug(f"Pass {pass_num}: Resolved template in {field_path}: {field_value} → {resolved_value}")
-                        setattr(config, field_name, resolved_value)
-                        changes_made = True
-        elif isinstance(config, dict):
-            # Process dictionary objects
-            for key, value in list(config.items()):
-                dict_path = f"{path}.{key}" if path else key
-                if isinstance(value, str) and "${" in value:
-                    resolved_value = self.resolve_template_string(value)
-                    if resolved_value != value:
-                        logger.debug(f"Pass {pass_num}: Resolved template in {dict_path}: {value} → {resolved_value}")
-                        config[key] = resolved_value
-                        changes_made = True
-                elif isinstance(value, (dict, list, BaseModel)):
-                    sub_changes = self._resolve_templates_single_pass(value, dict_path, pass_num)
-                    changes_made = changes_made or sub_changes
-        elif isinstance(config, list):
-            # Process list objects
-            for i, item in enumerate(config):
-                item_path = f"{path}[{i}]" if path else f"[{i}]"
-                if isinstance(item, str) and "${" in item:
-                    resolved_item = self.resolve_template_string(item)
-                    if resolved_item != item:
-                        logger.debug(f"Pass {pass_num}: Resolved template in {item_path}: {item} → {resolved_item}")
-                        config[i] = resolved_item
-                        changes_made = True
-                elif isinstance(item, (dict, list, BaseModel)):
-                    sub_changes = self._resolve_templates_single_pass(item, item_path, pass_num)
-                    changes_made = changes_made or sub_changes
-        
-        return changes_made
+        Args:
+            config: The configuration model
+            key: Configuration key in dot notation
+            
+        Returns:
+            The value at the key
+            
+        Raises:
+            AttributeError: If the key does not exist
+        """
+        value = config
+        for part in key.split('.'):
+            if isinstance(value, BaseModel):
+                value = getattr(value, part)
+            elif isinstance(value, dict) and part in value:
+                value = value[part]
+            else:
+                raise AttributeError(f"Cannot access '{part}' in path '{key}'")
+        return value
 
     def get(self, key: str, resolve_templates: bool = False) -> Any:
         """
@@ -695,39 +775,9 @@ class ConfigurationManager:
             logger.warning(f"Maximum template resolution depth reached for: '{template_str}'")
             return template_str
             
-        # Define regex pattern for ${key} syntax
-        pattern = r'\${([^}]+)}'
-        
-        # Function to replace each match with its value using direct attribute access
-        def replace_var(match):
-            key = match.group(1)  # Extract the key from ${key}
-            try:
-                # Use direct attribute navigation to avoid get() recursion
-                parts = key.split('.')
-                # Use current configuration model that's being built
-                value = self._config  
-                
-                # Navigate through the model hierarchy
-                for part in parts:
-                    if isinstance(value, BaseModel):
-                        value = getattr(value, part)
-                    elif isinstance(value, dict) and part in value:
-                        value = value[part]
-                    else:
-                        raise AttributeError(f"Cannot access '{part}' in path '{key}'")
-                    
-            except (AttributeError, KeyError):
-                logger.debug(f"Template variable '${{{key}}}' not found during resolution")
-                return f"${{{key}}}"  # Return the original template if not found
-                
-            # Convert non-string values to string
-            if not isinstance(value, str):
-                return str(value)
-                
-            return value
-            
-        # Replace all template variables
-        result = re.sub(pattern, replace_var, template_str)
+        # Replace all template variables using direct attribute navigation
+        # to avoid get() recursion
+        result = TEMPLATE_PATTERN.sub(lambda match: self._lookup_template_value(self._config, match), template_str)
         
         # If the result still contains template variables and we haven't reached max depth,
         # recursively resolve any nested templates that were values of replaced variables
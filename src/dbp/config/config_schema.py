@@ -47,19 +47,14 @@
 # system:logging
 ###############################################################################
 # [GenAI tool change history]
-# 2025-05-02T01:21:15Z : Removed scheduler component from ComponentEnabledConfig by CodeAssistant
-# * Removed scheduler field from ComponentEnabledConfig class
-# * Kept SchedulerConfig and scheduler field in AppConfig for configuration documentation
-# 2025-05-02T01:12:00Z : Removed metadata_extraction references by CodeAssistant
-# * Removed MetadataExtractionConfig class
-# * Removed metadata_extraction field from main AppConfig class
-# * Updated imports to remove METADATA_EXTRACTION_DEFAULTS
-# 2025-05-02T00:39:23Z : Removed consistency_analysis references by CodeAssistant
-# * Removed consistency_analysis field from ComponentEnabledConfig class
-# * Removed ConsistencyAnalysisConfig class
-# 2025-04-25T14:36:00Z : Added missing COMPONENT_ENABLED_DEFAULTS import by CodeAssistant
-# * Added COMPONENT_ENABLED_DEFAULTS to the imports from default_config.py
-# * Fixed NameError in ComponentEnabledConfig class
+# 2026-10-19T00:10:00Z : Added fs_monitor slow listener isolation settings by CodeAssistant
+# * Added slow_listener_p95_ms and isolated_thread_count to FSMonitorConfig
+# 2026-10-18T23:10:00Z : Added profiler configuration by CodeAssistant
+# * Added ProfilerConfig and the AppConfig profiler section
+# 2026-10-18T22:10:00Z : Added runtime watchdog configuration by CodeAssistant
+# * Added WatchdogConfig section
+# 2026-10-18T20:40:00Z : Added deferred initialization settings by CodeAssistant
+# * Added InitializationConfig deferred_start and component_wait_timeout_seconds
 ###############################################################################
 
 from pydantic import BaseModel, Field, validator, DirectoryPath, FilePath
@@ -78,6 +73,8 @@ from .default_config import (
     MONITOR_DEFAULTS,
     DATABASE_DEFAULTS,
     INITIALIZATION_DEFAULTS,
+    WATCHDOG_DEFAULTS,
+    PROFILER_DEFAULTS,
     COORDINATOR_LLM_DEFAULTS,
     LLM_COORDINATOR_DEFAULTS,
     NOVA_LITE_DEFAULTS,
@@ -192,8 +189,10 @@ class FSMonitorConfig(BaseModel):
     ignore_patterns: List[str] = Field(default=MONITOR_DEFAULTS["ignore_patterns"], description="Glob patterns to ignore during monitoring")
     recursive: bool = Field(default=MONITOR_DEFAULTS["recursive"], description="Monitor subdirectories recursively")
     thread_count: int = Field(default=MONITOR_DEFAULTS["thread_count"], ge=1, le=16, description="Number of worker threads for event dispatching")
-    thread_priority: str = Field(default=MONITOR_DEFAULTS["thread_priority"], description="Priority for worker threads")
+    thread_priority: str = Field(default=MONITOR_DEFAULTS["thread_priority"], description="Dispatch priority of listeners declaring none")
     default_debounce_ms: int = Field(default=MONITOR_DEFAULTS["default_debounce_ms"], ge=0, le=10000, description="Default debounce delay in milliseconds")
+    slow_listener_p95_ms: int = Field(default=MONITOR_DEFAULTS["slow_listener_p95_ms"], ge=0, le=60000, description="p95 handler time above which a listener gets its own worker threads, 0 disables isolation")
+    isolated_thread_count: int = Field(default=MONITOR_DEFAULTS["isolated_thread_count"], ge=1, le=8, description="Worker threads of an isolated slow listener")
     polling_fallback: PollingFallbackConfig = Field(default_factory=PollingFallbackConfig, description="Polling fallback configuration")
     
     @validator('thread_priority')
@@ -243,6 +242,11 @@ class InitializationConfig(BaseModel):
     verification_level: str = Field(default=INITIALIZATION_DEFAULTS["verification_level"], description="Level of verification during initialization ('minimal', 'normal', 'thorough')")
     startup_mode: str = Field(default=INITIALIZATION_DEFAULTS["startup_mode"], description="System startup mode ('normal', 'maintenance', 'recovery', 'minimal')")
     watchdog_timeout: int = Field(default=INITIALIZATION_DEFAULTS["watchdog_timeout"], ge=5, le=300, description="Timeout in seconds for the initialization watchdog")
+    parallel: bool = Field(default=INITIALIZATION_DEFAULTS["parallel"], description="Initialize components that do not depend on each other concurrently, one dependency level at a time")
+    max_workers: int = Field(default=INITIALIZATION_DEFAULTS["max_workers"], ge=1, le=32, description="Components initialized at once in parallel mode")
+    level_timeout_seconds: int = Field(default=INITIALIZATION_DEFAULTS["level_timeout_seconds"], ge=1, le=600, description="Maximum time to initialize one dependency level in parallel mode")
+    deferred_start: bool = Field(default=INITIALIZATION_DEFAULTS["deferred_start"], description="Initialize deferrable components in the background once the critical components are ready")
+    component_wait_timeout_seconds: int = Field(default=INITIALIZATION_DEFAULTS["component_wait_timeout_seconds"], ge=0, le=600, description="Maximum time a request waits for a component still initializing in the background")
 
     @validator('verification_level')
     def validate_verification_level(cls, v):
@@ -347,11 +351,17 @@ class AppConfig(BaseModel):
 
 # --- AWS Configuration ---
 
+class RuntimePoolConfig(BaseModel):
+    """Configuration for the shared Bedrock runtime client pool."""
+    max_pool_connections: Optional[int] = Field(default=AWS_DEFAULTS["runtime_pool"]["max_pool_connections"], ge=1, le=256, description="Connections per Bedrock runtime client (defaults to llm_coordinator.max_parallel_jobs)")
+    prewarm_connections: int = Field(default=AWS_DEFAULTS["runtime_pool"]["prewarm_connections"], ge=0, le=64, description="Connections opened per region at component start (0 disables pre-warming)")
+
 class AWSConfig(BaseModel):
     """Configuration for AWS services."""
     region: Optional[str] = Field(default=AWS_DEFAULTS["region"], description="AWS region for API calls")
     endpoint_url: Optional[str] = Field(default=AWS_DEFAULTS["endpoint_url"], description="Optional custom endpoint URL for AWS services")
     credentials_profile: Optional[str] = Field(default=AWS_DEFAULTS["credentials_profile"], description="AWS credentials profile name")
+    runtime_pool: RuntimePoolConfig = Field(default_factory=RuntimePoolConfig, description="Shared Bedrock runtime client pool settings")
 
 # --- File Access Configuration ---
 
@@ -393,6 +403,15 @@ class MCPServerConfig(BaseModel):
     keep_alive: int = Field(default=MCP_SERVER_DEFAULTS["keep_alive"], ge=1, le=30, description="Keep-alive timeout in seconds")
     graceful_shutdown_timeout: int = Field(default=MCP_SERVER_DEFAULTS["graceful_shutdown_timeout"], ge=1, le=60, description="Graceful shutdown timeout in seconds")
     
+    # Tool execution pools
+    tool_thread_workers: int = Field(default=MCP_SERVER_DEFAULTS["tool_thread_workers"], ge=1, le=64, description="Threads running tools with the thread execution policy")
+    tool_process_workers: int = Field(default=MCP_SERVER_DEFAULTS["tool_process_workers"], ge=1, le=32, description="Processes running tools with the process execution policy")
+    tool_executor_queue_size: int = Field(default=MCP_SERVER_DEFAULTS["tool_executor_queue_size"], ge=0, le=4096, description="Tool calls admitted per execution pool beyond its workers before calls are rejected")
+    
+    # Result cache
+    result_cache_max_entries: int = Field(default=MCP_SERVER_DEFAULTS["result_cache_max_entries"], ge=0, le=65536, description="Cached results of cacheable tools and resources per server process, 0 disables the cache")
+    result_cache_ttl_seconds: int = Field(default=MCP_SERVER_DEFAULTS["result_cache_ttl_seconds"], ge=0, le=86400, description="Default time-to-live of cached results in seconds, 0 keeps them until evicted or invalidated")
+    
     # Capability negotiation settings
     require_negotiation: bool = Field(default=MCP_SERVER_DEFAULTS["require_negotiation"], description="Whether to require capability negotiation for all requests")
     session_timeout_seconds: int = Field(default=MCP_SERVER_DEFAULTS["session_timeout_seconds"], ge=300, le=86400, description="Session timeout in seconds")
@@ -424,6 +443,22 @@ class CLIConfig(BaseModel):
             # Raise exception instead of providing fallback
             raise ValueError(f"Invalid cache directory path: {v}")
 
+class WatchdogConfig(BaseModel):
+    """Runtime watchdog settings."""
+    enabled: bool = Field(default=WATCHDOG_DEFAULTS["enabled"], description="Monitor subsystem heartbeats while the server runs")
+    check_interval_seconds: float = Field(default=WATCHDOG_DEFAULTS["check_interval_seconds"], ge=0.1, le=60, description="Seconds between heartbeat checks")
+    escalation_misses: int = Field(default=WATCHDOG_DEFAULTS["escalation_misses"], ge=1, le=100, description="Consecutive missed checks of a subsystem before collecting diagnostics")
+    diagnostics_cooldown_seconds: int = Field(default=WATCHDOG_DEFAULTS["diagnostics_cooldown_seconds"], ge=0, le=86400, description="Minimum seconds between two diagnostics")
+    stack_samples: int = Field(default=WATCHDOG_DEFAULTS["stack_samples"], ge=1, le=20, description="Stack samples taken per diagnostics")
+    diagnostics_dir: str = Field(default=WATCHDOG_DEFAULTS["diagnostics_dir"], description="Directory of diagnostics files, empty to log them")
+    event_loop_stall_seconds: float = Field(default=WATCHDOG_DEFAULTS["event_loop_stall_seconds"], ge=0.1, le=600, description="Event loop lag reported as a stall")
+
+class ProfilerConfig(BaseModel):
+    """On-demand sampling profiler settings."""
+    output_dir: str = Field(default=PROFILER_DEFAULTS["output_dir"], description="Directory of collapsed-stack profile files")
+    sample_interval_ms: int = Field(default=PROFILER_DEFAULTS["sample_interval_ms"], ge=1, le=1000, description="Milliseconds between two stack samples")
+    max_duration_seconds: int = Field(default=PROFILER_DEFAULTS["max_duration_seconds"], ge=1, le=86400, description="Longest profile a trigger may request")
+
 class ComponentEnabledConfig(BaseModel):
     """Configuration for enabling/disabling individual components."""
     config_manager: bool = Field(default=COMPONENT_ENABLED_DEFAULTS["config_manager"], description="Enable configuration manager component")
@@ -444,6 +479,8 @@ class AppConfig(BaseModel):
     fs_monitor: FSMonitorConfig = Field(default_factory=FSMonitorConfig, description="File system monitoring settings")
     database: DatabaseConfig = Field(default_factory=DatabaseConfig, description="Database settings")
     initialization: InitializationConfig = Field(default_factory=InitializationConfig, description="Initialization settings")
+    watchdog: WatchdogConfig = Field(default_factory=WatchdogConfig, description="Runtime watchdog settings")
+    profiler: ProfilerConfig = Field(default_factory=ProfilerConfig, description="On-demand sampling profiler settings")
     llm_coordinator: LLMCoordinatorConfig = Field(default_factory=LLMCoordinatorConfig, description="LLM Coordinator settings")
     internal_tools: InternalToolsConfig = Field(default_factory=InternalToolsConfig, description="Internal LLM Tools settings")
     file_access: FileAccessConfig = Field(default_factory=FileAccessConfig, description="File Access settings")
@@ -35,33 +35,22 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
-# 2025-05-02T01:20:50Z : Removed scheduler implementation by CodeAssistant
-# * Removed scheduler component implementation (directory and files)
-# * Maintained scheduler configuration settings for documentation purposes
-# 2025-05-02T01:11:50Z : Removed METADATA_EXTRACTION_DEFAULTS by CodeAssistant
-# * Removed metadata extraction component configuration as part of component removal
-# 2025-05-02T00:29:00Z : Removed CONSISTENCY_ANALYSIS_DEFAULTS dictionary by CodeAssistant
-# * Removed consistency_analysis component configuration as part of component removal
-# 2025-04-25T17:33:00Z : Changed MCP server default host from 0.0.0.0 to 127.0.0.1 by CodeAssistant
-# * Fixed security issue by changing default host binding from all interfaces to localhost only
-# * Aligned implementation with security requirements specified in doc/SECURITY.md
-# 2025-04-25T14:41:38Z : Removed unused fallback values by CodeAssistant
-# * Removed fallback_path from DATABASE_DEFAULTS
-# * Removed fallback_format and fallback_verbosity from CLI_OUTPUT_DEFAULTS
-# * Removed fallback_path from CLI_HISTORY_DEFAULTS
-# * Removed cache_fallback_dir from CLI_DEFAULTS
-# 2025-04-25T11:42:23Z : Removed COMPONENT_DEFAULT_FACTORIES dictionary by CodeAssistant
-# * Removed unused COMPONENT_DEFAULT_FACTORIES dictionary following design decision clarification
-# * The design decision now explicitly applies only to Field default parameter
-# 2025-04-17T15:16:00Z : Reorganized configuration structure for clarity by CodeAssistant
-# * Renamed SERVER_DEFAULTS to CLI_SERVER_CONNECTION_DEFAULTS
-# * Renamed OUTPUT_DEFAULTS to CLI_OUTPUT_DEFAULTS
-# * Renamed HISTORY_DEFAULTS to CLI_HISTORY_DEFAULTS
-# * Updated COORDINATOR_LLM_DEFAULTS to reference Nova Lite model
-# * Grouped all CLI-related defaults at the end of file
-# 2025-04-17T14:46:00Z : Added CLI-specific settings to defaults by CodeAssistant
-# * Increased server timeout from 5 to 30 seconds for CLI compatibility
-# * Added CLI specific settings for output formatting and progress display
+# 2026-10-19T00:10:00Z : Added fs_monitor slow listener isolation defaults by CodeAssistant
+# * Added slow_listener_p95_ms and isolated_thread_count to MONITOR_DEFAULTS
+# 2026-10-18T23:10:00Z : Added profiler defaults by CodeAssistant
+# * Added PROFILER_DEFAULTS
+# 2026-10-18T22:10:00Z : Added runtime watchdog defaults by CodeAssistant
+# * Added WATCHDOG_DEFAULTS
+# 2026-10-18T20:40:00Z : Added deferred initialization defaults by CodeAssistant
+# * Added initialization deferred_start and component_wait_timeout_seconds
+# 2026-10-18T20:10:00Z : Added parallel initialization defaults by CodeAssistant
+# * Added initialization parallel, max_workers and level_timeout_seconds
+# 2026-10-18T18:00:00Z : Added result cache defaults by CodeAssistant
+# * Added mcp_server result_cache_max_entries and result_cache_ttl_seconds
+# 2026-10-18T17:20:00Z : Added tool execution pool defaults by CodeAssistant
+# * Added mcp_server tool_thread_workers, tool_process_workers and tool_executor_queue_size
+# 2026-10-18T09:05:00Z : Added Bedrock runtime pool defaults by CodeAssistant
+# * Added AWS_DEFAULTS runtime_pool settings for pool size and pre-warming
 ###############################################################################
 
 """
@@ -117,6 +106,8 @@ MONITOR_DEFAULTS = {
     "thread_count": 1,
     "thread_priority": "normal",
     "default_debounce_ms": 100,
+    "slow_listener_p95_ms": 500,
+    "isolated_thread_count": 1,
     "polling_fallback": {
         "enabled": True,
         "poll_interval": 1.0,
@@ -147,6 +138,29 @@ INITIALIZATION_DEFAULTS = {
     "verification_level": "normal",
     "startup_mode": "normal",
     "watchdog_timeout": 20,  # Timeout in seconds for the initialization watchdog
+    "parallel": False,  # Initialize independent components concurrently, level by level
+    "max_workers": 4,  # Components initialized at once in parallel mode
+    "level_timeout_seconds": 120,  # Maximum time to initialize one dependency level in parallel mode
+    "deferred_start": True,  # Initialize deferrable components in the background after startup
+    "component_wait_timeout_seconds": 30,  # Maximum wait of a request for a component warming up
+}
+
+# Runtime watchdog settings
+WATCHDOG_DEFAULTS = {
+    "enabled": True,  # Monitor subsystem heartbeats while the server runs
+    "check_interval_seconds": 1.0,  # Seconds between heartbeat checks
+    "escalation_misses": 3,  # Consecutive missed checks before collecting diagnostics
+    "diagnostics_cooldown_seconds": 300,  # Minimum seconds between two diagnostics
+    "stack_samples": 3,  # Stack samples taken per diagnostics
+    "diagnostics_dir": "${general.base_dir}/diagnostics",  # Directory of diagnostics files
+    "event_loop_stall_seconds": 2.0,  # Event loop lag reported as a stall
+}
+
+# On-demand sampling profiler settings
+PROFILER_DEFAULTS = {
+    "output_dir": "${general.base_dir}/profiles",  # Directory of collapsed-stack profile files
+    "sample_interval_ms": 5,  # Milliseconds between two stack samples
+    "max_duration_seconds": 600,  # Longest profile a trigger may request
 }
 
 # LLM Coordinator settings - Coordinator LLM
@@ -205,6 +219,13 @@ MCP_SERVER_DEFAULTS = {
     "cors_allow_credentials": False,
     "keep_alive": 5,
     "graceful_shutdown_timeout": 10,
+    # Tool execution pools (tools declaring the thread or process execution policy)
+    "tool_thread_workers": 8,
+    "tool_process_workers": 2,
+    "tool_executor_queue_size": 64,
+    # Result cache of cacheable tools and resources (0 entries disables it, 0 TTL: no expiry)
+    "result_cache_max_entries": 1024,
+    "result_cache_ttl_seconds": 300,
     # Capability negotiation settings
     "require_negotiation": False,  # Whether to require capability negotiation for all requests
     "session_timeout_seconds": 3600,  # Session timeout in seconds (1 hour)
@@ -222,6 +243,11 @@ AWS_DEFAULTS = {
     "region": "us-east-1",
     "endpoint_url": None,
     "credentials_profile": None,
+    # Shared Bedrock runtime clients used for all model invocations
+    "runtime_pool": {
+        "max_pool_connections": None,  # None follows llm_coordinator.max_parallel_jobs
+        "prewarm_connections": 2,      # Connections opened per region at component start (0 disables)
+    },
 }
 
 # Bedrock settings
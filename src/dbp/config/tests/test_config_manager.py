@@ -0,0 +1,114 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for template variable resolution and the resolved configuration
+# snapshot of ConfigurationManager.
+###############################################################################
+# [Source file design principles]
+# - Each test starts from a fresh singleton
+# - Configuration files and the snapshot live in the test's temporary directory
+###############################################################################
+# [Source file constraints]
+# - System and user configuration files of the machine are never read
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/config/config_manager.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T21:10:00Z : Created ConfigurationManager tests by CodeAssistant
+# * Added template resolution and configuration snapshot tests
+###############################################################################
+
+"""
+Tests for ConfigurationManager template resolution and snapshot.
+"""
+
+import json
+import os
+
+import pytest
+
+from .. import config_manager
+from ..config_manager import ConfigurationManager
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ConfigurationManager, "_instance", None)
+    monkeypatch.setattr(ConfigurationManager, "snapshot_file", tmp_path / "snapshot.json")
+    monkeypatch.setattr(config_manager, "STANDARD_CONFIG_PATHS", [tmp_path / "config.json"])
+    for key in [key for key in os.environ if key.startswith("DBP_")]:
+        monkeypatch.delenv(key)
+    return tmp_path
+
+
+def write_config(path, data):
+    path.write_text(json.dumps(data))
+
+
+def test_chained_templates_resolve_against_overrides(config_dir):
+    write_config(config_dir / "config.json", {"mcp_server": {"logs_dir": "${database.path}.logs"}})
+    manager = ConfigurationManager()
+    manager.initialize(["--general.base_dir=/srv/dbp"])
+
+    config = manager.get_typed_config()
+    assert config.database.path == "/srv/dbp/database.sqlite"
+    assert config.mcp_server.logs_dir == "/srv/dbp/database.sqlite.logs"
+    assert config.mcp_server.pid_file == "/srv/dbp/mcp_server.pid"
+
+
+def test_circular_templates_are_left_unresolved(config_dir, caplog):
+    write_config(config_dir / "config.json", {
+        "mcp_server": {"logs_dir": "${mcp_server.pid_file}", "pid_file": "${mcp_server.logs_dir}"},
+    })
+    manager = ConfigurationManager()
+    manager.initialize([])
+
+    assert manager.get_typed_config().mcp_server.logs_dir == "${mcp_server.pid_file}"
+    assert "Circular template references" in caplog.text
+
+
+def test_snapshot_is_reused_until_a_source_changes(config_dir, monkeypatch):
+    config_file = config_dir / "config.json"
+    write_config(config_file, {"general": {"base_dir": "/srv/one"}})
+    ConfigurationManager().initialize([])
+    assert (config_dir / "snapshot.json").exists()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("configuration file read despite the snapshot")
+
+    monkeypatch.setattr(ConfigurationManager, "_instance", None)
+    with monkeypatch.context() as m:
+        m.setattr(ConfigurationManager, "_load_config_file_content", fail)
+        manager = ConfigurationManager()
+        manager.initialize([])
+    assert manager.get_typed_config().database.path == "/srv/one/database.sqlite"
+
+    # Modified file
+    write_config(config_file, {"general": {"base_dir": "/srv/two-two"}})
+    monkeypatch.setattr(ConfigurationManager, "_instance", None)
+    manager = ConfigurationManager()
+    manager.initialize([])
+    assert manager.get_typed_config().database.path == "/srv/two-two/database.sqlite"
+
+    # Changed environment
+    reads = []
+    load_config_file_content = ConfigurationManager._load_config_file_content
+    monkeypatch.setattr(ConfigurationManager, "_load_config_file_content",
+                        lambda self, path: reads.append(path) or load_config_file_content(self, path))
+    monkeypatch.setenv("DBP_SERVER_TIMEOUT", "45")
+    monkeypatch.setattr(ConfigurationManager, "_instance", None)
+    ConfigurationManager().initialize([])
+    assert reads == [config_file]
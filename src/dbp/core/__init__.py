@@ -28,6 +28,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Exported logging pipeline helpers by CodeAssistant
+# * Exported RateLimitFilter and stop_application_logging
 # 2025-04-17T17:02:45Z : Added logging utility exports by CodeAssistant
 # * Imported MillisecondFormatter and logging utilities from log_utils module
 # * Added them to __all__ to expose them to other modules
@@ -56,9 +58,11 @@ from .system import ComponentSystem
 from .lifecycle import LifecycleManager
 from .log_utils import (
     MillisecondFormatter,
+    RateLimitFilter,
     configure_logger, 
     get_formatted_logger,
     setup_application_logging,
+    stop_application_logging,
 )
 
 __all__ = [
@@ -67,7 +71,9 @@ __all__ = [
     "ComponentSystem",
     "LifecycleManager",
     "MillisecondFormatter",
+    "RateLimitFilter",
     "configure_logger",
     "get_formatted_logger",
     "setup_application_logging",
+    "stop_application_logging",
 ]
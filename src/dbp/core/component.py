@@ -28,12 +28,16 @@
 # - Must provide clear indication of initialization status
 # - Must not introduce complexity in dependency declaration
 # - Requires components to set _initialized flag properly
+# - Deferrable components may finish initializing after the system is started
 ###############################################################################
 # [Dependencies]
 # codebase:- doc/DESIGN.md
 # codebase:- doc/design/COMPONENT_INITIALIZATION.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T20:40:00Z : Added readiness tiers by CodeAssistant
+# * Added Component.deferrable class attribute declaring components initialized in the background
+# * Added InitializationContext.wait_for_component() for components still warming up
 # 2025-04-20T00:35:54Z : Removed deprecated dependencies property by CodeAssistant
 # * Removed dependencies property as part of Phase 3 cleanup
 # * Updated get_debug_info to remove reference to dependencies
@@ -47,11 +51,6 @@
 # * Updated initialize() method signature to use typed InitializationContext parameter
 # * Enhanced Component documentation to reflect strong typing support
 # * Improved method signature for better IDE support and type checking
-# 2025-04-17T23:10:30Z : Enhanced InitializationContext with typed configuration by CodeAssistant
-# * Added typed_config field to provide access to strongly-typed configuration
-# * Added get_typed_config() method for type-safe configuration access
-# * Improved documentation with more detailed function intent and design principles
-# * Added forward references for proper type annotations
 ###############################################################################
 
 import logging
@@ -109,6 +108,29 @@ class InitializationContext:
         system = ComponentSystem.get_instance()
         return system.get_component(name) if system else None
     
+    def wait_for_component(self, name: str, timeout: Optional[float] = None) -> Any:
+        """
+        [Function intent]
+        Provides access to a component that may still be initializing in the
+        background, waiting for it to become ready.
+        
+        [Implementation details]
+        Delegates to ComponentSystem.wait_for_component().
+        
+        [Design principles]
+        Lazy access to deferred components without declaring them as dependencies.
+        
+        Args:
+            name: Name of the component to retrieve
+            timeout: Maximum wait in seconds, None for the configured default
+            
+        Returns:
+            The requested component instance or None if no system is running
+        """
+        from .system import ComponentSystem
+        system = ComponentSystem.get_instance()
+        return system.wait_for_component(name, timeout) if system else None
+    
     def get_typed_config(self) -> 'AppConfig':
         """
         [Function intent]
@@ -154,6 +176,11 @@ class Component:
     Strong typing for component initialization.
     """
     
+    # Components that are slow to start and not needed to accept the first
+    # requests set this to True: they are initialized in the background after
+    # the critical components, unless a critical component depends on them
+    deferrable: bool = False
+    
     def __init__(self):
         """
         [Function intent]
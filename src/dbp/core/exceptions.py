@@ -36,6 +36,8 @@
 # codebase:- doc/design/COMPONENT_INITIALIZATION.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T20:40:00Z : Added ComponentNotReadyError by CodeAssistant
+# * Added ComponentNotReadyError for components still initializing in the background after a wait timeout
 # 2025-04-26T01:45:00Z : Added DBPBaseException and updated inheritance hierarchy by CodeAssistant
 # * Added DBPBaseException as the root exception class for all system exceptions
 # * Updated ComponentError to inherit from DBPBaseException instead of Exception
@@ -162,6 +164,37 @@ class ComponentNotInitializedError(ComponentError):
         super().__init__("Component not initialized", component_name)
 
 
+class ComponentNotReadyError(ComponentError):
+    """
+    [Class intent]
+    Exception raised when a component initializing in the background is not
+    ready within the time a caller is willing to wait for it.
+    
+    [Implementation details]
+    Provides a clear error message including the time waited.
+    
+    [Design principles]
+    Specific exception type distinguishing a slow component from a missing one.
+    """
+    def __init__(self, component_name: str, timeout: float):
+        """
+        [Function intent]
+        Initializes the ComponentNotReadyError with a component name and wait time.
+        
+        [Implementation details]
+        Creates a standardized error message for components still warming up.
+        
+        [Design principles]
+        Clear, descriptive error messaging with consistent format.
+        
+        Args:
+            component_name: Name of the component that is not ready
+            timeout: Time waited for the component in seconds
+        """
+        super().__init__(f"Component not ready after waiting {timeout}s", component_name)
+        self.timeout = timeout
+
+
 class CircularDependencyError(ComponentError):
     """
     [Class intent]
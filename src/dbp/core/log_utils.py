@@ -20,6 +20,10 @@
 # - Single Responsibility: Focused only on logging-related utilities
 # - Consistent Formatting: Provides standard formatters for unified log appearance
 # - Reusability: Utilities can be imported by any component requiring logging
+# - Non-blocking Output: Records are written by a listener thread, off the
+#   request and event threads
+# - Bounded Volume: High-frequency debug/info messages are rate limited per
+#   logger and message template; warnings and errors are never dropped
 # - Design Decision: Centralized Logging Formatters (2025-04-17)
 #   * Rationale: Ensures consistent log formatting across all components
 #   * Alternatives considered: Per-component formatters (rejected due to inconsistency)
@@ -33,6 +37,12 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T02:00:00Z : Kept one rate limit filter per handler by CodeAssistant
+# * setup_application_logging removes the RateLimitFilter of a previous setup from the reused queue handler
+# 2026-10-18T21:40:00Z : Added asynchronous logging pipeline and rate limiting by CodeAssistant
+# * Root logger enqueues records, a QueueListener thread writes them to the console and file handlers
+# * Added RateLimitFilter with per-logger token buckets for high-frequency messages
+# * Added stop_application_logging, registered with atexit, and listener restart after fork
 # 2025-04-18T13:54:00Z : Fixed log level name truncation by CodeAssistant
 # * Added width specifier to level name format to prevent truncation 
 # * Changed '%(levelname)s' to '%(levelname)-8s' to ensure complete level names display
@@ -41,23 +51,31 @@
 # * Added explicit root logger configuration with basicConfig
 # * Added handler cleanup to prevent inconsistent formats
 # * Ensured standardized logging format: 2025-04-17 17:24:30,221 - dbp.core.lifecycle - <LOGLEVEL> - <message>
-# 2025-04-17T17:18:15Z : Added centralized setup_application_logging function by CodeAssistant
-# * Implemented single function to configure application-wide logging
-# * Added support for both console and file logging with rotation
-# * Ensured consistent log formatting across all system components
-# 2025-04-17T17:09:30Z : Enhanced MillisecondFormatter to remove duplicate level prefixes by CodeAssistant
-# * Added format method override to strip redundant "Error:" prefixes from messages
-# * Added support for all log levels and case variants in prefix detection
 ###############################################################################
 
+import atexit
 import logging
+import queue
+import threading
 import time
 import sys
 import os
-from logging.handlers import RotatingFileHandler
-from typing import Optional, List
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 
+# Rate limits of high-frequency loggers: logger name prefix -> (messages per
+# second, burst), applied per message template to records below WARNING
+DEFAULT_RATE_LIMITS: Dict[str, Tuple[float, int]] = {
+    "dbp.fs_monitor": (20.0, 100),
+    "dbp.database.repositories": (50.0, 200),
+    "dbp.mcp_server.auth": (10.0, 50),
+}
+
+# Listener writing the records queued by setup_application_logging()
+_queue_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
 class MillisecondFormatter(logging.Formatter):
     """
     [Class intent]
@@ -113,6 +131,79 @@ class MillisecondFormatter(logging.Formatter):
             
         return formatted_message
 
+class RateLimitFilter(logging.Filter):
+    """
+    [Class intent]
+    Drops the excess of high-frequency log messages so that a burst of events
+    cannot saturate the log output.
+    
+    [Implementation details]
+    One token bucket per (logger name, message template), configured by the
+    longest logger name prefix found in the limits. Records at or above
+    WARNING always pass. The first record let through after drops carries the
+    count of suppressed similar messages.
+    
+    [Design principles]
+    Lazy %-style templates identify a message independently of its arguments.
+    Filtering happens before formatting, dropped records cost no formatting.
+    Never hides warnings and errors.
+    """
+    MAX_BUCKETS = 10000
+    
+    def __init__(self, limits: Dict[str, Tuple[float, int]], max_level: int = logging.INFO):
+        """
+        [Function intent]
+        Creates the filter.
+        
+        Args:
+            limits: Logger name prefix -> (messages per second, burst)
+            max_level: Highest level subject to rate limiting
+        """
+        super().__init__()
+        self.limits = dict(limits)
+        self.max_level = max_level
+        self._limit_by_logger: Dict[str, Optional[Tuple[float, int]]] = {}
+        self._buckets: Dict[Tuple[str, str], List[float]] = {}
+        self._lock = threading.Lock()
+    
+    def _limit_for(self, name: str) -> Optional[Tuple[float, int]]:
+        """
+        [Function intent]
+        Finds the limit of a logger from its longest configured name prefix.
+        """
+        if name not in self._limit_by_logger:
+            prefixes = [p for p in self.limits if name == p or name.startswith(p + ".")]
+            self._limit_by_logger[name] = self.limits[max(prefixes, key=len)] if prefixes else None
+        return self._limit_by_logger[name]
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        limit = self._limit_for(record.name)
+        if limit is None:
+            return True
+        rate, burst = limit
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                if len(self._buckets) >= self.MAX_BUCKETS:
+                    self._buckets.clear()
+                # [tokens, last refill time, suppressed count]
+                bucket = self._buckets[key] = [float(burst), now, 0]
+            bucket[0] = min(float(burst), bucket[0] + (now - bucket[1]) * rate)
+            bucket[1] = now
+            if bucket[0] < 1.0:
+                bucket[2] += 1
+                return False
+            bucket[0] -= 1.0
+            suppressed, bucket[2] = bucket[2], 0
+        if suppressed:
+            record.msg = f"{record.getMessage()} ({suppressed} similar messages suppressed)"
+            record.args = None
+        return True
+
 def configure_logger(logger: logging.Logger, level: Optional[int] = None, 
                     add_formatter: bool = True) -> logging.Logger:
     """
@@ -173,7 +264,9 @@ def get_formatted_logger(name: str, level: Optional[int] = None) -> logging.Logg
     logger = logging.getLogger(name)
     return configure_logger(logger, level)
 
-def setup_application_logging(log_level: str = "INFO", log_file: Optional[Path] = None) -> None:
+def setup_application_logging(log_level: str = "INFO", log_file: Optional[Path] = None,
+                              asynchronous: bool = True,
+                              rate_limits: Optional[Dict[str, Tuple[float, int]]] = None) -> None:
     """
     [Function intent]
     Sets up consistent application-wide logging configuration.
@@ -184,15 +277,24 @@ def setup_application_logging(log_level: str = "INFO", log_file: Optional[Path]
     Configures the root logger with our custom MillisecondFormatter.
     Handles console output and optional file logging with rotation.
     Ensures that all logging, including from the 'root' logger, uses the standardized format.
+    When asynchronous, the root logger only enqueues records: a QueueListener
+    thread formats and writes them to the console and file handlers.
     
     [Design principles]
     Provides a single point of configuration for all application logging.
     Ensures consistent formatting and behavior across all components.
+    Logging threads never wait on console or file I/O.
     
     Args:
         log_level: Logging level as string (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional path to log file for persistent logging
+        asynchronous: Whether to write records from a background listener thread
+        rate_limits: Logger name prefix -> (messages per second, burst),
+            None for DEFAULT_RATE_LIMITS, empty to disable rate limiting
     """
+    # Stop the listener of a previous setup, writing its pending records
+    stop_application_logging()
+    
     # Reset any existing logging configuration to avoid format inconsistencies
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
@@ -245,7 +347,80 @@ def setup_application_logging(log_level: str = "INFO", log_file: Optional[Path]
     root_logger.setLevel(numeric_level)
     for handler in handlers:
         handler.setFormatter(formatter)
+    
+    if asynchronous:
+        _start_queue_listener(handlers)
+        handlers = [_queue_handler]
+    if rate_limits is None:
+        rate_limits = DEFAULT_RATE_LIMITS
+    for handler in handlers:
+        # The queue handler is reused across setups: drop the filter of a
+        # previous setup, which would otherwise apply its limits on top
+        for existing in [f for f in handler.filters if isinstance(f, RateLimitFilter)]:
+            handler.removeFilter(existing)
+        # Each handler counts its own records: a shared filter would let
+        # a record consume one token per handler
+        if rate_limits:
+            handler.addFilter(RateLimitFilter(rate_limits))
         root_logger.addHandler(handler)
     
     # Log successful setup
-    logging.debug(f"Application logging initialized at level {log_level} with consistent formatting")
+    logging.debug("Application logging initialized at level %s with consistent formatting", log_level)
+
+def _start_queue_listener(handlers: List[logging.Handler]) -> None:
+    """
+    [Function intent]
+    Starts the listener thread writing queued records to the given handlers
+    and creates the handler enqueuing them.
+    
+    [Implementation details]
+    The queue is unbounded: enqueuing never blocks the logging thread.
+    QueueHandler interpolates the message in the logging thread, so records
+    never reference mutable arguments once queued.
+    """
+    global _queue_listener, _queue_handler
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _queue_listener.start()
+    if _queue_handler is None:
+        _queue_handler = QueueHandler(log_queue)
+    else:
+        _queue_handler.queue = log_queue
+
+def stop_application_logging() -> None:
+    """
+    [Function intent]
+    Writes the pending log records and stops the listener thread of the
+    asynchronous pipeline.
+    
+    [Implementation details]
+    Registered with atexit. Must also be called before os._exit(), which
+    skips atexit handlers. Records logged afterwards stay queued until
+    setup_application_logging() is called again.
+    """
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+
+def _restart_listener_after_fork() -> None:
+    """
+    [Function intent]
+    Restarts the listener in a forked child, which inherits the queue but not
+    the thread consuming it.
+    
+    [Implementation details]
+    A new queue replaces the inherited one: the records pending at fork time
+    belong to the parent, which writes them.
+    """
+    global _queue_listener
+    if _queue_listener is not None:
+        handlers = _queue_listener.handlers
+        _queue_listener = None
+        _start_queue_listener(list(handlers))
+
+atexit.register(stop_application_logging)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
@@ -0,0 +1,531 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides the in-process instrumentation of the DBP system: counters, gauges
+# and histograms recorded on the hot paths (file system events, dispatch
+# queues, database sessions, Bedrock calls, prompt cache, event loop) and
+# rendered in the Prometheus text exposition format.
+###############################################################################
+# [Source file design principles]
+# - Cheap enough to leave on in production: recording is a dictionary lookup
+#   and a few additions, no lock is taken
+# - Each thread records into its own shard, shards are summed at scrape time
+# - Queue depths are callback gauges, evaluated only when scraped
+# - No dependency on a metrics client library
+###############################################################################
+# [Source file constraints]
+# - Must not depend on other DBP components to avoid circular dependencies
+# - Lock-free recording relies on the GIL: a shard is only written by the
+#   thread owning it, and readers tolerate values one update behind
+# - Label sets must stay small (model IDs, event types), never paths or IDs
+###############################################################################
+# [Dependencies]
+# system:bisect
+# system:os
+# system:threading
+# system:time
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T05:30:00Z : Recorded ToolRegistry latencies in the registry by CodeAssistant
+# * Added Histogram.summary with bucket percentiles
+# * Declared the LLM tool overhead and work histograms
+# 2026-10-19T02:10:00Z : Added metric snapshots for multi-process servers by CodeAssistant
+# * Added MetricsRegistry.collect and render_families merging the snapshots of several processes under a process label
+# * Reset the registry in forked children
+# * Declared the MCP tool queue time and run time histograms
+# 2026-10-19T00:10:00Z : Added fs_monitor listener timing metrics by CodeAssistant
+# * Declared the per-listener queue time and handler time histograms of the dispatch thread pool
+# 2026-10-18T22:40:00Z : Initial implementation by CodeAssistant
+# * Added lock-free counters, gauges and histograms with Prometheus text rendering
+# * Declared the metrics of the fs_monitor, database, Bedrock, prompt cache and event loop hot paths
+###############################################################################
+
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Picklable snapshot of one metric: name, type, help text and its samples as
+# (sample name, formatted labels, value), exchanged between server processes
+MetricFamily = Tuple[str, str, str, List[Tuple[str, str, float]]]
+
+# Latency buckets in seconds, from sub-millisecond waits to long model calls
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{value}"' for name, value in extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Shards:
+    """
+    [Class intent]
+    Per-thread storage of the values of one metric child.
+
+    [Implementation details]
+    Shards are lists keyed by thread ident. A thread creates its shard on
+    first use with a single dictionary assignment, atomic under the GIL, and
+    is the only writer of it afterwards. A thread reusing the ident of an
+    exited thread continues its shard, so no update is ever lost.
+    """
+
+    __slots__ = ("_size", "_shards")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._shards: Dict[int, List[float]] = {}
+
+    def local(self) -> List[float]:
+        shard = self._shards.get(threading.get_ident())
+        if shard is None:
+            shard = self._shards[threading.get_ident()] = [0] * self._size
+        return shard
+
+    def total(self) -> List[float]:
+        totals = [0] * self._size
+        for shard in list(self._shards.values()):
+            for index, value in enumerate(shard):
+                totals[index] += value
+        return totals
+
+
+class _Metric:
+    """
+    [Class intent]
+    Base of the metric types: name, help text, label names and labelled
+    children.
+
+    [Implementation details]
+    A metric without label names is its own only child. Children are cached
+    by label values; the lock is only taken to create a new child.
+    """
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "_Metric"] = {}
+        self._children_lock = threading.Lock()
+        self._labelvalues: Tuple[str, ...] = ()
+        self._sample_labelnames = self.labelnames
+
+    def labels(self, *values, **kwargs) -> "_Metric":
+        """
+        [Function intent]
+        Get the child of this metric recording under the given label values.
+
+        Returns:
+            Metric child with the same recording methods as this metric
+
+        Raises:
+            ValueError: If the label values do not match the label names
+        """
+        if kwargs:
+            try:
+                values = tuple(str(kwargs.pop(name)) for name in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"Missing label {e} for metric {self.name}")
+            if kwargs:
+                raise ValueError(f"Unknown labels {sorted(kwargs)} for metric {self.name}")
+        else:
+            values = tuple(str(value) for value in values)
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"Metric {self.name} expects labels {self.labelnames}")
+            with self._children_lock:
+                child = self._children.get(values)
+                if child is None:
+                    child = self._new_child()
+                    child._labelvalues = values
+                    child._sample_labelnames = self.labelnames
+                    self._children[values] = child
+        return child
+
+    def _new_child(self) -> "_Metric":
+        raise NotImplementedError
+
+    def _samples(self) -> Iterator[Tuple[str, str, float]]:
+        raise NotImplementedError
+
+    def _reset(self) -> None:
+        raise NotImplementedError
+
+    def _iter_children(self) -> List["_Metric"]:
+        return [self] if not self.labelnames else list(self._children.values())
+
+    def collect(self) -> List[Tuple[str, str, float]]:
+        """
+        [Function intent]
+        Collect the current samples of the metric and its children.
+
+        Returns:
+            List of (sample name, formatted labels, value)
+        """
+        samples = []
+        for child in self._iter_children():
+            samples.extend(child._samples())
+        return samples
+
+
+class Counter(_Metric):
+    """
+    [Class intent]
+    Monotonically increasing count, e.g. events seen or tokens consumed.
+    """
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        [Function intent]
+        Increase the counter by amount, which must not be negative.
+        """
+        self._shards.local()[0] += amount
+
+    def get(self) -> float:
+        return self._shards.total()[0]
+
+    def _new_child(self) -> "Counter":
+        return Counter(self.name, self.documentation)
+
+    def _reset(self) -> None:
+        self._shards = _Shards(1)
+
+    def _samples(self):
+        yield self.name + "_total", _format_labels(self._sample_labelnames, self._labelvalues), self.get()
+
+
+class Gauge(_Metric):
+    """
+    [Class intent]
+    Value that goes up and down, set directly or read from a callback when
+    scraped, e.g. the depth of a queue.
+
+    [Implementation details]
+    set() is a single attribute assignment. A callback gauge does no work
+    between scrapes; a failing callback drops its sample from the scrape.
+    """
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def set_function(self, function: Optional[Callable[[], float]]) -> None:
+        """
+        [Function intent]
+        Read the gauge value from function at scrape time, None to go back
+        to the value given to set().
+        """
+        self._function = function
+
+    def get(self) -> float:
+        function = self._function
+        return function() if function is not None else self._value
+
+    def _new_child(self) -> "Gauge":
+        return Gauge(self.name, self.documentation)
+
+    def _reset(self) -> None:
+        self._value = 0.0
+        self._function = None
+
+    def _samples(self):
+        try:
+            value = self.get()
+        except Exception as e:
+            logger.debug("Gauge %s callback failed: %s", self.name, e)
+            return
+        yield self.name, _format_labels(self._sample_labelnames, self._labelvalues), value
+
+class Histogram(_Metric):
+    """
+    [Class intent]
+    Distribution of observed values, e.g. latencies, in cumulative buckets
+    with their sum and count.
+
+    [Implementation details]
+    A shard holds one count per bucket (the last one is +Inf), then the sum
+    and the count of observations. observe() bisects the bucket bounds.
+    """
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(bound) for bound in buckets if bound != float("inf")))
+        self._shards = _Shards(len(self.buckets) + 3)
+
+    def observe(self, value: float) -> None:
+        shard = self._shards.local()
+        shard[bisect.bisect_left(self.buckets, value)] += 1
+        shard[-2] += value
+        shard[-1] += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """
+        [Function intent]
+        Observe the duration in seconds of the with block.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def get(self) -> Dict[str, float]:
+        """
+        [Function intent]
+        Get the count and sum of the observations.
+        """
+        totals = self._shards.total()
+        return {"count": totals[-1], "sum": totals[-2]}
+
+    def summary(self) -> Dict[str, float]:
+        """
+        [Function intent]
+        Get the count, sum, mean and p50/p90/p99 of the observations.
+
+        [Implementation details]
+        A percentile is the upper bound of the bucket holding it, the largest
+        bound when it falls in the +Inf bucket.
+        """
+        totals = self._shards.total()
+        count, total = totals[-1], totals[-2]
+        summary = {"count": count, "sum": total, "mean": total / count if count else 0.0}
+        for name, fraction in (("p50", 0.50), ("p90", 0.90), ("p99", 0.99)):
+            summary[name] = self._percentile(totals, fraction)
+        return summary
+
+    def _percentile(self, totals: List[float], fraction: float) -> float:
+        if not totals[-1]:
+            return 0.0
+        target = fraction * totals[-1]
+        seen = 0
+        for bound, count in zip(self.buckets, totals):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return self.buckets[-1] if self.buckets else 0.0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, buckets=self.buckets)
+
+    def _reset(self) -> None:
+        self._shards = _Shards(len(self.buckets) + 3)
+
+    def _samples(self):
+        totals = self._shards.total()
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), totals):
+            cumulative += count
+            labels = _format_labels(self._sample_labelnames, self._labelvalues, [("le", _format_value(bound))])
+            yield self.name + "_bucket", labels, cumulative
+        labels = _format_labels(self._sample_labelnames, self._labelvalues)
+        yield self.name + "_sum", labels, totals[-2]
+        yield self.name + "_count", labels, totals[-1]
+
+class MetricsRegistry:
+    """
+    [Class intent]
+    Named collection of the metrics of the process, rendered together.
+
+    [Implementation details]
+    Metric creation is idempotent: modules declare their metrics at import
+    time and get the existing metric when it is already registered.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames: Sequence[str], **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered as a different {metric.type_name}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def collect(self) -> List[MetricFamily]:
+        """
+        [Function intent]
+        Take a snapshot of every metric of the registry.
+
+        Returns:
+            Picklable metric families sorted by metric name
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        return [(metric.name, metric.type_name, metric.documentation, metric.collect()) for metric in metrics]
+
+    def render_prometheus(self) -> str:
+        """
+        [Function intent]
+        Render every metric in the Prometheus text exposition format 0.0.4.
+
+        Returns:
+            Exposition text, one HELP/TYPE block per metric
+        """
+        return render_families([(None, self.collect())])
+
+    def reset(self) -> None:
+        """
+        [Function intent]
+        Clear the recorded values and gauge callbacks of every metric.
+
+        [Implementation details]
+        Children are reset in place, not removed, since the recording code
+        keeps references to them.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            for child in [metric] + list(metric._children.values()):
+                child._reset()
+
+
+def render_families(sources: Sequence[Tuple[Optional[str], List[MetricFamily]]], label: str = "process") -> str:
+    """
+    [Function intent]
+    Render the metric snapshots of several processes as one Prometheus
+    exposition.
+
+    [Implementation details]
+    Families of the same name are merged under one HELP/TYPE block. The
+    samples of a named source get the label first in their label set, so that
+    the series of the processes stay distinct.
+
+    Args:
+        sources: (process name or None for no label, metric families) pairs
+        label: Name of the label identifying the process
+
+    Returns:
+        Exposition text, one HELP/TYPE block per metric
+    """
+    blocks: Dict[str, List[str]] = {}
+    for process, families in sources:
+        extra = f'{label}="{_escape_label_value(process)}"' if process is not None else ""
+        for name, type_name, documentation, samples in families:
+            lines = blocks.get(name)
+            if lines is None:
+                lines = blocks[name] = [f"# HELP {name} {documentation}", f"# TYPE {name} {type_name}"]
+            for sample_name, labels, value in samples:
+                if extra:
+                    labels = "{" + extra + ("," + labels[1:] if labels else "}")
+                lines.append(f"{sample_name}{labels} {_format_value(value)}")
+    return "".join(line + "\n" for name in sorted(blocks) for line in blocks[name])
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    [Function intent]
+    Get the metrics registry of the process.
+    """
+    return _registry
+
+
+def render_prometheus() -> str:
+    """
+    [Function intent]
+    Render the metrics of the process in the Prometheus text format.
+    """
+    return _registry.render_prometheus()
+
+
+# A forked server worker starts with empty metrics: the values inherited from
+# the parent would otherwise be reported twice, and its gauge callbacks read
+# components that only run in the parent
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_registry.reset)
+
+
+# Metrics of the hot paths, declared here so that /metrics lists them all
+# even before the code recording them has run
+FS_EVENTS = _registry.counter(
+    "dbp_fs_events", "File system events received by the dispatcher", ["type"])
+FS_DEBOUNCER_QUEUE_DEPTH = _registry.gauge(
+    "dbp_fs_debouncer_queue_depth", "File system events waiting for their debounce delay")
+FS_DISPATCH_QUEUE_SIZE = _registry.gauge(
+    "dbp_fs_dispatch_queue_size", "Debounced events waiting for a ThreadManager worker")
+FS_LISTENER_QUEUE_SECONDS = _registry.histogram(
+    "dbp_fs_listener_queue_seconds", "Time listener tasks wait in their dispatch queue", ["listener"])
+FS_LISTENER_HANDLER_SECONDS = _registry.histogram(
+    "dbp_fs_listener_handler_seconds", "Duration of listener event handlers", ["listener"])
+DB_SESSION_WAIT_SECONDS = _registry.histogram(
+    "dbp_db_session_wait_seconds", "Time to acquire a database connection for a session")
+BEDROCK_REQUEST_SECONDS = _registry.histogram(
+    "dbp_bedrock_request_seconds", "Duration of Bedrock model invocations", ["model"])
+BEDROCK_TOKENS = _registry.counter(
+    "dbp_bedrock_tokens", "Tokens consumed by Bedrock model invocations", ["model", "direction"])
+PROMPT_CACHE_REQUESTS = _registry.counter(
+    "dbp_prompt_cache_requests", "Rendered prompt cache lookups", ["result"])
+EVENT_LOOP_LAG_SECONDS = _registry.histogram(
+    "dbp_event_loop_lag_seconds", "Delay of the MCP server event loop in running a scheduled callback")
+MCP_TOOL_QUEUE_SECONDS = _registry.histogram(
+    "dbp_mcp_tool_queue_seconds", "Time MCP tool calls wait for a ToolExecutor slot", ["tool"])
+MCP_TOOL_RUN_SECONDS = _registry.histogram(
+    "dbp_mcp_tool_run_seconds", "Duration of MCP tool calls in the ToolExecutor", ["tool"])
+# Validation and wrapping of a ToolRegistry call take microseconds
+LLM_TOOL_OVERHEAD_SECONDS = _registry.histogram(
+    "dbp_llm_tool_overhead_seconds", "ToolRegistry time spent around LLM tool functions: validation and wrapping",
+    ["tool"], buckets=(0.000001, 0.0000025, 0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025,
+                       0.0005, 0.001, 0.0025, 0.005, 0.01))
+LLM_TOOL_WORK_SECONDS = _registry.histogram(
+    "dbp_llm_tool_work_seconds", "Duration of LLM tool functions called through the ToolRegistry", ["tool"])
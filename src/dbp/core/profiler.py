@@ -0,0 +1,303 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides an on-demand sampling profiler for long-running processes (MCP
+# server, HSTC batches): the stacks of all threads are sampled at a fixed
+# interval and written as collapsed stacks, the input format of flamegraph
+# tools (flamegraph.pl, speedscope, inferno).
+###############################################################################
+# [Source file design principles]
+# - Started and stopped in a running process, no restart under a profiler
+# - Low overhead: a timer thread reads sys._current_frames(), the profiled
+#   threads are never interrupted or instrumented
+# - Wall-clock view: waiting threads are sampled too, so time spent blocked
+#   on I/O or locks shows up where it is spent
+# - No external service or dependency
+###############################################################################
+# [Source file constraints]
+# - Must not depend on other DBP components to avoid circular dependencies
+# - One triggered profile at a time per process
+# - Samples are taken while holding the GIL: very long stacks are truncated
+#   at MAX_STACK_DEPTH frames
+###############################################################################
+# [Dependencies]
+# system:sys
+# system:threading
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T23:10:00Z : Initial implementation by CodeAssistant
+# * Added SamplingProfiler sampling all thread stacks from a timer thread into collapsed stacks
+# * Added start_profile and get_profile_status for profiles triggered in a running process
+###############################################################################
+
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Frames kept per sampled stack, counted from the innermost frame
+MAX_STACK_DEPTH = 128
+
+# Default seconds between two samples
+DEFAULT_SAMPLE_INTERVAL = 0.005
+
+
+class SamplingProfiler:
+    """
+    [Class intent]
+    Samples the stacks of all threads of the process from a background
+    thread and aggregates them into collapsed stack counts.
+
+    [Implementation details]
+    Each sample walks the frames returned by sys._current_frames() and
+    counts the (thread name, stack) pair. Frame labels are cached per code
+    object. The profiler thread excludes itself from the samples.
+
+    [Design principles]
+    Timer-thread sampling covers every thread and works in any thread of
+    any process, unlike signal-based sampling limited to the main thread.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """
+        [Function intent]
+        Create a stopped profiler.
+
+        Args:
+            interval: Seconds between two samples
+        """
+        self.interval = interval
+        self._counts: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        self._labels: Dict[Any, str] = {}
+        self._thread_names: Dict[int, str] = {}
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._samples = 0
+        self._sampling_time = 0.0
+        self._start_time = 0.0
+        self._duration = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """
+        [Function intent]
+        Start sampling in a daemon thread.
+
+        Raises:
+            RuntimeError: If the profiler is already running
+        """
+        if self._thread is not None:
+            raise RuntimeError("Profiler already running")
+        self._stop_event.clear()
+        self._start_time = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Stop sampling and report what was collected.
+
+        Returns:
+            Statistics of the profile, see get_stats()
+        """
+        thread = self._thread
+        if thread is not None:
+            self._stop_event.set()
+            thread.join()
+            self._thread = None
+            self._duration = time.monotonic() - self._start_time
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Report the number of samples and the cost of sampling.
+
+        Returns:
+            Dictionary with samples, stacks, duration_seconds and overhead_percent,
+            the share of the profiled time spent taking samples
+        """
+        duration = self._duration if self._thread is None else time.monotonic() - self._start_time
+        return {
+            "samples": self._samples,
+            "stacks": len(self._counts),
+            "duration_seconds": round(duration, 3),
+            "overhead_percent": round(100.0 * self._sampling_time / duration, 3) if duration else 0.0,
+        }
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        while not self._stop_event.wait(self.interval):
+            start = time.perf_counter()
+            self._sample(own_ident)
+            self._sampling_time += time.perf_counter() - start
+
+    def _sample(self, own_ident: int) -> None:
+        """
+        [Function intent]
+        Take one sample of the stacks of all threads but the profiler's.
+        """
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            thread_name = self._thread_names.get(ident)
+            if thread_name is None:
+                self._thread_names = {thread.ident: thread.name.replace(";", ":") for thread in threading.enumerate()}
+                thread_name = self._thread_names.setdefault(ident, f"thread-{ident}")
+            stack = []
+            while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                code = frame.f_code
+                label = self._labels.get(code)
+                if label is None:
+                    label = self._labels[code] = _frame_label(code)
+                stack.append(label)
+                frame = frame.f_back
+            key = (thread_name, tuple(stack))
+            self._counts[key] = self._counts.get(key, 0) + 1
+        self._samples += 1
+
+    def collapsed(self) -> List[str]:
+        """
+        [Function intent]
+        Render the samples as collapsed stacks.
+
+        [Implementation details]
+        One line per distinct stack: the thread name, then the frames from
+        the outermost to the innermost, separated by semicolons, then the
+        sample count.
+
+        Returns:
+            Collapsed stack lines, most sampled first
+        """
+        lines = []
+        for (thread_name, stack), count in sorted(self._counts.items(), key=lambda item: -item[1]):
+            lines.append(";".join((thread_name,) + stack[::-1]) + f" {count}")
+        return lines
+
+    def write_collapsed(self, path: Path) -> Path:
+        """
+        [Function intent]
+        Write the collapsed stacks to a file, creating its directory.
+
+        Args:
+            path: Output file
+
+        Returns:
+            The path written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("\n".join(self.collapsed()) + "\n", encoding="utf-8")
+        return path
+
+
+def _frame_label(code) -> str:
+    """
+    [Function intent]
+    Label a code object as function (module file:first line), without the
+    semicolons separating the frames of the collapsed format.
+    """
+    filename = os.path.basename(code.co_filename)
+    label = f"{getattr(code, 'co_qualname', code.co_name)} ({filename}:{code.co_firstlineno})"
+    return label.replace(";", ":")
+
+
+class ProfilerBusyError(RuntimeError):
+    """
+    [Class intent]
+    Raised when a profile is requested while another one is running.
+    """
+
+
+_profile_lock = threading.Lock()
+_active_profile: Optional[Dict[str, Any]] = None
+_last_profile: Optional[Dict[str, Any]] = None
+
+
+def start_profile(seconds: float, output_dir: str, interval: float = DEFAULT_SAMPLE_INTERVAL) -> Dict[str, Any]:
+    """
+    [Function intent]
+    Profile the process for a number of seconds in the background and write
+    the collapsed stacks to a file of output_dir.
+
+    [Implementation details]
+    A threading.Timer stops the profiler and writes
+    profile-<pid>-<UTC time>.folded. The file name is returned at once.
+
+    Args:
+        seconds: Duration of the profile
+        output_dir: Directory of the profile files
+        interval: Seconds between two samples
+
+    Returns:
+        Description of the started profile: pid, seconds, interval, output
+
+    Raises:
+        ProfilerBusyError: If a profile is already running in this process
+    """
+    global _active_profile
+    with _profile_lock:
+        if _active_profile is not None:
+            raise ProfilerBusyError(f"A profile is already running until {_active_profile['ends_at']}")
+        output = Path(output_dir) / f"profile-{os.getpid()}-{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}.folded"
+        profiler = SamplingProfiler(interval)
+        profiler.start()
+        _active_profile = {
+            "pid": os.getpid(),
+            "seconds": seconds,
+            "interval": interval,
+            "output": str(output),
+            "ends_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + seconds)),
+        }
+        timer = threading.Timer(seconds, _finish_profile, args=(profiler, output))
+        timer.daemon = True
+        timer.start()
+        logger.info("Profiling process %s for %ss into %s", os.getpid(), seconds, output)
+        return dict(_active_profile)
+
+
+def _finish_profile(profiler: SamplingProfiler, output: Path) -> None:
+    global _active_profile, _last_profile
+    stats = profiler.stop()
+    try:
+        profiler.write_collapsed(output)
+        logger.info("Profile written to %s (%s samples, %s%% overhead)",
+                    output, stats["samples"], stats["overhead_percent"])
+    except OSError as e:
+        logger.error("Failed to write profile %s: %s", output, e)
+        stats["error"] = str(e)
+    with _profile_lock:
+        _last_profile = {**_active_profile, **stats}
+        _active_profile = None
+
+
+def get_profile_status() -> Dict[str, Any]:
+    """
+    [Function intent]
+    Report the running profile and the last completed one of this process.
+
+    Returns:
+        Dictionary with pid, active (or None) and last (or None)
+    """
+    with _profile_lock:
+        return {"pid": os.getpid(), "active": _active_profile, "last": _last_profile}
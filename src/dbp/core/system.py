@@ -21,6 +21,10 @@
 # - Dictionary-based component registry instead of complex classes
 # - Direct dependency validation without complex graph algorithms
 # - Sequential initialization based on simple dependency order
+# - Opt-in parallel initialization of independent components, level by level
+#   of the dependency graph
+# - Readiness tiers: deferrable components not needed by critical ones warm up
+#   in the background while the system already serves requests
 # - Clear error reporting rather than sophisticated recovery
 ###############################################################################
 # [Source file constraints]
@@ -28,12 +32,22 @@
 # - Initialization errors fail fast rather than attempting recovery
 # - All components are stored in a single dictionary
 # - No complex transactions or rollbacks beyond basic cleanup
+# - Components initialized in parallel must not share unsynchronized state
+#   with components of the same dependency level
 ###############################################################################
 # [Dependencies]
 # codebase:- doc/DESIGN.md
 # codebase:- doc/design/COMPONENT_INITIALIZATION.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T20:40:00Z : Added readiness tiers by CodeAssistant
+# * Deferrable components not needed by critical ones are initialized on a background thread when initialization.deferred_start is set
+# * Added wait_for_component(), wait_for_deferred() and get_readiness()
+# * shutdown_all() stops the background initialization first
+# 2026-10-18T20:10:00Z : Added opt-in parallel component initialization by CodeAssistant
+# * Added initialization by dependency level on a thread pool when initialization.parallel is set, with a per-level timeout and reverse-order rollback
+# * Factored the per-component initialization and failure diagnostics out of initialize_all
+# * Added per-component startup timing report, logged and returned by get_debug_info()
 # 2025-04-25T10:54:00Z : Updated config access to use get_typed_config() by CodeAssistant
 # * Replaced deprecated ConfigurationManager.get() calls with get_typed_config()
 # * Updated component enablement configuration access to use direct attribute access
@@ -44,24 +58,20 @@
 # * Added strict validation for component enablement configuration
 # * Updated documentation to reflect component enablement functionality
 # * Improved error handling for component enablement configuration access
-# 2025-04-25T08:43:00Z : Improved error handling with specific exceptions by CodeAssistant
-# * Replaced CircularDependencyError with imported one from exceptions module
-# * Modified get_component to raise ComponentNotFoundError and ComponentNotInitializedError
-# * Changed return type from Optional[Component] to Component for strict error checking
-# * Updated docstring to reflect the new fail-fast behavior
-# 2025-04-20T19:15:00Z : Added watchdog keepalive to prevent deadlocks by CodeAssistant
-# * Added keep_alive call before each component initialization
-# * Ensured watchdog doesn't trigger false alarms during long component initializations
-# * Fixed issue where watchdog wasn't properly updated between initializations
 ###############################################################################
 
 import logging
-from typing import Any, Dict, List, Set, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Set, Optional, Tuple
 import sys
 import traceback
 
 from .component import Component, InitializationContext
-from .exceptions import CircularDependencyError, ComponentNotFoundError, ComponentNotInitializedError, ComponentError
+from .exceptions import (
+    CircularDependencyError, ComponentNotFoundError, ComponentNotInitializedError, ComponentNotReadyError, ComponentError
+)
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +136,15 @@ class ComponentSystem:
         self.components: Dict[str, Component] = {}  # name -> component
         self._initialized: List[str] = []  # Initialization order for shutdown
         self.dependencies: Dict[str, List[str]] = {}  # name -> list of dependency names
+        self._init_timings: Dict[str, float] = {}  # name -> startup time in milliseconds
+        self._init_report: Dict[str, Any] = {}  # Report of the last initialization
+        self._init_lock = threading.Lock()  # Guards tracking updated by worker and background threads
+        self._init_aborted = False  # Set when initialization is abandoned (timeout or shutdown)
+        self._ready: Dict[str, threading.Event] = {}  # name -> set once initialized or failed
+        self._failed: Dict[str, BaseException] = {}  # name -> error of a failed deferred component
+        self._deferred: List[str] = []  # Components initialized in the background
+        self._deferred_thread: Optional[threading.Thread] = None
+        self._wait_timeout: float = 30.0  # Default wait for a deferred component in seconds
         
         # Set singleton instance
         ComponentSystem._instance = self
@@ -236,7 +255,13 @@ class ComponentSystem:
         [Implementation details]
         Validates dependencies, calculates initialization order,
         checks if each component is enabled in configuration,
-        and initializes components sequentially with clear error reporting.
+        and initializes components with clear error reporting.
+        Components are initialized sequentially unless initialization.parallel
+        is set, in which case each dependency level is initialized concurrently.
+        With initialization.deferred_start, deferrable components that no
+        critical component depends on are left to a background thread started
+        before returning; callers needing them use wait_for_component().
+        Per-component startup times are logged and kept for get_debug_info().
         
         [Design principles]
         Simple sequential process with explicit error handling.
@@ -248,6 +273,12 @@ class ComponentSystem:
         """
         # Reset initialization tracking
         self._initialized = []
+        self._init_timings = {}
+        self._init_report = {}
+        self._init_aborted = False
+        self._ready = {name: threading.Event() for name in self.components}
+        self._failed = {}
+        self._deferred = []
         
         # Log component count
         self.logger.info(f"Initializing {len(self.components)} components")
@@ -276,136 +307,542 @@ class ComponentSystem:
         # Get the component_enabled configuration from the typed config model
         typed_config = config_manager.get_typed_config()
         enabled_config = typed_config.component_enabled
+        init_config = typed_config.initialization
+        self._wait_timeout = init_config.component_wait_timeout_seconds
         
         # We expect this to be a Pydantic model (ComponentEnabledConfig)
         self.logger.info(f"Using component enablement configuration: {enabled_config}")
         
-        # Initialize components in order
-        for name in init_order:
-            component = self.components[name]
+        # Split critical components from the ones warming up in the background
+        if init_config.deferred_start:
+            init_order, self._deferred = self._split_tiers(init_order)
+            if self._deferred:
+                self.logger.info(f"Deferring initialization of: {', '.join(self._deferred)}")
+        
+        start = time.perf_counter()
+        if init_config.parallel:
+            levels = self._calculate_init_levels(init_order)
+            self._initialize_parallel(levels, enabled_config, config_manager,
+                                      init_config.max_workers, init_config.level_timeout_seconds)
+            self._init_report["mode"] = "parallel"
+            self._init_report["levels"] = levels
+        else:
+            # Initialize components in order
+            for name in self._select_components(init_order, enabled_config):
+                try:
+                    self._initialize_component(name, config_manager)
+                except Exception as e:
+                    self._log_initialization_failure(name, e)
+                    self._rollback()
+                    # Re-raise the original exception
+                    raise e
+            self._init_report["mode"] = "sequential"
+        self._init_report["total_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        self._init_report["components"] = dict(self._init_timings)
+        self._log_startup_report(self._init_report["mode"], self._init_report["total_ms"], init_order)
+        
+        if self._deferred:
+            self._deferred_thread = threading.Thread(
+                target=self._initialize_deferred,
+                args=(self._deferred, enabled_config, config_manager),
+                name="component-deferred-init",
+                daemon=True
+            )
+            self._deferred_thread.start()
+            self.logger.info(f"Critical components initialized, {len(self._deferred)} components warming up in the background")
+        else:
+            self.logger.info("All components initialized successfully")
+        return True
+    
+    def _split_tiers(self, init_order: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        [Function intent]
+        Splits components into the critical tier, initialized before startup
+        completes, and the deferred tier, initialized in the background.
+        
+        [Implementation details]
+        Components not declaring themselves deferrable are critical, and so
+        are all their transitive dependencies. Walking the initialization
+        order backwards visits dependents before their dependencies.
+        
+        [Design principles]
+        A critical component never waits for a deferred one.
+        
+        Args:
+            init_order: Components in initialization order
+            
+        Returns:
+            Tuple[List[str], List[str]]: Critical and deferred components, each in initialization order
+        """
+        critical: Set[str] = set()
+        for name in reversed(init_order):
+            if name in critical or not self.components[name].deferrable:
+                critical.add(name)
+                critical.update(self.dependencies.get(name, []))
+        return ([name for name in init_order if name in critical],
+                [name for name in init_order if name not in critical])
+    
+    def _initialize_deferred(self, names: List[str], enabled_config: Any, config_manager: Component) -> None:
+        """
+        [Function intent]
+        Initializes the deferred components in the background.
+        
+        [Implementation details]
+        Runs on its own thread, one component at a time in initialization
+        order. A failure is logged and recorded for the callers waiting on the
+        component and on its dependents, without rolling back the running
+        system. Stops early when the system shuts down.
+        
+        [Design principles]
+        A slow or failing optional component does not take the server down.
+        
+        Args:
+            names: Deferred components in initialization order
+            enabled_config: Component enablement configuration model
+            config_manager: Configuration manager component
+        """
+        start = time.perf_counter()
+        for name in self._select_components(names, enabled_config):
+            if self._init_aborted:
+                self.logger.info("System shutting down, stopping background initialization")
+                return
+            failed_deps = [dep for dep in self.dependencies.get(name, []) if dep in self._failed]
+            if failed_deps:
+                self._mark_failed(name, ComponentError(f"Dependency '{failed_deps[0]}' failed to initialize", name))
+                continue
+            try:
+                self._initialize_component(name, config_manager)
+            except Exception as e:
+                self._log_initialization_failure(name, e)
+                self._mark_failed(name, e)
+        
+        total_ms = round((time.perf_counter() - start) * 1000, 1)
+        with self._init_lock:
+            self._init_report["deferred_ms"] = total_ms
+            self._init_report.setdefault("components", {}).update(self._init_timings)
+        self._log_startup_report("deferred", total_ms, names)
+        if self._failed:
+            self.logger.error(f"Background initialization failed for: {', '.join(self._failed)}")
+        else:
+            self.logger.info("All components initialized successfully")
+    
+    def _mark_failed(self, name: str, error: BaseException) -> None:
+        """
+        [Function intent]
+        Records a component that will not become ready and wakes its waiters.
+        """
+        with self._init_lock:
+            self._failed[name] = error
+            self._ready[name].set()
+    
+    def wait_for_component(self, name: str, timeout: Optional[float] = None) -> Component:
+        """
+        [Function intent]
+        Retrieves a component, waiting for it if it is still initializing in
+        the background.
+        
+        [Implementation details]
+        Returns initialized components immediately. Otherwise waits on the
+        readiness event of the component, set when its initialization
+        succeeds or fails.
+        
+        [Design principles]
+        Requests needing a warming component wait for it instead of failing.
+        Bounded waits with specific exceptions.
+        
+        Args:
+            name: Name of the component to retrieve
+            timeout: Maximum wait in seconds, None for initialization.component_wait_timeout_seconds
+            
+        Returns:
+            Component: The initialized component
             
-            # Check if component is enabled in configuration
+        Raises:
+            ComponentNotFoundError: If the component is not registered
+            ComponentNotReadyError: If the component is not ready within the timeout
+            ComponentNotInitializedError: If the component is not initialized and not initializing
+            ComponentError: If the component failed to initialize in the background
+        """
+        component = self.components.get(name)
+        if component is None:
+            raise ComponentNotFoundError(name)
+        if component.is_initialized:
+            return component
+        
+        event = self._ready.get(name)
+        if event is None or name not in self._deferred:
+            raise ComponentNotInitializedError(name)
+        timeout = self._wait_timeout if timeout is None else timeout
+        if not event.wait(timeout):
+            raise ComponentNotReadyError(name, timeout)
+        if name in self._failed:
+            raise ComponentError(f"Failed to initialize: {self._failed[name]}", name)
+        if not component.is_initialized:
+            raise ComponentNotInitializedError(name)
+        return component
+    
+    @property
+    def component_wait_timeout(self) -> float:
+        """
+        [Function intent]
+        Default time in seconds a caller waits for a component warming up.
+        """
+        return self._wait_timeout
+    
+    def is_component_ready(self, name: str) -> bool:
+        """
+        [Function intent]
+        Tells whether a component is initialized and can be used without waiting.
+        """
+        component = self.components.get(name)
+        return component is not None and component.is_initialized
+    
+    def wait_for_deferred(self, timeout: Optional[float] = None) -> bool:
+        """
+        [Function intent]
+        Waits for the background initialization of deferred components to end.
+        
+        Args:
+            timeout: Maximum wait in seconds, None to wait indefinitely
+            
+        Returns:
+            bool: True if no background initialization is running anymore
+        """
+        thread = self._deferred_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+    
+    def get_readiness(self) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Reports the readiness of the components for health checks.
+        
+        [Implementation details]
+        Each component is 'ready', 'warming' (deferred, not initialized yet),
+        'failed' (deferred, failed in the background) or 'down'.
+        
+        Returns:
+            Dict[str, Any]: Overall readiness and the state of each component
+        """
+        states = {}
+        for name, component in self.components.items():
+            if name in self._failed:
+                states[name] = "failed"
+            elif component.is_initialized:
+                states[name] = "ready"
+            elif name in self._deferred and not self._init_aborted:
+                states[name] = "warming"
+            else:
+                states[name] = "down"
+        return {
+            "ready": all(state == "ready" for state in states.values()),
+            "warming": [name for name, state in states.items() if state == "warming"],
+            "components": states,
+        }
+    
+    def _select_components(self, names: List[str], enabled_config: Any) -> List[str]:
+        """
+        [Function intent]
+        Filters the components that still need initialization.
+        
+        [Implementation details]
+        Skips components disabled in the component_enabled configuration and
+        records already initialized components for shutdown ordering.
+        
+        [Design principles]
+        Same enablement rules for sequential and parallel initialization.
+        
+        Args:
+            names: Component names in initialization order
+            enabled_config: Component enablement configuration model
+            
+        Returns:
+            List[str]: Names of the components to initialize, in the given order
+        """
+        selected = []
+        for name in names:
             # Access component enablement directly via attribute access on the Pydantic model
             is_enabled = getattr(enabled_config, name)  # Dynamic attribute access using component name
             if not is_enabled:
                 self.logger.info(f"Skipping disabled component: '{name}'")
+                self._mark_failed(name, ComponentError("Disabled by configuration", name))
                 continue
             
             # Skip already initialized components
-            if component.is_initialized:
+            if self.components[name].is_initialized:
                 self.logger.debug(f"Component '{name}' already initialized, skipping")
-                if name not in self._initialized:
-                    self._initialized.append(name)
+                with self._init_lock:
+                    if name not in self._initialized:
+                        self._initialized.append(name)
+                    self._ready[name].set()
                 continue
+            selected.append(name)
+        return selected
+    
+    def _initialize_component(self, name: str, config_manager: Component) -> None:
+        """
+        [Function intent]
+        Initializes a single component with its resolved dependencies.
+        
+        [Implementation details]
+        Updates the watchdog keepalive, builds the initialization context,
+        resolves the dependencies, initializes the component, verifies its
+        initialization flag, and records it for shutdown together with its
+        startup time. May run on a worker thread of the parallel initializer:
+        shared state is only updated under the initialization lock.
+        
+        [Design principles]
+        One code path for sequential and parallel initialization.
+        Failures are raised to the caller, which owns rollback.
+        
+        Args:
+            name: Name of the component to initialize
+            config_manager: Configuration manager component
+            
+        Raises:
+            ComponentNotFoundError: If a dependency is not registered
+            ComponentNotInitializedError: If a dependency is not initialized
+            ComponentError: If the component does not report itself initialized
+        """
+        component = self.components[name]
+        
+        # Enhanced logging before initialization
+        self.logger.info(f"Initializing component '{name}'...")
+        self.logger.debug(f"Component '{name}' class: {component.__class__.__name__}")
+        
+        # Update watchdog keepalive to prevent false deadlock detection during initialization
+        self._keep_alive(name)
+        
+        # Get the typed configuration - throw on error
+        typed_config = config_manager.get_typed_config()
+        
+        # Components expect a config manager with get() method, not the raw config
+        context = InitializationContext(
+            config=config_manager,
+            logger=self.logger.getChild(component.name),  # Use child logger
+            typed_config=typed_config  # Include typed configuration
+        )
+        
+        # Resolve dependencies for this component
+        resolved_deps = {}
+        for dep_name in self.dependencies.get(name, []):
+            dep_component = self.components.get(dep_name)
+            if not dep_component:
+                self.logger.error(f"Dependency '{dep_name}' not found for component '{name}'")
+                raise ComponentNotFoundError(dep_name)
+            if not dep_component.is_initialized:
+                self.logger.error(f"Dependency '{dep_name}' for component '{name}' is not initialized")
+                raise ComponentNotInitializedError(dep_name)
+            resolved_deps[dep_name] = dep_component
+        
+        # Add logging for dependencies
+        if resolved_deps:
+            self.logger.info(f"Resolved {len(resolved_deps)} dependencies for component '{name}'")
+        
+        # Initialize with dependencies
+        start = time.perf_counter()
+        component.initialize(context, resolved_deps)
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        
+        # Verify initialization flag with more detailed diagnostics
+        if not component.is_initialized:
+            self.logger.error(f"Component '{name}' failed to set is_initialized flag to True")
+            raise ComponentError(f"Component '{name}' failed to set is_initialized flag to True after initialization")
+        
+        with self._init_lock:
+            if self._init_aborted:
+                # The initialization this component belonged to timed out and was rolled back
+                self.logger.warning(f"Component '{name}' finished after initialization was aborted, shutting it down")
+                component.shutdown()
+                return
+            # Track initialization for shutdown order
+            self._initialized.append(name)
+            self._init_timings[name] = elapsed_ms
+            self._ready[name].set()
+        self._keep_alive(name)
+        self.logger.info(f"Component '{name}' initialized successfully in {elapsed_ms} ms")
+    
+    def _initialize_parallel(self, levels: List[List[str]], enabled_config: Any, config_manager: Component,
+                             max_workers: int, level_timeout: float) -> None:
+        """
+        [Function intent]
+        Initializes components level by level, running the components of a
+        level concurrently.
+        
+        [Implementation details]
+        Submits the components of each level to a thread pool and waits for
+        all of them up to level_timeout seconds. Components complete only
+        after their dependencies, so the completion order recorded in
+        self._initialized is a valid reverse shutdown order. On failure or
+        timeout the level is drained, every initialized component is rolled
+        back in reverse order and the error is raised; components still
+        running after a timeout shut themselves down when they finish.
+        
+        [Design principles]
+        Concurrency only between components that do not depend on each other.
+        Same failure semantics as sequential initialization.
+        
+        Args:
+            levels: Component names grouped by dependency level
+            enabled_config: Component enablement configuration model
+            config_manager: Configuration manager component
+            max_workers: Maximum number of components initialized at once
+            level_timeout: Maximum time in seconds to initialize one level
+            
+        Raises:
+            ComponentError: If the components of a level do not finish in time
+            Exception: The first error raised by a component of a level
+        """
+        self.logger.info(f"Initializing components in {len(levels)} parallel levels with up to {max_workers} workers")
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="component-init")
+        try:
+            for index, level in enumerate(levels):
+                names = self._select_components(level, enabled_config)
+                if not names:
+                    continue
+                self.logger.info(f"Initializing level {index}: {', '.join(names)}")
+                futures = {executor.submit(self._initialize_component, name, config_manager): name for name in names}
+                done, pending = wait(futures, timeout=level_timeout)
                 
-            try:
-                # Enhanced logging before initialization
-                self.logger.info(f"Initializing component '{name}'...")
-                self.logger.debug(f"Component '{name}' class: {component.__class__.__name__}")
-                
-                # Update watchdog keepalive to prevent false deadlock detection during initialization
-                try:
-                    from .watchdog import keep_alive
-                    keep_alive()
-                    self.logger.debug(f"Updated watchdog keepalive before initializing '{name}'")
-                except ImportError:
-                    self.logger.debug(f"Watchdog module not available, skipping keepalive")
-                
-                # Create the initialization context
-                # Components expect a config manager with get() method, not the raw config
-                try:
-                    config_manager = self.components.get('config_manager')
-                    if not config_manager:
-                        raise ComponentNotFoundError('config_manager')
-                except ComponentError as e:
-                    self.logger.error(f"Config manager error during initialization of '{name}': {e}")
+                failures = [(futures[future], future.exception()) for future in done if future.exception() is not None]
+                for name, error in failures:
+                    self._log_initialization_failure(name, error)
+                if pending:
+                    timed_out = sorted(futures[future] for future in pending)
+                    for future in pending:
+                        future.cancel()
+                    with self._init_lock:
+                        self._init_aborted = True
+                    self.logger.error(f"Components did not initialize within {level_timeout}s: {', '.join(timed_out)}")
                     self._rollback()
-                    # Re-raise the original exception
-                    raise e
-                
-                # Get the typed configuration - throw on error
-                typed_config = config_manager.get_typed_config()
-                
-                context = InitializationContext(
-                    config=config_manager,
-                    logger=self.logger.getChild(component.name),  # Use child logger
-                    typed_config=typed_config  # Include typed configuration
-                )
-                
-                # Add logging for initialization context
-                self.logger.info(f"Initializing component '{name}' with context type: {type(context)}")
-                self.logger.info(f"Context attributes: config={type(context.config)}, logger={type(context.logger)}")
-                
-                # Resolve dependencies for this component
-                component_deps = self.dependencies.get(name, [])
-                resolved_deps = {}
-                
-                for dep_name in component_deps:
-                    dep_component = self.components.get(dep_name)
-                    if not dep_component:
-                        self.logger.error(f"Dependency '{dep_name}' not found for component '{name}'")
-                        self._rollback()
-                        raise ComponentNotFoundError(dep_name)
-                    if not dep_component.is_initialized:
-                        self.logger.error(f"Dependency '{dep_name}' for component '{name}' is not initialized")
-                        self._rollback()
-                        raise ComponentNotInitializedError(dep_name)
-                    resolved_deps[dep_name] = dep_component
-                
-                # Add logging for dependencies
-                if resolved_deps:
-                    self.logger.info(f"Resolved {len(resolved_deps)} dependencies for component '{name}'")
-                
-                # Initialize with dependencies
-                component.initialize(context, resolved_deps)
-                
-                # Verify initialization flag with more detailed diagnostics
-                if not component.is_initialized:
-                    self.logger.error(f"Component '{name}' failed to set is_initialized flag to True")
-                    self.logger.error(f"Component '{name}' current is_initialized value: {component.is_initialized}")
+                    raise ComponentError(f"Initialization of {', '.join(timed_out)} timed out after {level_timeout}s")
+                if failures:
                     self._rollback()
-                    raise ComponentError(f"Component '{name}' failed to set is_initialized flag to True after initialization")
-                    
-                # Track initialization for shutdown order
-                self._initialized.append(name)
-                self.logger.info(f"Component '{name}' initialized successfully")
-                
-            except Exception as e:
-                # Enhanced error logging with exception details and stack trace
-                self.logger.error(f"Failed to initialize component '{name}': {str(e)}")
-                self.logger.error(f"Exception type: {type(e).__name__}")
-                
-                # Get and log the traceback
-                exc_info = sys.exc_info()
-                tb_lines = traceback.format_exception(*exc_info)
-                
-                # Log the full traceback with proper indentation for readability
-                for line in tb_lines:
-                    for subline in line.splitlines():
-                        if subline.strip():
-                            self.logger.error(f"  {subline}")
-                
-                # Log component state information if available
-                if hasattr(component, 'get_debug_info'):
-                    try:
-                        debug_info = component.get_debug_info()
-                        self.logger.error(f"Component '{name}' debug info: {debug_info}")
-                    except Exception as debug_err:
-                        self.logger.error(f"Failed to get component debug info: {debug_err}")
-                
-                # Log dependency states to help with troubleshooting
-                if hasattr(component, 'dependencies'):
-                    for dep_name in component.dependencies:
-                        dep = self.components.get(dep_name)
-                        if dep:
-                            self.logger.error(f"Dependency '{dep_name}' initialized: {dep.is_initialized}")
-                
-                self._rollback()
-                # Re-raise the original exception
-                raise e
+                    raise failures[0][1]
+        finally:
+            executor.shutdown(wait=False)
+    
+    def _keep_alive(self, name: str) -> None:
+        """
+        [Function intent]
+        Updates the watchdog keepalive around a component initialization.
+        """
+        try:
+            from .watchdog import keep_alive
+            keep_alive()
+        except ImportError:
+            self.logger.debug(f"Watchdog module not available, skipping keepalive for '{name}'")
+    
+    def _log_initialization_failure(self, name: str, error: BaseException) -> None:
+        """
+        [Function intent]
+        Logs a component initialization failure with diagnostics.
         
-        self.logger.info("All components initialized successfully")
-        return True
+        [Implementation details]
+        Logs the exception with its traceback, the component debug info and
+        the initialization state of its dependencies.
+        
+        [Design principles]
+        Detailed diagnostics for troubleshooting startup failures.
+        
+        Args:
+            name: Name of the component that failed
+            error: Exception raised by the initialization
+        """
+        component = self.components[name]
+        
+        # Enhanced error logging with exception details and stack trace
+        self.logger.error(f"Failed to initialize component '{name}': {str(error)}")
+        self.logger.error(f"Exception type: {type(error).__name__}")
+        
+        # Log the full traceback with proper indentation for readability
+        tb_lines = traceback.format_exception(type(error), error, error.__traceback__)
+        for line in tb_lines:
+            for subline in line.splitlines():
+                if subline.strip():
+                    self.logger.error(f"  {subline}")
+        
+        # Log component state information if available
+        if hasattr(component, 'get_debug_info'):
+            try:
+                debug_info = component.get_debug_info()
+                self.logger.error(f"Component '{name}' debug info: {debug_info}")
+            except Exception as debug_err:
+                self.logger.error(f"Failed to get component debug info: {debug_err}")
+        
+        # Log dependency states to help with troubleshooting
+        for dep_name in self.dependencies.get(name, []):
+            dep = self.components.get(dep_name)
+            if dep:
+                self.logger.error(f"Dependency '{dep_name}' initialized: {dep.is_initialized}")
+    
+    def _log_startup_report(self, mode: str, total_ms: float, names: List[str]) -> None:
+        """
+        [Function intent]
+        Logs the startup times of the given components, slowest first.
+        """
+        timings = sorted(((name, self._init_timings[name]) for name in names if name in self._init_timings),
+                         key=lambda item: item[1], reverse=True)
+        self.logger.info(
+            f"Component startup report ({mode}, total {total_ms} ms): "
+            + ", ".join(f"{name}={elapsed_ms} ms" for name, elapsed_ms in timings)
+        )
+    
+    def get_debug_info(self) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Provides diagnostic information about the component system.
+        
+        [Implementation details]
+        Returns the registered and initialized components, their readiness,
+        and the report of the last initialization: mode, dependency levels
+        when parallel, total wall time of the critical and deferred tiers and
+        per-component startup times in milliseconds.
+        
+        [Design principles]
+        Same diagnostic entry point as components.
+        
+        Returns:
+            Dict[str, Any]: Diagnostic information
+        """
+        return {
+            "registered": list(self.components),
+            "initialized": list(self._initialized),
+            "initialization": dict(self._init_report),
+            "readiness": self.get_readiness(),
+        }
+    
+    def _calculate_init_levels(self, init_order: List[str]) -> List[List[str]]:
+        """
+        [Function intent]
+        Groups components into dependency levels for parallel initialization.
+        
+        [Implementation details]
+        The level of a component is one more than the highest level of its
+        dependencies; components without dependencies are on level 0. Walking
+        the initialization order guarantees dependencies are leveled first.
+        
+        [Design principles]
+        Components of the same level never depend on each other.
+        
+        Args:
+            init_order: Components in initialization order
+            
+        Returns:
+            List[List[str]]: Component names per level, lowest level first
+        """
+        depth: Dict[str, int] = {}
+        levels: List[List[str]] = []
+        for name in init_order:
+            level = max((depth[dep] + 1 for dep in self.dependencies.get(name, [])), default=0)
+            depth[name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(name)
+        return levels
+    
     
     def _calculate_init_order(self) -> List[str]:
         """
@@ -503,7 +940,9 @@ class ComponentSystem:
         Shuts down all initialized components in reverse initialization order.
         
         [Implementation details]
-        Iterates through components in reverse initialization order,
+        Stops the background initialization first: it does not start another
+        component, and a component it is initializing shuts itself down once
+        done. Then iterates through components in reverse initialization order,
         calling shutdown on each with error handling.
         
         [Design principles]
@@ -513,6 +952,11 @@ class ComponentSystem:
         Returns:
             None
         """
+        with self._init_lock:
+            self._init_aborted = True
+        if not self.wait_for_deferred(self._wait_timeout):
+            self.logger.warning("Background initialization still running, shutting down initialized components")
+        
         if not self._initialized:
             self.logger.info("No components to shut down")
             return
@@ -0,0 +1,137 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the asynchronous logging pipeline and rate limiting of log_utils,
+# and lint check of the logging calls of hot-path modules.
+###############################################################################
+# [Source file design principles]
+# - The root logger configuration is restored after each test
+# - The lint check parses the sources, nothing is imported
+###############################################################################
+# [Source file constraints]
+# - HOT_PATH_MODULES must list the modules logging per event or per request
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/log_utils.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T02:00:00Z : Added repeated setup test by CodeAssistant
+# * Added test calling setup_application_logging several times
+# 2026-10-18T21:40:00Z : Created logging pipeline tests by CodeAssistant
+# * Added queue listener, rate limiting and hot-path logging lint tests
+###############################################################################
+
+"""
+Tests for the logging utilities.
+"""
+
+import ast
+import logging
+import threading
+from pathlib import Path
+
+import pytest
+
+from .. import log_utils
+from ..log_utils import RateLimitFilter, setup_application_logging, stop_application_logging
+
+DBP_DIR = Path(__file__).resolve().parents[2]
+
+# Modules logging per file system event, database operation or request
+HOT_PATH_MODULES = [
+    "fs_monitor/git_filter.py",
+    "mcp_server/auth.py",
+    "database/repositories.py",
+    *sorted(str(p.relative_to(DBP_DIR)) for p in (DBP_DIR / "database" / "repositories").glob("*.py")),
+]
+
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield root
+    stop_application_logging()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+        handler.close()
+    for handler in handlers:
+        root.addHandler(handler)
+    root.setLevel(level)
+
+
+def make_record(msg, args=(), level=logging.DEBUG, name="dbp.fs_monitor.git_filter"):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_filter_drops_excess_and_reports_it(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(log_utils.time, "monotonic", lambda: now[0])
+    rate_limit = RateLimitFilter({"dbp.fs_monitor": (1.0, 3)})
+
+    passed = [rate_limit.filter(make_record("Path '%s' ignored", (i,))) for i in range(10)]
+    assert passed == [True] * 3 + [False] * 7
+    # Other templates, levels and loggers have their own budget
+    assert rate_limit.filter(make_record("Other message"))
+    assert rate_limit.filter(make_record("Path '%s' ignored", (0,), level=logging.WARNING))
+    assert rate_limit.filter(make_record("Path '%s' ignored", (0,), name="dbp.database"))
+
+    now[0] += 1.0
+    record = make_record("Path '%s' ignored", ("a",))
+    assert rate_limit.filter(record)
+    assert record.getMessage() == "Path 'a' ignored (7 similar messages suppressed)"
+
+
+def test_records_are_written_by_the_listener_thread(root_logger, tmp_path):
+    log_file = tmp_path / "dbp.log"
+    setup_application_logging("DEBUG", log_file, rate_limits={})
+    writers = []
+
+    class WriterRecorder(logging.Handler):
+        def emit(self, record):
+            writers.append(threading.current_thread())
+
+    log_utils._queue_listener.handlers += (WriterRecorder(),)
+    logging.getLogger("dbp.test").info("value %s", 42)
+    stop_application_logging()
+
+    assert "dbp.test - INFO - value 42" in log_file.read_text()
+    assert writers and threading.current_thread() not in writers
+
+
+def test_repeated_setup_keeps_one_rate_limit_filter_per_handler(root_logger, tmp_path):
+    setup_application_logging("INFO", tmp_path / "dbp.log")
+    setup_application_logging("DEBUG", tmp_path / "dbp.log", rate_limits={"dbp.fs_monitor": (1.0, 3)})
+
+    assert root_logger.handlers == [log_utils._queue_handler]
+    filters = [f for f in log_utils._queue_handler.filters if isinstance(f, RateLimitFilter)]
+    assert len(filters) == 1 and filters[0].limits == {"dbp.fs_monitor": (1.0, 3)}
+
+    setup_application_logging("DEBUG", tmp_path / "dbp.log", rate_limits={})
+    assert not [f for f in log_utils._queue_handler.filters if isinstance(f, RateLimitFilter)]
+
+
+def test_hot_path_modules_log_lazily():
+    offenders = []
+    for module in HOT_PATH_MODULES:
+        path = DBP_DIR / module
+        for node in ast.walk(ast.parse(path.read_text(), str(path))):
+            if (isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute)
+                    and node.func.attr in ("debug", "info") and node.args
+                    and (isinstance(node.args[0], ast.JoinedStr)
+                         or (isinstance(node.args[0], ast.Call)
+                             and getattr(node.args[0].func, "attr", None) == "format"))):
+                offenders.append(f"{module}:{node.lineno}")
+    assert not offenders, f"Use lazy %-style arguments for debug/info logging: {offenders}"
@@ -0,0 +1,144 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the instrumentation metrics and their Prometheus rendering.
+###############################################################################
+# [Source file design principles]
+# - Each test uses its own registry, the process registry is left untouched
+###############################################################################
+# [Source file constraints]
+# - None
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/metrics.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T05:30:00Z : Added histogram summary test by CodeAssistant
+# * Tested the count, mean and bucket percentiles of Histogram.summary
+# 2026-10-19T02:10:00Z : Added multi-process rendering tests by CodeAssistant
+# * Added render_families and registry reset tests
+# 2026-10-18T22:40:00Z : Created metrics tests by CodeAssistant
+# * Added thread sharding, histogram rendering and callback gauge tests
+###############################################################################
+
+"""
+Tests for the metrics registry.
+"""
+
+import threading
+
+import pytest
+
+from ..metrics import MetricsRegistry, render_families
+
+
+def test_counter_sums_the_updates_of_all_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("dbp_test_events", "Test events", ["type"])
+    child = counter.labels(type="created")
+
+    threads = [threading.Thread(target=lambda: [child.inc() for _ in range(5000)]) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    child.inc(2)
+
+    assert counter.labels("created") is child
+    assert child.get() == 20002
+    assert 'dbp_test_events_total{type="created"} 20002.0' in registry.render_prometheus()
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("dbp_test_seconds", "Test latency", buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value)
+
+    lines = registry.render_prometheus().splitlines()
+    assert lines[:2] == ["# HELP dbp_test_seconds Test latency", "# TYPE dbp_test_seconds histogram"]
+    assert lines[2:] == [
+        'dbp_test_seconds_bucket{le="0.1"} 2.0',
+        'dbp_test_seconds_bucket{le="1.0"} 3.0',
+        'dbp_test_seconds_bucket{le="+Inf"} 4.0',
+        "dbp_test_seconds_sum 3.65",
+        "dbp_test_seconds_count 4.0",
+    ]
+
+
+def test_histogram_summary_reports_bucket_percentiles():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("dbp_test_seconds", "Test latency", buckets=(0.1, 1.0))
+    assert histogram.summary() == {"count": 0, "sum": 0, "mean": 0.0, "p50": 0.0, "p90": 0.0, "p99": 0.0}
+
+    for value in (0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+
+    summary = histogram.summary()
+    assert summary["count"] == 4 and summary["mean"] == pytest.approx(0.9)
+    assert (summary["p50"], summary["p90"], summary["p99"]) == (0.1, 1.0, 1.0)
+
+
+def test_callback_gauges_and_registration_errors():
+    registry = MetricsRegistry()
+    gauge = registry.gauge("dbp_test_depth", "Test depth")
+    gauge.set(3)
+    assert "dbp_test_depth 3.0" in registry.render_prometheus()
+
+    gauge.set_function(lambda: 1 / 0)
+    assert registry.render_prometheus().splitlines()[2:] == []
+
+    assert registry.gauge("dbp_test_depth", "Test depth") is gauge
+    with pytest.raises(ValueError):
+        registry.counter("dbp_test_depth", "Test depth")
+    with pytest.raises(ValueError):
+        registry.counter("dbp_test_tokens", "Tokens", ["model"]).labels(model="m", direction="in")
+
+
+def test_render_families_labels_the_samples_of_each_process():
+    coordinator = MetricsRegistry()
+    coordinator.counter("dbp_test_events", "Test events", ["type"]).labels(type="created").inc(3)
+    worker = MetricsRegistry()
+    worker.counter("dbp_test_events", "Test events", ["type"]).labels(type="created").inc()
+    worker.histogram("dbp_test_seconds", "Test latency", buckets=(1.0,)).observe(0.5)
+
+    lines = render_families([("coordinator", coordinator.collect()), ("worker-0", worker.collect())]).splitlines()
+
+    assert lines == [
+        "# HELP dbp_test_events Test events",
+        "# TYPE dbp_test_events counter",
+        'dbp_test_events_total{process="coordinator",type="created"} 3.0',
+        'dbp_test_events_total{process="worker-0",type="created"} 1.0',
+        "# HELP dbp_test_seconds Test latency",
+        "# TYPE dbp_test_seconds histogram",
+        'dbp_test_seconds_bucket{process="worker-0",le="1.0"} 1.0',
+        'dbp_test_seconds_bucket{process="worker-0",le="+Inf"} 1.0',
+        'dbp_test_seconds_sum{process="worker-0"} 0.5',
+        'dbp_test_seconds_count{process="worker-0"} 1.0',
+    ]
+
+
+def test_reset_clears_values_but_keeps_children_recording():
+    registry = MetricsRegistry()
+    child = registry.counter("dbp_test_events", "Test events", ["type"]).labels(type="created")
+    gauge = registry.gauge("dbp_test_depth", "Test depth")
+    child.inc(5)
+    gauge.set_function(lambda: 7)
+
+    registry.reset()
+    child.inc()
+
+    assert child.get() == 1
+    assert gauge.get() == 0
@@ -0,0 +1,86 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the on-demand sampling profiler.
+###############################################################################
+# [Source file design principles]
+# - Profiles are short and sample a thread waiting on an event, whose stack
+#   is known in advance
+###############################################################################
+# [Source file constraints]
+# - Sample counts are only checked to be positive, never exact
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/profiler.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T23:10:00Z : Created profiler tests by CodeAssistant
+# * Added collapsed stack and triggered profile tests
+###############################################################################
+
+"""
+Tests for SamplingProfiler and triggered profiles.
+"""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ..profiler import ProfilerBusyError, SamplingProfiler, get_profile_status, start_profile
+
+
+def wait_for_release(release):
+    release.wait()
+
+
+def test_collapsed_stacks_of_all_threads(tmp_path):
+    release = threading.Event()
+    worker = threading.Thread(target=wait_for_release, args=(release,), name="worker")
+    worker.start()
+
+    profiler = SamplingProfiler(interval=0.001)
+    profiler.start()
+    time.sleep(0.1)
+    stats = profiler.stop()
+    release.set()
+    worker.join()
+
+    assert stats["samples"] > 0 and not profiler.is_running
+    worker_lines = [line for line in profiler.collapsed() if line.startswith("worker;")]
+    assert worker_lines
+    stack, count = worker_lines[0].rsplit(" ", 1)
+    assert any(frame.startswith("wait_for_release (test_profiler.py:") for frame in stack.split(";"))
+    assert int(count) > 0
+    assert not [line for line in profiler.collapsed() if line.startswith("SamplingProfiler;")]
+
+    path = profiler.write_collapsed(tmp_path / "out" / "profile.folded")
+    assert path.read_text().splitlines() == profiler.collapsed()
+
+
+def test_triggered_profile_writes_file_and_rejects_overlap(tmp_path):
+    started = start_profile(0.1, str(tmp_path), interval=0.001)
+    with pytest.raises(ProfilerBusyError):
+        start_profile(0.1, str(tmp_path))
+
+    deadline = time.time() + 5
+    while get_profile_status()["active"] is not None and time.time() < deadline:
+        time.sleep(0.02)
+
+    last = get_profile_status()["last"]
+    assert last["output"] == started["output"] and last["samples"] > 0
+    assert Path(started["output"]).parent == tmp_path
+    assert Path(started["output"]).read_text()
@@ -0,0 +1,208 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for sequential and parallel component initialization in ComponentSystem.
+###############################################################################
+# [Source file design principles]
+# - Components are minimal stand-ins that sleep and record lifecycle events
+# - Configuration is a plain namespace, no configuration files are read
+###############################################################################
+# [Source file constraints]
+# - Timing assertions keep wide margins to stay stable on loaded machines
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/system.py
+# codebase:src/dbp/core/component.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T20:40:00Z : Added deferred initialization tests by CodeAssistant
+# * Added background warm-up and deferred failure tests
+# 2026-10-18T20:10:00Z : Created ComponentSystem tests by CodeAssistant
+# * Added parallel initialization, rollback and timeout tests
+###############################################################################
+
+"""
+Tests for ComponentSystem initialization.
+"""
+
+import logging
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ..component import Component
+from ..exceptions import ComponentError, ComponentNotReadyError
+from ..system import ComponentSystem
+
+
+class _AllEnabled:
+    def __getattr__(self, name):
+        return True
+
+
+class FakeComponent(Component):
+    def __init__(self, name, events, delay=0.0, fail=False, deferrable=False):
+        super().__init__()
+        self._name = name
+        self.events = events
+        self.delay = delay
+        self.fail = fail
+        self.deferrable = deferrable
+
+    @property
+    def name(self):
+        return self._name
+
+    def initialize(self, context, dependencies=None):
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError(f"{self._name} failed")
+        self.events.append(("init", self._name))
+        self._initialized = True
+
+    def shutdown(self):
+        self.events.append(("shutdown", self._name))
+        self._initialized = False
+
+
+class FakeConfigManager(FakeComponent):
+    def __init__(self, events, **initialization):
+        super().__init__("config_manager", events)
+        self.typed_config = SimpleNamespace(
+            component_enabled=_AllEnabled(),
+            initialization=SimpleNamespace(**{
+                "parallel": True, "max_workers": 4, "level_timeout_seconds": 10,
+                "deferred_start": False, "component_wait_timeout_seconds": 5, **initialization,
+            }),
+        )
+
+    def get_typed_config(self):
+        return self.typed_config
+
+
+def make_system(events, components, **initialization):
+    system = ComponentSystem(config=None, logger=logging.getLogger("test_system"))
+    system.register(FakeConfigManager(events, **initialization), [])
+    for component, dependencies in components:
+        system.register(component, dependencies)
+    return system
+
+
+def test_independent_components_initialize_concurrently():
+    events = []
+    system = make_system(events, [
+        (FakeComponent("database", events, delay=0.3), ["config_manager"]),
+        (FakeComponent("fs_monitor", events, delay=0.3), ["config_manager"]),
+        (FakeComponent("file_access", events, delay=0.3), ["config_manager"]),
+        (FakeComponent("mcp_server", events), ["database", "fs_monitor"]),
+    ])
+
+    start = time.perf_counter()
+    assert system.initialize_all()
+    assert time.perf_counter() - start < 0.8
+
+    report = system.get_debug_info()["initialization"]
+    assert report["mode"] == "parallel"
+    assert [sorted(level) for level in report["levels"]] == [
+        ["config_manager"], ["database", "file_access", "fs_monitor"], ["mcp_server"],
+    ]
+    assert report["components"]["database"] >= 250
+    assert events[-1] == ("init", "mcp_server")
+
+    system.shutdown_all()
+    assert events[-1] == ("shutdown", "config_manager")
+
+
+def test_failure_rolls_back_in_reverse_order():
+    events = []
+    system = make_system(events, [
+        (FakeComponent("database", events, delay=0.1), ["config_manager"]),
+        (FakeComponent("fs_monitor", events, fail=True), ["config_manager"]),
+        (FakeComponent("mcp_server", events), ["database", "fs_monitor"]),
+    ])
+
+    with pytest.raises(RuntimeError, match="fs_monitor failed"):
+        system.initialize_all()
+
+    assert ("init", "mcp_server") not in events
+    assert events[-2:] == [("shutdown", "database"), ("shutdown", "config_manager")]
+    assert system.get_debug_info()["initialized"] == []
+
+
+def test_level_timeout_rolls_back_and_shuts_down_late_components():
+    events = []
+    system = make_system(events, [
+        (FakeComponent("database", events, delay=0.5), ["config_manager"]),
+    ], level_timeout_seconds=0.1)
+
+    with pytest.raises(ComponentError, match="timed out"):
+        system.initialize_all()
+    assert events[-1] == ("shutdown", "config_manager")
+
+    # The late component shuts itself down once its initialization returns
+    deadline = time.time() + 5
+    while ("shutdown", "database") not in events and time.time() < deadline:
+        time.sleep(0.05)
+    assert events[-2:] == [("init", "database"), ("shutdown", "database")]
+
+
+def test_deferred_components_warm_up_in_the_background():
+    events = []
+    system = make_system(events, [
+        (FakeComponent("mcp_server", events), ["config_manager"]),
+        (FakeComponent("database", events, delay=0.5, deferrable=True), ["config_manager"]),
+        (FakeComponent("llm_coordinator", events, deferrable=True), ["mcp_server", "database"]),
+        # A critical dependent keeps its deferrable dependency critical
+        (FakeComponent("fs_monitor", events, delay=0.1, deferrable=True), ["config_manager"]),
+        (FakeComponent("file_access", events), ["fs_monitor"]),
+    ], deferred_start=True)
+
+    start = time.perf_counter()
+    assert system.initialize_all()
+    assert time.perf_counter() - start < 0.4
+    assert system.get_readiness()["warming"] == ["database", "llm_coordinator"]
+    assert system.is_component_ready("file_access")
+
+    assert system.wait_for_component("llm_coordinator").is_initialized
+    assert system.wait_for_deferred(5)
+    assert system.get_readiness()["ready"]
+    assert "database" in system.get_debug_info()["initialization"]["components"]
+
+    system.shutdown_all()
+    assert events[-1] == ("shutdown", "config_manager")
+    assert events.index(("shutdown", "llm_coordinator")) < events.index(("shutdown", "database"))
+
+
+def test_deferred_failure_is_reported_to_waiters_without_stopping_the_system():
+    events = []
+    system = make_system(events, [
+        (FakeComponent("mcp_server", events), ["config_manager"]),
+        (FakeComponent("database", events, delay=0.2, fail=True, deferrable=True), ["config_manager"]),
+        (FakeComponent("llm_coordinator", events, deferrable=True), ["database"]),
+    ], deferred_start=True)
+    assert system.initialize_all()
+
+    with pytest.raises(ComponentNotReadyError):
+        system.wait_for_component("database", timeout=0.01)
+    with pytest.raises(ComponentError, match="database failed"):
+        system.wait_for_component("database")
+    with pytest.raises(ComponentError, match="Dependency 'database' failed"):
+        system.wait_for_component("llm_coordinator")
+
+    assert system.wait_for_deferred(5)
+    assert system.get_readiness()["components"] == {
+        "config_manager": "ready", "mcp_server": "ready", "database": "failed", "llm_coordinator": "failed",
+    }
@@ -0,0 +1,127 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the tiered heartbeat monitoring of the watchdog module.
+###############################################################################
+# [Source file design principles]
+# - Checks are driven with explicit timestamps, without waiting for stalls
+# - Each test uses its own HeartbeatMonitor, never the process-wide one
+###############################################################################
+# [Source file constraints]
+# - Timing assertions keep wide margins to stay stable on loaded machines
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/watchdog.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T22:10:00Z : Created heartbeat monitor tests by CodeAssistant
+# * Added escalation, idle heartbeat, event loop and overhead tests
+###############################################################################
+
+"""
+Tests for HeartbeatMonitor.
+"""
+
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+from ..watchdog import HeartbeatMonitor, run_event_loop_probe
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_stall_is_logged_then_escalated_to_a_diagnostics_file(tmp_path, caplog):
+    monitor = HeartbeatMonitor(escalation_misses=3, diagnostics_dir=tmp_path, stack_samples=1)
+    heartbeat = monitor.register("fs_monitor", 1.0)
+    heartbeat.beat()
+    start = heartbeat.last_beat
+
+    assert monitor.check(start + 0.5) == []
+    assert monitor.check(start + 2) == ["fs_monitor"]
+    assert "missed its heartbeat" in caplog.text
+    assert monitor.get_stats()["escalations"] == 0
+
+    monitor.check(start + 3)
+    monitor.check(start + 4)
+    assert wait_for(lambda: monitor.get_stats()["diagnostics_written"] == 1)
+    report = Path(monitor.get_stats()["last_diagnostics"]).read_text()
+    assert "Subsystem fs_monitor: no heartbeat" in report
+    assert f"({threading.get_ident()})" in report
+
+    # Recovery resets the misses, a new stall within the cooldown is not escalated again
+    heartbeat.beat()
+    monitor.check(heartbeat.last_beat)
+    assert heartbeat.misses == 0
+    for delay in range(2, 6):
+        monitor.check(heartbeat.last_beat + delay)
+    assert monitor.get_stats()["escalations"] == 1
+    monitor.stop()
+
+
+def test_idle_heartbeats_are_not_checked():
+    monitor = HeartbeatMonitor()
+    loop_heartbeat = monitor.register("fs_debouncer", 1.0)
+    database = monitor.register("database", 1.0)
+    assert monitor.register("database", 5.0) is database
+    now = time.monotonic()
+
+    loop_heartbeat.beat()
+    loop_heartbeat.pause()
+    database.begin()
+    database.begin()
+    database.end()
+    assert monitor.check(now + 10) == ["database"]
+    database.end()
+    assert monitor.check(now + 20) == []
+
+
+def test_blocked_event_loop_misses_its_heartbeat():
+    monitor = HeartbeatMonitor()
+    heartbeat = monitor.register("event_loop", 0.2)
+
+    async def block_loop():
+        probe = asyncio.ensure_future(run_event_loop_probe(heartbeat, 0.05))
+        await asyncio.sleep(0.1)
+        assert monitor.check() == []
+        time.sleep(0.4)
+        stalled = monitor.check()
+        probe.cancel()
+        return stalled
+
+    assert asyncio.run(block_loop()) == ["event_loop"]
+    assert heartbeat.last_beat is None
+
+
+def test_check_overhead_is_measured_and_small():
+    monitor = HeartbeatMonitor(check_interval=0.02)
+    heartbeats = [monitor.register(f"subsystem_{i}", 60.0) for i in range(100)]
+    for heartbeat in heartbeats:
+        heartbeat.beat()
+    monitor.start()
+    assert wait_for(lambda: monitor.get_stats()["checks"] >= 10)
+    monitor.stop()
+
+    stats = monitor.get_stats()
+    assert not stats["running"]
+    assert stats["max_check_time_ms"] < 50
+    assert stats["check_time_ms"] / stats["checks"] < 5
+    assert len(stats["heartbeats"]) == 100
@@ -14,7 +14,8 @@
 # [Source file intent]
 # Implements a watchdog mechanism to detect and handle system deadlocks.
 # Provides functionality to monitor process activity and automatically
-# terminate stuck processes to prevent system-wide failures.
+# terminate stuck processes to prevent system-wide failures, and a heartbeat
+# monitor detecting stalled subsystems of the running server.
 ###############################################################################
 # [Source file design principles]
 # - Thread-safe activity monitoring with configurable timeout threshold
@@ -22,6 +23,9 @@
 # - Provides detailed process diagnostics to aid debugging of deadlocks
 # - Automatic process termination with comprehensive exit information
 # - Non-invasive monitoring that minimizes performance impact
+# - Tiered runtime monitoring: per-subsystem heartbeats are checked cheaply,
+#   a miss is logged, only repeated misses trigger sampled diagnostics
+# - Diagnostics files are written by a background thread, rate limited
 ###############################################################################
 # [Source file constraints]
 # - Must be thread-safe to handle concurrent access from multiple components
@@ -34,22 +38,21 @@
 # codebase:- doc/design/COMPONENT_INITIALIZATION.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T22:40:00Z : Added event loop lag metric by CodeAssistant
+# * run_event_loop_probe records the overshoot of each sleep in dbp_event_loop_lag_seconds
+# 2026-10-18T22:10:00Z : Added tiered heartbeat monitor with sampled diagnostics by CodeAssistant
+# * Added Heartbeat and HeartbeatMonitor: per-subsystem heartbeats, warning on first miss, stack samples after repeated misses
+# * Diagnostics files written by a writer thread with a cooldown, check cost reported by get_stats()
+# * get_process_diagnostics lists open files and connections once, locals and process scan optional
+# * stop_watchdog releases the thread so the watchdog can be restarted for shutdown
+# 2026-10-18T21:40:00Z : Flushed asynchronous log records before forced exit by CodeAssistant
+# * Call stop_application_logging before os._exit so the diagnostics of the trigger are written
 # 2025-04-25T13:08:04Z : Fixed watchdog logging severity levels by CodeAssistant
 # * Adjusted log levels to reserve CRITICAL only for actual watchdog triggers
 # * Changed routine status checks from CRITICAL to INFO level
 # * Changed thread information logging from CRITICAL to DEBUG level
 # * Changed threshold exceeded notifications from CRITICAL to WARNING level
 # * Maintained CRITICAL level for actual watchdog trigger diagnostics
-# 2025-04-20T21:04:54Z : Enhanced watchdog to prioritize all thread stack traces on trigger by CodeAssistant
-# * Modified diagnostic display to prominently show all thread stack traces first
-# * Added clear section separators for better log readability
-# * Ensured main thread trace is displayed first followed by other threads
-# * Improved visibility of critical diagnostic information during deadlocks
-# 2025-04-20T10:43:35Z : Created watchdog module with conditional variable mechanism by CodeAssistant
-# * Implemented watchdog with condition variables instead of sleep-based polling
-# * Added thread-safe keepalive mechanism with minimal overhead
-# * Improved responsiveness to process activity updates
-# * Simplified implementation following KISS principles
 ###############################################################################
 
 import logging
@@ -59,7 +62,12 @@ import os
 import traceback
 import sys
 import inspect
-from typing import Dict, Any, Optional, Callable
+import queue
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+from .log_utils import stop_application_logging
+from .metrics import EVENT_LOOP_LAG_SECONDS
 
 # Global logger
 logger = logging.getLogger('dbp.core.watchdog')
@@ -210,6 +218,9 @@ def start_watchdog(timeout: int = 60, exit_handler: Optional[Callable] = None):
                     # Allow a small delay for exit handler to log info
                     time.sleep(1)
                     
+                    # Write the queued log records, os._exit skips atexit handlers
+                    stop_application_logging()
+                    
                     # Force terminate the process
                     os._exit(1)  # Use os._exit to ensure immediate exit
             except Exception as e:
@@ -235,15 +246,20 @@ def stop_watchdog():
     Clean shutdown of monitoring resources.
     Immediate notification for quick termination.
     """
-    global _watchdog_active
+    global _watchdog_active, _watchdog_thread
     
     with _condition:
         _watchdog_active = False
         _condition.notify_all()
     
+    # Let start_watchdog() start a new thread, e.g. to watch the shutdown
+    thread, _watchdog_thread = _watchdog_thread, None
+    if thread is not None and thread is not threading.current_thread():
+        thread.join(timeout=1.0)
+    
     logger.debug("Watchdog deactivated")
 
-def get_process_diagnostics() -> Dict[str, Any]:
+def get_process_diagnostics(include_locals: bool = True, include_related_processes: bool = True) -> Dict[str, Any]:
     """
     [Function intent]
     Gathers detailed diagnostics about the current process state, with enhanced detection
@@ -253,6 +269,7 @@ def get_process_diagnostics() -> Dict[str, Any]:
     Collects comprehensive information about threads, system resources, stack traces,
     thread states, waiting conditions, and potential deadlocks. Analyzes each thread's
     stack frames to identify functions that are likely blocking or waiting.
+    Open files and connections are listed once each.
     
     [Design principles]
     - Comprehensive diagnostics for any type of deadlock identification
@@ -260,6 +277,11 @@ def get_process_diagnostics() -> Dict[str, Any]:
     - Detailed local variable analysis in critical frames
     - Non-intrusive diagnostics that don't interfere with process state
     
+    Args:
+        include_locals: Whether to render the local variables of waiting and top frames
+        include_related_processes: Whether to list the other Python processes of the
+            machine, which enumerates every process
+    
     Returns:
         Dict with diagnostic information about the process state
     """
@@ -282,21 +304,19 @@ def get_process_diagnostics() -> Dict[str, Any]:
         
         diagnostics["CPU Usage"] = f"{process.cpu_percent()}%"
         diagnostics["Memory Usage"] = f"{process.memory_info().rss / (1024*1024):.1f} MB"
-        open_files_count = len(process.open_files())
-        open_conns_count = len(process.connections())
-        diagnostics["Open Files"] = open_files_count
-        diagnostics["Open Connections"] = open_conns_count
+        open_files = process.open_files()
+        connections = process.connections()
+        diagnostics["Open Files"] = len(open_files)
+        diagnostics["Open Connections"] = len(connections)
         
         # Get more details about open files and connections that might be related to deadlocks
-        if open_files_count > 0:
-            open_files = process.open_files()
+        if open_files:
             file_details = [f"{f.path} (mode: {f.mode})" for f in open_files[:20]]  # Limit to 20 files
             if len(open_files) > 20:
                 file_details.append(f"... and {len(open_files) - 20} more files")
             diagnostics["Open File Details"] = file_details
             
-        if open_conns_count > 0:
-            connections = process.connections()
+        if connections:
             conn_details = []
             for conn in connections[:20]:  # Limit to 20 connections
                 conn_details.append(f"{conn.laddr}→{conn.raddr if conn.raddr else 'N/A'} ({conn.status})")
@@ -357,8 +377,9 @@ def get_process_diagnostics() -> Dict[str, Any]:
                     
                     # Capture interesting local variables that might help diagnose the wait
                     wait_locals = {}
-                    for var_name in ['timeout', 'block', 'blocking', 'queue', 'lock', 'condition',
-                                    'event', 'self', 'obj', 'future', 'task', 'waiter']:
+                    wait_var_names = ['timeout', 'block', 'blocking', 'queue', 'lock', 'condition',
+                                      'event', 'self', 'obj', 'future', 'task', 'waiter'] if include_locals else []
+                    for var_name in wait_var_names:
                         if var_name in current_frame.f_locals:
                             var_val = current_frame.f_locals[var_name]
                             # Get a safe string representation
@@ -437,7 +458,7 @@ def get_process_diagnostics() -> Dict[str, Any]:
                 
                 # For interesting frames (like ones that might be involved in waiting),
                 # add more details about the local variables
-                if markers or i < 3:  # Show details for waiting frames or top frames
+                if include_locals and (markers or i < 3):  # Show details for waiting frames or top frames
                     if f_obj and f_obj.f_locals:
                         # Get key locals that might help diagnose issues
                         important_locals = {}
@@ -530,6 +551,8 @@ def get_process_diagnostics() -> Dict[str, Any]:
     
     # Get information about other running processes that might be related
     try:
+        if not include_related_processes:
+            return diagnostics
         import psutil
         
         # Get information about Python processes
@@ -600,3 +623,521 @@ def setup_watchdog_for_exit_handler(timeout: int, exit_handler_func: Callable):
         exit_handler_func: Function to call when watchdog is triggered
     """
     start_watchdog(timeout=timeout, exit_handler=exit_handler_func)
+
+
+# Tiered heartbeat monitoring of the running system
+#
+# Tier 1: each subsystem signals progress through a Heartbeat, a timestamp
+#         store, and the monitor compares the timestamps once per check
+# Tier 2: the first missed heartbeat logs a warning naming the subsystem
+# Tier 3: after repeated misses, stacks are sampled a few times and handed to
+#         a writer thread that adds process diagnostics and writes a file
+
+# Frames kept per thread in stack samples
+MAX_SAMPLE_DEPTH = 30
+
+
+class Heartbeat:
+    """
+    [Class intent]
+    Progress signal of one subsystem, checked by the HeartbeatMonitor.
+    
+    [Implementation details]
+    beat() stores the monotonic time and the calling thread: no lock, no
+    allocation. A paused heartbeat (last_beat None) is not checked, for loops
+    that block while idle. begin()/end() count operations in flight: the
+    heartbeat is only checked while at least one runs.
+    
+    [Design principles]
+    Signalling is cheap enough for every loop iteration or operation.
+    Idle subsystems are never reported as stalled.
+    """
+    __slots__ = ("name", "interval", "last_beat", "thread_id", "misses", "_in_flight", "_lock")
+    
+    def __init__(self, name: str, interval: float):
+        """
+        [Function intent]
+        Creates a paused heartbeat.
+        
+        Args:
+            name: Name of the subsystem
+            interval: Seconds without a beat after which the subsystem is stalled
+        """
+        self.name = name
+        self.interval = interval
+        self.last_beat: Optional[float] = None
+        self.thread_id: Optional[int] = None
+        self.misses = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+    
+    def beat(self) -> None:
+        """
+        [Function intent]
+        Signals progress of the subsystem.
+        """
+        self.last_beat = time.monotonic()
+        self.thread_id = threading.get_ident()
+    
+    def pause(self) -> None:
+        """
+        [Function intent]
+        Stops checking the heartbeat until the next beat, before an idle wait.
+        """
+        self.last_beat = None
+    
+    def begin(self) -> None:
+        """
+        [Function intent]
+        Signals the start of an operation, checked until the matching end().
+        """
+        with self._lock:
+            self._in_flight += 1
+            self.beat()
+    
+    def end(self) -> None:
+        """
+        [Function intent]
+        Signals the end of an operation started by begin().
+        """
+        with self._lock:
+            self._in_flight = max(0, self._in_flight - 1)
+            if self._in_flight:
+                self.beat()
+            else:
+                self.pause()
+    
+    def stalled_for(self, now: float) -> float:
+        """
+        [Function intent]
+        Returns the seconds elapsed since the last beat, 0 while paused.
+        """
+        last_beat = self.last_beat
+        return 0.0 if last_beat is None else now - last_beat
+
+
+class HeartbeatMonitor:
+    """
+    [Class intent]
+    Detects stalled subsystems from their heartbeats and escalates to
+    diagnostics only when a stall persists.
+    
+    [Implementation details]
+    A daemon thread checks the heartbeats every check_interval seconds. The
+    first miss of a heartbeat is logged; escalation_misses consecutive misses
+    trigger stack sampling, at most once per diagnostics_cooldown seconds.
+    Diagnostics files are written by a separate writer thread fed by a
+    bounded queue: the checking thread never waits on psutil or disk I/O.
+    The cost of each check is measured and reported by get_stats().
+    
+    [Design principles]
+    Cheap in the common case: one comparison per heartbeat per check.
+    Expensive diagnostics only for confirmed stalls, rate limited.
+    The monitor's own overhead is measured, not assumed.
+    """
+    
+    def __init__(self, check_interval: float = 1.0, escalation_misses: int = 3,
+                 diagnostics_dir: Optional[Path] = None, diagnostics_cooldown: float = 300.0,
+                 stack_samples: int = 3, sample_interval: float = 0.1):
+        """
+        [Function intent]
+        Creates the monitor, not started.
+        
+        Args:
+            check_interval: Seconds between heartbeat checks
+            escalation_misses: Consecutive missed checks before diagnostics
+            diagnostics_dir: Directory of diagnostics files, None to log a summary only
+            diagnostics_cooldown: Minimum seconds between two diagnostics
+            stack_samples: Stack samples taken per escalation
+            sample_interval: Seconds between stack samples
+        """
+        self.check_interval = check_interval
+        self.escalation_misses = escalation_misses
+        self.diagnostics_dir = Path(diagnostics_dir) if diagnostics_dir else None
+        self.diagnostics_cooldown = diagnostics_cooldown
+        self.stack_samples = stack_samples
+        self.sample_interval = sample_interval
+        self._heartbeats: Dict[str, Heartbeat] = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._writer_queue: "queue.Queue[Optional[Dict[str, Any]]]" = queue.Queue(maxsize=2)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._last_escalation: Optional[float] = None
+        self._started_at: Optional[float] = None
+        self._stats = {"checks": 0, "check_time_ms": 0.0, "max_check_time_ms": 0.0,
+                       "check_cpu_ms": 0.0, "misses": 0, "escalations": 0,
+                       "diagnostics_written": 0, "diagnostics_dropped": 0, "last_diagnostics": None}
+    
+    def register(self, name: str, interval: float) -> Heartbeat:
+        """
+        [Function intent]
+        Registers a subsystem, or returns its heartbeat if already registered.
+        
+        Args:
+            name: Name of the subsystem
+            interval: Seconds without a beat after which the subsystem is stalled
+            
+        Returns:
+            Heartbeat: The heartbeat the subsystem signals progress with
+        """
+        with self._lock:
+            heartbeat = self._heartbeats.get(name)
+            if heartbeat is None:
+                heartbeat = self._heartbeats[name] = Heartbeat(name, interval)
+            return heartbeat
+    
+    def unregister(self, name: str) -> None:
+        """
+        [Function intent]
+        Stops monitoring a subsystem.
+        """
+        with self._lock:
+            self._heartbeats.pop(name, None)
+    
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """
+        [Function intent]
+        Starts the checking thread.
+        """
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self._started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="heartbeat_monitor")
+        self._thread.start()
+        logger.info("Heartbeat monitor started: check every %ss, diagnostics after %s misses",
+                    self.check_interval, self.escalation_misses)
+    
+    def stop(self) -> None:
+        """
+        [Function intent]
+        Stops the checking and writer threads.
+        """
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.check_interval + 1.0)
+        writer, self._writer_thread = self._writer_thread, None
+        if writer is not None:
+            try:
+                self._writer_queue.put_nowait(None)
+            except queue.Full:
+                pass
+            writer.join(timeout=5.0)
+    
+    def _run(self) -> None:
+        """
+        [Function intent]
+        Checks the heartbeats until stopped, measuring the cost of each check.
+        """
+        while not self._stop_event.wait(self.check_interval):
+            started, cpu_started = time.perf_counter(), time.thread_time()
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Heartbeat check failed: {e}", exc_info=True)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self._stats["checks"] += 1
+            self._stats["check_time_ms"] += elapsed_ms
+            self._stats["check_cpu_ms"] += (time.thread_time() - cpu_started) * 1000
+            self._stats["max_check_time_ms"] = max(self._stats["max_check_time_ms"], elapsed_ms)
+    
+    def check(self, now: Optional[float] = None) -> List[str]:
+        """
+        [Function intent]
+        Checks every heartbeat once and escalates persistent stalls.
+        
+        [Implementation details]
+        Stack sampling, when escalating, runs on the calling thread and lasts
+        about (stack_samples - 1) * sample_interval seconds.
+        
+        Args:
+            now: Monotonic time of the check, current time if None
+            
+        Returns:
+            List[str]: Names of the stalled subsystems
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            heartbeats = list(self._heartbeats.values())
+        stalled = []
+        escalate = []
+        for heartbeat in heartbeats:
+            stalled_for = heartbeat.stalled_for(now)
+            if stalled_for <= heartbeat.interval:
+                if heartbeat.misses:
+                    logger.info("Subsystem '%s' recovered after %s missed heartbeat checks", heartbeat.name, heartbeat.misses)
+                    heartbeat.misses = 0
+                continue
+            heartbeat.misses += 1
+            self._stats["misses"] += 1
+            stalled.append(heartbeat.name)
+            if heartbeat.misses == 1:
+                logger.warning("Subsystem '%s' missed its heartbeat: no progress for %.1fs (limit %.1fs)",
+                               heartbeat.name, stalled_for, heartbeat.interval)
+            elif heartbeat.misses == self.escalation_misses:
+                escalate.append((heartbeat, stalled_for))
+        if escalate:
+            self._escalate(escalate, now)
+        return stalled
+    
+    def _escalate(self, stalls: List[Tuple[Heartbeat, float]], now: float) -> None:
+        """
+        [Function intent]
+        Samples the thread stacks and queues the diagnostics of persistent stalls.
+        """
+        names = ", ".join(heartbeat.name for heartbeat, _ in stalls)
+        if self._last_escalation is not None and now - self._last_escalation < self.diagnostics_cooldown:
+            logger.warning("Subsystems stalled: %s (diagnostics skipped, cooldown)", names)
+            return
+        self._last_escalation = now
+        self._stats["escalations"] += 1
+        logger.critical("Subsystems stalled for %s checks: %s, collecting diagnostics", self.escalation_misses, names)
+        
+        samples = []
+        for index in range(self.stack_samples):
+            if index:
+                time.sleep(self.sample_interval)
+            samples.append(sample_stacks())
+        report = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "pid": os.getpid(),
+            "stalls": [{"name": heartbeat.name, "stalled_seconds": round(stalled_for, 1),
+                        "interval": heartbeat.interval, "thread_id": heartbeat.thread_id}
+                       for heartbeat, stalled_for in stalls],
+            "samples": samples,
+        }
+        self._start_writer()
+        try:
+            self._writer_queue.put_nowait(report)
+        except queue.Full:
+            self._stats["diagnostics_dropped"] += 1
+            logger.warning("Diagnostics writer busy, dropped the diagnostics of: %s", names)
+    
+    def _start_writer(self) -> None:
+        """
+        [Function intent]
+        Starts the diagnostics writer thread on first use.
+        """
+        if self._writer_thread is None or not self._writer_thread.is_alive():
+            self._writer_thread = threading.Thread(target=self._write_diagnostics, daemon=True,
+                                                   name="heartbeat_diagnostics_writer")
+            self._writer_thread.start()
+    
+    def _write_diagnostics(self) -> None:
+        """
+        [Function intent]
+        Writer thread: completes queued reports with process diagnostics and
+        writes them to the diagnostics directory.
+        """
+        while True:
+            report = self._writer_queue.get()
+            if report is None:
+                return
+            try:
+                text = format_stall_report(report, get_process_diagnostics(
+                    include_locals=False, include_related_processes=False))
+                if self.diagnostics_dir is None:
+                    logger.critical(text)
+                    continue
+                self.diagnostics_dir.mkdir(parents=True, exist_ok=True)
+                path = self.diagnostics_dir / f"watchdog-{report['pid']}-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+                path.write_text(text, encoding="utf-8")
+                self._stats["diagnostics_written"] += 1
+                self._stats["last_diagnostics"] = str(path)
+                logger.critical("Stall diagnostics written to %s", path)
+            except Exception as e:
+                logger.error(f"Failed to write stall diagnostics: {e}", exc_info=True)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Reports the heartbeats and the overhead of the monitor.
+        
+        Returns:
+            Dict[str, Any]: Check counts and times, escalations, per-subsystem
+            state and the share of one CPU spent checking (overhead_percent)
+        """
+        now = time.monotonic()
+        stats = dict(self._stats)
+        uptime = now - self._started_at if self._started_at is not None else 0.0
+        stats["running"] = self.is_running
+        stats["overhead_percent"] = round(stats["check_cpu_ms"] / (uptime * 10), 4) if uptime else 0.0
+        with self._lock:
+            heartbeats = list(self._heartbeats.values())
+        stats["heartbeats"] = {
+            heartbeat.name: {"interval": heartbeat.interval, "misses": heartbeat.misses,
+                             "idle": heartbeat.last_beat is None,
+                             "seconds_since_beat": round(heartbeat.stalled_for(now), 3)}
+            for heartbeat in heartbeats
+        }
+        return stats
+    
+    def _after_fork(self) -> None:
+        """
+        [Function intent]
+        Resets the monitor in a forked child, which inherits neither the
+        threads nor the subsystems of the parent.
+        """
+        was_running = self._thread is not None
+        self._heartbeats = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._writer_thread = None
+        self._writer_queue = queue.Queue(maxsize=2)
+        if was_running:
+            self.start()
+
+
+def sample_stacks() -> Dict[str, List[str]]:
+    """
+    [Function intent]
+    Captures the current stack of every thread, without local variables.
+    
+    [Implementation details]
+    At most MAX_SAMPLE_DEPTH innermost frames per thread, source lines come
+    from the linecache.
+    
+    Returns:
+        Dict[str, List[str]]: "name (id)" -> frames, outermost first
+    """
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    return {
+        f"{names.get(thread_id, 'Unknown')} ({thread_id})":
+            [f"{f.filename}:{f.lineno} in {f.name}: {f.line}" for f in traceback.extract_stack(frame, limit=MAX_SAMPLE_DEPTH)]
+        for thread_id, frame in sys._current_frames().items()
+    }
+
+
+def format_stall_report(report: Dict[str, Any], diagnostics: Dict[str, Any]) -> str:
+    """
+    [Function intent]
+    Renders stall diagnostics as text.
+    
+    [Implementation details]
+    Threads of stalled subsystems come first. A thread whose stack is the
+    same in every sample is marked STUCK.
+    
+    Args:
+        report: Stalls and stack samples built by HeartbeatMonitor
+        diagnostics: Output of get_process_diagnostics()
+        
+    Returns:
+        str: Report text
+    """
+    lines = [f"Stall diagnostics, pid {report['pid']}, {report['time']}", ""]
+    stalled_threads = set()
+    for stall in report["stalls"]:
+        lines.append(f"Subsystem {stall['name']}: no heartbeat for {stall['stalled_seconds']}s "
+                     f"(limit {stall['interval']}s), last beat from thread {stall['thread_id']}")
+        stalled_threads.add(f"({stall['thread_id']})")
+    samples = report["samples"]
+    threads = sorted(samples[-1], key=lambda t: (not any(t.endswith(s) for s in stalled_threads), t))
+    for thread in threads:
+        stacks = [sample.get(thread) for sample in samples]
+        marker = " STUCK" if len(samples) > 1 and all(stack == stacks[0] for stack in stacks) else ""
+        lines.extend(["", f"Thread {thread}{marker}:"])
+        lines.extend(f"  {frame}" for frame in stacks[-1])
+    lines.extend(["", "Process diagnostics:"])
+    for key, value in diagnostics.items():
+        if key == "Stack Traces":
+            continue
+        if isinstance(value, list):
+            lines.append(f"{key}:")
+            lines.extend(f"  {item}" for item in value)
+        else:
+            lines.append(f"{key}: {value}")
+    return "\n".join(lines) + "\n"
+
+
+# Heartbeat monitor of the process
+_heartbeat_monitor = HeartbeatMonitor()
+
+
+def get_heartbeat_monitor() -> HeartbeatMonitor:
+    """
+    [Function intent]
+    Returns the heartbeat monitor of the process.
+    """
+    return _heartbeat_monitor
+
+
+def register_heartbeat(name: str, interval: float) -> Heartbeat:
+    """
+    [Function intent]
+    Registers a subsystem with the heartbeat monitor of the process.
+    
+    [Implementation details]
+    Registration does not start the monitor: beats are recorded at no cost
+    until start_heartbeat_monitor() is called.
+    
+    Args:
+        name: Name of the subsystem
+        interval: Seconds without a beat after which the subsystem is stalled
+        
+    Returns:
+        Heartbeat: The heartbeat the subsystem signals progress with
+    """
+    return _heartbeat_monitor.register(name, interval)
+
+
+def start_heartbeat_monitor(config: Any) -> HeartbeatMonitor:
+    """
+    [Function intent]
+    Configures and starts the heartbeat monitor of the process.
+    
+    Args:
+        config: WatchdogConfig section of the application configuration
+        
+    Returns:
+        HeartbeatMonitor: The monitor, not started if disabled
+    """
+    monitor = _heartbeat_monitor
+    monitor.check_interval = config.check_interval_seconds
+    monitor.escalation_misses = config.escalation_misses
+    monitor.diagnostics_cooldown = config.diagnostics_cooldown_seconds
+    monitor.stack_samples = config.stack_samples
+    monitor.diagnostics_dir = Path(config.diagnostics_dir).expanduser() if config.diagnostics_dir else None
+    if config.enabled:
+        monitor.start()
+    return monitor
+
+
+async def run_event_loop_probe(heartbeat: Heartbeat, period: float) -> None:
+    """
+    [Function intent]
+    Beats a heartbeat from the running event loop, so that a blocked loop
+    shows as a stalled subsystem.
+    
+    [Implementation details]
+    Sleeps period seconds between beats: the heartbeat misses when the loop
+    lags by more than heartbeat.interval - period. The overshoot of each
+    sleep is recorded in the dbp_event_loop_lag_seconds histogram.
+    
+    Args:
+        heartbeat: Heartbeat of the event loop
+        period: Seconds between beats, well below heartbeat.interval
+    """
+    import asyncio
+    try:
+        while True:
+            heartbeat.beat()
+            wake_time = time.monotonic() + period
+            await asyncio.sleep(period)
+            EVENT_LOOP_LAG_SECONDS.observe(max(0.0, time.monotonic() - wake_time))
+    finally:
+        heartbeat.pause()
+
+
+def _reset_heartbeat_monitor_after_fork() -> None:
+    _heartbeat_monitor._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_heartbeat_monitor_after_fork)
@@ -38,42 +38,45 @@
 # - Requires configuration object providing database settings.
 # - Depends on SQLAlchemy library.
 # - Assumes `models.py` defines the `Base` and `SchemaVersion` model.
+# - Forked processes (MCP server workers) must not use the pooled connections
+#   of their parent: the engine pool is discarded in the child after a fork.
+# - Once attached to the MCP server coordinator channel, only the coordinator
+#   opens sessions; workers run repository operations through call_repository().
 # - Schema migration is handled by AlembicManager.
 ###############################################################################
 # [Dependencies]
 # codebase:- doc/DATA_MODEL.md
 # codebase:- doc/DESIGN.md
 # codebase:- doc/CONFIGURATION.md
+# codebase:- src/dbp/core/metrics.py
 ###############################################################################
 # [GenAI tool change history]
-# 2025-04-19T23:52:00Z : Added dependency injection support by CodeAssistant
-# * Updated initialize() method to accept dependencies parameter
-# * Added support for obtaining configuration either from injected dependencies or context
-# * Enhanced method documentation to follow three-section format
-# 2025-04-18T10:54:00Z : Refactored to use AlembicManager for migrations by CodeAssistant
-# * Extracted Alembic migration code to dedicated AlembicManager class
-# * Added proper function documentation for all methods
-# * Updated database initialization to use AlembicManager
-# * Reduced file size and complexity
-# 2025-04-18T09:31:00Z : Modified Alembic to throw errors without fallbacks by CodeAssistant
-# * Removed fallback behavior in ImportError and OperationalError cases 
-# * Enforced strict dependency on Alembic for database schema management
-# * Ensured database failures propagate properly without silent fallbacks
-# 2025-04-18T08:15:00Z : Fixed database URL configuration in Alembic setup by CodeAssistant
-# * Modified _run_alembic_migrations to construct database URL from configuration
-# * Fixed error: "Configuration key 'database.url' not found"
-# * Implemented database type-specific URL construction for SQLite and PostgreSQL
+# 2026-10-19T04:20:00Z : Routed worker database access through the coordinator by CodeAssistant
+# * Added attach_coordinator() registering the database.repository operation on the MCP server coordinator channel
+# * Added call_repository()/acall_repository() running repository operations in the coordinator
+# * Sessions are refused in MCP server workers once the coordinator is attached
+# 2026-10-19T01:30:00Z : Reset the engine pool in forked children by CodeAssistant
+# * Registered an after-fork hook disposing the inherited connection pool and scoped sessions
+# 2026-10-18T22:40:00Z : Added session wait metric by CodeAssistant
+# * get_session acquires its connection up front and records the wait in dbp_db_session_wait_seconds
+# 2026-10-18T22:10:00Z : Added database heartbeat by CodeAssistant
+# * get_session checks the database heartbeat while transactions are in flight
+# * Session debug logging formats lazily
 ###############################################################################
 
+import asyncio
 import os
 import logging
 import time
 import shutil
 import sqlite3
 import traceback
+import weakref
 from contextlib import contextmanager
 from typing import List, Any, Dict, Optional
 from ..core.component import Component, InitializationContext
+from ..core.watchdog import register_heartbeat
+from ..core.metrics import DB_SESSION_WAIT_SECONDS
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import QueuePool
@@ -92,6 +95,31 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Seconds a transaction may run without another starting or ending before
+# the database is considered stalled
+HEARTBEAT_INTERVAL = 60.0
+
+
+def _reset_after_fork(manager_ref) -> None:
+    """
+    [Function intent]
+    Discard the connections a forked child inherited from its parent.
+
+    [Implementation details]
+    - dispose(close=False) drops the pool without closing the connections,
+      which still belong to the parent; the child opens its own on demand
+    - The thread-local sessions of the parent are forgotten, not closed
+
+    Args:
+        manager_ref: Weak reference to the DatabaseManager
+    """
+    manager = manager_ref()
+    if manager is None or manager.engine is None:
+        return
+    manager.engine.dispose(close=False)
+    if manager.Session is not None:
+        manager.Session.registry.clear()
+
 class DatabaseComponent(Component):
     """
     [Class intent]
@@ -107,6 +135,9 @@ class DatabaseComponent(Component):
     Centralized database initialization and configuration.
     """
 
+    # Schema migrations may take long: initialized in the background
+    deferrable = True
+
     def __init__(self):
         """
         [Function intent]
@@ -121,6 +152,8 @@ class DatabaseComponent(Component):
         """
         super().__init__()
         self._db_manager = None
+        self._coordinator = None
+        self._repositories: Dict[str, Any] = {}
         self.logger = logging.getLogger(f"dbp.{self.name}")
 
     @property
@@ -247,6 +280,7 @@ class DatabaseComponent(Component):
         if not self._initialized:
             self.logger.error("Attempted to access database manager before initialization")
             raise RuntimeError("Database component not initialized")
+        self._check_connection_owner()
             
         return self._db_manager
         
@@ -270,6 +304,7 @@ class DatabaseComponent(Component):
         if not self._initialized:
             self.logger.error("Attempted to get database session before initialization")
             raise RuntimeError("Database component not initialized")
+        self._check_connection_owner()
             
         return self._db_manager.get_session()
         
@@ -298,9 +333,130 @@ class DatabaseComponent(Component):
         if not self._initialized:
             self.logger.error("Attempted to execute database operation before initialization")
             raise RuntimeError("Database component not initialized")
+        self._check_connection_owner()
             
         return self._db_manager.execute_with_retry(operation, max_retries, retry_interval)
 
+    def attach_coordinator(self, channel) -> None:
+        """
+        [Function intent]
+        Serves the database operations of the forked MCP server workers from
+        the coordinator process.
+        
+        [Implementation details]
+        Registers "database.repository" on the channel. Once attached, the
+        processes other than the coordinator cannot open sessions: their
+        repository operations run in the coordinator through call_repository(),
+        so a single process writes to the database.
+        
+        [Design principles]
+        One connection pool, owned by the coordinator.
+        
+        Args:
+            channel: CoordinatorChannel of the MCP server, attached before the fork
+        """
+        channel.register("database.repository", self._run_repository_operation)
+        self._coordinator = channel
+
+    def call_repository(self, repository: str, method: str, *args, **kwargs) -> Any:
+        """
+        [Function intent]
+        Runs a repository operation in the process owning the database connections.
+        
+        [Implementation details]
+        Without attached coordinator the operation runs in this process. With it,
+        the operation runs in the coordinator (directly there, through the
+        channel in workers); arguments and result must be picklable.
+        
+        [Design principles]
+        Same call in every deployment mode.
+        
+        Args:
+            repository: Repository class name, e.g. "DocumentRepository"
+            method: Name of the repository method
+            *args: Positional arguments of the method
+            **kwargs: Keyword arguments of the method
+            
+        Returns:
+            Result of the repository method
+            
+        Raises:
+            RuntimeError: If accessed before initialization
+            CoordinatorError: If the operation fails in the coordinator
+        """
+        if self._coordinator is not None:
+            return self._coordinator.call("database.repository", repository, method, args, kwargs)
+        return self._run_repository_operation(repository, method, args, kwargs)
+
+    async def acall_repository(self, repository: str, method: str, *args, **kwargs) -> Any:
+        """
+        [Function intent]
+        Runs a repository operation like call_repository() without blocking the event loop.
+        
+        [Implementation details]
+        Uses the channel's acall() when attached, a worker thread otherwise.
+        
+        Args:
+            repository: Repository class name, e.g. "DocumentRepository"
+            method: Name of the repository method
+            *args: Positional arguments of the method
+            **kwargs: Keyword arguments of the method
+            
+        Returns:
+            Result of the repository method
+        """
+        if self._coordinator is not None:
+            return await self._coordinator.acall("database.repository", repository, method, args, kwargs)
+        return await asyncio.to_thread(self._run_repository_operation, repository, method, args, kwargs)
+
+    def _run_repository_operation(self, repository: str, method: str, args: tuple, kwargs: dict) -> Any:
+        """
+        [Function intent]
+        Executes a repository method with the database manager of this process.
+        
+        [Implementation details]
+        Repositories are instantiated once per class name and reused; they are
+        stateless apart from the database manager.
+        
+        Args:
+            repository: Repository class name exported by dbp.database.repositories
+            method: Name of the repository method
+            args: Positional arguments of the method
+            kwargs: Keyword arguments of the method
+            
+        Returns:
+            Result of the repository method
+            
+        Raises:
+            ValueError: If the repository or method does not exist
+            RuntimeError: If accessed before initialization
+        """
+        from . import repositories
+        
+        if not self._initialized:
+            raise RuntimeError("Database component not initialized")
+        instance = self._repositories.get(repository)
+        if instance is None:
+            repository_class = getattr(repositories, repository, None) if repository in repositories.__all__ else None
+            if repository_class is None or repository_class is repositories.BaseRepository:
+                raise ValueError(f"Unknown repository '{repository}'")
+            instance = self._repositories.setdefault(repository, repository_class(self._db_manager))
+        if method.startswith("_") or not callable(getattr(instance, method, None)):
+            raise ValueError(f"Unknown operation '{method}' of repository '{repository}'")
+        return getattr(instance, method)(*args, **kwargs)
+
+    def _check_connection_owner(self) -> None:
+        """
+        [Function intent]
+        Refuses direct database access in processes not owning the connections.
+        
+        Raises:
+            RuntimeError: In an MCP server worker once the coordinator is attached
+        """
+        if self._coordinator is not None and not self._coordinator.is_coordinator:
+            raise RuntimeError("Database sessions are owned by the coordinator process, "
+                               "use call_repository() in MCP server workers")
+
 
 class DatabaseManager:
     """Manages database connections, sessions, and schema initialization."""
@@ -321,6 +477,8 @@ class DatabaseManager:
         self.Session = None
         self.initialized = False
         self.db_path = None
+        self._fork_hook_registered = False
+        self._heartbeat = register_heartbeat("database", HEARTBEAT_INTERVAL)
         logger.debug("DatabaseManager instantiated.")
 
     def initialize(self):
@@ -383,6 +541,11 @@ class DatabaseManager:
             self.Session = scoped_session(sessionmaker(bind=self.engine))
             logger.debug("Scoped session factory created.")
 
+            # Forked children (MCP server workers, process pools) open their own connections
+            if hasattr(os, "register_at_fork") and not self._fork_hook_registered:
+                os.register_at_fork(after_in_child=lambda ref=weakref.ref(self): _reset_after_fork(ref))
+                self._fork_hook_registered = True
+
             # Mark as initialized so we can use sessions in schema initialization
             self.initialized = True
 
@@ -683,17 +846,25 @@ class DatabaseManager:
 
     @contextmanager
     def get_session(self):
-        """Provides a transactional scope around a series of operations."""
+        """
+        Provides a transactional scope around a series of operations.
+        The database heartbeat is checked while transactions are in flight.
+        The connection is acquired up front so that the time spent waiting
+        for the pool is recorded in dbp_db_session_wait_seconds.
+        """
         if not self.initialized:
             logger.error("DatabaseManager not initialized. Call initialize() first.")
             raise RuntimeError("Database not initialized. Call initialize() first.")
 
         session = self.Session()
-        logger.debug(f"Session {id(session)} acquired from scoped session factory.")
+        self._heartbeat.begin()
+        logger.debug("Session %s acquired from scoped session factory.", id(session))
         try:
+            with DB_SESSION_WAIT_SECONDS.time():
+                session.connection()
             yield session
             session.commit()
-            logger.debug(f"Session {id(session)} committed.")
+            logger.debug("Session %s committed.", id(session))
         except SQLAlchemyError as e:
             logger.error(f"SQLAlchemy error in session {id(session)}, rolling back: {e}", exc_info=True)
             session.rollback()
@@ -703,8 +874,9 @@ class DatabaseManager:
             session.rollback()
             raise # Re-raise the original exception
         finally:
-            logger.debug(f"Session {id(session)} closed.")
+            logger.debug("Session %s closed.", id(session))
             self.Session.remove() # Return session to the pool/registry
+            self._heartbeat.end()
 
     def execute_with_retry(self, operation, max_retries=3, retry_interval=1):
         """
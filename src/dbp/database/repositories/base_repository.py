@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:00:02Z : Created base_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted BaseRepository class from original repositories.py
 ###############################################################################
@@ -76,7 +78,7 @@ class BaseRepository:
         if not isinstance(db_manager, DatabaseManager):
              raise TypeError("db_manager must be an instance of DatabaseManager")
         self.db_manager = db_manager
-        logger.debug(f"{self.__class__.__name__} initialized.")
+        logger.debug("%s initialized.", self.__class__.__name__)
 
     def _log_error(self, operation: str, error: Exception):
         """
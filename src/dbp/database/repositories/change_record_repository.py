@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:35:04Z : Created change_record_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted ChangeRecordRepository class from original repositories.py
 ###############################################################################
@@ -76,7 +78,7 @@ class ChangeRecordRepository(BaseRepository):
             records_data: List of dictionaries with change record data.
         """
         operation = "bulk_create_change_records"
-        logger.debug(f"{operation}: Adding {len(records_data)} change records for document ID {document_id}.")
+        logger.debug("%s: Adding %s change records for document ID %s.", operation, len(records_data), document_id)
         try:
             with self.db_manager.get_session() as session:
                  # Simple approach: delete existing and add new ones for the document
@@ -92,7 +94,7 @@ class ChangeRecordRepository(BaseRepository):
                     session.add(record)
                     added_count += 1
                 session.flush()
-                logger.info(f"{operation}: Added {added_count} change records for document ID {document_id}.")
+                logger.info("%s: Added %s change records for document ID %s.", operation, added_count, document_id)
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
 
@@ -115,13 +117,13 @@ class ChangeRecordRepository(BaseRepository):
             A list of ChangeRecord objects for the document.
         """
         operation = "get_change_records_by_document"
-        logger.debug(f"{operation}: Fetching change records for document ID {document_id}.")
+        logger.debug("%s: Fetching change records for document ID %s.", operation, document_id)
         try:
             with self.db_manager.get_session() as session:
                 records = session.query(ChangeRecord).filter(
                     ChangeRecord.document_id == document_id
                 ).order_by(ChangeRecord.timestamp.desc()).all()
-                logger.debug(f"{operation}: Found {len(records)} change records for document ID {document_id}.")
+                logger.debug("%s: Found %s change records for document ID %s.", operation, len(records), document_id)
                 return records
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
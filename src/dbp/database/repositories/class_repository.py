@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:15:43Z : Created class_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted ClassRepository class from original repositories.py
 ###############################################################################
@@ -76,7 +78,7 @@ class ClassRepository(BaseRepository):
             classes_data: List of dictionaries with class metadata.
         """
         operation = "bulk_create_or_update_classes"
-        logger.debug(f"{operation}: Processing {len(classes_data)} classes for document ID {document_id}.")
+        logger.debug("%s: Processing %s classes for document ID %s.", operation, len(classes_data), document_id)
         try:
             with self.db_manager.get_session() as session:
                 existing_classes = {c.name: c for c in session.query(Class).filter_by(document_id=document_id).all()}
@@ -99,7 +101,7 @@ class ClassRepository(BaseRepository):
                         cls.start_line = data.get('start_line', cls.start_line)
                         cls.end_line = data.get('end_line', cls.end_line)
                         updated_count += 1
-                        logger.debug(f"{operation}: Updating class '{name}' for document ID {document_id}.")
+                        logger.debug("%s: Updating class '%s' for document ID %s.", operation, name, document_id)
                     else:
                         # Create new class
                         cls = Class(
@@ -114,9 +116,9 @@ class ClassRepository(BaseRepository):
                         )
                         session.add(cls)
                         added_count += 1
-                        logger.debug(f"{operation}: Adding new class '{name}' for document ID {document_id}.")
+                        logger.debug("%s: Adding new class '%s' for document ID %s.", operation, name, document_id)
 
                 session.flush()
-                logger.info(f"{operation}: Document ID {document_id}: {added_count} classes added, {updated_count} updated.")
+                logger.info("%s: Document ID %s: %s classes added, %s updated.", operation, document_id, added_count, updated_count)
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
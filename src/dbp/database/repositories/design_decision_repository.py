@@ -32,6 +32,8 @@
 # codebase:- doc/DESIGN_DECISIONS.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:33:27Z : Created design_decision_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted DesignDecisionRepository class from original repositories.py
 ###############################################################################
@@ -77,7 +79,7 @@ class DesignDecisionRepository(BaseRepository):
             decisions_data: List of dictionaries with design decision data.
         """
         operation = "bulk_create_or_update_design_decisions"
-        logger.debug(f"{operation}: Processing {len(decisions_data)} design decisions for document ID {document_id}.")
+        logger.debug("%s: Processing %s design decisions for document ID %s.", operation, len(decisions_data), document_id)
         try:
             with self.db_manager.get_session() as session:
                 # Simple approach: delete existing and add new ones for the document
@@ -94,6 +96,6 @@ class DesignDecisionRepository(BaseRepository):
                     session.add(decision)
                     added_count += 1
                 session.flush()
-                logger.info(f"{operation}: Added {added_count} design decisions for document ID {document_id}.")
+                logger.info("%s: Added %s design decisions for document ID %s.", operation, added_count, document_id)
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
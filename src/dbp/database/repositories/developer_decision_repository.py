@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:32:19Z : Created developer_decision_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted DeveloperDecisionRepository class from original repositories.py
 ###############################################################################
@@ -82,7 +84,7 @@ class DeveloperDecisionRepository(BaseRepository):
             The created DeveloperDecision object or None if creation failed.
         """
         operation = "create_developer_decision"
-        logger.debug(f"{operation}: Recording decision '{decision}' for recommendation ID {recommendation_id}.")
+        logger.debug("%s: Recording decision '%s' for recommendation ID %s.", operation, decision, recommendation_id)
         try:
             with self.db_manager.get_session() as session:
                 # Ensure recommendation exists
@@ -100,7 +102,7 @@ class DeveloperDecisionRepository(BaseRepository):
                 )
                 session.add(dev_decision)
                 session.flush()
-                logger.info(f"{operation}: Decision '{decision}' recorded with ID {dev_decision.id} for recommendation ID {recommendation_id}.")
+                logger.info("%s: Decision '%s' recorded with ID %s for recommendation ID %s.", operation, decision, dev_decision.id, recommendation_id)
                 return dev_decision
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -125,13 +127,13 @@ class DeveloperDecisionRepository(BaseRepository):
             A list of DeveloperDecision objects for the recommendation.
         """
         operation = "get_decisions_by_recommendation"
-        logger.debug(f"{operation}: Fetching decisions for recommendation ID {recommendation_id}.")
+        logger.debug("%s: Fetching decisions for recommendation ID %s.", operation, recommendation_id)
         try:
             with self.db_manager.get_session() as session:
                 decisions = session.query(DeveloperDecision).filter(
                     DeveloperDecision.recommendation_id == recommendation_id
                 ).order_by(DeveloperDecision.timestamp.desc()).all()
-                logger.debug(f"{operation}: Found {len(decisions)} decisions for recommendation ID {recommendation_id}.")
+                logger.debug("%s: Found %s decisions for recommendation ID %s.", operation, len(decisions), recommendation_id)
                 return decisions
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:00:55Z : Created document_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted DocumentRepository class from original repositories.py
 ###############################################################################
@@ -86,7 +88,7 @@ class DocumentRepository(BaseRepository):
             The created Document object or None if creation failed.
         """
         operation = "create_document"
-        logger.debug(f"{operation}: Creating document for path '{path}' in project {project_id}.")
+        logger.debug("%s: Creating document for path '%s' in project %s.", operation, path, project_id)
         try:
             with self.db_manager.get_session() as session:
                 document = Document(
@@ -107,7 +109,7 @@ class DocumentRepository(BaseRepository):
 
                 session.add(document)
                 session.flush() # Flush to get the ID if needed immediately
-                logger.info(f"{operation}: Document created with ID {document.id} for path '{path}'.")
+                logger.info("%s: Document created with ID %s for path '%s'.", operation, document.id, path)
                 # Eager load relationships if needed, though usually not required on create
                 # session.refresh(document, attribute_names=['project'])
                 return document
@@ -133,15 +135,15 @@ class DocumentRepository(BaseRepository):
             The Document object if found, otherwise None.
         """
         operation = "get_document_by_path"
-        logger.debug(f"{operation}: Getting document for path '{path}'.")
+        logger.debug("%s: Getting document for path '%s'.", operation, path)
         try:
             with self.db_manager.get_session() as session:
                 # Consider adding options like joinedload for relationships if frequently accessed
                 document = session.query(Document).filter(Document.path == path).first()
                 if document:
-                    logger.debug(f"{operation}: Found document ID {document.id} for path '{path}'.")
+                    logger.debug("%s: Found document ID %s for path '%s'.", operation, document.id, path)
                 else:
-                    logger.debug(f"{operation}: No document found for path '{path}'.")
+                    logger.debug("%s: No document found for path '%s'.", operation, path)
                 return document
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -165,14 +167,14 @@ class DocumentRepository(BaseRepository):
             The Document object if found, otherwise None.
         """
         operation = "get_document_by_id"
-        logger.debug(f"{operation}: Getting document for ID {document_id}.")
+        logger.debug("%s: Getting document for ID %s.", operation, document_id)
         try:
             with self.db_manager.get_session() as session:
                 document = session.query(Document).get(document_id)
                 if document:
-                    logger.debug(f"{operation}: Found document ID {document.id}.")
+                    logger.debug("%s: Found document ID %s.", operation, document.id)
                 else:
-                    logger.debug(f"{operation}: No document found for ID {document_id}.")
+                    logger.debug("%s: No document found for ID %s.", operation, document_id)
                 return document
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -199,7 +201,7 @@ class DocumentRepository(BaseRepository):
             True if the update was successful, False otherwise.
         """
         operation = "update_document"
-        logger.debug(f"{operation}: Updating document ID {document_id} with data: {list(update_data.keys())}.")
+        logger.debug("%s: Updating document ID %s with data: %s.", operation, document_id, list(update_data.keys()))
         try:
             with self.db_manager.get_session() as session:
                 document = session.query(Document).get(document_id)
@@ -225,7 +227,7 @@ class DocumentRepository(BaseRepository):
                 document.last_modified = datetime.datetime.now()
 
                 session.flush() # Commit happens at the end of the 'with' block
-                logger.info(f"{operation}: Document ID {document_id} updated successfully.")
+                logger.info("%s: Document ID %s updated successfully.", operation, document_id)
                 return True
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -250,14 +252,14 @@ class DocumentRepository(BaseRepository):
             True if deletion was successful, False otherwise.
         """
         operation = "delete_document"
-        logger.debug(f"{operation}: Deleting document ID {document_id}.")
+        logger.debug("%s: Deleting document ID %s.", operation, document_id)
         try:
             with self.db_manager.get_session() as session:
                 document = session.query(Document).get(document_id)
                 if document:
                     session.delete(document)
                     session.flush() # Commit happens at the end of the 'with' block
-                    logger.info(f"{operation}: Document ID {document_id} deleted successfully.")
+                    logger.info("%s: Document ID %s deleted successfully.", operation, document_id)
                     return True
                 else:
                     logger.warning(f"{operation}: Document ID {document_id} not found for deletion.")
@@ -286,14 +288,14 @@ class DocumentRepository(BaseRepository):
         """
         operation = "list_documents_by_project"
         filter_msg = f" for project ID {project_id}" + (f" and type '{document_type}'" if document_type else "")
-        logger.debug(f"{operation}: Listing documents{filter_msg}.")
+        logger.debug("%s: Listing documents%s.", operation, filter_msg)
         try:
             with self.db_manager.get_session() as session:
                 query = session.query(Document).filter(Document.project_id == project_id)
                 if document_type:
                     query = query.filter(Document.type == document_type)
                 documents = query.all()
-                logger.debug(f"{operation}: Found {len(documents)} documents{filter_msg}.")
+                logger.debug("%s: Found %s documents%s.", operation, len(documents), filter_msg)
                 return documents
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -318,7 +320,7 @@ class DocumentRepository(BaseRepository):
             The Document object if found, otherwise None.
         """
         operation = "find_document_by_md5"
-        logger.debug(f"{operation}: Searching for MD5 '{md5_digest}' in project {project_id}.")
+        logger.debug("%s: Searching for MD5 '%s' in project %s.", operation, md5_digest, project_id)
         try:
             with self.db_manager.get_session() as session:
                 document = session.query(Document).filter(
@@ -326,9 +328,9 @@ class DocumentRepository(BaseRepository):
                     Document.md5_digest == md5_digest
                 ).first()
                 if document:
-                    logger.debug(f"{operation}: Found document ID {document.id} with MD5 '{md5_digest}'.")
+                    logger.debug("%s: Found document ID %s with MD5 '%s'.", operation, document.id, md5_digest)
                 else:
-                    logger.debug(f"{operation}: No document found with MD5 '{md5_digest}'.")
+                    logger.debug("%s: No document found with MD5 '%s'.", operation, md5_digest)
                 return document
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:14:25Z : Created function_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted FunctionRepository class from original repositories.py
 ###############################################################################
@@ -76,7 +78,7 @@ class FunctionRepository(BaseRepository):
             functions_data: List of dictionaries with function metadata.
         """
         operation = "bulk_create_or_update_functions"
-        logger.debug(f"{operation}: Processing {len(functions_data)} functions for document ID {document_id}.")
+        logger.debug("%s: Processing %s functions for document ID %s.", operation, len(functions_data), document_id)
         try:
             with self.db_manager.get_session() as session:
                 existing_functions = {f.name: f for f in session.query(Function).filter_by(document_id=document_id).all()}
@@ -100,7 +102,7 @@ class FunctionRepository(BaseRepository):
                         func.start_line = data.get('start_line', func.start_line)
                         func.end_line = data.get('end_line', func.end_line)
                         updated_count += 1
-                        logger.debug(f"{operation}: Updating function '{name}' for document ID {document_id}.")
+                        logger.debug("%s: Updating function '%s' for document ID %s.", operation, name, document_id)
                     else:
                         # Create new function
                         func = Function(
@@ -116,7 +118,7 @@ class FunctionRepository(BaseRepository):
                         )
                         session.add(func)
                         added_count += 1
-                        logger.debug(f"{operation}: Adding new function '{name}' for document ID {document_id}.")
+                        logger.debug("%s: Adding new function '%s' for document ID %s.", operation, name, document_id)
 
                 # Optionally delete functions that were in DB but not in new data
                 # current_names = {data['name'] for data in functions_data if 'name' in data}
@@ -126,6 +128,6 @@ class FunctionRepository(BaseRepository):
                 #         logger.debug(f"{operation}: Deleting obsolete function '{name}' for document ID {document_id}.")
 
                 session.flush()
-                logger.info(f"{operation}: Document ID {document_id}: {added_count} functions added, {updated_count} updated.")
+                logger.info("%s: Document ID %s: %s functions added, %s updated.", operation, document_id, added_count, updated_count)
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:16:49Z : Created inconsistency_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted InconsistencyRepository class from original repositories.py
 ###############################################################################
@@ -84,7 +86,7 @@ class InconsistencyRepository(BaseRepository):
             The created Inconsistency object or None if creation failed.
         """
         operation = "create_inconsistency"
-        logger.debug(f"{operation}: Creating inconsistency: type='{type}', severity='{severity}'.")
+        logger.debug("%s: Creating inconsistency: type='%s', severity='%s'.", operation, type, severity)
         try:
             with self.db_manager.get_session() as session:
                 inconsistency = Inconsistency(
@@ -104,7 +106,7 @@ class InconsistencyRepository(BaseRepository):
 
                 session.add(inconsistency)
                 session.flush()
-                logger.info(f"{operation}: Inconsistency created with ID {inconsistency.id}.")
+                logger.info("%s: Inconsistency created with ID %s.", operation, inconsistency.id)
                 return inconsistency
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -127,13 +129,13 @@ class InconsistencyRepository(BaseRepository):
             A list of Inconsistency objects with 'Pending' status.
         """
         operation = "get_pending_inconsistencies"
-        logger.debug(f"{operation}: Fetching pending inconsistencies.")
+        logger.debug("%s: Fetching pending inconsistencies.", operation)
         try:
             with self.db_manager.get_session() as session:
                 inconsistencies = session.query(Inconsistency).filter(
                     Inconsistency.status == "Pending"
                 ).options(joinedload(Inconsistency.affected_documents)).all()
-                logger.debug(f"{operation}: Found {len(inconsistencies)} pending inconsistencies.")
+                logger.debug("%s: Found %s pending inconsistencies.", operation, len(inconsistencies))
                 return inconsistencies
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -158,14 +160,14 @@ class InconsistencyRepository(BaseRepository):
             True if the update was successful, False otherwise.
         """
         operation = "update_inconsistency_status"
-        logger.debug(f"{operation}: Updating status of inconsistency ID {inconsistency_id} to '{new_status}'.")
+        logger.debug("%s: Updating status of inconsistency ID %s to '%s'.", operation, inconsistency_id, new_status)
         try:
             with self.db_manager.get_session() as session:
                 inconsistency = session.query(Inconsistency).get(inconsistency_id)
                 if inconsistency:
                     inconsistency.status = new_status
                     session.flush()
-                    logger.info(f"{operation}: Status updated for inconsistency ID {inconsistency_id}.")
+                    logger.info("%s: Status updated for inconsistency ID %s.", operation, inconsistency_id)
                     return True
                 else:
                     logger.warning(f"{operation}: Inconsistency ID {inconsistency_id} not found.")
@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:11:08Z : Created project_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted ProjectRepository class from original repositories.py
 ###############################################################################
@@ -79,13 +81,13 @@ class ProjectRepository(BaseRepository):
             The created Project object or None if creation failed.
         """
         operation = "create_project"
-        logger.debug(f"{operation}: Creating project '{name}' at path '{root_path}'.")
+        logger.debug("%s: Creating project '%s' at path '%s'.", operation, name, root_path)
         try:
             with self.db_manager.get_session() as session:
                 project = Project(name=name, root_path=root_path, description=description)
                 session.add(project)
                 session.flush()
-                logger.info(f"{operation}: Project '{name}' created with ID {project.id}.")
+                logger.info("%s: Project '%s' created with ID %s.", operation, name, project.id)
                 return project
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -109,14 +111,14 @@ class ProjectRepository(BaseRepository):
             The Project object if found, otherwise None.
         """
         operation = "get_project_by_root_path"
-        logger.debug(f"{operation}: Getting project for root path '{root_path}'.")
+        logger.debug("%s: Getting project for root path '%s'.", operation, root_path)
         try:
             with self.db_manager.get_session() as session:
                 project = session.query(Project).filter(Project.root_path == root_path).first()
                 if project:
-                    logger.debug(f"{operation}: Found project ID {project.id} for path '{root_path}'.")
+                    logger.debug("%s: Found project ID %s for path '%s'.", operation, project.id, root_path)
                 else:
-                    logger.debug(f"{operation}: No project found for path '{root_path}'.")
+                    logger.debug("%s: No project found for path '%s'.", operation, root_path)
                 return project
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -140,14 +142,14 @@ class ProjectRepository(BaseRepository):
             The Project object if found, otherwise None.
         """
         operation = "get_project_by_id"
-        logger.debug(f"{operation}: Getting project for ID {project_id}.")
+        logger.debug("%s: Getting project for ID %s.", operation, project_id)
         try:
             with self.db_manager.get_session() as session:
                 project = session.query(Project).get(project_id)
                 if project:
-                    logger.debug(f"{operation}: Found project ID {project.id}.")
+                    logger.debug("%s: Found project ID %s.", operation, project.id)
                 else:
-                    logger.debug(f"{operation}: No project found for ID {project_id}.")
+                    logger.debug("%s: No project found for ID %s.", operation, project_id)
                 return project
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -168,11 +170,11 @@ class ProjectRepository(BaseRepository):
             A list of all Project objects.
         """
         operation = "list_all_projects"
-        logger.debug(f"{operation}: Listing all projects.")
+        logger.debug("%s: Listing all projects.", operation)
         try:
             with self.db_manager.get_session() as session:
                 projects = session.query(Project).all()
-                logger.debug(f"{operation}: Found {len(projects)} projects.")
+                logger.debug("%s: Found %s projects.", operation, len(projects))
                 return projects
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
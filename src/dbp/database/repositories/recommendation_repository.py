@@ -31,6 +31,8 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:18:25Z : Created recommendation_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted RecommendationRepository class from original repositories.py
 ###############################################################################
@@ -83,7 +85,7 @@ class RecommendationRepository(BaseRepository):
             The created Recommendation object or None if creation failed.
         """
         operation = "create_recommendation"
-        logger.debug(f"{operation}: Creating recommendation '{title}'.")
+        logger.debug("%s: Creating recommendation '%s'.", operation, title)
         try:
             with self.db_manager.get_session() as session:
                 recommendation = Recommendation(
@@ -121,7 +123,7 @@ class RecommendationRepository(BaseRepository):
                     inc.status = "InRecommendation"
 
                 session.flush()
-                logger.info(f"{operation}: Recommendation '{title}' created with ID {recommendation.id}.")
+                logger.info("%s: Recommendation '%s' created with ID %s.", operation, title, recommendation.id)
                 return recommendation
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -143,7 +145,7 @@ class RecommendationRepository(BaseRepository):
             The active Recommendation object or None if no active recommendation exists.
         """
         operation = "get_active_recommendation"
-        logger.debug(f"{operation}: Fetching active recommendation.")
+        logger.debug("%s: Fetching active recommendation.", operation)
         try:
             with self.db_manager.get_session() as session:
                 # Load relationships eagerly
@@ -155,9 +157,9 @@ class RecommendationRepository(BaseRepository):
                 ).order_by(Recommendation.creation_timestamp).first() # Get the oldest active one
 
                 if recommendation:
-                    logger.debug(f"{operation}: Found active recommendation ID {recommendation.id}.")
+                    logger.debug("%s: Found active recommendation ID %s.", operation, recommendation.id)
                 else:
-                    logger.debug(f"{operation}: No active recommendation found.")
+                    logger.debug("%s: No active recommendation found.", operation)
                 return recommendation
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -185,7 +187,7 @@ class RecommendationRepository(BaseRepository):
             True if the update was successful, False otherwise.
         """
         operation = "update_recommendation_status"
-        logger.debug(f"{operation}: Updating status of recommendation ID {recommendation_id} to '{new_status}'.")
+        logger.debug("%s: Updating status of recommendation ID %s to '%s'.", operation, recommendation_id, new_status)
         try:
             with self.db_manager.get_session() as session:
                 recommendation = session.query(Recommendation).get(recommendation_id)
@@ -198,7 +200,7 @@ class RecommendationRepository(BaseRepository):
                          recommendation.developer_feedback = None
 
                     session.flush()
-                    logger.info(f"{operation}: Status updated for recommendation ID {recommendation_id}.")
+                    logger.info("%s: Status updated for recommendation ID %s.", operation, recommendation_id)
                     return True
                 else:
                     logger.warning(f"{operation}: Recommendation ID {recommendation_id} not found.")
@@ -227,7 +229,7 @@ class RecommendationRepository(BaseRepository):
             True if an active recommendation was invalidated, False otherwise.
         """
         operation = "invalidate_active_recommendation"
-        logger.debug(f"{operation}: Invalidating active recommendation due to change at {change_timestamp}.")
+        logger.debug("%s: Invalidating active recommendation due to change at %s.", operation, change_timestamp)
         try:
             with self.db_manager.get_session() as session:
                 recommendation = session.query(Recommendation).filter(Recommendation.status == "Active").first()
@@ -235,10 +237,10 @@ class RecommendationRepository(BaseRepository):
                     recommendation.status = "Invalidated"
                     recommendation.last_codebase_change_timestamp = change_timestamp
                     session.flush()
-                    logger.info(f"{operation}: Active recommendation ID {recommendation.id} invalidated.")
+                    logger.info("%s: Active recommendation ID %s invalidated.", operation, recommendation.id)
                     return True
                 else:
-                    logger.debug(f"{operation}: No active recommendation to invalidate.")
+                    logger.debug("%s: No active recommendation to invalidate.", operation)
                     return False # Or True, as there was nothing to do?
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -265,7 +267,7 @@ class RecommendationRepository(BaseRepository):
         """
         operation = "delete_old_recommendations"
         cutoff_date = datetime.datetime.now() - datetime.timedelta(days=days_old)
-        logger.info(f"{operation}: Deleting recommendations created before {cutoff_date}.")
+        logger.info("%s: Deleting recommendations created before %s.", operation, cutoff_date)
         try:
             with self.db_manager.get_session() as session:
                 # Find old recommendations (excluding Active ones)
@@ -275,7 +277,7 @@ class RecommendationRepository(BaseRepository):
                 )
                 count = query.delete(synchronize_session=False)
                 session.flush()
-                logger.info(f"{operation}: Deleted {count} old recommendations.")
+                logger.info("%s: Deleted %s old recommendations.", operation, count)
                 return count
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -33,6 +33,8 @@
 # codebase:- doc/DOCUMENT_RELATIONSHIPS.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-15T22:13:00Z : Created relationship_repository.py as part of repositories.py refactoring by CodeAssistant
 # * Extracted RelationshipRepository class from original repositories.py
 ###############################################################################
@@ -84,7 +86,7 @@ class RelationshipRepository(BaseRepository):
             None if creation failed.
         """
         operation = "create_relationship"
-        logger.debug(f"{operation}: Creating relationship {relationship_type} from {source_id} to {target_id}.")
+        logger.debug("%s: Creating relationship %s from %s to %s.", operation, relationship_type, source_id, target_id)
         try:
             with self.db_manager.get_session() as session:
                 # Check if relationship already exists to avoid duplicates
@@ -108,7 +110,7 @@ class RelationshipRepository(BaseRepository):
                 )
                 session.add(relationship)
                 session.flush()
-                logger.info(f"{operation}: Relationship created with ID {relationship.id}.")
+                logger.info("%s: Relationship created with ID %s.", operation, relationship.id)
                 return relationship
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -133,14 +135,14 @@ class RelationshipRepository(BaseRepository):
             A list of DocumentRelationship objects involving the document.
         """
         operation = "get_relationships_for_document"
-        logger.debug(f"{operation}: Getting relationships for document ID {document_id}.")
+        logger.debug("%s: Getting relationships for document ID %s.", operation, document_id)
         try:
             with self.db_manager.get_session() as session:
                 relationships = session.query(DocumentRelationship).filter(
                     (DocumentRelationship.source_id == document_id) |
                     (DocumentRelationship.target_id == document_id)
                 ).options(joinedload(DocumentRelationship.source), joinedload(DocumentRelationship.target)).all()
-                logger.debug(f"{operation}: Found {len(relationships)} relationships for document ID {document_id}.")
+                logger.debug("%s: Found %s relationships for document ID %s.", operation, len(relationships), document_id)
                 return relationships
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -164,7 +166,7 @@ class RelationshipRepository(BaseRepository):
             True if deletion was successful, False otherwise.
         """
         operation = "delete_relationships_for_document"
-        logger.debug(f"{operation}: Deleting relationships for document ID {document_id}.")
+        logger.debug("%s: Deleting relationships for document ID %s.", operation, document_id)
         try:
             with self.db_manager.get_session() as session:
                 deleted_count = session.query(DocumentRelationship).filter(
@@ -172,7 +174,7 @@ class RelationshipRepository(BaseRepository):
                     (DocumentRelationship.target_id == document_id)
                 ).delete(synchronize_session=False)
                 session.flush()
-                logger.info(f"{operation}: Deleted {deleted_count} relationships for document ID {document_id}.")
+                logger.info("%s: Deleted %s relationships for document ID %s.", operation, deleted_count, document_id)
                 return True
         except SQLAlchemyError as e:
             self._handle_sqla_error(operation, e)
@@ -45,25 +45,24 @@
 # codebase:src/dbp/fs_monitor/dispatch/thread_manager.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T04:20:00Z : Routed worker calls through the coordinator channel by CodeAssistant
+# * Added attach_coordinator() registering the fs_monitor.* operations on the MCP server coordinator channel
+# * Listener registration and dispatch statistics calls of MCP server workers are forwarded to the coordinator
+# 2026-10-19T00:10:00Z : Configured slow listener isolation by CodeAssistant
+# * Passed slow_listener_p95_ms and isolated_thread_count to the event dispatcher
+# * Added get_dispatch_stats() reporting per-listener queue and handler times
+# 2026-10-18T18:00:00Z : Fixed listener registration by CodeAssistant
+# * register_listener() no longer passes patterns to WatchManager.register_listener(), which does not accept them, and returns the watch handle
 # 2025-05-01T11:43:00Z : Fixed initialization flag setting by CodeAssistant
 # * Added explicit setting of _initialized flag to True
 # * Fixed "Component failed to set is_initialized flag to True" error
 # * Resolved server startup failure caused by missing initialized state
-# 2025-05-01T11:41:00Z : Fixed config access method by CodeAssistant
-# * Changed all calls to get_config() to get_typed_config()
-# * Fixed "'ConfigManagerComponent' object has no attribute 'get_config'" error
-# * Updated component to use typed configuration access for type safety
-# 2025-05-01T11:39:00Z : Updated initialize and configure methods by CodeAssistant
-# * Fixed initialize method signature to match Component base class requirements
-# * Added proper context and dependencies parameters to initialize method
-# * Updated configure method to raise error when called without initialization
-# * Fixed "initialize() takes 1 positional argument but 3 were given" error 
 ###############################################################################
 
 import logging
 import os
 import threading
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Tuple
 
 from ..core.component import Component
 from ..config.config_manager import ConfigurationManager as ConfigManager
@@ -72,6 +71,7 @@ from .dispatch.event_dispatcher import EventDispatcher
 from .dispatch.thread_manager import ThreadPriority
 from .platforms.factory import FileSystemMonitorFactory
 from .core.listener import FileSystemEventListener
+from .core.handle import WatchHandle
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +91,9 @@ class FSMonitorComponent(Component):
     - Manages watch_manager, event_dispatcher, and platform_monitor
     - Handles component configuration
     - Provides registration methods for other components
+    - Attached to the MCP server coordinator channel, the monitor runs in the
+      coordinator only: the registration calls of forked workers are forwarded
+      to it and their listeners handle events there
     """
     
     @property
@@ -138,6 +141,9 @@ class FSMonitorComponent(Component):
         self._platform_monitor = None
         self._lock = threading.RLock()
         self._started = False
+        self._coordinator = None
+        self._remote_watches: Dict[int, WatchHandle] = {}
+        self._next_remote_watch_id = 1
     
     def initialize(self, context: 'InitializationContext', dependencies: Dict[str, 'Component'] = None) -> None:
         """
@@ -186,7 +192,9 @@ class FSMonitorComponent(Component):
             self._event_dispatcher.configure(
                 thread_count=fs_monitor_config.thread_count,
                 thread_priority=thread_priority,
-                default_debounce_ms=fs_monitor_config.default_debounce_ms
+                default_debounce_ms=fs_monitor_config.default_debounce_ms,
+                slow_listener_p95_ms=fs_monitor_config.slow_listener_p95_ms,
+                isolated_thread_count=fs_monitor_config.isolated_thread_count
             )
             
             # Create platform-specific monitor
@@ -298,7 +306,7 @@ class FSMonitorComponent(Component):
             
             logger.info("FSMonitorComponent shut down")
     
-    def register_listener(self, listener: FileSystemEventListener, patterns: List[str] = None) -> int:
+    def register_listener(self, listener: FileSystemEventListener, patterns: List[str] = None) -> WatchHandle:
         """
         [Function intent]
         Register a file system event listener.
@@ -309,23 +317,35 @@ class FSMonitorComponent(Component):
         
         [Implementation details]
         - Delegates to watch_manager for listener registration
-        - Returns listener ID for future reference
+        - The watched paths are defined by the listener's path_pattern;
+          patterns is accepted for compatibility and not used
+        - Returns the watch handle, which unregisters the listener
+        
+        - In an MCP server worker the listener is registered in the coordinator
+          through the channel; it must be picklable and handles events there
         
         Args:
             listener: The listener to register
-            patterns: List of path patterns to watch
+            patterns: Unused, see listener.path_pattern
             
         Returns:
-            Listener ID
+            Watch handle of the registration
             
         Raises:
             RuntimeError: If the component is not initialized
+            CoordinatorError: If the registration fails in the coordinator
         """
+        if self._in_worker():
+            channel = self._coordinator
+            watch_id, watched_paths = channel.call("fs_monitor.register_listener", listener)
+            return WatchHandle(listener, set(watched_paths),
+                               lambda: channel.call("fs_monitor.unregister_watch", watch_id))
+        
         with self._lock:
             if not self._watch_manager:
                 raise RuntimeError("FSMonitorComponent not initialized")
             
-            return self._watch_manager.register_listener(listener, patterns)
+            return self._watch_manager.register_listener(listener)
     
     def unregister_listener(self, listener_id: int) -> None:
         """
@@ -345,6 +365,10 @@ class FSMonitorComponent(Component):
         Raises:
             RuntimeError: If the component is not initialized
         """
+        if self._in_worker():
+            self._coordinator.call("fs_monitor.unregister_listener", listener_id)
+            return
+        
         with self._lock:
             if not self._watch_manager:
                 raise RuntimeError("FSMonitorComponent not initialized")
@@ -370,12 +394,111 @@ class FSMonitorComponent(Component):
         Raises:
             RuntimeError: If the component is not initialized
         """
+        if self._in_worker():
+            self._coordinator.call("fs_monitor.update_listener_patterns", listener_id, patterns)
+            return
+        
         with self._lock:
             if not self._watch_manager:
                 raise RuntimeError("FSMonitorComponent not initialized")
             
             self._watch_manager.update_listener_patterns(listener_id, patterns)
     
+    def get_dispatch_stats(self) -> List[Dict[str, Any]]:
+        """
+        [Function intent]
+        Report how the events of every listener are dispatched.
+        
+        [Design principles]
+        - Observability of slow listeners
+        
+        [Implementation details]
+        - Delegates to the event dispatcher
+        
+        Returns:
+            One dictionary per listener queue with its priority, concurrency cap,
+            isolation, counters and queue and handler time percentiles in ms
+            
+        Raises:
+            RuntimeError: If the component is not initialized
+        """
+        if self._in_worker():
+            return self._coordinator.call("fs_monitor.get_dispatch_stats")
+        
+        with self._lock:
+            if not self._event_dispatcher:
+                raise RuntimeError("FSMonitorComponent not initialized")
+            
+            return self._event_dispatcher.get_listener_stats()
+    
+    def attach_coordinator(self, channel) -> None:
+        """
+        [Function intent]
+        Serve the fs_monitor operations of forked MCP server workers from the
+        coordinator process.
+        
+        [Design principles]
+        - File system watches and event dispatch exist in the coordinator only
+        
+        [Implementation details]
+        - Registers the fs_monitor.* operations on the channel
+        - Must be called in the coordinator before the workers are forked, which
+          then forward their calls through the channel
+        
+        Args:
+            channel: CoordinatorChannel of the MCP server
+        """
+        channel.register("fs_monitor.register_listener", self._register_remote_listener)
+        channel.register("fs_monitor.unregister_watch", self._unregister_remote_watch)
+        channel.register("fs_monitor.unregister_listener", self.unregister_listener)
+        channel.register("fs_monitor.update_listener_patterns", self.update_listener_patterns)
+        channel.register("fs_monitor.get_dispatch_stats", self.get_dispatch_stats)
+        self._coordinator = channel
+    
+    def _in_worker(self) -> bool:
+        """
+        [Function intent]
+        Check whether calls must be forwarded to the coordinator process.
+        
+        Returns:
+            bool: True in an MCP server worker once the coordinator is attached
+        """
+        return self._coordinator is not None and not self._coordinator.is_coordinator
+    
+    def _register_remote_listener(self, listener: FileSystemEventListener) -> Tuple[int, List[str]]:
+        """
+        [Function intent]
+        Register the listener of a worker, in the coordinator.
+        
+        [Implementation details]
+        - The watch handle stays in the coordinator, the worker refers to it by id
+        
+        Args:
+            listener: Unpickled listener sent by the worker
+            
+        Returns:
+            Tuple of the watch id and the watched paths
+        """
+        handle = self.register_listener(listener)
+        with self._lock:
+            watch_id = self._next_remote_watch_id
+            self._next_remote_watch_id += 1
+            self._remote_watches[watch_id] = handle
+        return watch_id, handle.list_watched_paths()
+    
+    def _unregister_remote_watch(self, watch_id: int) -> None:
+        """
+        [Function intent]
+        Unregister a listener registered by a worker, in the coordinator.
+        
+        Args:
+            watch_id: Watch id returned by _register_remote_listener()
+        """
+        with self._lock:
+            handle = self._remote_watches.pop(watch_id, None)
+        if handle is not None:
+            handle.unregister()
+    
     def configure(self) -> None:
         """
         [Function intent]
@@ -410,7 +533,9 @@ class FSMonitorComponent(Component):
                 self._event_dispatcher.configure(
                     thread_count=fs_monitor_config.thread_count,
                     thread_priority=thread_priority,
-                    default_debounce_ms=fs_monitor_config.default_debounce_ms
+                    default_debounce_ms=fs_monitor_config.default_debounce_ms,
+                    slow_listener_p95_ms=fs_monitor_config.slow_listener_p95_ms,
+                    isolated_thread_count=fs_monitor_config.isolated_thread_count
                 )
             
             # Update platform monitor configuration (if applicable)
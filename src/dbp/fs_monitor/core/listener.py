@@ -29,13 +29,16 @@
 # - Must maintain backward compatibility with existing file system event handlers
 # - Abstract class must be easy to implement by client code
 # - Path pattern property is mandatory for all implementations
-# - Filter function and debounce delay are optional with reasonable defaults
+# - Filter function, debounce delay, dispatch priority and concurrency are optional
+#   with reasonable defaults
 ###############################################################################
 # [Dependencies]
 # system:abc
 # system:typing
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T00:10:00Z : Added dispatch scheduling properties by CodeAssistant
+# * Added dispatch_priority and max_concurrency properties read by the dispatch thread pool
 # 2025-04-28T23:50:00Z : Initial implementation of abstract listener class for fs_monitor redesign by CodeAssistant
 # * Created FileSystemEventListener abstract base class
 # * Implemented BaseFileSystemEventListener with default no-op methods
@@ -265,6 +268,44 @@ class FileSystemEventListener(ABC):
             Delay in milliseconds
         """
         return 100
+    
+    @property
+    def dispatch_priority(self) -> Optional[str]:
+        """
+        [Function intent]
+        Gets the priority of this listener's events in the dispatch thread pool.
+        
+        [Design principles]
+        - Latency-sensitive listeners are served before background work
+        
+        [Implementation details]
+        - "low", "normal" or "high"; None (the default) follows the
+          fs_monitor.thread_priority setting
+        - Higher priority events are taken first by the worker threads, events
+          of equal priority in arrival order
+        
+        Returns:
+            Priority name, or None for the configured default
+        """
+        return None
+    
+    @property
+    def max_concurrency(self) -> int:
+        """
+        [Function intent]
+        Gets the maximum number of this listener's events handled at the same time.
+        
+        [Design principles]
+        - Sequential handling by default, listeners need no locking
+        
+        [Implementation details]
+        - Default value is 1: events are handled one at a time, in dispatch order
+        - Listeners with thread-safe handlers can raise it to use several workers
+        
+        Returns:
+            Maximum number of concurrent handler calls
+        """
+        return 1
 
 
 class BaseFileSystemEventListener(FileSystemEventListener):
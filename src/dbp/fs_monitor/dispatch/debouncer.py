@@ -40,32 +40,33 @@
 # codebase:src/dbp/fs_monitor/event_types.py
 ###############################################################################
 # [GenAI tool change history]
-# 2025-04-29T15:25:00Z : Renamed Debouncer class to EventDebouncer by CodeAssistant
-# * Changed class name to match import in dispatch/__init__.py
-# * Fixed "cannot import name 'EventDebouncer'" error during server startup
-# 2025-04-29T14:00:00Z : Fixed import path for watch_manager by CodeAssistant
-# * Changed import from .watch_manager to ..watch_manager
-# * Fixed import error causing server startup failure
-# 2025-04-29T13:40:00Z : Fixed import path for event_types by CodeAssistant
-# * Changed import from .event_types to ..core.event_types 
-# * Fixed "No module named 'dbp.fs_monitor.dispatch.event_types'" error
-# 2025-04-29T00:08:00Z : Initial implementation of debouncer for fs_monitor redesign by CodeAssistant
-# * Created Debouncer class for event debouncing
-# * Implemented PendingEvent dataclass for priority queue
-# * Added scheduler thread for efficient event processing
+# 2026-10-19T00:10:00Z : Stopped sleeping under the debouncer lock by CodeAssistant
+# * The scheduler waits on a condition of the lock instead of sleeping while holding it, which blocked add_event for up to 100 ms
+# * add_event wakes up the scheduler when the new event is due first
+# 2026-10-18T23:40:00Z : Fixed delivery of debounced events by CodeAssistant
+# * Pending events keep the listener IDs they were routed to; the scheduler dispatched to a new, empty WatchManager and never reached a listener
+# * PendingEvent orders on dispatch_time only
+# 2026-10-18T22:40:00Z : Added pending_count property by CodeAssistant
+# * Exposed the number of pending events for the queue depth gauge
+# 2026-10-18T22:10:00Z : Added fs_debouncer heartbeat by CodeAssistant
+# * Scheduler loop beats the fs_debouncer heartbeat once per iteration
 ###############################################################################
 
 import time
 import threading
 import logging
 from typing import Dict, Set, List, Any, Optional, Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import heapq
 
+from ...core.watchdog import register_heartbeat
 from ..core.event_types import EventType, FileSystemEvent
 
 logger = logging.getLogger(__name__)
 
+# Seconds without a scheduler loop iteration after which the debouncer is stalled
+HEARTBEAT_INTERVAL = 10.0
+
 
 @dataclass(order=True)
 class PendingEvent:
@@ -81,13 +82,16 @@ class PendingEvent:
     - Comparable for use in a priority queue
     - Dispatched_time determines when the event should be dispatched
     - Event contains the original filesystem event
+    - Only dispatch_time is compared, events of the same time are never ordered
     
     Attributes:
         dispatch_time: When the event should be dispatched (in seconds since epoch)
         event: The filesystem event to dispatch
+        listener_ids: The listeners the event was routed to when it was added
     """
     dispatch_time: float
-    event: FileSystemEvent = None  # This will be compared by reference, so it's fine
+    event: FileSystemEvent = field(default=None, compare=False)
+    listener_ids: List[int] = field(default_factory=list, compare=False)
 
 
 class EventDebouncer:
@@ -123,6 +127,7 @@ class EventDebouncer:
             dispatch_callback: Function to call when an event is ready to be dispatched
         """
         self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)  # Notified when an event is due earlier
         self._pending_events: List[PendingEvent] = []  # Priority queue (heap)
         self._path_events: Dict[str, Set[EventType]] = {}  # Events pending for each path
         self._dispatch_callback = dispatch_callback
@@ -171,6 +176,7 @@ class EventDebouncer:
             self._scheduler_running = False
             self._pending_events = []
             self._path_events.clear()
+            self._wakeup.notify()
             logger.debug("Stopped debouncer scheduler thread")
     
     def add_event(self, event: FileSystemEvent, listener_ids: List[int], 
@@ -185,7 +191,8 @@ class EventDebouncer:
         
         [Implementation details]
         - Calculates dispatch time based on debounce delays
-        - Adds event to priority queue
+        - Adds event to priority queue with the listeners it is routed to
+        - Wakes up the scheduler if the event is due first
         - Updates path events map
         
         Args:
@@ -215,8 +222,11 @@ class EventDebouncer:
                     for i in range(len(self._pending_events)):
                         pending_event = self._pending_events[i]
                         if pending_event.event.path == path and pending_event.event.event_type == event.event_type:
-                            # Update the dispatch time
+                            # Update the dispatch time and merge the listeners
                             self._pending_events[i].dispatch_time = dispatch_time
+                            for listener_id in listener_ids:
+                                if listener_id not in pending_event.listener_ids:
+                                    pending_event.listener_ids.append(listener_id)
                             # Re-heapify
                             heapq.heapify(self._pending_events)
                             return
@@ -228,8 +238,10 @@ class EventDebouncer:
                 self._path_events[path] = {event.event_type}
             
             # Add the event to the priority queue
-            pending_event = PendingEvent(dispatch_time, event)
+            pending_event = PendingEvent(dispatch_time, event, list(listener_ids))
             heapq.heappush(self._pending_events, pending_event)
+            if self._pending_events[0] is pending_event:
+                self._wakeup.notify()
     
     def _event_scheduler_loop(self) -> None:
         """
@@ -242,10 +254,17 @@ class EventDebouncer:
         
         [Implementation details]
         - Continuously processes events in the priority queue
-        - Dispatches events when their scheduled time arrives
-        - Sleeps when no events are pending
+        - Dispatches events when their scheduled time arrives, to the listeners
+          recorded with them by add_event
+        - Waits on a condition of the lock, woken up by add_event when a new
+          event is due before the others
+        - Waits without holding the lock when no events are due
+        - Beats the fs_debouncer heartbeat once per iteration, at least every
+          0.1 second unless dispatching blocks
         """
+        heartbeat = register_heartbeat("fs_debouncer", HEARTBEAT_INTERVAL)
         while self._scheduler_running:
+            heartbeat.beat()
             dispatch_now = []
             
             with self._lock:
@@ -264,35 +283,32 @@ class EventDebouncer:
                             del self._path_events[event.path]
                     
                     # Add to list of events to dispatch
-                    dispatch_now.append(event)
+                    dispatch_now.append(pending_event)
             
-            # Dispatch events outside the lock
-            for event in dispatch_now:
+            # Dispatch events outside the lock, to the listeners they were routed to
+            for pending_event in dispatch_now:
+                event = pending_event.event
                 try:
-                    # Get matching listeners - we can't import WatchManager here due to circular imports
-                    # The watch manager instance must be passed in by the event dispatcher
-                    from ..watch_manager import WatchManager  # This is a placeholder
-                    manager = WatchManager()  # This is a placeholder, actual implementation will get the manager instance
-                    listener_ids = manager.get_matching_listeners(event.path)
-                    if listener_ids:
-                        self._dispatch_callback(event, listener_ids)
+                    if pending_event.listener_ids:
+                        self._dispatch_callback(event, pending_event.listener_ids)
                 except Exception as e:
                     logger.error(f"Error dispatching event {event}: {e}")
             
-            # Sleep until next event or a short time
+            # Wait until next event or a short time, releasing the lock for add_event
             with self._lock:
                 if not self._pending_events:
-                    # No events, sleep for a short time
-                    time.sleep(0.1)
+                    # No events, wait for a short time or a new event
+                    self._wakeup.wait(0.1)
                 else:
-                    # Sleep until the next event
+                    # Wait until the next event or an earlier new one
                     next_event_time = self._pending_events[0].dispatch_time
                     now = time.time()
                     if next_event_time > now:
-                        time.sleep(min(next_event_time - now, 0.1))
+                        self._wakeup.wait(min(next_event_time - now, 0.1))
                     else:
                         # Don't sleep, process the event immediately
                         pass
+        heartbeat.pause()
     
     def set_default_debounce_ms(self, ms: int) -> None:
         """
@@ -309,3 +325,17 @@ class EventDebouncer:
             ms: Debounce delay in milliseconds
         """
         self._default_debounce_ms = ms
+    
+    @property
+    def pending_count(self) -> int:
+        """
+        [Function intent]
+        Get the number of events waiting for their debounce delay.
+        
+        [Implementation details]
+        - Reads the heap length without taking the lock, for metrics scrapes
+        
+        Returns:
+            Number of pending events
+        """
+        return len(self._pending_events)
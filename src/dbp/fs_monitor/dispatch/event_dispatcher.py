@@ -40,8 +40,19 @@
 # codebase:src/dbp/fs_monitor/debouncer.py
 # codebase:src/dbp/fs_monitor/thread_manager.py
 # codebase:src/dbp/fs_monitor/watch_manager.py
+# codebase:src/dbp/core/metrics.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T02:20:00Z : Dropped queues of unregistered listeners by CodeAssistant
+# * Removed the dispatch queue of a listener when the watch manager unregisters it
+# * Skipped events of listeners unregistered while being dispatched
+# 2026-10-19T00:10:00Z : Dispatched to per-listener queues by CodeAssistant
+# * Events are submitted to the ThreadManager queue of their listener, registered on its first event with its priority and concurrency cap
+# * configure() passes the slow listener isolation settings
+# * Added get_listener_stats()
+# 2026-10-18T22:40:00Z : Added dispatch metrics by CodeAssistant
+# * Counted dispatched events by type
+# * Published debouncer and ThreadManager queue depths as callback gauges
 # 2025-04-30T05:57:00Z : Updated debouncer class references by CodeAssistant
 # * Changed import from Debouncer to EventDebouncer
 # * Updated instance creation to use EventDebouncer
@@ -50,27 +61,17 @@
 # * Changed imports for debouncer from ..debouncer to .debouncer
 # * Changed imports for thread_manager from ..thread_manager to .thread_manager
 # * Fixed "No module named 'dbp.fs_monitor.debouncer'" error
-# 2025-04-29T09:14:00Z : Fixed import paths to use core module by CodeAssistant
-# * Changed imports to use ..core.event_types and ..core.listener
-# * Fixed "No module named 'dbp.fs_monitor.event_types'" error
-# 2025-04-29T09:08:00Z : Fixed import paths to use parent directory by CodeAssistant
-# * Changed imports from .event_types to ..event_types
-# * Fixed imports for listener, debouncer, and thread_manager to use parent module
-# * Fixed "No module named 'dbp.fs_monitor.dispatch.event_types'" error
-# 2025-04-29T00:12:00Z : Initial implementation of event dispatcher for fs_monitor redesign by CodeAssistant
-# * Created EventDispatcher class for event routing and coordination
-# * Implemented integration with WatchManager, Debouncer, and ThreadManager
-# * Added configuration options for event processing behavior
 ###############################################################################
 
 import threading
 import logging
 from typing import Dict, List, Optional, Any, Set, Callable
 
+from ...core.metrics import FS_DEBOUNCER_QUEUE_DEPTH, FS_DISPATCH_QUEUE_SIZE, FS_EVENTS
 from ..core.event_types import EventType, FileSystemEvent
 from ..core.listener import FileSystemEventListener
 from .debouncer import EventDebouncer
-from .thread_manager import ThreadManager, ThreadPriority
+from .thread_manager import ThreadManager, ThreadPriority, priority_from_name
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +104,7 @@ class EventDispatcher:
         [Implementation details]
         - Stores reference to watch manager
         - Creates debouncer and thread manager
+        - Drops the dispatch queue of each listener the watch manager unregisters
         
         Args:
             watch_manager: Reference to the watch manager
@@ -112,6 +114,7 @@ class EventDispatcher:
         self._debouncer = EventDebouncer(self._dispatch_debounced_event)
         self._thread_manager = ThreadManager(num_threads=1, priority=ThreadPriority.NORMAL)
         self._started = False
+        self._watch_manager.add_unregister_callback(self._unregister_listener_queue)
     
     def start(self) -> None:
         """
@@ -123,6 +126,7 @@ class EventDispatcher:
         
         [Implementation details]
         - Starts the debouncer and thread manager
+        - Publishes their queue depths as callback gauges
         - Sets started flag
         """
         with self._lock:
@@ -132,6 +136,8 @@ class EventDispatcher:
             
             self._debouncer.start()
             self._thread_manager.start()
+            FS_DEBOUNCER_QUEUE_DEPTH.set_function(lambda: self._debouncer.pending_count)
+            FS_DISPATCH_QUEUE_SIZE.set_function(lambda: self._thread_manager.queue_size)
             self._started = True
             
             logger.debug("Started event dispatcher")
@@ -155,6 +161,8 @@ class EventDispatcher:
             
             self._debouncer.stop()
             self._thread_manager.stop()
+            FS_DEBOUNCER_QUEUE_DEPTH.set_function(None)
+            FS_DISPATCH_QUEUE_SIZE.set_function(None)
             self._started = False
             
             logger.debug("Stopped event dispatcher")
@@ -169,6 +177,7 @@ class EventDispatcher:
         - Support for debouncing
         
         [Implementation details]
+        - Counts the event by type in the dbp_fs_events metric
         - Gets matching listeners from watch manager
         - Adds event to debouncer
         
@@ -179,11 +188,13 @@ class EventDispatcher:
             logger.warning("EventDispatcher not started, event will not be dispatched")
             return
         
+        FS_EVENTS.labels(event.event_type.name).inc()
+        
         # Get matching listeners from watch manager
         listener_ids = self._watch_manager.get_matching_listeners(event.path)
         
         if not listener_ids:
-            logger.debug(f"No listeners found for path {event.path}, event will not be dispatched")
+            logger.debug("No listeners found for path %s, event will not be dispatched", event.path)
             return
         
         # Collect debounce delays for each listener
@@ -207,7 +218,8 @@ class EventDispatcher:
         
         [Implementation details]
         - Retrieves listeners from watch manager
-        - Submits dispatcher tasks to thread manager
+        - Registers the dispatch queue of a listener on its first event
+        - Submits dispatcher tasks to the listener's queue in the thread manager
         
         Args:
             event: The file system event to dispatch
@@ -224,12 +236,60 @@ class EventDispatcher:
                 logger.warning(f"Listener {listener_id} not found, skipping event dispatch")
                 continue
             
-            # Submit task to thread manager
-            self._thread_manager.submit_task(
-                self._call_listener_method,
-                listener,
-                event
-            )
+            if not self._thread_manager.has_listener_queue(listener_id):
+                self._register_listener_queue(listener_id, listener)
+            
+            # Submit task to the listener's queue
+            try:
+                self._thread_manager.submit_listener_task(
+                    listener_id,
+                    self._call_listener_method,
+                    listener,
+                    event
+                )
+            except KeyError:
+                logger.debug(f"Listener {listener_id} unregistered, skipping event dispatch")
+    
+    def _register_listener_queue(self, listener_id: int, listener: FileSystemEventListener) -> None:
+        """
+        [Function intent]
+        Create the dispatch queue of a listener with its declared scheduling settings.
+        
+        [Implementation details]
+        - Names the queue after the listener class, the metrics of listeners
+          of the same class are aggregated
+        - An invalid priority is logged and replaced by the default one
+        
+        Args:
+            listener_id: ID of the listener in the watch manager
+            listener: The listener
+        """
+        priority = None
+        if listener.dispatch_priority is not None:
+            try:
+                priority = priority_from_name(listener.dispatch_priority)
+            except ValueError as e:
+                logger.warning(f"Listener {listener_id}: {e}, using the default priority")
+        self._thread_manager.register_listener_queue(
+            listener_id,
+            type(listener).__name__,
+            priority=priority,
+            max_concurrency=listener.max_concurrency
+        )
+    
+    def _unregister_listener_queue(self, listener_id: int) -> None:
+        """
+        [Function intent]
+        Drop the dispatch queue of an unregistered listener.
+        
+        [Implementation details]
+        - Called by the watch manager; pending events of the listener are
+          discarded and its isolated worker threads exit
+        
+        Args:
+            listener_id: ID of the unregistered listener
+        """
+        self._thread_manager.unregister_listener_queue(listener_id)
     
     def _call_listener_method(self, listener: FileSystemEventListener, event: FileSystemEvent) -> None:
         """
@@ -271,7 +331,8 @@ class EventDispatcher:
         except Exception as e:
             logger.error(f"Error calling listener method: {e}")
     
-    def configure(self, thread_count: int, thread_priority: ThreadPriority, default_debounce_ms: int) -> None:
+    def configure(self, thread_count: int, thread_priority: ThreadPriority, default_debounce_ms: int,
+                  slow_listener_p95_ms: float = 500.0, isolated_thread_count: int = 1) -> None:
         """
         [Function intent]
         Configure the event dispatcher.
@@ -286,6 +347,9 @@ class EventDispatcher:
             thread_count: Number of worker threads
             thread_priority: Priority of worker threads
             default_debounce_ms: Default debounce delay in milliseconds
+            slow_listener_p95_ms: p95 handler time above which a listener gets
+                its own worker threads, 0 disables isolation
+            isolated_thread_count: Worker threads of an isolated listener
         """
         with self._lock:
             # Need to stop and restart components for configuration to take effect
@@ -295,7 +359,12 @@ class EventDispatcher:
                 self.stop()
             
             # Update thread manager
-            self._thread_manager = ThreadManager(num_threads=thread_count, priority=thread_priority)
+            self._thread_manager = ThreadManager(
+                num_threads=thread_count,
+                priority=thread_priority,
+                slow_listener_p95_ms=slow_listener_p95_ms,
+                isolated_thread_count=isolated_thread_count
+            )
             
             # Update debouncer
             self._debouncer.set_default_debounce_ms(default_debounce_ms)
@@ -306,6 +375,20 @@ class EventDispatcher:
             logger.debug(f"EventDispatcher configured with {thread_count} threads, "
                          f"priority {thread_priority}, default debounce {default_debounce_ms}ms")
     
+    def get_listener_stats(self) -> List[Dict[str, Any]]:
+        """
+        [Function intent]
+        Report the dispatch queue state and timings of every listener.
+        
+        [Implementation details]
+        - Delegates to the thread manager
+        
+        Returns:
+            One dictionary per listener queue with its priority, concurrency cap,
+            isolation, counters and queue and handler time percentiles
+        """
+        return self._thread_manager.get_listener_stats()
+    
     @property
     def is_running(self) -> bool:
         """
@@ -22,6 +22,7 @@
 # - Graceful shutdown handling
 # - Thread-safe operations
 # - Minimal resource utilization during idle periods
+# - A slow listener never delays the events of the other listeners
 ###############################################################################
 # [Source file constraints]
 # - Must handle concurrent task submissions from multiple sources
@@ -29,17 +30,26 @@
 # - Must support variable task priorities
 # - Must ensure proper thread cleanup during shutdown
 # - Must prevent resource leaks and thread leaks
+# - Tasks of a listener run in submission order when its concurrency is 1
 ###############################################################################
 # [Dependencies]
+# codebase:src/dbp/core/metrics.py
 # system:threading
 # system:logging
 # system:time
-# system:queue
+# system:collections
 # system:typing
 # system:enum
 # system:dataclasses
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T02:20:00Z : Added listener queue removal by CodeAssistant
+# * Added unregister_listener_queue discarding pending tasks and ending the isolation of the listener's workers
+# 2026-10-19T00:10:00Z : Scheduled tasks from per-listener queues by CodeAssistant
+# * Replaced the shared FIFO queue with per-listener queues served by priority, then age
+# * Added per-listener concurrency caps and worker sets isolating listeners whose p95 handler time is too high
+# * Isolated workers take shared work while their listener is idle
+# * Recorded queue and handler times per listener, reported by get_listener_stats()
 # 2025-04-29T00:10:00Z : Initial implementation of thread manager for fs_monitor redesign by CodeAssistant
 # * Created ThreadManager class for managing worker threads
 # * Implemented ThreadPriority enum for thread prioritization
@@ -49,13 +59,27 @@
 import threading
 import logging
 import time
-import queue
-from typing import Dict, List, Callable, Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
 from enum import Enum, auto
 from dataclasses import dataclass
 
+from ...core.metrics import FS_LISTENER_HANDLER_SECONDS, FS_LISTENER_QUEUE_SECONDS
+
 logger = logging.getLogger(__name__)
 
+# Key of the queue of the tasks submitted without a listener
+DEFAULT_QUEUE = "default"
+
+# Number of recent tasks per listener whose timings are kept for the percentiles
+TIMING_WINDOW = 200
+
+# Handler durations a listener needs before it can be isolated
+MIN_ISOLATION_SAMPLES = 20
+
+# Completed tasks between two checks of the handler time percentile of a listener
+ISOLATION_CHECK_INTERVAL = 10
+
 
 class ThreadPriority(Enum):
     """
@@ -67,13 +91,33 @@ class ThreadPriority(Enum):
     - Alignment with OS thread priorities
     
     [Implementation details]
-    - Enum values correspond to priority levels
+    - Enum values correspond to priority levels, higher values are served first
     """
     LOW = auto()
     NORMAL = auto()
     HIGH = auto()
 
 
+def priority_from_name(name: str) -> ThreadPriority:
+    """
+    [Function intent]
+    Convert a configured priority name to a ThreadPriority.
+    
+    Args:
+        name: "low", "normal" or "high", in any case
+    
+    Returns:
+        The matching priority
+    
+    Raises:
+        ValueError: If the name is not a priority
+    """
+    try:
+        return ThreadPriority[name.upper()]
+    except KeyError:
+        raise ValueError(f"Unknown priority {name!r}, expected low, normal or high")
+
+
 @dataclass
 class DispatchTask:
     """
@@ -86,24 +130,116 @@ class DispatchTask:
     
     [Implementation details]
     - Contains target function and arguments
-    - Stores creation time for diagnostics
+    - Stores creation time for diagnostics and a monotonic enqueue time
+      for the queue time of the task
     
     Attributes:
         target: Function to call
         args: Arguments to pass to the function
         kwargs: Keyword arguments to pass to the function
         created_at: When the task was created (for diagnostics)
+        enqueued_at: time.monotonic() at creation
     """
     target: Callable
     args: tuple = ()
     kwargs: dict = None
     created_at: float = 0.0
+    enqueued_at: float = 0.0
     
     def __post_init__(self):
         """Initialize default values and record creation time"""
         if self.kwargs is None:
             self.kwargs = {}
         self.created_at = time.time()
+        self.enqueued_at = time.monotonic()
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """
+    [Function intent]
+    Nearest-rank percentile of a list of values, 0.0 when it is empty.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class ListenerQueue:
+    """
+    [Class intent]
+    Holds the pending tasks of one listener with its scheduling settings and
+    the timings of its recent tasks.
+    
+    [Implementation details]
+    Only accessed under the condition of its ThreadManager. A declared
+    priority of None follows the default priority of the manager.
+    """
+    
+    def __init__(self, key: Any, name: str, declared_priority: Optional[ThreadPriority],
+                 default_priority: ThreadPriority, max_concurrency: int):
+        """
+        [Function intent]
+        Create an empty queue.
+        
+        Args:
+            key: Identifier of the listener in the ThreadManager
+            name: Name of the listener in statistics and metrics, shared by
+                listeners of the same kind to bound the metric labels
+            declared_priority: Priority declared by the listener, or None
+            default_priority: Priority used when none is declared
+            max_concurrency: Maximum number of tasks of the listener running at once
+        """
+        self.key = key
+        self.name = name
+        self.declared_priority = declared_priority
+        self.priority = declared_priority or default_priority
+        self.max_concurrency = max(1, max_concurrency)
+        self.tasks: Deque[DispatchTask] = deque()
+        self.active = 0
+        self.isolated = False
+        self.isolated_threads: List[threading.Thread] = []
+        self.queue_times: Deque[float] = deque(maxlen=TIMING_WINDOW)
+        self.handler_times: Deque[float] = deque(maxlen=TIMING_WINDOW)
+        self.completed = 0
+        self.failed = 0
+        self.queue_time_metric = FS_LISTENER_QUEUE_SECONDS.labels(name)
+        self.handler_time_metric = FS_LISTENER_HANDLER_SECONDS.labels(name)
+    
+    @property
+    def ready(self) -> bool:
+        """True when a task is pending and the concurrency cap allows running it."""
+        return bool(self.tasks) and self.active < self.max_concurrency
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Report the state and timings of the queue.
+        
+        Returns:
+            Dictionary with the settings, counters and the p50, p95 and max of
+            the queue and handler times of the recent tasks in milliseconds
+        """
+        def timings(values: Deque[float]) -> Dict[str, float]:
+            values = list(values)
+            return {
+                "p50": round(_percentile(values, 0.5) * 1000, 3),
+                "p95": round(_percentile(values, 0.95) * 1000, 3),
+                "max": round(max(values, default=0.0) * 1000, 3),
+            }
+        return {
+            "key": self.key,
+            "name": self.name,
+            "priority": self.priority.name.lower(),
+            "max_concurrency": self.max_concurrency,
+            "isolated": self.isolated,
+            "queued": len(self.tasks),
+            "active": self.active,
+            "completed": self.completed,
+            "failed": self.failed,
+            "queue_time_ms": timings(self.queue_times),
+            "handler_time_ms": timings(self.handler_times),
+        }
 
 
 class ThreadManager:
@@ -115,14 +251,21 @@ class ThreadManager:
     - Efficient thread utilization
     - Support for task prioritization
     - Graceful shutdown handling
+    - Isolation of slow listeners from fast ones
     
     [Implementation details]
-    - Maintains a pool of worker threads
-    - Uses a queue for task distribution
-    - Supports thread priority configuration
+    - Maintains a pool of shared worker threads
+    - Keeps one queue of tasks per listener; a worker takes the oldest task of
+      the highest priority queue whose concurrency cap is not reached
+    - A listener whose p95 handler time exceeds the slow listener threshold
+      is isolated: its tasks are only run by its own worker threads, which
+      take shared tasks while it is idle; the isolation ends when its p95
+      falls under half the threshold
+    - Records the queue and handler time of every task per listener
     """
     
-    def __init__(self, num_threads: int = 1, priority: ThreadPriority = ThreadPriority.NORMAL) -> None:
+    def __init__(self, num_threads: int = 1, priority: ThreadPriority = ThreadPriority.NORMAL,
+                 slow_listener_p95_ms: float = 500.0, isolated_thread_count: int = 1) -> None:
         """
         [Function intent]
         Initialize a new thread manager.
@@ -132,16 +275,26 @@ class ThreadManager:
         - Support for thread priority
         
         [Implementation details]
-        - Creates task queue
-        - Initializes worker threads
+        - Creates the default task queue
+        - Worker threads are created by start()
         
         Args:
-            num_threads: Number of worker threads to create
-            priority: Priority level for the worker threads
+            num_threads: Number of shared worker threads to create
+            priority: Priority of the tasks of listeners declaring none
+            slow_listener_p95_ms: p95 handler time above which a listener gets its
+                own worker threads, 0 disables isolation
+            isolated_thread_count: Worker threads of an isolated listener, at most
+                its concurrency cap
         """
         self._num_threads = max(1, num_threads)  # At least one thread
         self._priority = priority
-        self._task_queue = queue.Queue()
+        self._slow_listener_p95 = slow_listener_p95_ms / 1000.0
+        self._isolated_thread_count = max(1, isolated_thread_count)
+        self._condition = threading.Condition(threading.Lock())
+        self._queues: Dict[Any, ListenerQueue] = {
+            DEFAULT_QUEUE: ListenerQueue(DEFAULT_QUEUE, DEFAULT_QUEUE, None, priority, self._num_threads)
+        }
+        self._queued = 0
         self._threads: List[threading.Thread] = []
         self._running = False
         self._lock = threading.RLock()
@@ -163,7 +316,8 @@ class ThreadManager:
                 logger.warning("ThreadManager already running")
                 return
             
-            self._running = True
+            with self._condition:
+                self._running = True
             
             for i in range(self._num_threads):
                 thread = threading.Thread(
@@ -185,8 +339,8 @@ class ThreadManager:
         - Graceful shutdown
         
         [Implementation details]
-        - Clears running flag
-        - Adds poison pills to task queue
+        - Clears running flag and wakes up all threads
+        - Workers run the tasks they can still take, then exit
         - Waits for threads to terminate
         """
         with self._lock:
@@ -194,21 +348,87 @@ class ThreadManager:
                 logger.debug("ThreadManager already stopped")
                 return
             
-            self._running = False
-            
-            # Add poison pills to wake up all threads
-            for _ in range(self._num_threads):
-                self._task_queue.put(None)
+            with self._condition:
+                self._running = False
+                self._condition.notify_all()
+                threads = self._threads + [thread for task_queue in self._queues.values()
+                                           for thread in task_queue.isolated_threads]
             
             # Wait for threads to terminate
-            for thread in self._threads:
+            for thread in threads:
                 if thread.is_alive():
                     thread.join(timeout=1.0)
             
-            # Clear thread list
+            # Clear thread lists
             self._threads.clear()
+            with self._condition:
+                for task_queue in self._queues.values():
+                    task_queue.isolated_threads.clear()
             logger.debug("Stopped all worker threads")
     
+    def register_listener_queue(self, key: Any, name: str, priority: Optional[ThreadPriority] = None,
+                                max_concurrency: int = 1) -> None:
+        """
+        [Function intent]
+        Create the task queue of a listener, or update its settings.
+        
+        [Implementation details]
+        Timings and pending tasks of an existing queue are kept.
+        
+        Args:
+            key: Identifier of the listener, used by submit_listener_task()
+            name: Name of the listener in statistics and metrics
+            priority: Priority of the listener's tasks, None for the default priority
+            max_concurrency: Maximum number of the listener's tasks running at once
+        """
+        with self._condition:
+            task_queue = self._queues.get(key)
+            if task_queue is None:
+                self._queues[key] = ListenerQueue(key, name, priority, self._priority, max_concurrency)
+                return
+            task_queue.declared_priority = priority
+            task_queue.priority = priority or self._priority
+            task_queue.max_concurrency = max(1, max_concurrency)
+            self._condition.notify_all()
+    
+    def unregister_listener_queue(self, key: Any) -> None:
+        """
+        [Function intent]
+        Remove the task queue of a listener that no longer receives events.
+        
+        [Implementation details]
+        - Pending tasks are discarded, running tasks complete
+        - Isolated worker threads of the listener exit once their current task
+          is done: the queue stops being isolated
+        - The timing metrics are labelled by listener name, shared by other
+          listeners of the same class, and are kept
+        
+        Args:
+            key: Listener key given to register_listener_queue()
+        
+        Raises:
+            ValueError: If key is the default queue
+        """
+        if key == DEFAULT_QUEUE:
+            raise ValueError("The default queue cannot be unregistered")
+        with self._condition:
+            task_queue = self._queues.pop(key, None)
+            if task_queue is None:
+                return
+            discarded = len(task_queue.tasks)
+            task_queue.tasks.clear()
+            self._queued -= discarded
+            task_queue.isolated = False
+            task_queue.isolated_threads = []
+            self._condition.notify_all()
+        if discarded:
+            logger.debug(f"Discarded {discarded} pending tasks of unregistered listener {task_queue.name}")
+    
+    def has_listener_queue(self, key: Any) -> bool:
+        """True when a queue is registered for the listener key."""
+        with self._condition:
+            return key in self._queues
+    
     def submit_task(self, target: Callable, *args, **kwargs) -> None:
         """
         [Function intent]
@@ -218,22 +438,73 @@ class ThreadManager:
         - Simple API for task submission
         
         [Implementation details]
-        - Creates a task object
-        - Adds it to the task queue
+        - Adds the task to the default queue, whose tasks may all run at once
+        
+        Args:
+            target: Function to call
+            args: Positional arguments to pass to the function
+            kwargs: Keyword arguments to pass to the function
+        """
+        self.submit_listener_task(DEFAULT_QUEUE, target, *args, **kwargs)
+    
+    def submit_listener_task(self, key: Any, target: Callable, *args, **kwargs) -> None:
+        """
+        [Function intent]
+        Submit a task to the queue of a listener.
+        
+        [Implementation details]
+        - Creates a task object and appends it to the listener's queue
+        - Wakes up the workers
         
         Args:
+            key: Listener key given to register_listener_queue()
             target: Function to call
             args: Positional arguments to pass to the function
             kwargs: Keyword arguments to pass to the function
+        
+        Raises:
+            KeyError: If no queue is registered for the key
         """
         if not self._running:
             logger.warning("ThreadManager not running, task will not be executed")
             return
         
         task = DispatchTask(target, args, kwargs)
-        self._task_queue.put(task)
+        with self._condition:
+            self._queues[key].tasks.append(task)
+            self._queued += 1
+            self._condition.notify_all()
     
-    def _worker_loop(self) -> None:
+    def _next_queue(self, own: Optional[ListenerQueue]) -> Optional[ListenerQueue]:
+        """
+        [Function intent]
+        Choose the queue a worker takes its next task from, under the condition.
+        
+        [Implementation details]
+        An isolated worker serves its own listener first. Otherwise the ready
+        queue of a non-isolated listener with the highest priority wins, then
+        the one whose first task waited longest.
+        
+        Args:
+            own: Queue of the isolated listener the worker belongs to, None
+                for a shared worker
+        
+        Returns:
+            The queue to take a task from, or None if no task can be run
+        """
+        if own is not None and own.ready:
+            return own
+        best = None
+        for task_queue in self._queues.values():
+            if task_queue.isolated or not task_queue.ready:
+                continue
+            if (best is None or task_queue.priority.value > best.priority.value
+                    or (task_queue.priority is best.priority
+                        and task_queue.tasks[0].enqueued_at < best.tasks[0].enqueued_at)):
+                best = task_queue
+        return best
+    
+    def _worker_loop(self, own: Optional[ListenerQueue] = None) -> None:
         """
         [Function intent]
         Main loop for worker threads.
@@ -243,33 +514,102 @@ class ThreadManager:
         - Error handling
         
         [Implementation details]
-        - Gets tasks from queue
-        - Executes tasks
-        - Handles errors
-        """
-        while self._running:
-            try:
-                # Get a task from the queue
-                task = self._task_queue.get()
-                
-                # Check for poison pill
-                if task is None:
+        - Waits on the condition until a queue has a task it may run
+        - Exits when the manager stops and no task can be taken, or when the
+          isolation of its listener ends for an isolated worker
+        - Executes tasks outside the condition and records their timings
+        
+        Args:
+            own: Queue of the isolated listener the worker belongs to, None
+                for a shared worker
+        """
+        while True:
+            with self._condition:
+                while True:
+                    if own is not None and not own.isolated:
+                        task_queue = None
+                        break
+                    task_queue = self._next_queue(own)
+                    if task_queue is not None or not self._running:
+                        break
+                    self._condition.wait()
+                if task_queue is None:
                     break
-                
-                # Execute the task
-                try:
-                    task.target(*task.args, **(task.kwargs or {}))
-                except Exception as e:
-                    logger.error(f"Error executing task: {e}")
-                finally:
-                    # Mark the task as done
-                    self._task_queue.task_done()
-            
-            except Exception as e:
-                logger.error(f"Error in worker loop: {e}")
+                task = task_queue.tasks.popleft()
+                task_queue.active += 1
+                self._queued -= 1
+            self._run_task(task_queue, task)
         
         logger.debug("Worker thread exiting")
     
+    def _run_task(self, task_queue: ListenerQueue, task: DispatchTask) -> None:
+        """
+        [Function intent]
+        Execute a task and account for it in its queue.
+        
+        [Implementation details]
+        - Handles errors of the task
+        - Records its queue and handler times, then checks the isolation of
+          its listener every ISOLATION_CHECK_INTERVAL tasks
+        """
+        started = time.monotonic()
+        failed = False
+        try:
+            task.target(*task.args, **(task.kwargs or {}))
+        except Exception as e:
+            failed = True
+            logger.error(f"Error executing task of {task_queue.name}: {e}")
+        finished = time.monotonic()
+        queue_time = started - task.enqueued_at
+        handler_time = finished - started
+        
+        with self._condition:
+            task_queue.active -= 1
+            task_queue.completed += 1
+            task_queue.failed += failed
+            task_queue.queue_times.append(queue_time)
+            task_queue.handler_times.append(handler_time)
+            if task_queue.completed % ISOLATION_CHECK_INTERVAL == 0:
+                self._check_isolation(task_queue)
+            self._condition.notify_all()
+        task_queue.queue_time_metric.observe(queue_time)
+        task_queue.handler_time_metric.observe(handler_time)
+    
+    def _check_isolation(self, task_queue: ListenerQueue) -> None:
+        """
+        [Function intent]
+        Isolate a listener whose recent handlers are slow, or end its
+        isolation once they are fast again. Called under the condition.
+        
+        [Implementation details]
+        The default queue is never isolated. Isolation starts when the p95
+        exceeds the threshold and ends when it falls under half of it, so
+        that a listener near the threshold does not flip at every check.
+        """
+        if not self._slow_listener_p95 or task_queue.key == DEFAULT_QUEUE:
+            return
+        if len(task_queue.handler_times) < MIN_ISOLATION_SAMPLES:
+            return
+        p95 = _percentile(list(task_queue.handler_times), 0.95)
+        if not task_queue.isolated and p95 > self._slow_listener_p95:
+            task_queue.isolated = True
+            task_queue.isolated_threads = [thread for thread in task_queue.isolated_threads if thread.is_alive()]
+            for i in range(min(self._isolated_thread_count, task_queue.max_concurrency)):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    args=(task_queue,),
+                    daemon=True,
+                    name=f"FSMonitor-Isolated-{task_queue.name}-{task_queue.key}-{i}"
+                )
+                task_queue.isolated_threads.append(thread)
+                thread.start()
+            logger.warning(f"Listener {task_queue.name} isolated on its own worker threads: "
+                           f"p95 handler time {p95 * 1000:.1f} ms")
+        elif task_queue.isolated and p95 < self._slow_listener_p95 / 2:
+            task_queue.isolated = False
+            logger.info(f"Listener {task_queue.name} back on the shared worker threads: "
+                        f"p95 handler time {p95 * 1000:.1f} ms")
+    
     def set_thread_priority(self, priority: ThreadPriority) -> None:
         """
         [Function intent]
@@ -279,19 +619,31 @@ class ThreadManager:
         - Runtime configuration
         
         [Implementation details]
-        - Updates the priority setting
-        - This is a placeholder, actual implementation varies by platform
+        - Updates the default priority and the queues of the listeners that
+          declared no priority of their own, effective for the next task taken
         
         Args:
             priority: New priority level
         """
-        self._priority = priority
-        
-        # Actual implementation of thread priority setting depends on the platform
-        # This would require platform-specific code for Windows, Linux, and macOS
-        # For now, this is just a placeholder
+        with self._condition:
+            self._priority = priority
+            for task_queue in self._queues.values():
+                if task_queue.declared_priority is None:
+                    task_queue.priority = priority
         logger.debug(f"Thread priority set to {priority}")
     
+    def get_listener_stats(self) -> List[Dict[str, Any]]:
+        """
+        [Function intent]
+        Report the queue state and the queue and handler times of every listener.
+        
+        Returns:
+            One dictionary per listener queue, see ListenerQueue.stats(), by name
+        """
+        with self._condition:
+            return sorted((task_queue.stats() for task_queue in self._queues.values()),
+                          key=lambda stats: stats["name"])
+    
     @property
     def is_running(self) -> bool:
         """
@@ -320,9 +672,9 @@ class ThreadManager:
         - Status monitoring
         
         [Implementation details]
-        - Returns the current size of the task queue
+        - Returns the number of tasks waiting in all listener queues
         
         Returns:
             Number of tasks waiting in the queue
         """
-        return self._task_queue.qsize()
+        return self._queued
@@ -38,6 +38,8 @@
 # system:- doc/CONFIGURATION.md (fs_monitor.ignore_patterns)
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
 # 2025-04-17T16:49:00Z : Updated configuration key for ignore patterns by CodeAssistant
 # * Changed configuration key from 'monitor.ignore_patterns' to 'fs_monitor.ignore_patterns'
 # * Fixed component initialization error due to renamed config model
@@ -97,11 +99,11 @@ class GitIgnoreFilter:
             if self.project_root:
                 self._load_all_gitignore_files(self.project_root)
 
-            logger.info(f"GitIgnoreFilter initialized with {len(self._patterns)} patterns.")
+            logger.info("GitIgnoreFilter initialized with %s patterns.", len(self._patterns))
 
     def update_project_root(self, project_root: str):
         """Updates the project root and re-initializes patterns."""
-        logger.info(f"Updating project root for GitIgnoreFilter to: {project_root}")
+        logger.info("Updating project root for GitIgnoreFilter to: %s", project_root)
         new_root = Path(project_root).resolve()
         if new_root != self.project_root:
              self.project_root = new_root
@@ -129,7 +131,7 @@ class GitIgnoreFilter:
     def _add_config_patterns(self):
         """Adds ignore patterns specified in the configuration."""
         patterns = self.config.fs_monitor.ignore_patterns if hasattr(self.config, 'fs_monitor') and hasattr(self.config.fs_monitor, 'ignore_patterns') else []
-        logger.debug(f"Adding {len(patterns)} patterns from configuration.")
+        logger.debug("Adding %s patterns from configuration.", len(patterns))
         base = self.project_root if self.project_root else Path('.')
         for pattern in patterns:
             if isinstance(pattern, str) and pattern.strip():
@@ -141,9 +143,9 @@ class GitIgnoreFilter:
 
     def _load_all_gitignore_files(self, start_dir: Path):
         """Recursively finds and loads all .gitignore files from start_dir downwards."""
-        logger.debug(f"Scanning for .gitignore files starting from: {start_dir}")
+        logger.debug("Scanning for .gitignore files starting from: %s", start_dir)
         gitignore_paths = list(start_dir.rglob('.gitignore'))
-        logger.info(f"Found {len(gitignore_paths)} .gitignore files.")
+        logger.info("Found %s .gitignore files.", len(gitignore_paths))
 
         # Sort paths by depth (shortest first) so parent rules are processed first
         gitignore_paths.sort(key=lambda p: len(p.parts))
@@ -168,7 +170,7 @@ class GitIgnoreFilter:
 
         # Patterns in a .gitignore are relative to the directory containing the file
         base_dir = gitignore_path.parent
-        logger.debug(f"Loading patterns from: {gitignore_path} (relative to: {base_dir})")
+        logger.debug("Loading patterns from: %s (relative to: %s)", gitignore_path, base_dir)
 
         try:
             with open(gitignore_path, 'r', encoding='utf-8') as f:
@@ -196,7 +198,7 @@ class GitIgnoreFilter:
                     # Store the pattern, its negation status, and its base directory
                     self._patterns.append((pattern, is_negative, base_dir))
                     count += 1
-                logger.debug(f"Added {count} patterns from {gitignore_path}")
+                logger.debug("Added %s patterns from %s", count, gitignore_path)
 
             # Clear cache as patterns have changed
             self._cached_results = {}
@@ -232,7 +234,7 @@ class GitIgnoreFilter:
 
             # 2. Check mandatory 'deprecated' in path components
             if 'deprecated' in abs_path.parts:
-                 logger.debug(f"Ignoring path due to 'deprecated' component: {path_str_norm}")
+                 logger.debug("Ignoring path due to 'deprecated' component: %s", path_str_norm)
                  self._cached_results[path_str_norm] = True
                  return True
 
@@ -258,9 +260,9 @@ class GitIgnoreFilter:
                     ignored = not is_negative # If negative pattern matches, it's NOT ignored (overrides previous ignore)
 
             if matched_pattern:
-                 logger.debug(f"Path '{path_str_norm}' matched pattern '{matched_pattern[0]}' (negative={matched_pattern[1]}) from base '{matched_pattern[2]}'. Ignored={ignored}")
+                 logger.debug("Path '%s' matched pattern '%s' (negative=%s) from base '%s'. Ignored=%s", path_str_norm, matched_pattern[0], matched_pattern[1], matched_pattern[2], ignored)
             else:
-                 logger.debug(f"Path '{path_str_norm}' did not match any relevant patterns. Ignored={ignored}")
+                 logger.debug("Path '%s' did not match any relevant patterns. Ignored=%s", path_str_norm, ignored)
 
 
             # Cache and return result
@@ -382,7 +384,7 @@ class FilterComponent(Component):
             return
         
         self.logger = logging.getLogger(f"dbp.{self.name}")
-        self.logger.info(f"Initializing component '{self.name}'...")
+        self.logger.info("Initializing component '%s'...", self.name)
         
         try:
             # Get configuration and dependencies
@@ -398,7 +400,7 @@ class FilterComponent(Component):
             self._filter = GitIgnoreFilter(config, self.project_root)
             
             self._initialized = True
-            self.logger.info(f"Component '{self.name}' initialized successfully.")
+            self.logger.info("Component '%s' initialized successfully.", self.name)
         except Exception as e:
             self.logger.error(f"Failed to initialize filter component: {e}", exc_info=True)
             self._filter = None
@@ -416,7 +418,7 @@ class FilterComponent(Component):
         [Design principles]
         Clean resource release with clear state reset.
         """
-        self.logger.info(f"Shutting down component '{self.name}'...")
+        self.logger.info("Shutting down component '%s'...", self.name)
         
         if self._filter:
             try:
@@ -427,7 +429,7 @@ class FilterComponent(Component):
                 self._filter = None
         
         self._initialized = False
-        self.logger.info(f"Component '{self.name}' shut down.")
+        self.logger.info("Component '%s' shut down.", self.name)
     
     @property
     def is_initialized(self) -> bool:
@@ -491,7 +493,7 @@ class FilterComponent(Component):
             raise RuntimeError("FilterComponent not initialized")
         self.project_root = new_root
         self._filter.update_project_root(new_root)
-        self.logger.info(f"Updated project root to: {new_root}")
+        self.logger.info("Updated project root to: %s", new_root)
     
     def add_gitignore_file(self, gitignore_path: str) -> bool:
         """
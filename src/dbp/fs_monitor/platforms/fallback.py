@@ -44,6 +44,8 @@
 # codebase:src/dbp/fs_monitor/exceptions.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T22:10:00Z : Added fs_monitor heartbeat by CodeAssistant
+# * Polling loop beats the fs_monitor heartbeat once per poll
 # 2025-04-30T05:59:00Z : Updated import paths by CodeAssistant
 # * Changed imports to use parent modules properly
 # * Fixed "No module named 'dbp.fs_monitor.platforms.event_types'" error
@@ -62,6 +64,7 @@ import stat
 from pathlib import Path
 from typing import Dict, Set, List, Optional, Callable, Any, Tuple
 
+from ...core.watchdog import register_heartbeat
 from .monitor_base import MonitorBase
 from ..core.event_types import EventType, FileSystemEvent
 from ..core.exceptions import WatchCreationError
@@ -489,10 +492,14 @@ class FallbackMonitor(MonitorBase):
         [Implementation details]
         - Periodically checks for changes in watched directories
         - Dispatches events for detected changes
+        - Beats the fs_monitor heartbeat once per poll; a poll may scan every
+          watched file, so the heartbeat tolerates several poll intervals
         """
         last_poll_time = 0
+        heartbeat = register_heartbeat("fs_monitor", max(30.0, 5 * self._poll_interval))
         
         while self._running:
+            heartbeat.beat()
             try:
                 # Sleep until next poll interval
                 now = time.time()
@@ -510,6 +517,7 @@ class FallbackMonitor(MonitorBase):
                 if self._running:
                     logger.error(f"Error in polling loop: {e}")
                     time.sleep(1)  # Sleep to avoid tight loop on error
+        heartbeat.pause()
     
     def _check_for_changes(self) -> None:
         """
@@ -46,6 +46,8 @@
 # codebase:src/dbp/fs_monitor/event_dispatcher.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T22:10:00Z : Added fs_monitor heartbeat by CodeAssistant
+# * Monitor loop beats the fs_monitor heartbeat once per iteration
 # 2025-04-30T05:58:00Z : Updated EventDispatcher import path by CodeAssistant
 # * Changed import from ..event_dispatcher to ..dispatch.event_dispatcher
 # * Fixed "No module named 'dbp.fs_monitor.event_dispatcher'" error
@@ -60,10 +62,6 @@
 # 2025-04-29T08:58:00Z : Fixed import path for event types by CodeAssistant
 # * Changed import from .event_types to ..core for EventType and FileSystemEvent
 # * Fixed import error that caused server startup failure
-# 2025-04-29T00:20:00Z : Initial implementation of Linux monitor for fs_monitor redesign by CodeAssistant
-# * Created LinuxMonitor class using inotify API
-# * Implemented event translation from inotify to uniform model
-# * Added resource management for inotify file descriptors
 ###############################################################################
 
 import os
@@ -75,6 +73,7 @@ from typing import Dict, Set, List, Optional, Callable, Any
 import ctypes
 import ctypes.util
 
+from ...core.watchdog import register_heartbeat
 from .monitor_base import MonitorBase
 from ..core import EventType, FileSystemEvent
 from ..core import FileSystemMonitorError, WatchCreationError
@@ -83,6 +82,9 @@ from ..dispatch.event_dispatcher import EventDispatcher
 
 logger = logging.getLogger(__name__)
 
+# Seconds without a monitor loop iteration after which the monitor is stalled
+HEARTBEAT_INTERVAL = 10.0
+
 # Define inotify constants
 # These are from linux/inotify.h
 IN_ACCESS = 0x00000001  # File was accessed
@@ -495,8 +497,12 @@ class LinuxMonitor(MonitorBase):
         - Continuously reads inotify events
         - Translates them to our event model
         - Dispatches events to the event dispatcher
+        - Beats the fs_monitor heartbeat once per iteration, at least every
+          second as reads time out after one second
         """
+        heartbeat = register_heartbeat("fs_monitor", HEARTBEAT_INTERVAL)
         while self._running:
+            heartbeat.beat()
             try:
                 # Read events
                 events = self._read_events()
@@ -596,3 +602,4 @@ class LinuxMonitor(MonitorBase):
                 if self._running:
                     logger.error(f"Error in Linux monitor loop: {e}")
                     time.sleep(1)  # Sleep to avoid tight loop on error
+        heartbeat.pause()
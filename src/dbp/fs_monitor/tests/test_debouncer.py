@@ -0,0 +1,80 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the delivery of debounced events by the fs_monitor EventDebouncer.
+###############################################################################
+# [Source file design principles]
+# - Regression coverage: debounced events reach the listeners they were routed to
+###############################################################################
+# [Source file constraints]
+# - Timings are only checked against generous bounds
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/fs_monitor/dispatch/debouncer.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T03:40:00Z : Created debouncer tests by CodeAssistant
+# * Added delivery and listener merge tests of debounced events
+###############################################################################
+
+"""
+Tests for EventDebouncer.
+"""
+
+import threading
+
+from ..core.event_types import EventType, FileSystemEvent
+from ..dispatch.debouncer import EventDebouncer
+
+
+def _debouncer():
+    delivered = []
+    done = threading.Event()
+
+    def dispatch(event, listener_ids):
+        delivered.append((event, list(listener_ids)))
+        done.set()
+
+    debouncer = EventDebouncer(dispatch)
+    debouncer.set_default_debounce_ms(10)
+    return debouncer, delivered, done
+
+
+def test_debounced_event_reaches_the_listeners_it_was_routed_to():
+    debouncer, delivered, done = _debouncer()
+    event = FileSystemEvent(EventType.FILE_MODIFIED, "/repo/a.py")
+    debouncer.start()
+    try:
+        debouncer.add_event(event, [3, 5], {3: 10, 5: 20})
+        assert done.wait(5)
+    finally:
+        debouncer.stop()
+
+    assert delivered == [(event, [3, 5])]
+    assert debouncer.pending_count == 0
+
+
+def test_repeated_event_is_dispatched_once_to_all_its_listeners():
+    debouncer, delivered, done = _debouncer()
+    event = FileSystemEvent(EventType.FILE_MODIFIED, "/repo/a.py")
+    debouncer.add_event(event, [3], {3: 50})
+    debouncer.add_event(event, [3, 7], {3: 50, 7: 50})
+    debouncer.start()
+    try:
+        assert done.wait(5)
+    finally:
+        debouncer.stop()
+
+    assert delivered == [(event, [3, 7])]
@@ -0,0 +1,148 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the scheduling of listener tasks by the fs_monitor ThreadManager.
+###############################################################################
+# [Source file design principles]
+# - A gate task holds the workers while the tasks under test are queued, so
+#   that the scheduling order does not depend on thread timing
+###############################################################################
+# [Source file constraints]
+# - Timings are only checked against generous bounds
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/fs_monitor/dispatch/thread_manager.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T02:20:00Z : Added listener queue removal test by CodeAssistant
+# * Checked that unregistering a listener queue discards its tasks and stops its isolated workers
+# 2026-10-19T00:10:00Z : Created thread manager tests by CodeAssistant
+# * Added priority order, concurrency cap and slow listener isolation tests
+###############################################################################
+
+"""
+Tests for ThreadManager listener queues.
+"""
+
+import threading
+import time
+
+from ..dispatch.thread_manager import ThreadManager, ThreadPriority
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+def test_higher_priority_listeners_are_served_first():
+    manager = ThreadManager(num_threads=1)
+    manager.register_listener_queue("gate", "gate")
+    manager.register_listener_queue("slow", "slow", priority=ThreadPriority.LOW)
+    manager.register_listener_queue("cache", "cache", priority=ThreadPriority.HIGH)
+    manager.register_listener_queue("other", "other")
+    gate = threading.Event()
+    order = []
+    manager.start()
+    try:
+        manager.submit_listener_task("gate", gate.wait)
+        assert wait_until(lambda: manager.queue_size == 0)
+        manager.submit_listener_task("slow", order.append, "slow-1")
+        manager.submit_listener_task("other", order.append, "other-1")
+        manager.submit_listener_task("cache", order.append, "cache-1")
+        manager.submit_listener_task("slow", order.append, "slow-2")
+        manager.submit_listener_task("cache", order.append, "cache-2")
+        gate.set()
+        assert wait_until(lambda: len(order) == 5)
+    finally:
+        manager.stop()
+
+    assert order == ["cache-1", "cache-2", "other-1", "slow-1", "slow-2"]
+
+
+def test_concurrency_cap_per_listener():
+    manager = ThreadManager(num_threads=4)
+    manager.register_listener_queue("serial", "serial")
+    manager.register_listener_queue("parallel", "parallel", max_concurrency=2)
+    lock = threading.Lock()
+    running = {"serial": 0, "parallel": 0}
+    peak = {"serial": 0, "parallel": 0}
+
+    def handler(key):
+        with lock:
+            running[key] += 1
+            peak[key] = max(peak[key], running[key])
+        time.sleep(0.02)
+        with lock:
+            running[key] -= 1
+
+    manager.start()
+    try:
+        for _ in range(6):
+            manager.submit_listener_task("serial", handler, "serial")
+            manager.submit_listener_task("parallel", handler, "parallel")
+        assert wait_until(lambda: sum(stats["completed"] for stats in manager.get_listener_stats()) == 12)
+    finally:
+        manager.stop()
+
+    assert peak == {"serial": 1, "parallel": 2}
+
+
+def test_slow_listener_is_isolated_from_fast_ones():
+    manager = ThreadManager(num_threads=1, slow_listener_p95_ms=20)
+    manager.register_listener_queue("hstc", "hstc")
+    manager.register_listener_queue("cache", "cache")
+    manager.start()
+    try:
+        for _ in range(20):
+            manager.submit_listener_task("hstc", time.sleep, 0.03)
+        assert wait_until(lambda: {stats["name"]: stats for stats in manager.get_listener_stats()}["hstc"]["isolated"])
+
+        for _ in range(10):
+            manager.submit_listener_task("hstc", time.sleep, 0.03)
+        done = threading.Event()
+        manager.submit_listener_task("cache", done.set)
+        # The shared worker serves the fast listener without waiting for the slow backlog
+        assert done.wait(0.15)
+    finally:
+        manager.stop()
+
+    stats = {stats["name"]: stats for stats in manager.get_listener_stats()}
+    assert stats["hstc"]["handler_time_ms"]["p95"] >= 20
+    assert stats["cache"]["completed"] == 1 and stats["cache"]["queue_time_ms"]["max"] < 150
+
+
+def test_unregistered_listener_queue_releases_its_workers_and_tasks():
+    manager = ThreadManager(num_threads=1, slow_listener_p95_ms=5)
+    manager.register_listener_queue("hstc", "hstc")
+    manager.start()
+    try:
+        for _ in range(20):
+            manager.submit_listener_task("hstc", time.sleep, 0.01)
+        assert wait_until(lambda: {stats["name"]: stats for stats in manager.get_listener_stats()}["hstc"]["isolated"])
+        isolated_threads = list(manager._queues["hstc"].isolated_threads)
+        for _ in range(50):
+            manager.submit_listener_task("hstc", time.sleep, 0.01)
+
+        manager.unregister_listener_queue("hstc")
+
+        assert not manager.has_listener_queue("hstc")
+        assert manager.queue_size == 0
+        assert [stats["name"] for stats in manager.get_listener_stats()] == ["default"]
+        assert wait_until(lambda: not any(thread.is_alive() for thread in isolated_threads))
+    finally:
+        manager.stop()
@@ -45,6 +45,8 @@
 # codebase:src/dbp/fs_monitor/core/path_utils.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T02:20:00Z : Added unregister callbacks by CodeAssistant
+# * Added add_unregister_callback, notified after a listener is unregistered
 # 2025-04-29T08:29:00Z : Centralized log file filtering logic by CodeAssistant
 # * Moved is_log_file() to path_utils.py to ensure consistent filtering across components
 # * Updated WatchManager to use the centralized is_log_file() function
@@ -60,10 +62,6 @@
 # 2025-04-29T01:01:00Z : Updated import paths for module reorganization by CodeAssistant
 # * Updated imports to use the new module structure with core/ and dispatch/ submodules
 # * Updated dependencies section to reflect the new file locations
-# 2025-04-29T00:02:30Z : Initial implementation of watch manager for fs_monitor redesign by CodeAssistant
-# * Created WatchManager class for managing file system event listeners
-# * Implemented registration and unregistration APIs
-# * Added support for pattern matching and resource tracking
 ###############################################################################
 
 import os
@@ -126,6 +124,22 @@ class WatchManager:
         self._listener_watches: Dict[int, Set[str]] = {}
         self._next_listener_id = 1
         self._resource_tracker = ResourceTracker(self._cleanup_resource)
+        self._unregister_callbacks: List[Callable[[int], None]] = []
+    
+    def add_unregister_callback(self, callback: Callable[[int], None]) -> None:
+        """
+        [Function intent]
+        Register a function called with the ID of each unregistered listener.
+        
+        [Implementation details]
+        - Callbacks run after the listener is removed, outside the lock of the
+          watch manager
+        
+        Args:
+            callback: Function taking the listener ID
+        """
+        with self._lock:
+            self._unregister_callbacks.append(callback)
     
     def register_listener(self, listener: FileSystemEventListener) -> WatchHandle:
         """
@@ -238,6 +252,7 @@ class WatchManager:
         - Removes listener from registry
         - Decrements reference counts for resources
         - Cleans up watches
+        - Notifies the unregister callbacks
         
         Args:
             listener_id: ID of the listener to unregister
@@ -261,7 +276,14 @@ class WatchManager:
             self._listener_patterns.pop(listener_id, None)
             self._listener_watches.pop(listener_id, None)
             
+            callbacks = list(self._unregister_callbacks)
             logger.debug(f"Unregistered listener {listener_id}")
+        
+        for callback in callbacks:
+            try:
+                callback(listener_id)
+            except Exception as e:
+                logger.error(f"Unregister callback failed for listener {listener_id}: {e}")
     
     def _cleanup_resource(self, path: str, os_descriptor: Any) -> None:
         """
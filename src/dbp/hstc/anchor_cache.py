@@ -0,0 +1,122 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides the anchor lookup cache used by the source code processor to resolve
+# the positions of all the changes of an LLM response in a source file up front,
+# searching each distinct anchor at most once.
+###############################################################################
+# [Source file design principles]
+# - Each distinct anchor is searched once per file, whatever the number of changes
+# - Same results as str.find: first occurrence of each anchor, -1 when absent
+# - Fallback anchors are only searched when a change actually needs them
+###############################################################################
+# [Source file constraints]
+# - Content is immutable for the lifetime of a cache
+###############################################################################
+# [Dependencies]
+# system:typing
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T05:40:00Z : Renamed ChangeAnchorIndex to AnchorLookupCache by CodeAssistant
+# * The class memoizes one str.find per distinct anchor, it does not index the content
+# * Recorded why a single multi-pattern scan is not used
+# 2026-10-18T13:40:00Z : Initial implementation by CodeAssistant
+# * Added ChangeAnchorIndex resolving change anchors once per file
+###############################################################################
+
+"""
+Location of change anchors in source content.
+"""
+
+from typing import Any, Dict, Iterable
+
+
+# Marker used by the LLM response for changes anchored at the start of the file
+START_OF_FILE_MARKER = "<<SOF>>"
+
+
+class AnchorLookupCache:
+    """
+    [Class intent]
+    Cache of the first positions of the anchors (context, original text, and
+    their concatenation) of a set of changes in one source content.
+
+    [Design principles]
+    - Built once per file, one search per distinct anchor
+    - Drop-in replacement for content.find in change location code
+
+    [Implementation details]
+    - Primary anchors (context followed by original text) are resolved when the
+      cache is built, duplicates only once
+    - Each anchor is searched with str.find rather than all anchors in one
+      multi-pattern scan: on 100 changes of a 1 MB source file, a scan with one
+      compiled alternation of the anchors was 2 to 25 times slower than the
+      C-level searches, as source anchors share long prefixes (indentation,
+      "def ", comment markers) and an absent anchor makes it read the whole
+      file; pure Python Aho-Corasick costs an interpreter step per character
+      (see the hstc.anchor_lookup benchmark)
+    - Results of later lookups are cached
+    """
+
+    def __init__(self, content: str, anchors: Iterable[str] = ()):
+        """
+        [Method intent]
+        Create the cache and resolve the given anchors.
+
+        Args:
+            content: Content searched by the cache
+            anchors: Anchor strings to resolve up front
+        """
+        self.content = content
+        self._positions: Dict[str, int] = {}
+        for anchor in anchors:
+            self.find(anchor)
+
+    @classmethod
+    def for_changes(cls, content: str, changes: Iterable[Dict[str, Any]]) -> "AnchorLookupCache":
+        """
+        [Method intent]
+        Build the cache with the primary anchors of a list of changes resolved.
+
+        Args:
+            content: Original source content
+            changes: Change objects with context_before and original_text
+
+        Returns:
+            AnchorLookupCache: Cache of the changes' anchor positions
+        """
+        anchors = []
+        for change in changes:
+            context = change.get('context_before', '') or ''
+            original = change.get('original_text', '') or ''
+            if context != START_OF_FILE_MARKER and (context or original):
+                anchors.append(context + original)
+        return cls(content, anchors)
+
+    def find(self, anchor: str) -> int:
+        """
+        [Method intent]
+        Get the first position of an anchor in the content.
+
+        Args:
+            anchor: String to locate
+
+        Returns:
+            int: Position of the first occurrence, -1 if absent
+        """
+        position = self._positions.get(anchor)
+        if position is None:
+            position = self.content.find(anchor)
+            self._positions[anchor] = position
+        return position
@@ -32,6 +32,11 @@
 # codebase:src/dbp/hstc/manager.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T11:30:00Z : Passed batch runner through update_hstc by CodeAssistant
+# * Added optional batch_runner parameter delegated to the manager
+# 2026-10-18T09:05:00Z : Added Bedrock runtime client pre-warming by CodeAssistant
+# * initialize() sizes the shared runtime client pool to the configured concurrency
+# * Added _prepare_runtime_clients opening pooled connections in the background
 # 2025-05-07T12:56:53Z : Added direct console debugging to update_source_file by CodeAssistant
 # * Added direct stderr debug output to bypass logging system
 # * Implemented file existence checking at the component level
@@ -130,6 +135,9 @@ class HSTCComponent(Component):
             # Create and initialize the manager
             self._manager = HSTCManager(logger=self.logger)
 
+            # Size and pre-warm the shared Bedrock runtime clients
+            self._prepare_runtime_clients(context)
+
             # Set initialization flag
             self._initialized = True
             
@@ -139,6 +147,40 @@ class HSTCComponent(Component):
             self.set_initialization_error(e)
             raise
 
+    def _prepare_runtime_clients(self, context: InitializationContext) -> None:
+        """
+        [Function intent]
+        Sizes the shared Bedrock runtime client pool to the configured concurrency
+        and opens its first connections so the first LLM calls skip TLS handshakes.
+        
+        [Design principles]
+        Best-effort: a missing AWS setup must not prevent the component from starting.
+        
+        [Implementation details]
+        Uses aws.runtime_pool settings, falling back to llm_coordinator.max_parallel_jobs
+        for the pool size. Connections are opened in a background thread.
+        
+        Args:
+            context: Initialization context with configuration
+        """
+        try:
+            from dbp.api_providers.aws.client_factory import AWSClientFactory
+
+            config = context.get_typed_config()
+            pool_config = config.aws.runtime_pool
+            pool_size = pool_config.max_pool_connections or config.llm_coordinator.max_parallel_jobs
+
+            client_factory = AWSClientFactory.get_instance()
+            client_factory.configure_runtime_pool(pool_size)
+            if pool_config.prewarm_connections > 0:
+                client_factory.prewarm_runtime_clients(
+                    [config.aws.region],
+                    connections=pool_config.prewarm_connections,
+                    profile_name=config.aws.credentials_profile
+                )
+        except Exception as e:
+            self.logger.warning(f"Could not prepare Bedrock runtime clients: {str(e)}")
+
     def shutdown(self) -> None:
         """
         [Function intent]
@@ -173,7 +215,8 @@ class HSTCComponent(Component):
                 self.logger.error(f"Error during HSTC component shutdown: {str(e)}")
                 raise
 
-    def update_hstc(self, directory_path: Optional[Union[str, Path]] = None, dry_run: bool = False) -> Dict[str, Any]:
+    def update_hstc(self, directory_path: Optional[Union[str, Path]] = None, dry_run: bool = False,
+                    batch_runner=None) -> Dict[str, Any]:
         """
         [Function intent]
         Updates HSTC.md files for a directory tree, starting from the specified directory.
@@ -189,6 +232,7 @@ class HSTCComponent(Component):
         Args:
             directory_path: Root directory to update (defaults to project root)
             dry_run: If True, show changes without applying them
+            batch_runner: Optional BatchInferenceRunner to run the LLM calls as batch jobs
             
         Returns:
             dict: Summary of update operations
@@ -203,7 +247,7 @@ class HSTCComponent(Component):
         if directory_path and isinstance(directory_path, str):
             directory_path = Path(directory_path)
             
-        return self._manager.update_hstc(directory_path, dry_run)
+        return self._manager.update_hstc(directory_path, dry_run, batch_runner=batch_runner)
 
     def update_source_file(self, file_path: Union[str, Path], dry_run: bool = False) -> Dict[str, Any]:
         """
@@ -31,6 +31,8 @@
 # codebase:src/dbp/hstc/exceptions.py
 # codebase:src/dbp/core/file_access.py
 # codebase:src/dbp/llm/bedrock/client_factory.py
+# codebase:src/dbp/llm/bedrock/batch.py
+# codebase:src/dbp/llm/common/json_stream.py
 # system:pathlib
 # system:typing
 # system:logging
@@ -39,13 +41,17 @@
 # system:re
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T03:30:00Z : Restored fenced JSON block fallback by CodeAssistant
+# * _parse_llm_response falls back to the ```json code block when the single-pass parser finds no document
+# 2026-10-18T12:40:00Z : Replaced regex JSON extraction with single-pass parser by CodeAssistant
+# * _parse_llm_response uses parse_json_document, tolerating prose and code fences
+# 2026-10-18T11:30:00Z : Added injectable LLM client for batch mode by CodeAssistant
+# * Added llm_client constructor parameter
+# * BatchPending propagates unwrapped from update_hstc_file
 # 2025-05-07T12:12:50Z : Implemented full HSTCFileProcessor functionality by CodeAssistant
 # * Added file header extraction and child directory processing
 # * Implemented LLM integration for HSTC generation
 # * Added HSTC file creation and updating logic
-# 2025-05-07T11:50:30Z : Initial placeholder implementation of HSTCFileProcessor by CodeAssistant
-# * Created placeholder class with interface methods
-# * Added basic logging and NotImplementedError responses
 ###############################################################################
 
 import os
@@ -57,6 +63,8 @@ from typing import Dict, Any, Optional, Union, List, Tuple, Set
 
 from dbp.core.file_access import DBPFile, get_dbp_file
 from dbp.llm.bedrock.client_factory import BedrockClientFactory
+from dbp.llm.bedrock.batch import BatchPending
+from dbp.llm.common.json_stream import parse_json_document
 from dbp.hstc.exceptions import HSTCProcessingError, LLMError, FileAccessError
 
 
@@ -78,7 +86,7 @@ class HSTCFileProcessor:
     Processes responses from LLM to generate HSTC.md content.
     """
     
-    def __init__(self, logger=None, llm_model_id: str = "amazon.nova-lite-v1"):
+    def __init__(self, logger=None, llm_model_id: str = "amazon.nova-lite-v1", llm_client=None):
         """
         [Function intent]
         Initializes the HSTCFileProcessor with a logger and LLM model.
@@ -90,10 +98,12 @@ class HSTCFileProcessor:
         [Implementation details]
         Sets up logger instance with proper child hierarchy if parent provided.
         Initializes with the specified LLM model ID, defaulting to Nova Lite.
+        A pre-built client (e.g. a batch replay client) replaces the lazily
+        created LangChain client when provided.
         """
         self.logger = logger or logging.getLogger("dbp.hstc.hstc_processor")
         self.llm_model_id = llm_model_id
-        self._llm_client = None
+        self._llm_client = llm_client
         self._prompt_template = None
     
     def _get_llm_client(self):
@@ -401,41 +411,40 @@ You must return a valid JSON object with the structured HSTC content.
         Clear validation of expected response structure.
         
         [Implementation details]
-        Attempts to parse the response as JSON.
-        Falls back to extracting content from code blocks if JSON parsing fails.
+        Parses the response in a single pass with the incremental JSON parser,
+        which skips prose and markdown code fences around the JSON object.
+        Falls back to the content of a ```json code block when prose before
+        the block holds braces the parser stops on.
         Validates the presence of required fields.
         """
-        # Try to parse as JSON directly
-        try:
-            response_data = json.loads(response)
-            
+        response_data = parse_json_document(response, "hstc_content")
+        if response_data is not None:
             # Validate required fields
             if "hstc_content" not in response_data:
                 raise ValueError("Missing 'hstc_content' field in LLM response")
                 
             return response_data
-            
-        except json.JSONDecodeError:
-            # If direct parsing fails, try to extract JSON from the response
-            json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
-            if json_match:
-                try:
-                    response_data = json.loads(json_match.group(1))
+        
+        # Try to extract JSON from a fenced code block
+        json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
+        if json_match:
+            try:
+                response_data = json.loads(json_match.group(1))
+            except json.JSONDecodeError:
+                response_data = None
+            if isinstance(response_data, dict):
+                # Validate required fields
+                if "hstc_content" not in response_data:
+                    raise ValueError("Missing 'hstc_content' field in extracted JSON")
                     
-                    # Validate required fields
-                    if "hstc_content" not in response_data:
-                        raise ValueError("Missing 'hstc_content' field in extracted JSON")
-                        
-                    return response_data
-                except json.JSONDecodeError:
-                    pass
-            
-            # Return a basic error response if parsing fails
-            return {
-                "hstc_content": None,
-                "status": "error",
-                "messages": ["LLM response format was not valid JSON"]
-            }
+                return response_data
+        
+        # Return a basic error response if parsing fails
+        return {
+            "hstc_content": None,
+            "status": "error",
+            "messages": ["LLM response format was not valid JSON"]
+        }
     
     def _generate_hstc_markdown(self, hstc_data: Dict[str, Any]) -> str:
         """
@@ -609,6 +618,9 @@ You must return a valid JSON object with the structured HSTC content.
             try:
                 response = llm_client.invoke(messages)
                 response_text = response.content
+            except BatchPending:
+                # Prompt queued for the next batch job, the caller repeats the wave
+                raise
             except Exception as e:
                 error_msg = f"LLM processing failed: {str(e)}"
                 self.logger.error(error_msg)
@@ -661,7 +673,7 @@ You must return a valid JSON object with the structured HSTC content.
                 raise HSTCProcessingError(error_msg, directory_path=str(path_obj))
                 
         except Exception as e:
-            if isinstance(e, (HSTCProcessingError, LLMError)):
+            if isinstance(e, (HSTCProcessingError, LLMError, BatchPending)):
                 # Re-raise known exceptions
                 raise e
             else:
@@ -33,12 +33,16 @@
 # codebase:src/dbp/hstc/source_processor.py
 # codebase:src/dbp/hstc/hstc_processor.py
 # codebase:src/dbp/hstc/exceptions.py
+# codebase:src/dbp/llm/bedrock/batch.py
 # system:logging
 # system:pathlib
 # system:typing
 # system:os
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T11:30:00Z : Added batch inference mode to update_hstc by CodeAssistant
+# * Added batch_runner parameter running LLM calls as one batch job per directory depth
+# * Extracted directory loop into _process_directories
 # 2025-05-07T13:23:05Z : Removed threading from SourceProcessor delegation by CodeAssistant
 # * Simplified code with direct synchronous invocation
 # * Removed ThreadPoolExecutor dependency in manager
@@ -53,9 +57,6 @@
 # * Created manager class with component coordination
 # * Implemented HSTC update orchestration
 # * Added source file processing and reporting
-# 2025-05-07T11:48:00Z : Initial placeholder implementation of HSTCManager by CodeAssistant
-# * Created placeholder class with interface methods
-# * Added basic logging and NotImplementedError responses
 ###############################################################################
 
 import os
@@ -67,6 +68,7 @@ from dbp.hstc.scanner import HSTCScanner
 from dbp.hstc.source_processor import SourceCodeProcessor
 from dbp.hstc.hstc_processor import HSTCFileProcessor
 from dbp.hstc.exceptions import HSTCError, ScannerError, SourceProcessingError, HSTCProcessingError
+from dbp.llm.bedrock.batch import BatchInferenceRunner, BatchPending, BatchSession, BatchReplayChatClient
 
 
 class HSTCManager:
@@ -215,7 +217,8 @@ class HSTCManager:
             raise
     
     def update_hstc(self, directory_path: Optional[Union[str, Path]] = None, 
-                   dry_run: bool = False) -> Dict[str, Any]:
+                   dry_run: bool = False,
+                   batch_runner: Optional[BatchInferenceRunner] = None) -> Dict[str, Any]:
         """
         [Function intent]
         Updates HSTC.md files for a directory tree, starting from the specified directory.
@@ -230,10 +233,14 @@ class HSTCManager:
         Processes directories in bottom-up order (leaves to root).
         Updates HSTC.md files in each directory.
         Collects results for reporting.
+        With a batch runner, directories of the same depth are answered by one
+        batch job per level (a parent prompt needs its children's HSTC.md).
         
         Args:
             directory_path: Root directory to update (defaults to project root)
             dry_run: If True, show changes without applying them
+            batch_runner: Optional batch inference runner; when given, LLM calls are
+                submitted as batch jobs instead of synchronous requests
             
         Returns:
             dict: Summary of update operations with detailed results
@@ -296,39 +303,13 @@ class HSTCManager:
             self.logger.info(f"Processing {len(update_order)} directories in bottom-up order")
             
             # Process each directory
-            results = []
-            success_count = 0
-            error_count = 0
+            if batch_runner is None:
+                results = self._process_directories(update_order, dry_run, self._hstc_processor)
+            else:
+                results = self._process_directories_in_batches(update_order, dry_run, batch_runner)
             
-            for directory in update_order:
-                try:
-                    self.logger.info(f"Processing directory: {directory}")
-                    
-                    # Update HSTC.md file
-                    result = self._hstc_processor.update_hstc_file(directory, dry_run)
-                    
-                    # Add result to list
-                    results.append(result)
-                    
-                    # Update counts
-                    if result["status"] in ["updated", "preview"]:
-                        success_count += 1
-                    elif result["status"] == "error":
-                        error_count += 1
-                        
-                except Exception as e:
-                    error_msg = f"Error updating HSTC.md for {directory}: {str(e)}"
-                    self.logger.error(error_msg)
-                    
-                    # Add error result
-                    results.append({
-                        "status": "error",
-                        "message": error_msg,
-                        "directory_path": str(directory),
-                        "dry_run": dry_run
-                    })
-                    
-                    error_count += 1
+            success_count = sum(1 for result in results if result["status"] in ["updated", "preview"])
+            error_count = sum(1 for result in results if result["status"] == "error")
             
             # Return summary results
             return {
@@ -353,6 +334,92 @@ class HSTCManager:
                 "dry_run": dry_run
             }
     
+    def _process_directories(self, directories: List[Path], dry_run: bool,
+                             hstc_processor: HSTCFileProcessor) -> List[Dict[str, Any]]:
+        """
+        [Function intent]
+        Updates the HSTC.md files of a list of directories in the given order.
+        
+        [Design principles]
+        Continues processing on errors, each failure becomes an error result.
+        
+        [Implementation details]
+        Delegates each directory to the HSTC processor.
+        
+        Args:
+            directories: Directories to update, in processing order
+            dry_run: If True, show changes without applying them
+            hstc_processor: Processor used for the updates
+            
+        Returns:
+            list: One result dictionary per directory
+        """
+        results = []
+        for directory in directories:
+            try:
+                self.logger.info(f"Processing directory: {directory}")
+                results.append(hstc_processor.update_hstc_file(directory, dry_run))
+            except BatchPending:
+                results.append({
+                    "status": "pending",
+                    "message": f"Prompt for {directory} queued for batch inference",
+                    "directory_path": str(directory),
+                    "dry_run": dry_run
+                })
+            except Exception as e:
+                error_msg = f"Error updating HSTC.md for {directory}: {str(e)}"
+                self.logger.error(error_msg)
+                results.append({
+                    "status": "error",
+                    "message": error_msg,
+                    "directory_path": str(directory),
+                    "dry_run": dry_run
+                })
+        return results
+    
+    def _process_directories_in_batches(self, directories: List[Path], dry_run: bool,
+                                        batch_runner: BatchInferenceRunner) -> List[Dict[str, Any]]:
+        """
+        [Function intent]
+        Updates the HSTC.md files of a list of directories through batch jobs.
+        
+        [Design principles]
+        One batch job per directory depth instead of one request per directory.
+        Restartable: answered prompts are replayed from the runner state.
+        
+        [Implementation details]
+        Groups directories by depth, deepest first, so children are written before
+        their parents' prompts are built.
+        Each level runs in waves: the first wave queues the prompts, the runner
+        answers them in one job, the next wave replays the answers and writes.
+        
+        Args:
+            directories: Directories to update, in bottom-up order
+            dry_run: If True, show changes without applying them
+            batch_runner: Runner submitting and tracking the batch jobs
+            
+        Returns:
+            list: One result dictionary per directory
+        """
+        session = BatchSession(batch_runner)
+        hstc_processor = HSTCFileProcessor(
+            logger=self.logger.getChild("hstc_processor"),
+            llm_model_id=self._hstc_processor.llm_model_id,
+            llm_client=BatchReplayChatClient(session, self._hstc_processor.llm_model_id)
+        )
+        
+        levels: Dict[int, List[Path]] = {}
+        for directory in directories:
+            levels.setdefault(len(Path(directory).parts), []).append(Path(directory))
+        
+        results = []
+        for depth in sorted(levels, reverse=True):
+            self.logger.info(f"Batch processing {len(levels[depth])} directories at depth {depth}")
+            results.extend(session.run_waves(
+                lambda level=levels[depth]: self._process_directories(level, dry_run, hstc_processor)
+            ))
+        return results
+    
     def query_hstc(self, query: str) -> Dict[str, Any]:
         """
         [Function intent]
@@ -28,9 +28,11 @@
 # - Must provide detailed feedback on changes made
 ###############################################################################
 # [Dependencies]
+# codebase:src/dbp/hstc/anchor_cache.py
 # codebase:src/dbp/hstc/exceptions.py
 # codebase:src/dbp/core/file_access.py
 # codebase:src/dbp/llm/bedrock/client_factory.py
+# codebase:src/dbp/llm/common/json_stream.py
 # system:pathlib
 # system:typing
 # system:logging
@@ -39,25 +41,21 @@
 # system:re
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T05:40:00Z : Followed the anchor lookup cache rename by CodeAssistant
+# * Change anchors are located through AnchorLookupCache
+# 2026-10-18T13:40:00Z : Resolved all change positions up front in _apply_changes by CodeAssistant
+# * Anchors of all changes are located through ChangeAnchorIndex, each distinct anchor once
+# * Overlapping changes are detected and skipped with a warning
+# * Output is assembled in one pass from slices of the original content
+# 2026-10-18T12:40:00Z : Added incremental parsing of the streamed LLM response by CodeAssistant
+# * Changes are parsed and located in the source as soon as each change object closes
+# * Malformed response structure aborts the stream early with LLMError
+# * Split change location into _locate_change and response validation into _normalize_llm_result
 # 2025-05-07T17:35:33Z : Fixed documentation directives substitution in prompt template by CodeAssistant
 # * Updated _create_source_update_prompt to correctly handle code documentation directives
 # * Modified template parameter passing to use direct format() method
 # * Fixed error "'mandatory_code_documentation_directives' is not defined"
 # * Enhanced function documentation for template generation
-# 2025-05-07T16:28:29Z : Enhanced MIME message encoding and added debugging output by CodeAssistant
-# * Changed to use EmailMessage instead of MIMEMultipart for better encoding control
-# * Prevented base64 encoding for text files to improve LLM understanding
-# * Added proper file extension to attachment filename for better content recognition
-# * Added detailed MIME message debugging output to stderr
-# 2025-05-07T16:15:21Z : Added json-repair library for robust JSON handling by CodeAssistant
-# * Integrated json-repair package for handling malformed JSON responses
-# * Updated model parameters for more reliable JSON output (temperature 0.1)
-# * Added enhanced error handling with multiple fallback strategies
-# 2025-05-07T15:17:42Z : Reimplemented source processor with enhanced JSON parsing by CodeAssistant
-# * Implemented robust JSON error handling for malformed LLM responses
-# * Added special handling for responses starting with "changes" field
-# * Implemented context-based replacement for precise code updates
-# * Added detailed logging throughout the process for better diagnostics
 ###############################################################################
 
 import os
@@ -67,7 +65,7 @@ import logging
 import mimetypes
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, Union, List, Tuple
+from typing import Callable, Dict, Any, Optional, Union, List, Tuple
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.application import MIMEApplication
@@ -77,6 +75,9 @@ from json_repair import repair_json
 
 from dbp.core.file_access import DBPFile, get_dbp_file
 from dbp.llm.bedrock.client_factory import BedrockClientFactory
+from dbp.llm.common.exceptions import MalformedStreamError
+from dbp.llm.common.json_stream import IncrementalJSONParser, parse_json_document
+from dbp.hstc.anchor_cache import AnchorLookupCache, START_OF_FILE_MARKER
 from dbp.hstc.exceptions import SourceProcessingError, LLMError, FileAccessError
 
 # Register the markdown MIME type if not already registered
@@ -232,36 +233,64 @@ class SourceCodeProcessor:
                 self.logger.info(f"Invoking LLM with streaming enabled")
                 
                 # Initialize response variables
-                full_response_content = ""
                 chunks_received = 0
                 
+                # Incremental parser: each change is located in the source while
+                # the model is still generating the following ones
+                parser = IncrementalJSONParser("changes", repair=repair_json)
+                change_positions = []
+                changes_received = 0
+                
                 # Direct console output for debugging
                 import sys
                 print(f"[SOURCE_PROCESSOR:STREAMING] Starting LLM streaming, will print chunks as they arrive", file=sys.stderr)
                 sys.stderr.flush()
                 
                 # Start streaming
-                for chunk in llm_client.stream_text(messages):
-                    # Accumulate the response content
-                    full_response_content += chunk
-                    chunks_received += 1
-                    
-                    # Print each chunk as it arrives
-                    print(chunk, file=sys.stderr, end="")
-                    sys.stderr.flush()
+                stream = llm_client.stream_text(messages)
+                try:
+                    for chunk in stream:
+                        chunks_received += 1
+                        
+                        # Print each chunk as it arrives
+                        print(chunk, file=sys.stderr, end="")
+                        sys.stderr.flush()
+                        
+                        for change in parser.feed(chunk):
+                            position = self._locate_change(file_content, changes_received, change)
+                            changes_received += 1
+                            if position is not None:
+                                change_positions.append(position)
+                        
+                        if parser.complete:
+                            break
+                except MalformedStreamError as e:
+                    # Abort generation early, the response cannot be applied
+                    raise LLMError(f"Malformed LLM response after {chunks_received} chunks: {str(e)}",
+                                   model_id=self.llm_model_id)
+                finally:
+                    if hasattr(stream, "close"):
+                        stream.close()
                 
                 print(f"[SOURCE_PROCESSOR:STREAMING] Streaming complete, received {chunks_received} chunks", file=sys.stderr)
                 sys.stderr.flush()
                 
                 # Dump raw response for debugging (only in debug mode)
                 if self.logger.isEnabledFor(logging.DEBUG):
-                    self.logger.debug(f"Raw LLM response: {full_response_content[:500]}...")
+                    self.logger.debug(f"Raw LLM response: {parser.text[:500]}...")
                 
-                # Parse the response
+                # Use the streamed document, fall back to full-text parsing and repair
                 self.logger.info(f"Parsing LLM response after receiving {chunks_received} chunks")
-                result = self._parse_llm_response(full_response_content)
+                document = parser.finish()
+                if document is not None:
+                    result = self._normalize_llm_result(document)
+                else:
+                    result = self._parse_llm_response(parser.text)
+                    change_positions = None
                 self.logger.info(f"Response parsed successfully")
                 
+            except LLMError:
+                raise
             except Exception as e:
                 self.logger.error(f"Failed to process file with LLM: {str(e)}")
                 raise LLMError(f"Failed to process file with LLM: {str(e)}", model_id=self.llm_model_id)
@@ -272,8 +301,8 @@ class SourceCodeProcessor:
             status = result.get("status", "error")
             messages = result.get("messages", [])
             
-            # Apply changes to generate updated content
-            updated_source_code = self._apply_changes(file_content, changes)
+            # Apply changes to generate updated content (positions located while streaming)
+            updated_source_code = self._apply_changes(file_content, changes, change_positions)
             
             # Check if any changes were made
             changes_made = updated_source_code != file_content and len(changes) > 0
@@ -504,7 +533,101 @@ class SourceCodeProcessor:
             ]
         }
             
-    def _apply_changes(self, original_content: str, changes: List[Dict[str, Any]]) -> str:
+    def _locate_change(self, content: str, index: int, change: Dict[str, Any],
+                       find: Optional[Callable[[str], int]] = None) -> Optional[Dict[str, Any]]:
+        """
+        [Function intent]
+        Finds the position in the original content where a change applies.
+        
+        [Design principles]
+        Independent of the other changes so it can run while the response streams.
+        Robust error handling for missing context.
+        
+        [Implementation details]
+        Uses context_before to find the position of the change.
+        Falls back to the context alone, then to the original text alone.
+        Searches go through the given find function, content.find by default.
+        
+        Args:
+            content: The original source file content
+            index: Index of the change in the response, for logging
+            change: Change object with context_before, original_text, and replacement_text
+            find: Optional search function over content, such as AnchorLookupCache.find
+            
+        Returns:
+            Optional[Dict[str, Any]]: Located change, None if the change is skipped
+        """
+        i = index
+        if find is None:
+            find = content.find
+        context = change.get('context_before', '')
+        original = change.get('original_text', '')
+        replacement = change.get('replacement_text', '')
+        
+        # Skip invalid changes
+        if not context and not original:
+            self.logger.warning(f"Change #{i} has neither context_before nor original_text, skipping")
+            return None
+            
+        # Special handling for start of file marker
+        if context == START_OF_FILE_MARKER:
+            self.logger.info(f"Found start of file marker for change #{i}")
+            return {
+                'index': i,
+                'start_pos': 0,
+                'context': '',  # Empty context since we're at the start of the file
+                'original': original,
+                'replacement': replacement
+            }
+            
+        # Find position based on context
+        search_pattern = context + original
+        pos = find(search_pattern)
+        if pos >= 0:
+            # Found an exact match
+            start_pos = pos + len(context)  # Position after context_before
+            self.logger.info(f"Found match for change #{i} at position {start_pos}")
+            return {
+                'index': i,
+                'start_pos': start_pos,
+                'context': context,
+                'original': original,
+                'replacement': replacement
+            }
+        
+        # Try some fallback approaches
+        
+        # Try finding just the context
+        context_pos = find(context)
+        if context_pos >= 0:
+            start_pos = context_pos + len(context)
+            self.logger.warning(f"Found context only at position {context_pos}, using position {start_pos}")
+            return {
+                'index': i,
+                'start_pos': start_pos,
+                'context': context,
+                'original': original,
+                'replacement': replacement
+            }
+        elif original:
+            # Try finding just the original text
+            original_pos = find(original)
+            if original_pos >= 0:
+                self.logger.warning(f"Found original text only at position {original_pos}, using that position")
+                return {
+                    'index': i,
+                    'start_pos': original_pos,
+                    'context': context,
+                    'original': original,
+                    'replacement': replacement
+                }
+            self.logger.error(f"Could not find position for change #{i}, skipping")
+        else:
+            self.logger.error(f"Could not find context for change #{i}, skipping")
+        return None
+            
+    def _apply_changes(self, original_content: str, changes: List[Dict[str, Any]],
+                       change_positions: Optional[List[Dict[str, Any]]] = None) -> str:
         """
         [Function intent]
         Applies a series of text changes to the original content.
@@ -514,12 +637,18 @@ class SourceCodeProcessor:
         Robust error handling for missing context.
         
         [Implementation details]
-        Uses context_before to find positions for changes.
-        Applies changes one by one in reverse order to avoid position shifts.
+        Uses context_before to find positions for changes, unless the positions
+        were already located while the response was streaming. All positions are
+        resolved up front through AnchorLookupCache, each distinct anchor once.
+        Changes are ordered by position (insertions before replacements at the
+        same position, then response order), changes overlapping an earlier one
+        are skipped, and the output is assembled in one pass from slices of the
+        original content.
         
         Args:
             original_content: The original source file content
             changes: List of change objects with context_before, original_text, and replacement_text
+            change_positions: Optional changes already located with _locate_change
             
         Returns:
             str: The modified content with all changes applied
@@ -530,105 +659,45 @@ class SourceCodeProcessor:
         if not changes:
             return original_content
             
-        # Work with a copy of the original content
-        modified_content = original_content
-        
         # Track positions for all changes first
-        change_positions = []
-        for i, change in enumerate(changes):
-            context = change.get('context_before', '')
-            original = change.get('original_text', '')
-            replacement = change.get('replacement_text', '')
-            
-            # Skip invalid changes
-            if not context and not original:
-                self.logger.warning(f"Change #{i} has neither context_before nor original_text, skipping")
-                continue
-                
-            # Special handling for start of file marker
-            if context == "<<SOF>>":
-                self.logger.info(f"Found start of file marker for change #{i}")
-                start_pos = 0
-                change_positions.append({
-                    'index': i,
-                    'start_pos': start_pos,
-                    'context': '',  # Empty context since we're at the start of the file
-                    'original': original,
-                    'replacement': replacement
-                })
-                continue
+        if change_positions is None:
+            anchors = AnchorLookupCache.for_changes(original_content, changes)
+            change_positions = []
+            for i, change in enumerate(changes):
+                position = self._locate_change(original_content, i, change, find=anchors.find)
+                if position is not None:
+                    change_positions.append(position)
                 
-            # Find position based on context
-            search_pattern = context + original
-            pos = modified_content.find(search_pattern)
-            if pos >= 0:
-                # Found an exact match
-                start_pos = pos + len(context)  # Position after context_before
-                self.logger.info(f"Found match for change #{i} at position {start_pos}")
-                change_positions.append({
-                    'index': i,
-                    'start_pos': start_pos,
-                    'context': context,
-                    'original': original,
-                    'replacement': replacement
-                })
-            else:
-                # Try some fallback approaches
-                
-                # Try finding just the context
-                context_pos = modified_content.find(context)
-                if context_pos >= 0:
-                    start_pos = context_pos + len(context)
-                    self.logger.warning(f"Found context only at position {context_pos}, using position {start_pos}")
-                    change_positions.append({
-                        'index': i,
-                        'start_pos': start_pos,
-                        'context': context,
-                        'original': original,
-                        'replacement': replacement
-                    })
-                elif original:
-                    # Try finding just the original text
-                    original_pos = modified_content.find(original)
-                    if original_pos >= 0:
-                        self.logger.warning(f"Found original text only at position {original_pos}, using that position")
-                        change_positions.append({
-                            'index': i,
-                            'start_pos': original_pos,
-                            'context': context,
-                            'original': original,
-                            'replacement': replacement
-                        })
-                    else:
-                        self.logger.error(f"Could not find position for change #{i}, skipping")
-                else:
-                    self.logger.error(f"Could not find context for change #{i}, skipping")
-                
-        # Sort positions in reverse order to avoid position shifts
-        change_positions.sort(key=lambda x: x['start_pos'], reverse=True)
+        ordered = sorted(change_positions,
+                         key=lambda x: (x['start_pos'], bool(x['original']), x['index']))
         
-        # Apply changes in reverse order
-        for change_info in change_positions:
+        parts = []
+        cursor = 0
+        for change_info in ordered:
             start_pos = change_info['start_pos']
             original = change_info['original']
-            replacement = change_info['replacement']
+            end_pos = start_pos + len(original)
+            
+            if start_pos < cursor:
+                self.logger.warning(f"Change #{change_info['index']} at position {start_pos} overlaps "
+                                    f"a previous change ending at {cursor}, skipping")
+                continue
             
             # Verify the text at the position matches what we expect
-            if original and modified_content[start_pos:start_pos + len(original)] != original:
-                actual_text = modified_content[start_pos:start_pos + len(original)]
+            if original and not original_content.startswith(original, start_pos):
+                actual_text = original_content[start_pos:end_pos]
                 self.logger.warning(f"Text mismatch at position {start_pos}")
                 self.logger.warning(f"Expected: '{original[:50]}{'...' if len(original) > 50 else ''}'")
                 self.logger.warning(f"Actual:   '{actual_text[:50]}{'...' if len(actual_text) > 50 else ''}'")
                 self.logger.warning("Skipping this change to avoid corruption")
                 continue
                 
-            # Apply the change
-            if original:  # Replacement
-                modified_content = modified_content[:start_pos] + replacement + modified_content[start_pos + len(original):]
-            else:  # Insertion at the end of context
-                modified_content = modified_content[:start_pos] + replacement + modified_content[start_pos:]
-                
-        return modified_content
+            parts.append(original_content[cursor:start_pos])
+            parts.append(change_info['replacement'])
+            cursor = end_pos
+            
+        parts.append(original_content[cursor:])
+        return ''.join(parts)
     
     def _parse_llm_response(self, content: str) -> Dict[str, Any]:
         """
@@ -668,6 +737,11 @@ class SourceCodeProcessor:
                 "messages": ["Failed to parse LLM response"]
             }
             
+            # Single-pass parse of well-formed responses (prose and fences are skipped)
+            document = parse_json_document(content, "changes")
+            if document is not None:
+                return self._normalize_llm_result(document)
+            
             # Try to parse the raw content as JSON
             try:
                 # Clean up the content for parsing
@@ -719,36 +793,55 @@ class SourceCodeProcessor:
                             # If all attempts fail, use default result
                             self.logger.warning("All JSON parsing attempts failed")
                 
-            # Validate required fields
-            if "changes" not in result:
-                self.logger.warning("LLM response missing changes field")
-                result["changes"] = []
-                result["status"] = "error"
-                result["messages"] = ["LLM response missing changes field"]
-                
-            if "changes_summary" not in result:
-                self.logger.warning("LLM response missing changes_summary field")
-                result["changes_summary"] = {
-                    "file_header_updated": False,
-                    "functions_updated": 0,
-                    "classes_updated": 0,
-                    "methods_updated": 0
-                }
-                
-            if "status" not in result:
-                result["status"] = "warning" if result.get("changes") else "error"
-                
-            # Always ensure we have a messages array
-            if "messages" not in result:
-                result["messages"] = []
-            
-            # Return the parsed or default result
-            return result
+            return self._normalize_llm_result(result)
                 
         except Exception as e:
             # Wrap parsing exceptions
             self.logger.error(f"Failed to parse LLM response: {str(e)}")
             raise LLMError(f"Failed to parse LLM response: {str(e)}", model_id=self.llm_model_id)
+    
+    def _normalize_llm_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Validates a parsed LLM response and fills in missing fields.
+        
+        [Design principles]
+        Same result shape whether the response was streamed or parsed at once.
+        
+        [Implementation details]
+        Adds default changes, changes_summary, status and messages fields.
+        
+        Args:
+            result: Parsed LLM response
+            
+        Returns:
+            dict: Response with all expected fields
+        """
+        # Validate required fields
+        if "changes" not in result:
+            self.logger.warning("LLM response missing changes field")
+            result["changes"] = []
+            result["status"] = "error"
+            result["messages"] = ["LLM response missing changes field"]
+            
+        if "changes_summary" not in result:
+            self.logger.warning("LLM response missing changes_summary field")
+            result["changes_summary"] = {
+                "file_header_updated": False,
+                "functions_updated": 0,
+                "classes_updated": 0,
+                "methods_updated": 0
+            }
+            
+        if "status" not in result:
+            result["status"] = "warning" if result.get("changes") else "error"
+            
+        # Always ensure we have a messages array
+        if "messages" not in result:
+            result["messages"] = []
+        
+        # Return the parsed or default result
+        return result
             
     def _is_processable_file(self, file_path: Path) -> bool:
         """
@@ -0,0 +1,71 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the anchor lookup cache in anchor_cache.py and for the change
+# application of SourceCodeProcessor built on it.
+###############################################################################
+# [Source file design principles]
+# - The cache is checked against str.find, the behavior it replaces
+# - Change application is checked on overlapping and mismatching changes
+###############################################################################
+# [Source file constraints]
+# - Must not depend on any LLM service
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/hstc/anchor_cache.py
+# codebase:src/dbp/hstc/source_processor.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T05:40:00Z : Renamed to anchor lookup cache tests by CodeAssistant
+# * Followed the rename of ChangeAnchorIndex to AnchorLookupCache
+# 2026-10-18T13:40:00Z : Created anchor index tests by CodeAssistant
+# * Added str.find equivalence and change application tests
+###############################################################################
+
+"""
+Tests for the anchor lookup cache.
+"""
+
+from ..anchor_cache import AnchorLookupCache
+from ..source_processor import SourceCodeProcessor
+
+
+CONTENT = "def a():\n    pass\n\ndef ab():\n    return 1\n\ndef a():\n    pass\n"
+
+
+def test_find_matches_str_find_for_nested_and_overlapping_anchors():
+    anchors = ["def a", "def ab", "a", "ab", "pass\n\ndef", "\n    ", "missing", "def a():\n    pass"]
+    cache = AnchorLookupCache(CONTENT, anchors)
+
+    for anchor in anchors + ["", "return", "not registered"]:
+        assert cache.find(anchor) == CONTENT.find(anchor), anchor
+
+
+def test_apply_changes_in_one_pass():
+    processor = SourceCodeProcessor()
+    changes = [
+        {"context_before": "def ab():\n", "original_text": "    return 1", "replacement_text": "    return 2"},
+        {"context_before": "<<SOF>>", "original_text": "", "replacement_text": "# header\n"},
+        {"context_before": "def a():\n", "original_text": "", "replacement_text": "    \"\"\"Doc.\"\"\"\n"},
+        # Overlaps the first change and must be skipped
+        {"context_before": "def ab():\n    ", "original_text": "return 1", "replacement_text": "return 3"},
+        # Original text does not match the located position and must be skipped
+        {"context_before": "def a():\n", "original_text": "    return", "replacement_text": "    yield"},
+    ]
+
+    result = processor._apply_changes(CONTENT, changes)
+
+    assert result == ("# header\ndef a():\n    \"\"\"Doc.\"\"\"\n    pass\n\n"
+                      "def ab():\n    return 2\n\ndef a():\n    pass\n")
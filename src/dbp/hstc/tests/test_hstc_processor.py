@@ -0,0 +1,59 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the parsing of LLM responses by HSTCFileProcessor.
+###############################################################################
+# [Source file design principles]
+# - Responses are given as plain strings, the LLM client is never created
+###############################################################################
+# [Source file constraints]
+# - Must not depend on any LLM service
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/hstc/hstc_processor.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T03:30:00Z : Created HSTC response parsing tests by CodeAssistant
+# * Added bare, fenced, prose-wrapped and invalid response tests
+###############################################################################
+
+"""
+Tests for the HSTC.md response parsing.
+"""
+
+import json
+
+import pytest
+
+from ..hstc_processor import HSTCFileProcessor
+
+
+DOCUMENT = {"hstc_content": {"directory_name": "src", "files": []}, "status": "success"}
+
+
+@pytest.mark.parametrize("response", [
+    json.dumps(DOCUMENT),
+    "Here is the result:\n```json\n" + json.dumps(DOCUMENT) + "\n```",
+    # Braces in the prose stop the single-pass parser, the fenced block is used
+    "I think {this} is it: ```json " + json.dumps(DOCUMENT) + " ```",
+])
+def test_parse_llm_response_finds_the_document(response):
+    assert HSTCFileProcessor()._parse_llm_response(response) == DOCUMENT
+
+
+def test_parse_llm_response_reports_invalid_json():
+    result = HSTCFileProcessor()._parse_llm_response("No JSON {here} ```json {broken ```")
+
+    assert result["hstc_content"] is None and result["status"] == "error"
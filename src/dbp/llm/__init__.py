@@ -28,6 +28,8 @@
 # codebase:- doc/llm/prompts/README.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T10:20:00Z : Made model-specific class exports lazy by CodeAssistant
+# * Model classes are forwarded lazily from dbp.llm.bedrock
 # 2025-04-16T13:45:00Z : Added Claude 3.7 Sonnet client by Cline
 # * Added Claude37SonnetClient for working with Anthropic's Claude 3.7 Sonnet
 # * Updated exports and registrations
@@ -49,9 +51,8 @@ try:
     from .bedrock.client_common import BedrockClientError
     
     # Import new LangChain-based implementations
+    # (model-specific classes resolve lazily through dbp.llm.bedrock)
     from .bedrock.langchain_wrapper import EnhancedChatBedrockConverse
-    from .bedrock.models.claude3 import ClaudeEnhancedChatBedrockConverse
-    from .bedrock.models.nova import NovaEnhancedChatBedrockConverse
     from .bedrock.client_factory import BedrockClientFactory
     
     # Export public interfaces
@@ -77,3 +78,10 @@ try:
 except ImportError as e:
     import logging
     logging.getLogger(__name__).error(f"Error importing LLM module components: {e}", exc_info=True)
+
+
+def __getattr__(name):
+    if name in ("ClaudeEnhancedChatBedrockConverse", "NovaEnhancedChatBedrockConverse"):
+        from . import bedrock
+        return getattr(bedrock, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -31,6 +31,8 @@
 # codebase:- doc/design/LLM_COORDINATION.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T10:20:00Z : Made model-specific class exports lazy by CodeAssistant
+# * ClaudeEnhancedChatBedrockConverse and NovaEnhancedChatBedrockConverse resolve on first access
 # 2025-05-02T22:12:00Z : Added model discovery exports by CodeAssistant
 # * Added import and export for BedrockModelDiscovery class
 # * Updated __all__ list to include new model discovery component
@@ -53,10 +55,22 @@ from .discovery.profiles import BedrockProfileDiscovery
 
 # New LangChain-based implementations
 from .langchain_wrapper import EnhancedChatBedrockConverse
-from .models.claude3 import ClaudeEnhancedChatBedrockConverse
-from .models.nova import NovaEnhancedChatBedrockConverse
 from .client_factory import BedrockClientFactory
 
+# Model-specific classes are imported on first access only, so that processes
+# never using a model family do not pay for importing its module
+_LAZY_MODEL_EXPORTS = {
+    "ClaudeEnhancedChatBedrockConverse": ".models.claude3",
+    "NovaEnhancedChatBedrockConverse": ".models.nova",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_MODEL_EXPORTS:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_MODEL_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __all__ = [
     # Legacy components (compatibility)
     "BedrockModelClientBase",
@@ -0,0 +1,943 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides the batch inference backend used by bulk documentation jobs. Prompts
+# are collected into a JSONL job, submitted through a pluggable transport (Amazon
+# Bedrock model invocation jobs, or a local file-based stand-in), polled until
+# complete, and their responses stored in a persistent, restartable job state.
+###############################################################################
+# [Source file design principles]
+# - One job per model and wave instead of one round trip per prompt
+# - Transport-agnostic runner: Bedrock and local transports share one interface
+# - Content-addressed record IDs so re-running a job never re-submits answered prompts
+# - Failed records are retryable: only successful responses count as answered
+# - Job state persisted after every transition so interrupted runs resume polling
+# - Record/replay session lets existing synchronous call sites join a batch unchanged
+###############################################################################
+# [Source file constraints]
+# - Batched prompts are single-turn: no conversation history and no tool use
+# - Bedrock transport needs an S3 location and an IAM service role for the job
+# - Response cache is append-only JSONL, safe to inspect and delete by hand
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/api_providers/aws/client_factory.py
+# codebase:src/dbp/llm/common/exceptions.py
+# system:hashlib
+# system:json
+# system:threading
+# system:time
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T03:20:00Z : Retried failed batch jobs by CodeAssistant
+# * Jobs that failed, stopped or expired get a new attempt name instead of being resumed
+# 2026-10-19T01:10:00Z : Added Bedrock model ID resolution for batch jobs by CodeAssistant
+# * Added resolve_batch_model_id mapping Anthropic API model names to Bedrock model IDs
+# 2026-10-19T01:00:00Z : Made failed batch records retryable by CodeAssistant
+# * Kept record errors apart from responses so the next run submits them again
+# * Added attempt suffix to job names whose previous job was already applied
+# * Queued prompts failed in an earlier session again in BatchSession.complete
+# 2026-10-18T11:30:00Z : Initial implementation by CodeAssistant
+# * Added BatchRequest, transports (Bedrock and local file) and BatchInferenceRunner
+# * Added persistent job state and response cache for restartable jobs
+# * Added BatchSession record/replay and BatchReplayChatClient for existing call sites
+###############################################################################
+
+"""
+Batch inference backend for bulk LLM workloads.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+
+from ..common.exceptions import LLMError
+
+
+T = TypeVar("T")
+
+# Bedrock model invocation job statuses
+JOB_STATUS_COMPLETED = "Completed"
+JOB_STATUS_PARTIALLY_COMPLETED = "PartiallyCompleted"
+JOB_STATUS_FAILED = "Failed"
+JOB_STATUS_STOPPED = "Stopped"
+JOB_STATUS_EXPIRED = "Expired"
+JOB_STATUS_IN_PROGRESS = "InProgress"
+
+_FINISHED_STATUSES = {JOB_STATUS_COMPLETED, JOB_STATUS_PARTIALLY_COMPLETED}
+_FAILED_STATUSES = {JOB_STATUS_FAILED, JOB_STATUS_STOPPED, JOB_STATUS_EXPIRED}
+
+# Statuses of jobs that are never resumed: a new run submits a new attempt
+_RETRIED_STATUSES = {"Applied"} | _FAILED_STATUSES
+
+# Local state layout inside the state directory
+_JOBS_FILE = "jobs.json"
+_RESPONSES_FILE = "responses.jsonl"
+_INPUTS_DIR = "inputs"
+_OUTPUTS_DIR = "outputs"
+
+
+class BatchInferenceError(LLMError):
+    """
+    [Class intent]
+    Raised when a batch inference job fails, expires or cannot be submitted.
+
+    [Implementation details]
+    Context carries the job name and transport handle when known.
+    """
+    pass
+
+
+class BatchPending(Exception):
+    """
+    [Class intent]
+    Raised by replay clients when the response to a prompt is not available yet
+    and the prompt has been queued for the next batch job.
+
+    [Design principles]
+    Call sites do not need to handle it: BatchSession tracks queued prompts itself,
+    so a call site that swallows the exception still results in a submitted prompt.
+    """
+    pass
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """
+    [Class intent]
+    A single-turn prompt to be answered by a batch job.
+
+    [Implementation details]
+    - record_id is a hash of the request content, identical prompts share one record
+    """
+    model_id: str
+    prompt: str
+    system: Optional[str] = None
+    max_tokens: int = 4096
+
+    @property
+    def record_id(self) -> str:
+        """
+        [Method intent]
+        Get the content-addressed record ID of this request.
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        payload = json.dumps([self.model_id, self.system, self.prompt, self.max_tokens])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def _is_anthropic_model(model_id: str) -> bool:
+    return "anthropic" in model_id or model_id.startswith("claude")
+
+
+# Anthropic API model names -> Bedrock model IDs (see models/claude3.py)
+ANTHROPIC_API_MODEL_IDS = {
+    "claude-3-haiku-20240307": "anthropic.claude-3-haiku-20240307-v1:0",
+    "claude-3-sonnet-20240229": "anthropic.claude-3-sonnet-20240229-v1:0",
+    "claude-3-opus-20240229": "anthropic.claude-3-opus-20240229-v1:0",
+    "claude-3-5-haiku-20241022": "anthropic.claude-3-5-haiku-20241022-v1:0",
+    "claude-3-5-sonnet-20240620": "anthropic.claude-3-5-sonnet-20240620-v1:0",
+    "claude-3-5-sonnet-20241022": "anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "claude-3-7-sonnet-20250219": "anthropic.claude-3-7-sonnet-20250219-v1:0",
+}
+
+
+def resolve_batch_model_id(model_id: str) -> str:
+    """
+    [Function intent]
+    Get the Bedrock model ID a batch job must be created with, for a model ID
+    that may be an Anthropic API model name.
+
+    [Implementation details]
+    - Known Anthropic API names map to their Bedrock model IDs
+    - Bedrock model IDs (provider.model), inference profiles and ARNs are kept
+    - Other names raise before any prompt is queued, since Bedrock would only
+      reject them when the job is created
+
+    Args:
+        model_id: Bedrock model ID or Anthropic API model name
+
+    Returns:
+        str: Bedrock model ID
+
+    Raises:
+        BatchInferenceError: If the model ID cannot be used for a Bedrock batch job
+    """
+    if model_id in ANTHROPIC_API_MODEL_IDS:
+        return ANTHROPIC_API_MODEL_IDS[model_id]
+    if "." in model_id or model_id.startswith("arn:"):
+        return model_id
+    raise BatchInferenceError(
+        f"Model {model_id} is not a Bedrock model ID, select the batch model explicitly",
+        context={"model_id": model_id}
+    )
+
+
+def build_model_input(request: BatchRequest) -> Dict[str, Any]:
+    """
+    [Function intent]
+    Build the model-native request body of a batch record.
+
+    [Implementation details]
+    - Anthropic models use the Messages API body
+    - Other models (Nova and compatible) use the messages-v1 schema
+
+    Args:
+        request: Request to convert
+
+    Returns:
+        Dict[str, Any]: modelInput body for the batch record
+    """
+    if _is_anthropic_model(request.model_id):
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": request.max_tokens,
+            "messages": [{"role": "user", "content": [{"type": "text", "text": request.prompt}]}]
+        }
+        if request.system:
+            body["system"] = request.system
+        return body
+
+    body = {
+        "schemaVersion": "messages-v1",
+        "messages": [{"role": "user", "content": [{"text": request.prompt}]}],
+        "inferenceConfig": {"maxTokens": request.max_tokens}
+    }
+    if request.system:
+        body["system"] = [{"text": request.system}]
+    return body
+
+
+def build_model_output(model_id: str, text: str) -> Dict[str, Any]:
+    """
+    [Function intent]
+    Build a model-native response body, used by the local transport to produce
+    output records shaped like the ones Bedrock writes.
+
+    Args:
+        model_id: Model the record was addressed to
+        text: Response text
+
+    Returns:
+        Dict[str, Any]: modelOutput body
+    """
+    if _is_anthropic_model(model_id):
+        return {"content": [{"type": "text", "text": text}], "stop_reason": "end_turn"}
+    return {"output": {"message": {"role": "assistant", "content": [{"text": text}]}},
+            "stopReason": "end_turn"}
+
+
+def extract_output_text(model_output: Dict[str, Any]) -> str:
+    """
+    [Function intent]
+    Extract the response text from a model-native response body.
+
+    [Implementation details]
+    - Handles Anthropic Messages and Nova messages-v1 bodies
+    - Falls back to the common single-field text outputs of other model families
+
+    Args:
+        model_output: modelOutput body of a batch output record
+
+    Returns:
+        str: Concatenated response text
+    """
+    if "content" in model_output:
+        return "".join(part.get("text", "") for part in model_output["content"])
+    if "output" in model_output:
+        content = model_output["output"].get("message", {}).get("content", [])
+        return "".join(part.get("text", "") for part in content)
+    for key in ("generation", "completion", "outputText"):
+        if key in model_output:
+            return model_output[key]
+    raise ValueError(f"Unrecognized model output format: {sorted(model_output)}")
+
+
+class BatchTransport(ABC):
+    """
+    [Class intent]
+    Interface of the services able to run a JSONL batch job.
+
+    [Design principles]
+    - Minimal surface: submit, poll, fetch
+    - Handles are plain strings so they can be persisted in the job state
+    """
+
+    @abstractmethod
+    def submit(self, job_name: str, model_id: str, input_path: Path) -> str:
+        """
+        [Method intent]
+        Submit a JSONL input file as a batch job.
+
+        Args:
+            job_name: Unique, deterministic job name
+            model_id: Model answering every record of the job
+            input_path: Local JSONL file with recordId/modelInput lines
+
+        Returns:
+            str: Transport handle identifying the job
+        """
+
+    @abstractmethod
+    def get_status(self, handle: str) -> str:
+        """
+        [Method intent]
+        Get the current status of a submitted job.
+
+        Args:
+            handle: Handle returned by submit()
+
+        Returns:
+            str: One of the Bedrock job status names
+        """
+
+    @abstractmethod
+    def fetch_output(self, handle: str, destination: Path) -> Path:
+        """
+        [Method intent]
+        Copy the JSONL output of a finished job to a local file.
+
+        Args:
+            handle: Handle returned by submit()
+            destination: Local path to write the output to
+
+        Returns:
+            Path: Path of the local output file
+        """
+
+
+class LocalFileBatchTransport(BatchTransport):
+    """
+    [Class intent]
+    File-based stand-in for a batch service, used by tests and offline runs.
+
+    [Design principles]
+    - Same record format as Bedrock, so the runner is exercised end to end
+    - Jobs complete when an output file appears in the job directory
+
+    [Implementation details]
+    - Each job gets root_dir/<job_name>/ with input.jsonl
+    - With a responder, output.jsonl is produced immediately on submit; without
+      one, another process is expected to drop output.jsonl into the job directory
+    """
+
+    def __init__(self, root_dir: Path, responder: Optional[Callable[[str, Dict[str, Any]], str]] = None):
+        """
+        [Method intent]
+        Create a local transport rooted in a directory.
+
+        Args:
+            root_dir: Directory holding the job directories
+            responder: Optional callable answering (record ID, model input) synchronously
+        """
+        self.root_dir = Path(root_dir)
+        self.responder = responder
+        self.submitted_jobs: List[str] = []
+
+    def submit(self, job_name: str, model_id: str, input_path: Path) -> str:
+        job_dir = self.root_dir / job_name
+        job_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(input_path, job_dir / "input.jsonl")
+        self.submitted_jobs.append(job_name)
+
+        if self.responder is not None:
+            self._respond(job_dir, model_id)
+        return job_name
+
+    def get_status(self, handle: str) -> str:
+        if (self.root_dir / handle / "output.jsonl").exists():
+            return JOB_STATUS_COMPLETED
+        return JOB_STATUS_IN_PROGRESS
+
+    def fetch_output(self, handle: str, destination: Path) -> Path:
+        shutil.copyfile(self.root_dir / handle / "output.jsonl", destination)
+        return destination
+
+    def _respond(self, job_dir: Path, model_id: str) -> None:
+        """
+        [Method intent]
+        Answer every record of a job with the responder and write output.jsonl.
+
+        [Implementation details]
+        - Responder exceptions become per-record errors, like Bedrock record errors
+
+        Args:
+            job_dir: Job directory holding input.jsonl
+            model_id: Model of the job
+        """
+        lines = []
+        with open(job_dir / "input.jsonl", "r", encoding="utf-8") as f:
+            for line in f:
+                record = json.loads(line)
+                output = dict(record)
+                try:
+                    text = self.responder(record["recordId"], record["modelInput"])
+                    output["modelOutput"] = build_model_output(model_id, text)
+                except Exception as e:
+                    output["error"] = {"errorMessage": str(e)}
+                lines.append(json.dumps(output))
+        tmp_path = job_dir / "output.jsonl.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, job_dir / "output.jsonl")
+
+
+class BedrockBatchTransport(BatchTransport):
+    """
+    [Class intent]
+    Runs batch jobs as Amazon Bedrock model invocation jobs.
+
+    [Design principles]
+    - boto3 clients come from AWSClientFactory like every other AWS call site
+
+    [Implementation details]
+    - Input is uploaded to <s3_uri>/input/<job_name>.jsonl
+    - Bedrock writes <s3_uri>/output/<job id>/<job_name>.jsonl.out
+    - The handle is the job ARN
+    """
+
+    def __init__(self, s3_uri: str, role_arn: str, region_name: Optional[str] = None,
+                 profile_name: Optional[str] = None):
+        """
+        [Method intent]
+        Create a Bedrock transport.
+
+        Args:
+            s3_uri: s3://bucket/prefix used for job input and output
+            role_arn: IAM service role Bedrock assumes to read and write S3
+            region_name: AWS region of the jobs
+            profile_name: Optional AWS profile
+        """
+        match = re.match(r"^s3://([^/]+)/?(.*)$", s3_uri)
+        if not match:
+            raise ValueError(f"Invalid S3 URI for batch jobs: {s3_uri}")
+        self.bucket = match.group(1)
+        self.prefix = match.group(2).rstrip("/")
+        self.role_arn = role_arn
+        self.region_name = region_name
+        self.profile_name = profile_name
+
+    def _client(self, service_name: str) -> Any:
+        from dbp.api_providers.aws.client_factory import AWSClientFactory
+        return AWSClientFactory.get_instance().get_client(
+            service_name, region_name=self.region_name, profile_name=self.profile_name
+        )
+
+    def _key(self, *parts: str) -> str:
+        return "/".join(([self.prefix] if self.prefix else []) + list(parts))
+
+    def submit(self, job_name: str, model_id: str, input_path: Path) -> str:
+        input_key = self._key("input", f"{job_name}.jsonl")
+        self._client("s3").upload_file(str(input_path), self.bucket, input_key)
+        response = self._client("bedrock").create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self.role_arn,
+            modelId=model_id,
+            inputDataConfig={"s3InputDataConfig": {
+                "s3Uri": f"s3://{self.bucket}/{input_key}", "s3InputFormat": "JSONL"
+            }},
+            outputDataConfig={"s3OutputDataConfig": {
+                "s3Uri": f"s3://{self.bucket}/{self._key('output')}/"
+            }}
+        )
+        return response["jobArn"]
+
+    def get_status(self, handle: str) -> str:
+        return self._client("bedrock").get_model_invocation_job(jobIdentifier=handle)["status"]
+
+    def fetch_output(self, handle: str, destination: Path) -> Path:
+        job = self._client("bedrock").get_model_invocation_job(jobIdentifier=handle)
+        job_id = handle.rsplit("/", 1)[-1]
+        input_name = job["inputDataConfig"]["s3InputDataConfig"]["s3Uri"].rsplit("/", 1)[-1]
+        output_key = self._key("output", job_id, f"{input_name}.out")
+        self._client("s3").download_file(self.bucket, output_key, str(destination))
+        return destination
+
+
+class BatchInferenceRunner:
+    """
+    [Class intent]
+    Submits prompts as batch jobs, waits for them and keeps every answer in a
+    persistent response cache, so an interrupted run resumes where it stopped.
+
+    [Design principles]
+    - Only prompts without a cached response are submitted
+    - Deterministic job names: re-running the same wave finds the submitted job
+      in the job state and resumes polling instead of submitting it again
+    - State written atomically after each submit and each applied job
+
+    [Implementation details]
+    - state_dir/jobs.json: job name -> handle, model, status, record IDs
+    - state_dir/responses.jsonl: record ID -> response text or error
+    - Error entries are kept apart from the responses: their records are
+      submitted again by the next run() covering them
+    - One job per model and call to run()
+    """
+
+    def __init__(self, transport: BatchTransport, state_dir: Path,
+                 poll_interval: float = 30.0, timeout: Optional[float] = None,
+                 job_prefix: str = "dbp-batch", logger: Optional[logging.Logger] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        [Method intent]
+        Create a runner and load the existing state of the state directory.
+
+        Args:
+            transport: Batch transport used to run the jobs
+            state_dir: Directory holding the job state and response cache
+            poll_interval: Seconds between two status checks
+            timeout: Maximum seconds to wait for jobs in one run() call, None to wait forever
+            job_prefix: Prefix of the generated job names
+            logger: Optional logger instance
+            sleep: Sleep function, replaceable in tests
+        """
+        self.transport = transport
+        self.state_dir = Path(state_dir)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.job_prefix = job_prefix
+        self.logger = logger or logging.getLogger("dbp.llm.bedrock.batch")
+        self._sleep = sleep
+        self._lock = threading.RLock()
+
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self._jobs: Dict[str, Dict[str, Any]] = self._load_jobs()
+        self._responses: Dict[str, Dict[str, Any]] = {}
+        self._failures: Dict[str, Dict[str, Any]] = {}
+        self._load_responses()
+
+    def get_response(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        [Method intent]
+        Get the cached response entry of a record.
+
+        [Implementation details]
+        - Returns the error entry of the last failed attempt when the record has
+          no successful response
+
+        Args:
+            record_id: Record ID of a BatchRequest
+
+        Returns:
+            Optional[Dict[str, Any]]: Entry with "text" or "error", None if never answered
+        """
+        with self._lock:
+            return self._responses.get(record_id) or self._failures.get(record_id)
+
+    def get_jobs(self) -> Dict[str, Dict[str, Any]]:
+        """
+        [Method intent]
+        Get a copy of the persisted job state.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Job name -> job state
+        """
+        with self._lock:
+            return {name: dict(job) for name, job in self._jobs.items()}
+
+    def run(self, requests: List[BatchRequest]) -> Dict[str, Dict[str, Any]]:
+        """
+        [Method intent]
+        Answer a set of requests through batch jobs and return their responses.
+
+        [Implementation details]
+        - Requests are deduplicated by record ID and grouped by model
+        - Requests whose last attempt failed are submitted again
+        - Jobs already present in the state are resumed, not re-submitted
+        - Raises BatchInferenceError when a job fails or the timeout elapses; the
+          state stays on disk so a later call resumes the jobs still running
+          and submits failed jobs again
+
+        Args:
+            requests: Requests to answer
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Record ID -> response entry for all requests
+        """
+        with self._lock:
+            missing: Dict[str, Dict[str, BatchRequest]] = {}
+            for request in requests:
+                if request.record_id not in self._responses:
+                    missing.setdefault(request.model_id, {})[request.record_id] = request
+
+            job_names = [self._submit(model_id, records) for model_id, records in missing.items()]
+            self._wait_and_apply(job_names)
+
+            responses = {}
+            for request in requests:
+                entry = self.get_response(request.record_id)
+                if entry is not None:
+                    responses[request.record_id] = entry
+            return responses
+
+    def _job_name(self, model_id: str, record_ids: List[str]) -> str:
+        """
+        [Method intent]
+        Get the deterministic name of the job answering a set of records.
+
+        [Implementation details]
+        - Applied jobs covering the same records (whose records failed or were
+          left out of the output) and jobs that failed, stopped or expired get
+          an attempt suffix so the retry is a new job
+
+        Args:
+            model_id: Model of all records
+            record_ids: Records of the job
+
+        Returns:
+            str: Job name
+        """
+        digest = hashlib.sha256("\n".join(sorted(record_ids)).encode("utf-8")).hexdigest()[:12]
+        model_slug = re.sub(r"[^a-zA-Z0-9-]+", "-", model_id).strip("-")[:40]
+        base_name = job_name = f"{self.job_prefix}-{model_slug}-{digest}"
+        attempt = 1
+        while self._jobs.get(job_name, {}).get("status") in _RETRIED_STATUSES:
+            attempt += 1
+            job_name = f"{base_name}-r{attempt}"
+        return job_name
+
+    def _submit(self, model_id: str, records: Dict[str, BatchRequest]) -> str:
+        """
+        [Method intent]
+        Submit one job for the records of a model, unless it was submitted before.
+
+        Args:
+            model_id: Model of all records
+            records: Record ID -> request
+
+        Returns:
+            str: Job name
+        """
+        job_name = self._job_name(model_id, list(records))
+        if job_name in self._jobs:
+            self.logger.info(f"Resuming batch job {job_name} ({len(records)} records)")
+            return job_name
+
+        input_dir = self.state_dir / _INPUTS_DIR
+        input_dir.mkdir(exist_ok=True)
+        input_path = input_dir / f"{job_name}.jsonl"
+        with open(input_path, "w", encoding="utf-8") as f:
+            for record_id, request in records.items():
+                f.write(json.dumps({
+                    "recordId": record_id,
+                    "modelInput": build_model_input(request)
+                }) + "\n")
+
+        try:
+            handle = self.transport.submit(job_name, model_id, input_path)
+        except Exception as e:
+            raise BatchInferenceError(f"Failed to submit batch job {job_name}: {e}",
+                                      context={"job_name": job_name})
+
+        self._jobs[job_name] = {
+            "handle": handle,
+            "model_id": model_id,
+            "status": "Submitted",
+            "record_ids": sorted(records),
+            "submitted_at": time.time()
+        }
+        self._save_jobs()
+        self.logger.info(f"Submitted batch job {job_name} with {len(records)} records for {model_id}")
+        return job_name
+
+    def _wait_and_apply(self, job_names: List[str]) -> None:
+        """
+        [Method intent]
+        Poll jobs until all are finished and apply their output to the response cache.
+
+        Args:
+            job_names: Jobs to wait for
+        """
+        pending = [name for name in job_names if self._jobs[name]["status"] != "Applied"]
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+
+        while pending:
+            still_pending = []
+            for name in pending:
+                job = self._jobs[name]
+                status = self.transport.get_status(job["handle"])
+                if status != job["status"]:
+                    job["status"] = status
+                    self._save_jobs()
+                if status in _FINISHED_STATUSES:
+                    self._apply_output(name)
+                elif status in _FAILED_STATUSES:
+                    raise BatchInferenceError(f"Batch job {name} ended with status {status}",
+                                              context={"job_name": name, "handle": job["handle"]})
+                else:
+                    still_pending.append(name)
+
+            pending = still_pending
+            if not pending:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                raise BatchInferenceError(
+                    f"Timed out waiting for batch jobs {', '.join(pending)}; "
+                    f"re-run to resume from {self.state_dir}",
+                    context={"job_names": pending}
+                )
+            self._sleep(self.poll_interval)
+
+    def _apply_output(self, job_name: str) -> None:
+        """
+        [Method intent]
+        Download the output of a finished job and store its responses.
+
+        [Implementation details]
+        - Records missing from the output (partially completed jobs) stay unanswered
+          and are submitted again by the next run() covering them
+        - Record errors are logged to the response cache for inspection but only
+          kept as the last failure of the record, never as its answer
+
+        Args:
+            job_name: Finished job
+        """
+        job = self._jobs[job_name]
+        output_dir = self.state_dir / _OUTPUTS_DIR
+        output_dir.mkdir(exist_ok=True)
+        output_path = self.transport.fetch_output(job["handle"], output_dir / f"{job_name}.jsonl.out")
+
+        entries = []
+        with open(output_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                entry = {"record_id": record["recordId"]}
+                if "modelOutput" in record:
+                    try:
+                        entry["text"] = extract_output_text(record["modelOutput"])
+                    except ValueError as e:
+                        entry["error"] = str(e)
+                else:
+                    entry["error"] = record.get("error", {}).get("errorMessage", "No model output")
+                entries.append(entry)
+
+        with open(self.state_dir / _RESPONSES_FILE, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+                self._store_entry(entry)
+
+        job["status"] = "Applied"
+        self._save_jobs()
+        failed = sum(1 for entry in entries if "error" in entry)
+        self.logger.info(f"Applied batch job {job_name}: {len(entries)} responses, {failed} failed")
+
+    def _store_entry(self, entry: Dict[str, Any]) -> None:
+        record_id = entry["record_id"]
+        if "error" in entry:
+            self._failures[record_id] = entry
+        else:
+            self._responses[record_id] = entry
+            self._failures.pop(record_id, None)
+
+    def _load_jobs(self) -> Dict[str, Dict[str, Any]]:
+        path = self.state_dir / _JOBS_FILE
+        if not path.exists():
+            return {}
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_jobs(self) -> None:
+        path = self.state_dir / _JOBS_FILE
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._jobs, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def _load_responses(self) -> None:
+        path = self.state_dir / _RESPONSES_FILE
+        if path.exists():
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        self._store_entry(json.loads(line))
+
+
+class BatchSession:
+    """
+    [Class intent]
+    Record/replay bridge between synchronous call sites and the batch runner.
+    A wave runs the normal code path: answered prompts replay from the response
+    cache, unanswered prompts are queued; the queue is then submitted as one job
+    and the wave is repeated until nothing is queued.
+
+    [Design principles]
+    - Existing pipelines join a batch without being restructured
+    - Number of jobs equals the depth of the prompt chain, not the number of files
+
+    [Implementation details]
+    - complete() raises BatchPending for unanswered prompts; whether or not the
+      call site swallows it, the prompt is already queued
+    - Prompts that failed in an earlier session are queued again; a prompt that
+      failed in this session raises, so waves end instead of retrying forever
+    - Thread-safe, waves may execute call sites in parallel threads
+    """
+
+    def __init__(self, runner: BatchInferenceRunner, max_waves: int = 20):
+        """
+        [Method intent]
+        Create a session on top of a runner.
+
+        Args:
+            runner: Runner submitting the queued prompts
+            max_waves: Safety limit on the number of waves of run_waves()
+        """
+        self.runner = runner
+        self.max_waves = max_waves
+        self._pending: Dict[str, BatchRequest] = {}
+        self._submitted: Set[str] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """
+        [Method intent]
+        Get the number of prompts queued for the next job.
+
+        Returns:
+            int: Queued prompt count
+        """
+        with self._lock:
+            return len(self._pending)
+
+    def complete(self, request: BatchRequest) -> str:
+        """
+        [Method intent]
+        Get the response to a prompt from the batch results.
+
+        Args:
+            request: Prompt to answer
+
+        Returns:
+            str: Response text
+
+        Raises:
+            BatchPending: If the prompt is not answered yet (it is queued)
+            BatchInferenceError: If the batch job answered the prompt with an error
+        """
+        entry = self.runner.get_response(request.record_id)
+        with self._lock:
+            if entry is None or ("error" in entry and request.record_id not in self._submitted):
+                self._pending[request.record_id] = request
+                raise BatchPending(request.record_id)
+        if "error" in entry:
+            raise BatchInferenceError(f"Batch record {request.record_id} failed: {entry['error']}",
+                                      context={"record_id": request.record_id})
+        return entry["text"]
+
+    def flush(self) -> int:
+        """
+        [Method intent]
+        Submit the queued prompts and wait for their responses.
+
+        Returns:
+            int: Number of prompts submitted
+        """
+        with self._lock:
+            requests = list(self._pending.values())
+            self._pending.clear()
+            self._submitted.update(request.record_id for request in requests)
+        if requests:
+            self.runner.run(requests)
+        return len(requests)
+
+    def run_waves(self, execute: Callable[[], T]) -> T:
+        """
+        [Method intent]
+        Repeat a unit of work, submitting the prompts it queues, until it runs
+        without queuing any prompt.
+
+        Args:
+            execute: Callable running the work; its last result is returned
+
+        Returns:
+            T: Result of the final wave, computed with all responses available
+        """
+        for wave in range(1, self.max_waves + 1):
+            result = execute()
+            submitted = self.flush()
+            if submitted == 0:
+                return result
+            self.runner.logger.info(f"Batch wave {wave} answered {submitted} prompts")
+        raise BatchInferenceError(f"Work still queues prompts after {self.max_waves} batch waves")
+
+
+class BatchResponse:
+    """
+    [Class intent]
+    Minimal response object exposing the response text as .content, like the
+    LangChain and Agno response objects the replay clients stand in for.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+
+    def __str__(self) -> str:
+        return self.content
+
+
+class BatchReplayChatClient:
+    """
+    [Class intent]
+    Drop-in replacement for a LangChain chat model's invoke() that answers from
+    a BatchSession.
+
+    [Implementation details]
+    - System messages become the request system prompt, user messages are joined
+    """
+
+    def __init__(self, session: BatchSession, model_id: str, max_tokens: int = 4096):
+        """
+        [Method intent]
+        Create a replay client for one model.
+
+        Args:
+            session: Session answering the prompts
+            model_id: Bedrock model ID the prompts are submitted to
+            max_tokens: Maximum response tokens
+        """
+        self.session = session
+        self.model_id = model_id
+        self.max_tokens = max_tokens
+
+    def invoke(self, messages: List[Dict[str, Any]]) -> BatchResponse:
+        """
+        [Method intent]
+        Answer a single-turn conversation from the batch session.
+
+        Args:
+            messages: LangChain-style role/content dictionaries
+
+        Returns:
+            BatchResponse: Response with .content
+
+        Raises:
+            BatchPending: If the prompt is queued for the next job
+        """
+        system = "\n".join(m["content"] for m in messages if m.get("role") == "system") or None
+        prompt = "\n".join(m["content"] for m in messages if m.get("role") != "system")
+        request = BatchRequest(model_id=self.model_id, prompt=prompt, system=system,
+                               max_tokens=self.max_tokens)
+        return BatchResponse(self.session.complete(request))
@@ -36,18 +36,23 @@
 # codebase:src/dbp/llm/common/exceptions.py
 # codebase:src/dbp/llm/common/streaming.py
 # codebase:src/dbp/llm/bedrock/base.py
+# codebase:src/dbp/core/metrics.py
 # system:json
 # system:asyncio
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T04:40:00Z : Coalesced Converse text streams by CodeAssistant
+# * ConverseStreamProcessor.process_to_text merges the token deltas into frames with a StreamCoalescer
+# 2026-10-18T22:40:00Z : Added Bedrock invocation metrics by CodeAssistant
+# * Added record_bedrock_invocation for latency and token metrics per model
+# * invoke_bedrock_model records its invocations
+# 2026-10-18T16:40:00Z : Used TextBuffer to accumulate complete responses by CodeAssistant
+# * accumulate_complete_response appends deltas to a TextBuffer instead of concatenating strings
 # 2025-05-02T11:16:00Z : Enhanced for LangChain/LangGraph integration by CodeAssistant
 # * Implemented Converse API response processing
 # * Added async streaming helpers
 # * Created standardized format conversion utilities
 # * Added specialized error mapping
-# 2025-05-02T07:15:00Z : Refactored and moved to bedrock directory by Cline
-# * Relocated from src/dbp/llm/bedrock_client_common.py to current location
-# * Updated imports to reflect new directory structure
 ###############################################################################
 
 """
@@ -56,6 +61,7 @@ Common utilities for Amazon Bedrock clients using the Converse API.
 
 import json
 import asyncio
+import time
 import botocore.exceptions
 from typing import Dict, Any, List, AsyncIterator, Optional, Union, Callable, Tuple
 
@@ -64,7 +70,8 @@ from ..common.exceptions import (
     InvocationError, StreamingError, AuthenticationError, 
     RateLimitError
 )
-from ..common.streaming import StreamingResponse, TextStreamingResponse
+from ..common.streaming import StreamCoalescer, StreamingResponse, TextBuffer, TextStreamingResponse
+from ...core.metrics import BEDROCK_REQUEST_SECONDS, BEDROCK_TOKENS
 
 
 class BedrockClientError(ClientError):
@@ -122,7 +129,10 @@ class ConverseStreamProcessor:
     """
     
     @staticmethod
-    async def process_to_text(stream: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[str]:
+    async def process_to_text(
+        stream: AsyncIterator[Dict[str, Any]],
+        coalescer: Optional[StreamCoalescer] = StreamCoalescer()
+    ) -> AsyncIterator[str]:
         """
         [Method intent]
         Process a Converse stream into a simple text stream, yielding
@@ -136,25 +146,32 @@ class ConverseStreamProcessor:
         [Implementation details]
         - Extracts text from contentBlockDelta events
         - Skips all metadata and control events
-        - Yields raw text chunks
+        - Merges the token deltas into frames with the coalescer, None yields
+          every delta as it arrives
         
         Args:
             stream: Raw stream from Bedrock Converse API
+            coalescer: Coalescer merging the text deltas
             
         Yields:
-            str: Individual text chunks
+            str: Text frames
             
         Raises:
             StreamingError: If processing fails
         """
-        try:
-            async for event in stream:
-                if "contentBlockDelta" in event and "delta" in event["contentBlockDelta"]:
-                    delta = event["contentBlockDelta"]["delta"]
-                    if "text" in delta:
-                        yield delta["text"]
-        except Exception as e:
-            raise StreamingError(f"Error processing stream to text: {str(e)}", e)
+        async def deltas():
+            try:
+                async for event in stream:
+                    if "contentBlockDelta" in event and "delta" in event["contentBlockDelta"]:
+                        delta = event["contentBlockDelta"]["delta"]
+                        if "text" in delta:
+                            yield delta["text"]
+            except Exception as e:
+                raise StreamingError(f"Error processing stream to text: {str(e)}", e)
+        
+        text = deltas() if coalescer is None else coalescer.coalesce(deltas())
+        async for frame in text:
+            yield frame
     
     @staticmethod
     async def process_to_langchain_deltas(stream: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
@@ -245,7 +262,7 @@ class ConverseStreamProcessor:
         - Synchronous return for non-streaming use cases
         
         [Implementation details]
-        - Collects and accumulates all response text
+        - Accumulates response text in a TextBuffer, joined once at the end
         - Tracks metadata like role and stop reason
         - Returns a structured complete response
         
@@ -265,6 +282,7 @@ class ConverseStreamProcessor:
                 "stop_reason": None,
                 "model_id": None
             }
+            content = TextBuffer()
             
             async for event in stream:
                 # Handle message start (role)
@@ -277,12 +295,13 @@ class ConverseStreamProcessor:
                 elif "contentBlockDelta" in event and "delta" in event["contentBlockDelta"]:
                     delta = event["contentBlockDelta"]["delta"]
                     if "text" in delta:
-                        result["content"] += delta["text"]
+                        content.append(delta["text"])
                 
                 # Handle message stop (finish reason)
                 elif "messageStop" in event:
                     result["stop_reason"] = event["messageStop"].get("stopReason")
             
+            result["content"] = content.getvalue()
             return result
         except Exception as e:
             raise LLMError(f"Error accumulating complete response: {str(e)}", e)
@@ -575,6 +594,30 @@ class BedrockClientMixin:
         return LLMError(f"Bedrock error: {str(error)}", error)
 
 
+def record_bedrock_invocation(
+    model_id: str,
+    duration: float,
+    input_tokens: int = 0,
+    output_tokens: int = 0,
+) -> None:
+    """
+    [Function intent]
+    Record the duration and token usage of a Bedrock invocation in the
+    dbp_bedrock_request_seconds and dbp_bedrock_tokens metrics.
+    
+    Args:
+        model_id: ID of the invoked model
+        duration: Duration of the invocation in seconds
+        input_tokens: Input tokens reported by Bedrock
+        output_tokens: Output tokens reported by Bedrock
+    """
+    BEDROCK_REQUEST_SECONDS.labels(model_id).observe(duration)
+    if input_tokens:
+        BEDROCK_TOKENS.labels(model_id, "input").inc(input_tokens)
+    if output_tokens:
+        BEDROCK_TOKENS.labels(model_id, "output").inc(output_tokens)
+
+
 async def invoke_bedrock_model(
     bedrock_runtime_client,
     model_id: str,
@@ -595,6 +638,8 @@ async def invoke_bedrock_model(
     - Uses the appropriate Bedrock API based on stream flag
     - Processes API responses into standardized format
     - Handles errors with appropriate mapping
+    - Records the invocation metrics; for streams the duration is the time
+      to open the stream and tokens are not known yet
     
     Args:
         bedrock_runtime_client: Boto3 Bedrock Runtime client
@@ -610,6 +655,7 @@ async def invoke_bedrock_model(
         LLMError: If invocation fails
     """
     loop = asyncio.get_event_loop()
+    start_time = time.perf_counter()
     
     try:
         if stream:
@@ -621,6 +667,7 @@ async def invoke_bedrock_model(
                     **request_body
                 )
             )
+            record_bedrock_invocation(model_id, time.perf_counter() - start_time)
             # Return the stream
             return response["stream"]
         else:
@@ -632,6 +679,13 @@ async def invoke_bedrock_model(
                     **request_body
                 )
             )
+            usage = response.get("usage", {})
+            record_bedrock_invocation(
+                model_id,
+                time.perf_counter() - start_time,
+                usage.get("inputTokens", 0),
+                usage.get("outputTokens", 0),
+            )
             # Return the response
             return response
     except botocore.exceptions.ClientError as e:
@@ -20,6 +20,7 @@
 # [Source file design principles]
 # - Hide implementation details from client code
 # - Dynamic client class detection without hardcoding
+# - Model modules imported lazily, only when one of their models is requested
 # - Transparent inference profile handling
 # - Single interface for all Bedrock model types
 # - Centralized client creation logic
@@ -49,6 +50,13 @@
 # system:langchain_aws.chat_models.bedrock_converse
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T10:20:00Z : Added O(1) model index and lazy model module loading by CodeAssistant
+# * Added _ModelIndex built from model module sources with exact and versioned-base lookup tables
+# * Model modules are imported only when one of their model IDs is requested
+# * Initialization of the index and class caches is now guarded by a lock
+# 2026-10-18T09:05:00Z : Switched LangChain clients to pooled runtime clients by CodeAssistant
+# * create_langchain_chatbedrock now uses AWSClientFactory.get_runtime_client
+# * Bedrock runtime clients are shared across threads with a concurrency-sized connection pool
 # 2025-05-07T10:40:52Z : Fixed _select_best_region error handling by CodeAssistant
 # * Implemented proper error handling when model discovery is disabled and no region is specified
 # * Replaced fallback to default region with explicit ConfigurationError
@@ -59,22 +67,18 @@
 # * Added _ensure_caches_initialized for lazy initialization with caching
 # * Added helper functions for accessing model metadata
 # * Updated create_langchain_chatbedrock to use new discovery system
-# 2025-05-06T12:57:00Z : Applied DRY principle to client factory by CodeAssistant
-# * Extracted common code into reusable helper methods
-# * Created _verify_model_support for model validation logic
-# * Created _extract_region_from_profile_arn for ARN parsing
-# * Created _select_best_region for region selection logic
-# * Created _select_inference_profile for profile handling
-# * Created _get_model_specific_class for model class determination
 ###############################################################################
 
 """
 Factory class for creating Bedrock clients with dynamic client class detection.
 """
 
+import ast
 import logging
 import importlib
+import importlib.util
 import pkgutil
+import threading
 import inspect
 import os
 import sys
@@ -84,11 +88,209 @@ from .langchain_wrapper import EnhancedChatBedrockConverse
 from .discovery.models_capabilities import BedrockModelCapabilities as BedrockModelDiscovery
 from ..common.exceptions import LLMError, UnsupportedModelError, ConfigurationError
 
+# Package containing model implementations
+_MODELS_PACKAGE = 'dbp.llm.bedrock.models'
+
 # Cache for discovered classes to avoid repeated scans
 _client_classes_cache = None
 _model_to_client_class_cache = None
 _model_to_parameter_class_cache = None
 
+# Lazy model registry built from the model module sources without importing them
+_model_index = None
+_index_lock = threading.RLock()
+
+
+class _ModelIndex:
+    """
+    [Class intent]
+    Precomputed lookup index from model IDs to the model module declaring them,
+    with the client and parameter classes resolved lazily per module.
+    
+    [Design principles]
+    - O(1) resolution for exact model IDs and for versioned variants of a model
+    - Model modules are imported only when one of their model IDs is requested
+    - Built once per process
+    
+    [Implementation details]
+    - exact: model ID -> module name
+    - by_base: model ID without ':' version suffix -> first declared model ID,
+      mirroring the former linear prefix scan that compared bases for equality
+    - resolved_modules tracks modules whose classes were already mapped
+    """
+    
+    def __init__(self, exact: Dict[str, str], eager_modules: List[str]):
+        """
+        [Method intent]
+        Initialize the index from the statically extracted model declarations.
+        
+        Args:
+            exact: Mapping from model ID to declaring module name
+            eager_modules: Modules whose model lists could not be read statically
+        """
+        self.exact = exact
+        self.by_base: Dict[str, str] = {}
+        for model_id in exact:
+            self.by_base.setdefault(model_id.split(':')[0], model_id)
+        self.eager_modules = eager_modules
+        self.resolved_modules: Set[str] = set()
+    
+    def canonical_model_id(self, model_id: str) -> Optional[str]:
+        """
+        [Method intent]
+        Map a requested model ID to the declared model ID it resolves to.
+        
+        Args:
+            model_id: Requested Bedrock model ID
+            
+        Returns:
+            Optional[str]: Declared model ID, or None if the model is unknown
+        """
+        if model_id in self.exact:
+            return model_id
+        return self.by_base.get(model_id.split(':')[0])
+
+
+def _read_module_model_ids(module_path: str) -> Optional[List[str]]:
+    """
+    [Function intent]
+    Extracts the model IDs declared by a model module without importing it.
+    
+    [Design principles]
+    - Keep discovery dynamic while avoiding the import cost of model modules
+    
+    [Implementation details]
+    - Parses the module with ast and collects literal
+      `class Config: supported_models = [...]` lists of every class
+    - Returns None when a list is not a literal so the caller can fall back
+      to importing the module
+    
+    Args:
+        module_path: Path of the module source file
+        
+    Returns:
+        Optional[List[str]]: Declared model IDs, or None if they cannot be read statically
+    """
+    with open(module_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=module_path)
+    
+    model_ids = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.ClassDef) and node.name == 'Config'):
+            continue
+        for statement in node.body:
+            if (isinstance(statement, ast.Assign) and
+                any(isinstance(t, ast.Name) and t.id == 'supported_models' for t in statement.targets)):
+                try:
+                    model_ids.extend(ast.literal_eval(statement.value))
+                except ValueError:
+                    return None
+    return model_ids
+
+
+def _build_model_index() -> _ModelIndex:
+    """
+    [Function intent]
+    Builds the lazy model registry from the sources of the model modules.
+    
+    [Design principles]
+    - No model module import during index construction
+    
+    [Implementation details]
+    - Locates the models package with importlib.util.find_spec (does not execute it)
+    - Modules whose declarations are not literals are imported eagerly
+    
+    Returns:
+        _ModelIndex: The model index
+    """
+    logger = logging.getLogger("BedrockClientFactory")
+    exact: Dict[str, str] = {}
+    eager_modules: List[str] = []
+    
+    spec = importlib.util.find_spec(_MODELS_PACKAGE)
+    if spec is None or not spec.submodule_search_locations:
+        logger.error(f"Could not locate models package: {_MODELS_PACKAGE}")
+        return _ModelIndex(exact, eager_modules)
+    
+    for module_info in pkgutil.iter_modules(spec.submodule_search_locations):
+        if module_info.ispkg:
+            continue
+        module_name = f"{_MODELS_PACKAGE}.{module_info.name}"
+        module_path = os.path.join(module_info.module_finder.path, f"{module_info.name}.py")
+        try:
+            model_ids = _read_module_model_ids(module_path)
+        except (OSError, SyntaxError) as e:
+            logger.warning(f"Could not read model declarations of {module_name}: {str(e)}")
+            model_ids = None
+        
+        if model_ids is None:
+            eager_modules.append(module_name)
+            continue
+        for model_id in model_ids:
+            if model_id in exact:
+                logger.warning(
+                    f"Model ID {model_id} already declared in {exact[model_id]}, "
+                    f"now also found in {module_name}"
+                )
+            exact[model_id] = module_name
+    
+    index = _ModelIndex(exact, eager_modules)
+    for module_name in eager_modules:
+        _resolve_module(index, module_name)
+    return index
+
+
+def _get_client_classes_from_module(module: Any) -> List[Type[EnhancedChatBedrockConverse]]:
+    """
+    [Function intent]
+    Returns the EnhancedChatBedrockConverse subclasses defined in a module.
+    
+    Args:
+        module: Imported module object
+        
+    Returns:
+        List[Type[EnhancedChatBedrockConverse]]: Client classes found in the module
+    """
+    return [
+        obj for _, obj in inspect.getmembers(module)
+        if (inspect.isclass(obj) and
+            issubclass(obj, EnhancedChatBedrockConverse) and
+            obj != EnhancedChatBedrockConverse)
+    ]
+
+
+def _resolve_module(index: _ModelIndex, module_name: str) -> None:
+    """
+    [Function intent]
+    Imports one model module and adds its client and parameter classes to the caches.
+    
+    [Design principles]
+    - Import on first use only
+    
+    [Implementation details]
+    - Must be called with _index_lock held
+    - Import failures are logged, the module is then considered resolved
+    
+    Args:
+        index: Model index tracking resolved modules
+        module_name: Fully qualified model module name
+    """
+    global _model_to_client_class_cache, _model_to_parameter_class_cache
+    
+    if module_name in index.resolved_modules:
+        return
+    index.resolved_modules.add(module_name)
+    
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError as e:
+        logging.getLogger("BedrockClientFactory").warning(f"Could not import module {module_name}: {str(e)}")
+        return
+    
+    client_map, param_map = _build_model_mappings(_get_client_classes_from_module(module))
+    _model_to_client_class_cache.update(client_map)
+    _model_to_parameter_class_cache.update(param_map)
+
 def _discover_client_classes() -> List[Type[EnhancedChatBedrockConverse]]:
     """
     [Function intent]
@@ -103,6 +305,8 @@ def _discover_client_classes() -> List[Type[EnhancedChatBedrockConverse]]:
     - Uses pkgutil to find modules
     - Uses inspect to identify subclasses
     - Returns list of discovered classes
+    - Only used when every model class is needed; lookups go through the
+      lazy model index instead
     
     Returns:
         List[Type[EnhancedChatBedrockConverse]]: List of discovered client classes
@@ -110,27 +314,18 @@ def _discover_client_classes() -> List[Type[EnhancedChatBedrockConverse]]:
     client_classes = []
     logger = logging.getLogger("BedrockClientFactory")
     
-    # Define the package containing model implementations
-    models_package = 'dbp.llm.bedrock.models'
-    
     # Import models package
     try:
-        package = importlib.import_module(models_package)
+        package = importlib.import_module(_MODELS_PACKAGE)
         package_path = os.path.dirname(package.__file__)
         
         # Find all modules in the package
         for _, module_name, is_pkg in pkgutil.iter_modules([package_path]):
             if not is_pkg:  # Skip subpackages, only load modules
                 try:
-                    # Import the module
-                    module = importlib.import_module(f"{models_package}.{module_name}")
-                    
-                    # Find all EnhancedChatBedrockConverse subclasses
-                    for name, obj in inspect.getmembers(module):
-                        if (inspect.isclass(obj) and 
-                            issubclass(obj, EnhancedChatBedrockConverse) and 
-                            obj != EnhancedChatBedrockConverse):
-                            client_classes.append(obj)
+                    # Import the module and find all EnhancedChatBedrockConverse subclasses
+                    module = importlib.import_module(f"{_MODELS_PACKAGE}.{module_name}")
+                    client_classes.extend(_get_client_classes_from_module(module))
                 except ImportError as e:
                     # Log warning but continue with other modules
                     logger.warning(f"Could not import module {module_name}: {str(e)}")
@@ -189,7 +384,7 @@ def _build_model_mappings(client_classes: List[Type[EnhancedChatBedrockConverse]
 def _ensure_caches_initialized():
     """
     [Function intent]
-    Ensures the discovery caches are initialized.
+    Ensures the model index and the class caches are initialized.
     
     [Design principles]
     - Lazy initialization
@@ -197,21 +392,81 @@ def _ensure_caches_initialized():
     - Thread-safe initialization
     
     [Implementation details]
-    - Checks if caches are already initialized
-    - Performs discovery if needed
-    - Updates all caches
+    - Builds the model index from module sources (no model module import)
+    - Class caches start empty and are filled per module on first lookup
     """
-    global _client_classes_cache, _model_to_client_class_cache, _model_to_parameter_class_cache
+    global _model_index, _model_to_client_class_cache, _model_to_parameter_class_cache
     
     # If caches are already initialized, return
+    if _model_index is not None:
+        return
+    
+    with _index_lock:
+        if _model_index is not None:
+            return
+        _model_to_client_class_cache = {}
+        _model_to_parameter_class_cache = {}
+        _model_index = _build_model_index()
+
+def _ensure_all_classes_loaded():
+    """
+    [Function intent]
+    Imports every model module so that the class caches are complete.
+    
+    [Design principles]
+    - Explicit opt-in for callers needing every client class
+    
+    [Implementation details]
+    - Resolves all modules of the index and records the discovered client classes
+    """
+    global _client_classes_cache
+    
+    _ensure_caches_initialized()
     if _client_classes_cache is not None:
         return
+    
+    with _index_lock:
+        if _client_classes_cache is not None:
+            return
+        for module_name in sorted(set(_model_index.exact.values())):
+            _resolve_module(_model_index, module_name)
+        _client_classes_cache = list(dict.fromkeys(_model_to_client_class_cache.values()))
+
+def _resolve_model(model_id: str) -> Optional[str]:
+    """
+    [Function intent]
+    Resolves a requested model ID to its declared ID, importing its module if needed.
+    
+    [Design principles]
+    - O(1) lookup in the model index
+    - Imports only the module declaring the model
+    
+    [Implementation details]
+    - Falls back to a full discovery when the declaring module does not provide
+      the classes itself (e.g. parameter classes reused by another module)
+    
+    Args:
+        model_id: The Bedrock model ID
         
-    # Discover client classes
-    _client_classes_cache = _discover_client_classes()
+    Returns:
+        Optional[str]: Declared model ID present in the class caches, or None
+    """
+    _ensure_caches_initialized()
+    
+    canonical_id = _model_index.canonical_model_id(model_id)
+    if canonical_id is None:
+        # Modules imported eagerly may declare models the static index missed
+        if model_id in _model_to_client_class_cache:
+            return model_id
+        return None
+    
+    if canonical_id not in _model_to_client_class_cache:
+        with _index_lock:
+            _resolve_module(_model_index, _model_index.exact[canonical_id])
+        if canonical_id not in _model_to_client_class_cache:
+            _ensure_all_classes_loaded()
     
-    # Build model mappings
-    _model_to_client_class_cache, _model_to_parameter_class_cache = _build_model_mappings(_client_classes_cache)
+    return canonical_id if canonical_id in _model_to_client_class_cache else None
 
 def get_all_supported_model_ids() -> List[str]:
     """
@@ -223,14 +478,14 @@ def get_all_supported_model_ids() -> List[str]:
     - Ensure initialization happens
     
     [Implementation details]
-    - Initializes discovery caches if needed
-    - Returns all keys from model mapping
+    - Initializes the model index if needed
+    - Returns all declared model IDs without importing any model module
     
     Returns:
         List[str]: List of all supported model IDs
     """
     _ensure_caches_initialized()
-    return list(_model_to_client_class_cache.keys())
+    return list(dict.fromkeys(list(_model_index.exact) + list(_model_to_client_class_cache)))
 
 def get_client_class_for_model(model_id: str) -> Type[EnhancedChatBedrockConverse]:
     """
@@ -242,8 +497,8 @@ def get_client_class_for_model(model_id: str) -> Type[EnhancedChatBedrockConvers
     - Error handling for unknown models
     
     [Implementation details]
-    - Initializes discovery caches if needed
-    - Looks up client class from mapping
+    - Resolves exact and versioned model IDs through the model index in O(1)
+    - Imports the declaring model module on first use
     - Raises exception if model is not supported
     
     Args:
@@ -255,21 +510,10 @@ def get_client_class_for_model(model_id: str) -> Type[EnhancedChatBedrockConvers
     Raises:
         UnsupportedModelError: If no client class supports the model ID
     """
-    _ensure_caches_initialized()
-    
-    # Check for exact model ID match
-    if model_id in _model_to_client_class_cache:
-        return _model_to_client_class_cache[model_id]
-    
-    # Check for model ID prefix match (for versioned models)
-    model_base = model_id.split(':')[0]
-    for supported_model_id, client_class in _model_to_client_class_cache.items():
-        supported_base = supported_model_id.split(':')[0]
-        if model_base == supported_base:
-            return client_class
-    
-    # No match found, raise exception
-    raise UnsupportedModelError(f"No client class supports model ID: {model_id}")
+    canonical_id = _resolve_model(model_id)
+    if canonical_id is None:
+        raise UnsupportedModelError(f"No client class supports model ID: {model_id}")
+    return _model_to_client_class_cache[canonical_id]
 
 def get_parameter_class_for_model(model_id: str):
     """
@@ -281,8 +525,8 @@ def get_parameter_class_for_model(model_id: str):
     - Error handling for unknown models
     
     [Implementation details]
-    - Initializes discovery caches if needed
-    - Looks up parameter class from mapping
+    - Resolves exact and versioned model IDs through the model index in O(1)
+    - Imports the declaring model module on first use
     - Raises exception if model is not supported
     
     Args:
@@ -294,21 +538,10 @@ def get_parameter_class_for_model(model_id: str):
     Raises:
         UnsupportedModelError: If no parameter class supports the model ID
     """
-    _ensure_caches_initialized()
-    
-    # Check for exact model ID match
-    if model_id in _model_to_parameter_class_cache:
-        return _model_to_parameter_class_cache[model_id]
-    
-    # Check for model ID prefix match (for versioned models)
-    model_base = model_id.split(':')[0]
-    for supported_model_id, param_class in _model_to_parameter_class_cache.items():
-        supported_base = supported_model_id.split(':')[0]
-        if model_base == supported_base:
-            return param_class
-    
-    # No match found, raise exception
-    raise UnsupportedModelError(f"No parameter class supports model ID: {model_id}")
+    canonical_id = _resolve_model(model_id)
+    if canonical_id is None or canonical_id not in _model_to_parameter_class_cache:
+        raise UnsupportedModelError(f"No parameter class supports model ID: {model_id}")
+    return _model_to_parameter_class_cache[canonical_id]
 
 def get_parameter_instance_for_client(client_instance: EnhancedChatBedrockConverse):
     """
@@ -752,21 +985,14 @@ class BedrockClientFactory:
                 # Get the AWS client factory instance
                 aws_client_factory = AWSClientFactory.get_instance()
                 
-                # Define configuration for bedrock client
-                import botocore.config
-                bedrock_config = botocore.config.Config(
-                    retries={"max_attempts": max_retries},
-                    connect_timeout=timeout,
-                    read_timeout=900  # Much higher read timeout (15 minutes) for large documents
-                )
-                
-                # Get the boto3 client for bedrock using our factory
-                bedrock_client = aws_client_factory.get_client(
-                    service_name="bedrock-runtime",  # Use bedrock-runtime for model invocation
+                # Get the shared, pooled bedrock-runtime client from our factory
+                bedrock_client = aws_client_factory.get_runtime_client(
                     region_name=region_name,
                     profile_name=profile_name,
                     credentials=credentials,
-                    config=bedrock_config
+                    connect_timeout=timeout,
+                    read_timeout=900,  # Much higher read timeout (15 minutes) for large documents
+                    max_attempts=max_retries
                 )
                 
                 # The inference profile ARN itself is used as the modelId parameter
@@ -41,6 +41,8 @@
 # system:langchain_aws.chat_models.bedrock_converse
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T22:40:00Z : Added Bedrock invocation metrics by CodeAssistant
+# * stream and astream record latency and token usage per model
 # 2025-05-06T13:36:59Z : Updated for dynamic model discovery by CodeAssistant
 # * Added PARAMETER_CLASSES class variable to store associated parameter classes
 # * Added _initialize_parameters method to select parameter class based on model
@@ -57,11 +59,6 @@
 # * Changed _extract_text_from_chunk to an abstract instance method
 # * Removed the mixed implementation within base class
 # * Updated to force model-specific subclasses to implement their own extraction logic
-# 2025-05-05T22:14:12Z : Added model-specific text extraction hook by CodeAssistant
-# * Added _extract_text_from_chunk class method as a customization point for model-specific implementations
-# * Updated astream, stream_text, and astream_text to use the new hook method
-# * Preserved original extract_text_from_chunk static method for backwards compatibility
-# * Improved separation of concerns for model-specific text extraction
 ###############################################################################
 
 import asyncio
@@ -78,6 +75,7 @@ from langchain_core.language_models.chat_models import BaseMessage
 from langchain_core.messages import AIMessageChunk
 
 from ..common.exceptions import ClientError, InvocationError, LLMError, ModelNotAvailableError, StreamingError, UnsupportedModelError
+from .client_common import record_bedrock_invocation
 
 
 class EnhancedChatBedrockConverse(ChatBedrockConverse, abc.ABC):
@@ -307,6 +305,7 @@ class EnhancedChatBedrockConverse(ChatBedrockConverse, abc.ABC):
         - Implements retry logic for throttling exceptions
         - Handles all Bedrock errors with appropriate classification
         - Properly delegates to parent implementation
+        - Records the invocation metrics once the stream is consumed
         
         Args:
             messages: List of chat messages
@@ -324,7 +323,7 @@ class EnhancedChatBedrockConverse(ChatBedrockConverse, abc.ABC):
         while True:
             try:
                 # Call parent implementation
-                return super().stream(messages, **kwargs)
+                return self._record_stream(super().stream(messages, **kwargs))
                 
             except botocore.exceptions.ClientError as e:
                 error_code = e.response['Error']['Code']
@@ -380,6 +379,7 @@ class EnhancedChatBedrockConverse(ChatBedrockConverse, abc.ABC):
         - Implements retry logic for throttling exceptions
         - Uses async sleep for waiting between retries
         - Properly delegates to parent implementation as an async generator
+        - Records the invocation metrics, retries included, when the stream ends
         
         Args:
             messages: List of chat messages
@@ -393,6 +393,8 @@ class EnhancedChatBedrockConverse(ChatBedrockConverse, abc.ABC):
         """
         
         retry_count = 0
+        start_time = time.perf_counter()
+        usage = {}
         
         while True:
             try:
@@ -406,11 +408,16 @@ class EnhancedChatBedrockConverse(ChatBedrockConverse, abc.ABC):
                 
                 # Process each chunk as they come through the generator
                 async for chunk in parent_generator:
+                    self._add_usage(usage, getattr(chunk.message, "usage_metadata", None))
                     # Extract text using model-specific implementation
                     text_content = self._extract_text_from_chunk(chunk)
                     yield AIMessageChunk(content=text_content)
                 
                 # Exit the retry loop once complete
+                record_bedrock_invocation(
+                    self.model_id, time.perf_counter() - start_time,
+                    usage.get("input_tokens", 0), usage.get("output_tokens", 0),
+                )
                 return
                 
             except botocore.exceptions.ClientError as e:
@@ -452,6 +459,40 @@ class EnhancedChatBedrockConverse(ChatBedrockConverse, abc.ABC):
                 # Wrap other exceptions with StreamingError for async methods
                 raise StreamingError(f"Bedrock streaming error: {str(e)}", e)
         
+    @staticmethod
+    def _add_usage(usage: Dict[str, int], usage_metadata) -> None:
+        """
+        [Method intent]
+        Add the token counts of a chunk's usage metadata to usage.
+        """
+        if usage_metadata:
+            for key in ("input_tokens", "output_tokens"):
+                usage[key] = usage.get(key, 0) + usage_metadata.get(key, 0)
+
+    def _record_stream(self, chunks: Iterator[AIMessageChunk]) -> Iterator[AIMessageChunk]:
+        """
+        [Method intent]
+        Pass the chunks of a stream through and record the invocation metrics
+        when the stream is exhausted or closed.
+        
+        Args:
+            chunks: Stream returned by LangChain's stream method
+            
+        Returns:
+            Iterator yielding the same chunks
+        """
+        start_time = time.perf_counter()
+        usage = {}
+        try:
+            for chunk in chunks:
+                self._add_usage(usage, getattr(chunk, "usage_metadata", None))
+                yield chunk
+        finally:
+            record_bedrock_invocation(
+                self.model_id, time.perf_counter() - start_time,
+                usage.get("input_tokens", 0), usage.get("output_tokens", 0),
+            )
+
     @abc.abstractmethod
     def _extract_text_from_chunk(self, content):
         """
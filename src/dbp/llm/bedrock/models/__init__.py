@@ -31,6 +31,8 @@
 # codebase:- doc/design/LLM_COORDINATION.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T10:20:00Z : Made model class exports lazy by CodeAssistant
+# * Model modules are imported on first attribute access through module __getattr__
 # 2025-05-02T12:14:00Z : Consolidated Claude model implementations by Cline
 # * Removed Claude37SonnetClient export
 # * Added ClaudeClient export from claude3.py
@@ -40,8 +42,20 @@
 # * Added exports for model-specific client classes
 ###############################################################################
 
-from .claude3 import ClaudeEnhancedChatBedrockConverse
-from .nova import NovaEnhancedChatBedrockConverse
+import importlib
+
+# Model modules are imported on first access only (see client_factory lazy registry)
+_LAZY_EXPORTS = {
+    "ClaudeEnhancedChatBedrockConverse": ".claude3",
+    "NovaEnhancedChatBedrockConverse": ".nova",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "ClaudeEnhancedChatBedrockConverse",
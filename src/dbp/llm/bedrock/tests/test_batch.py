@@ -0,0 +1,204 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the batch inference backend in batch.py, using the local file-based
+# transport in place of Bedrock model invocation jobs.
+###############################################################################
+# [Source file design principles]
+# - End-to-end runner coverage through the local transport
+# - Explicit coverage of restart and resume behavior
+###############################################################################
+# [Source file constraints]
+# - Must not depend on actual AWS services
+# - Must only write inside pytest temporary directories
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/llm/bedrock/batch.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T03:20:00Z : Added failed job retry test by CodeAssistant
+# * Checked that a job ended with a failed status is submitted again under a new attempt name
+# 2026-10-19T01:10:00Z : Added batch model ID resolution test by CodeAssistant
+# * Added test of resolve_batch_model_id
+# 2026-10-19T01:00:00Z : Added failed record retry test by CodeAssistant
+# * Added test re-running a session after a failed record
+# 2026-10-18T11:30:00Z : Created batch inference tests by CodeAssistant
+# * Added runner, restart, resume and record/replay session tests
+###############################################################################
+
+"""
+Tests for the batch inference backend.
+"""
+
+import json
+
+import pytest
+
+from ..batch import (
+    JOB_STATUS_FAILED,
+    BatchInferenceError,
+    BatchInferenceRunner,
+    BatchPending,
+    BatchReplayChatClient,
+    BatchRequest,
+    BatchSession,
+    LocalFileBatchTransport,
+    build_model_output,
+    resolve_batch_model_id,
+)
+
+
+MODEL_ID = "anthropic.claude-3-haiku-20240307-v1:0"
+
+
+def _echo_responder(record_id, model_input):
+    return "echo: " + model_input["messages"][0]["content"][0]["text"]
+
+
+class FirstJobFailsTransport(LocalFileBatchTransport):
+    """Local transport reporting the first submitted job as failed."""
+
+    def get_status(self, handle):
+        if handle == self.submitted_jobs[0]:
+            return JOB_STATUS_FAILED
+        return super().get_status(handle)
+
+
+def _runner(tmp_path, transport, **kwargs):
+    return BatchInferenceRunner(transport, tmp_path / "state", poll_interval=0,
+                                sleep=lambda seconds: None, **kwargs)
+
+
+class TestBatchInferenceRunner:
+    """Tests for job submission, polling and the response cache."""
+
+    def test_run_answers_all_requests_in_one_job(self, tmp_path):
+        transport = LocalFileBatchTransport(tmp_path / "jobs", responder=_echo_responder)
+        runner = _runner(tmp_path, transport)
+        requests = [BatchRequest(MODEL_ID, f"prompt {i}") for i in range(50)]
+
+        responses = runner.run(requests + requests[:5])
+
+        assert len(transport.submitted_jobs) == 1
+        assert len(responses) == 50
+        assert responses[requests[7].record_id]["text"] == "echo: prompt 7"
+
+    def test_restart_does_not_resubmit_answered_prompts(self, tmp_path):
+        transport = LocalFileBatchTransport(tmp_path / "jobs", responder=_echo_responder)
+        requests = [BatchRequest(MODEL_ID, "a"), BatchRequest(MODEL_ID, "b")]
+        _runner(tmp_path, transport).run(requests)
+
+        restarted = _runner(tmp_path, transport)
+        responses = restarted.run(requests)
+
+        assert len(transport.submitted_jobs) == 1
+        assert responses[requests[1].record_id]["text"] == "echo: b"
+
+    def test_interrupted_job_is_resumed_not_resubmitted(self, tmp_path):
+        transport = LocalFileBatchTransport(tmp_path / "jobs")
+        request = BatchRequest(MODEL_ID, "slow")
+        runner = _runner(tmp_path, transport, timeout=0)
+
+        with pytest.raises(BatchInferenceError):
+            runner.run([request])
+
+        # The batch service finishes the job while no runner is active
+        job_name = transport.submitted_jobs[0]
+        with open(tmp_path / "jobs" / job_name / "output.jsonl", "w") as f:
+            f.write(json.dumps({"recordId": request.record_id,
+                                "modelOutput": build_model_output(MODEL_ID, "done")}) + "\n")
+
+        responses = _runner(tmp_path, transport).run([request])
+
+        assert transport.submitted_jobs == [job_name]
+        assert responses[request.record_id]["text"] == "done"
+
+    def test_failed_record_is_resubmitted_on_rerun(self, tmp_path):
+        attempts = []
+
+        def flaky_responder(record_id, model_input):
+            attempts.append(record_id)
+            if len(attempts) == 1:
+                raise RuntimeError("ThrottlingException")
+            return "recovered"
+
+        transport = LocalFileBatchTransport(tmp_path / "jobs", responder=flaky_responder)
+        request = BatchRequest(MODEL_ID, "flaky")
+
+        def run_session():
+            session = BatchSession(_runner(tmp_path, transport))
+
+            def pipeline():
+                try:
+                    return session.complete(request)
+                except BatchPending:
+                    return None
+
+            return session.run_waves(pipeline)
+
+        with pytest.raises(BatchInferenceError):
+            run_session()
+
+        # The failure is not an answer: the next run submits the prompt again
+        assert run_session() == "recovered"
+        assert len(attempts) == 2
+        assert len(set(transport.submitted_jobs)) == 2
+
+    def test_failed_job_is_submitted_again_on_rerun(self, tmp_path):
+        transport = FirstJobFailsTransport(tmp_path / "jobs", responder=_echo_responder)
+        request = BatchRequest(MODEL_ID, "retry me")
+
+        with pytest.raises(BatchInferenceError):
+            _runner(tmp_path, transport).run([request])
+
+        runner = _runner(tmp_path, transport)
+        responses = runner.run([request])
+
+        assert responses[request.record_id]["text"] == "echo: retry me"
+        failed_job, retry_job = transport.submitted_jobs
+        assert retry_job == failed_job + "-r2"
+        assert runner.get_jobs()[failed_job]["status"] == JOB_STATUS_FAILED
+
+
+def test_resolve_batch_model_id_maps_anthropic_api_names():
+    assert resolve_batch_model_id("claude-3-5-sonnet-20241022") == "anthropic.claude-3-5-sonnet-20241022-v2:0"
+    assert resolve_batch_model_id(MODEL_ID) == MODEL_ID
+    with pytest.raises(BatchInferenceError):
+        resolve_batch_model_id("claude-unknown")
+
+
+class TestBatchSession:
+    """Tests for the record/replay session."""
+
+    def test_run_waves_resolves_prompt_chains(self, tmp_path):
+        transport = LocalFileBatchTransport(tmp_path / "jobs", responder=_echo_responder)
+        session = BatchSession(_runner(tmp_path, transport))
+        client = BatchReplayChatClient(session, MODEL_ID)
+
+        def pipeline():
+            results = []
+            for name in ("x", "y", "z"):
+                try:
+                    first = client.invoke([{"role": "user", "content": name}]).content
+                    results.append(client.invoke([{"role": "user", "content": first}]).content)
+                except BatchPending:
+                    results.append(None)
+            return results
+
+        results = session.run_waves(pipeline)
+
+        assert results == ["echo: echo: x", "echo: echo: y", "echo: echo: z"]
+        # One job per step of the chain, not per file
+        assert len(transport.submitted_jobs) == 2
@@ -0,0 +1,59 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the Converse stream processing shared by the Bedrock clients.
+###############################################################################
+# [Source file design principles]
+# - Raw Converse events are built by hand, no AWS access
+###############################################################################
+# [Source file constraints]
+# - Requires pytest-asyncio
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/llm/bedrock/client_common.py
+# codebase:src/dbp/llm/common/streaming.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T04:40:00Z : Created Converse stream processing tests by CodeAssistant
+# * Added text delta coalescing tests of ConverseStreamProcessor.process_to_text
+###############################################################################
+
+"""
+Tests for the Converse stream processing.
+"""
+
+import pytest
+
+from ...common.streaming import StreamCoalescer
+from ..client_common import ConverseStreamProcessor
+
+
+async def _converse_events(tokens):
+    yield {"messageStart": {"role": "assistant"}}
+    for token in tokens:
+        yield {"contentBlockDelta": {"delta": {"text": token}}}
+    yield {"messageStop": {"stopReason": "end_turn"}}
+
+
+@pytest.mark.asyncio
+async def test_text_deltas_are_coalesced_into_frames():
+    tokens = ["Hel", "lo", ", ", "wor", "ld"]
+    coalescer = StreamCoalescer(min_chars=5, max_latency=1.0)
+
+    frames = [frame async for frame in ConverseStreamProcessor.process_to_text(_converse_events(tokens), coalescer)]
+    deltas = [delta async for delta in ConverseStreamProcessor.process_to_text(_converse_events(tokens), None)]
+
+    assert frames == ["Hello", ", wor", "ld"]
+    assert deltas == tokens
@@ -39,6 +39,8 @@
 # system:warnings
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T10:20:00Z : Added model index tests by CodeAssistant
+# * Added TestModelIndex covering exact, versioned and unknown model lookups
 # 2025-05-05T22:30:27Z : Created initial tests for BedrockClientFactory by CodeAssistant
 # * Added tests for create_langchain_chatbedrock model selection
 # * Added tests to verify correct model class creation for different model IDs
@@ -178,3 +180,35 @@ class TestBedrockClientFactory:
         
         # Check that the correct model class was created
         assert isinstance(model, ClaudeEnhancedChatBedrockConverse)
+
+
+class TestModelIndex:
+    """Test suite for the lazy model-to-class index."""
+
+    def test_exact_and_versioned_lookup(self):
+        """Exact IDs and other versions of a declared model resolve to the same classes."""
+        from ..client_factory import get_client_class_for_model, get_parameter_class_for_model
+        from ..models.claude3 import Claude3Parameters
+
+        assert get_client_class_for_model("anthropic.claude-3-haiku-20240307-v1:0") is ClaudeEnhancedChatBedrockConverse
+        assert get_client_class_for_model("anthropic.claude-3-haiku-20240307-v1:9") is ClaudeEnhancedChatBedrockConverse
+        assert get_parameter_class_for_model("anthropic.claude-3-haiku-20240307-v1:9") is Claude3Parameters
+        assert get_client_class_for_model("amazon.nova-lite-v1:0") is NovaEnhancedChatBedrockConverse
+
+    def test_unknown_model_raises(self):
+        """Unknown model IDs raise UnsupportedModelError."""
+        from ..client_factory import get_client_class_for_model
+        from ...common.exceptions import UnsupportedModelError
+
+        with pytest.raises(UnsupportedModelError):
+            get_client_class_for_model("vendor.unknown-model-v1:0")
+
+    def test_supported_ids_read_without_import(self):
+        """Model declarations are read from the module sources, matching the imported classes."""
+        import os
+        from .. import client_factory
+        from ..models.nova import NovaParameters
+
+        nova_path = os.path.join(os.path.dirname(client_factory.__file__), "models", "nova.py")
+        assert client_factory._read_module_model_ids(nova_path) == NovaParameters.Config.supported_models
+        assert set(NovaParameters.Config.supported_models) <= set(client_factory.get_all_supported_model_ids())
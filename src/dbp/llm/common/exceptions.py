@@ -32,6 +32,11 @@
 # system:typing
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T15:00:00Z : Added tool registry exceptions by CodeAssistant
+# * Added ToolRegistrationError, ToolNotFoundError and ToolExecutionError imported by tool_registry.py
+# * Made ToolError tool_name optional
+# 2026-10-18T12:40:00Z : Added MalformedStreamError by CodeAssistant
+# * Raised by the incremental JSON parser on invalid streamed structure
 # 2025-05-02T13:04:00Z : Added UnsupportedFeatureError for capability checking by CodeAssistant
 # * Added exception for feature capability checks
 # * Used by EnhancedBedrockBase for model capability validation
@@ -121,6 +126,21 @@ class StreamingTimeoutError(StreamingError):
     pass
 
 
+class MalformedStreamError(StreamingError):
+    """
+    [Class intent]
+    Exception raised when a streamed structured response (e.g. JSON) has an
+    invalid structure that cannot be recovered.
+    
+    [Design principles]
+    Lets consumers stop reading a stream as soon as the output is known unusable.
+    
+    [Implementation details]
+    Context carries the character offset of the error when known.
+    """
+    pass
+
+
 class ModelError(LLMError):
     """
     [Class intent]
@@ -234,7 +254,7 @@ class ToolError(LLMError):
     def __init__(
         self,
         message: str,
-        tool_name: str,
+        tool_name: Optional[str] = None,
         context: Optional[Dict[str, Any]] = None
     ):
         """
@@ -245,14 +265,57 @@ class ToolError(LLMError):
         Captures the specific tool that caused the error.
         
         [Implementation details]
-        Adds tool_name as a required parameter and extends context.
+        Adds tool_name to the context when known.
         """
         context = context or {}
-        context["tool_name"] = tool_name
+        if tool_name is not None:
+            context["tool_name"] = tool_name
         super().__init__(message, context)
         self.tool_name = tool_name
 
 
+class ToolRegistrationError(ToolError):
+    """
+    [Class intent]
+    Exception raised when a tool cannot be registered.
+    
+    [Design principles]
+    Separates invalid tool definitions from execution failures.
+    
+    [Implementation details]
+    Extends ToolError without additional context.
+    """
+    pass
+
+
+class ToolNotFoundError(ToolError):
+    """
+    [Class intent]
+    Exception raised when a requested tool is not registered.
+    
+    [Design principles]
+    Specifically identifies unknown tool names.
+    
+    [Implementation details]
+    Extends ToolError without additional context.
+    """
+    pass
+
+
+class ToolExecutionError(ToolError):
+    """
+    [Class intent]
+    Exception raised when a tool call fails validation or execution.
+    
+    [Design principles]
+    Covers invalid input, tool failures and invalid output.
+    
+    [Implementation details]
+    Extends ToolError without additional context.
+    """
+    pass
+
+
 class ConnectionError(LLMError):
     """
     [Class intent]
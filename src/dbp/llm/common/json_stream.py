@@ -0,0 +1,355 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides an incremental JSON parser for streamed LLM responses. The parser
+# consumes text chunks as they arrive and emits each element of a designated
+# top-level array as soon as the element closes, so consumers can process
+# results while the model is still generating.
+###############################################################################
+# [Source file design principles]
+# - Single pass over the response: every character is scanned once
+# - Array elements are parsed once, when they close, never re-parsed at the end
+# - Tolerates prose and markdown fences around the JSON document
+# - Structural errors are reported immediately so the stream can be abandoned
+###############################################################################
+# [Source file constraints]
+# - Handles one top-level JSON object per response
+# - Only elements that are objects are emitted from the streamed array
+# - No dependency on a specific JSON repair library (repair is injectable)
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/llm/common/exceptions.py
+# system:json
+# system:re
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T12:40:00Z : Initial implementation by CodeAssistant
+# * Added IncrementalJSONParser emitting array elements as they close
+###############################################################################
+
+"""
+Incremental JSON parsing of streamed LLM responses.
+"""
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+from .exceptions import MalformedStreamError
+
+
+# Characters that change the scanner state outside of strings
+_STRUCTURAL = re.compile(r'[{}\[\]",:]')
+# Characters that change the scanner state inside strings
+_STRING_SPECIAL = re.compile(r'["\\]')
+
+
+class IncrementalJSONParser:
+    """
+    [Class intent]
+    Streaming parser for LLM responses shaped as one JSON object that contains
+    a (possibly large) array of result objects, such as {"changes": [...], ...}.
+
+    [Design principles]
+    - feed() returns the array elements completed by the chunk
+    - finish() returns the whole document without parsing the array a second time
+    - Raises MalformedStreamError on mismatched brackets or unparsable elements
+
+    [Implementation details]
+    - Regular expression jumps over string contents and scalar values, Python
+      code only runs on structural characters
+    - Keeps three buffers: the document skeleton (everything except the streamed
+      array contents), the element being captured, and the raw chunks for fallbacks
+    - Text before the first '{' and after the closing '}' is ignored
+    """
+
+    def __init__(self, array_key: str,
+                 repair: Optional[Callable[[str], str]] = None):
+        """
+        [Method intent]
+        Create a parser streaming the elements of one top-level array.
+
+        Args:
+            array_key: Key of the top-level array whose elements are emitted
+            repair: Optional function repairing an element that fails to parse
+        """
+        self.array_key = array_key
+        self.repair = repair
+
+        self._chunks: List[str] = []
+        self._offset = 0
+        self._items: List[Dict[str, Any]] = []
+        self._stack: List[str] = []
+        self._started = False
+        self._done = False
+
+        # String scanning state
+        self._in_string = False
+        self._escape = False
+        self._capturing_key = False
+        self._key_parts: List[str] = []
+        self._last_string: Optional[str] = None
+        self._current_key: Optional[str] = None
+
+        # Capture buffers
+        self._skeleton: List[str] = []
+        self._capturing_skeleton = False
+        self._in_array = False
+        self._element_parts: Optional[List[str]] = None
+
+    @property
+    def items(self) -> List[Dict[str, Any]]:
+        """
+        [Method intent]
+        Get all array elements emitted so far.
+
+        Returns:
+            List[Dict[str, Any]]: Emitted elements in stream order
+        """
+        return self._items
+
+    @property
+    def complete(self) -> bool:
+        """
+        [Method intent]
+        Check whether the top-level JSON object has been closed.
+
+        Returns:
+            bool: True once the document is complete
+        """
+        return self._done
+
+    @property
+    def text(self) -> str:
+        """
+        [Method intent]
+        Get the full raw text received so far, for fallback parsing and logging.
+
+        Returns:
+            str: Concatenated chunks
+        """
+        if len(self._chunks) > 1:
+            self._chunks = ["".join(self._chunks)]
+        return self._chunks[0] if self._chunks else ""
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        [Method intent]
+        Consume the next chunk of the response.
+
+        Args:
+            chunk: Text chunk as received from the stream
+
+        Returns:
+            List[Dict[str, Any]]: Array elements completed within this chunk
+
+        Raises:
+            MalformedStreamError: On mismatched brackets or an unparsable element
+        """
+        if not chunk:
+            return []
+        self._chunks.append(chunk)
+        chunk_offset = self._offset
+        self._offset += len(chunk)
+        if self._done:
+            return []
+
+        emitted = []
+        stack = self._stack
+        n = len(chunk)
+        i = 0
+        skeleton_from = 0 if self._capturing_skeleton else None
+        element_from = 0 if self._element_parts is not None else None
+        key_from = 0 if (self._in_string and self._capturing_key) else None
+
+        while i < n:
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    i += 1
+                    continue
+                match = _STRING_SPECIAL.search(chunk, i)
+                if match is None:
+                    break
+                i = match.start()
+                if chunk[i] == "\\":
+                    self._escape = True
+                    i += 1
+                    continue
+                # Closing quote
+                self._in_string = False
+                if key_from is not None:
+                    self._key_parts.append(chunk[key_from:i])
+                    self._last_string = "".join(self._key_parts)
+                    key_from = None
+                    self._capturing_key = False
+                i += 1
+                continue
+
+            if not self._started:
+                start = chunk.find("{", i)
+                if start < 0:
+                    break
+                self._started = True
+                self._capturing_skeleton = True
+                skeleton_from = start
+                stack.append("{")
+                i = start + 1
+                continue
+
+            match = _STRUCTURAL.search(chunk, i)
+            if match is None:
+                break
+            i = match.start()
+            char = chunk[i]
+
+            if char == '"':
+                self._in_string = True
+                if len(stack) == 1:
+                    # Top-level strings are candidate keys
+                    self._capturing_key = True
+                    self._key_parts = []
+                    key_from = i + 1
+            elif char == ":":
+                if len(stack) == 1:
+                    self._current_key = self._last_string
+            elif char == ",":
+                if len(stack) == 1:
+                    self._current_key = None
+            elif char == "{" or char == "[":
+                if char == "[" and len(stack) == 1 and self._current_key == self.array_key:
+                    # Streamed array: keep only its brackets in the skeleton
+                    self._skeleton.append(chunk[skeleton_from:i + 1])
+                    skeleton_from = None
+                    self._capturing_skeleton = False
+                    self._in_array = True
+                elif char == "{" and self._in_array and len(stack) == 2:
+                    self._element_parts = []
+                    element_from = i
+                stack.append(char)
+            else:
+                expected = "{" if char == "}" else "["
+                if stack[-1] != expected:
+                    raise MalformedStreamError(
+                        f"Unexpected '{char}' at offset {chunk_offset + i} closing '{stack[-1]}'",
+                        context={"offset": chunk_offset + i}
+                    )
+                stack.pop()
+                if char == "}" and self._in_array and len(stack) == 2 and self._element_parts is not None:
+                    self._element_parts.append(chunk[element_from:i + 1])
+                    element_from = None
+                    emitted.append(self._emit("".join(self._element_parts), chunk_offset + i))
+                    self._element_parts = None
+                elif char == "]" and self._in_array and len(stack) == 1:
+                    self._in_array = False
+                    self._capturing_skeleton = True
+                    skeleton_from = i
+                elif not stack:
+                    self._skeleton.append(chunk[skeleton_from:i + 1])
+                    skeleton_from = None
+                    self._capturing_skeleton = False
+                    self._done = True
+                    break
+            i += 1
+
+        # Carry partial captures over to the next chunk
+        if skeleton_from is not None:
+            self._skeleton.append(chunk[skeleton_from:])
+        if element_from is not None:
+            self._element_parts.append(chunk[element_from:])
+        if key_from is not None:
+            self._key_parts.append(chunk[key_from:])
+        return emitted
+
+    def finish(self) -> Optional[Dict[str, Any]]:
+        """
+        [Method intent]
+        Build the complete document once the stream has ended.
+
+        [Implementation details]
+        - Parses only the skeleton; the streamed array is filled with the
+          elements already emitted
+
+        Returns:
+            Optional[Dict[str, Any]]: Parsed document, None if the stream ended
+            before the top-level object closed or the skeleton is not valid JSON
+        """
+        if not self._done:
+            return None
+        try:
+            document = json.loads("".join(self._skeleton), strict=False)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(document, dict):
+            return None
+        if isinstance(document.get(self.array_key), list):
+            document[self.array_key] = list(self._items)
+        return document
+
+    def _emit(self, text: str, offset: int) -> Dict[str, Any]:
+        """
+        [Method intent]
+        Parse a completed array element and record it.
+
+        Args:
+            text: JSON text of the element
+            offset: Stream offset of the element's closing brace
+
+        Returns:
+            Dict[str, Any]: Parsed element
+
+        Raises:
+            MalformedStreamError: If the element cannot be parsed or repaired
+        """
+        try:
+            item = json.loads(text, strict=False)
+        except json.JSONDecodeError as e:
+            if self.repair is None:
+                raise MalformedStreamError(f"Invalid array element ending at offset {offset}: {e}",
+                                           context={"offset": offset})
+            try:
+                item = json.loads(self.repair(text), strict=False)
+            except Exception as repair_error:
+                raise MalformedStreamError(
+                    f"Invalid array element ending at offset {offset}: {repair_error}",
+                    context={"offset": offset}
+                )
+        self._items.append(item)
+        return item
+
+
+def parse_json_document(text: str, array_key: str,
+                        repair: Optional[Callable[[str], str]] = None) -> Optional[Dict[str, Any]]:
+    """
+    [Function intent]
+    Parse a complete response with the incremental parser in one pass.
+
+    [Design principles]
+    Same tolerance for surrounding prose and fences as the streaming path.
+
+    Args:
+        text: Complete response text
+        array_key: Key of the top-level array
+        repair: Optional element repair function
+
+    Returns:
+        Optional[Dict[str, Any]]: Parsed document, None if the text holds no
+        complete, structurally valid JSON object
+    """
+    parser = IncrementalJSONParser(array_key, repair=repair)
+    try:
+        parser.feed(text)
+    except MalformedStreamError:
+        return None
+    return parser.finish()
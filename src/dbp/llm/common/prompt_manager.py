@@ -41,28 +41,34 @@
 # system:langchain_core
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T01:20:00Z : Fixed cache key collisions of equal scalars by CodeAssistant
+# * Scalar cache key hints include the type name so 1, True and 1.0 no longer share an entry
+# 2026-10-18T22:40:00Z : Added prompt cache metrics by CodeAssistant
+# * Counted rendered prompt cache hits and misses in dbp_prompt_cache_requests
+# 2026-10-18T14:20:00Z : Compiled templates and O(1) LRU render cache by CodeAssistant
+# * Templates are parsed once into CompiledTemplate segments and rendered with a single join
+# * Cache keys hint large values by length and hash instead of stringifying them
+# * Rendered prompt cache is an OrderedDict LRU bounded by entries and bytes
+# * Templates reload when their file modification time or size changes
 # 2025-05-02T10:57:00Z : Enhanced for LangChain/LangGraph integration by CodeAssistant
 # * Added version tracking and caching system for prompt templates
 # * Implemented variable extraction and validation for templates
 # * Added LangChainPromptAdapter for LangChain integration
-# 2025-05-02T07:13:00Z : Moved to common directory by Cline
-# * Relocated from src/dbp/llm/prompt_manager.py to src/dbp/llm/common/prompt_manager.py
-# * Updated header to reflect provider-agnostic nature
-# 2025-04-16T11:58:00Z : Initial creation of LLMPromptManager class by Cline
-# * Created generic prompt manager with strict template loading requirements.
 ###############################################################################
 
 import os
 import re
+import sys
 import logging
 import hashlib
+from collections import OrderedDict
 from pathlib import Path
-import datetime
-from typing import Any, Dict, Optional, List, Set, Type, Union
+from typing import Any, Dict, Optional, List, Set, Tuple, Type, Union
 
 from langchain_core.prompts import PromptTemplate, ChatPromptTemplate
 from langchain_core.messages import SystemMessage, HumanMessage
 
+from ...core.metrics import PROMPT_CACHE_REQUESTS
 from .exceptions import PromptError, PromptNotFoundError, PromptRenderingError
 
 logger = logging.getLogger(__name__)
@@ -70,6 +76,74 @@ logger = logging.getLogger(__name__)
 # Constants
 PROMPTS_DIR = "doc/llm/prompts"
 
+# Variable values longer than this are represented in cache keys by a hint
+LARGE_VALUE_THRESHOLD = 1024
+
+# Scalar types whose values are used as-is in cache keys
+_KEY_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Children of the prompt cache metric, resolved once for the render path
+PROMPT_CACHE_HITS = PROMPT_CACHE_REQUESTS.labels(result="hit")
+PROMPT_CACHE_MISSES = PROMPT_CACHE_REQUESTS.labels(result="miss")
+
+
+class CompiledTemplate:
+    """
+    [Class intent]
+    Prompt template parsed once into literal and placeholder segments, so that
+    rendering is a single join instead of one full-string replace per variable.
+    
+    [Design principles]
+    - Parse once per template version, render many times
+    - Substituted values are never rescanned for placeholders
+    
+    [Implementation details]
+    - re.split with a capturing group yields alternating literals and variable
+      names: even indexes are literals, odd indexes are variable names
+    - String values are inserted without conversion, so the only copy of a large
+      value made while rendering is the final join
+    """
+    
+    def __init__(self, template: str, pattern: str, version: Optional[str] = None):
+        """
+        [Class method intent]
+        Parse a template into its segments.
+        
+        Args:
+            template: Template content with {{variable}} placeholders
+            pattern: Placeholder regex with one group capturing the variable name
+            version: Optional version identifier of the template content
+        """
+        self.source = template
+        self.version = version
+        self.segments: List[str] = re.split(pattern, template)
+        self.variables: Set[str] = set(self.segments[1::2])
+        
+    def render(self, variables: Dict[str, Any]) -> str:
+        """
+        [Class method intent]
+        Render the template with the given variable values.
+        
+        Args:
+            variables: Dictionary of variables for substitution
+            
+        Returns:
+            str: Rendered prompt
+            
+        Raises:
+            PromptRenderingError: If required variables are missing
+        """
+        missing_vars = self.variables.difference(variables)
+        if missing_vars:
+            raise PromptRenderingError(
+                f"Missing required variables: {', '.join(sorted(missing_vars))}"
+            )
+        parts = self.segments[:]
+        for i in range(1, len(parts), 2):
+            value = variables[parts[i]]
+            parts[i] = value if type(value) is str else str(value)
+        return "".join(parts)
+
 
 class PromptManager:
     """
@@ -87,8 +161,9 @@ class PromptManager:
     
     [Implementation details]
     - Loads templates from the doc/llm/prompts directory
-    - Implements a caching mechanism for rendered prompts
-    - Uses simple variable substitution with validation
+    - Compiles each template once into a CompiledTemplate
+    - Reloads a template when its file modification time or size changes
+    - Caches rendered prompts in an LRU bounded by entry count and bytes
     - Maintains prompt versions based on content hashes
     """
     
@@ -100,7 +175,8 @@ class PromptManager:
         config: Optional[Any] = None, 
         logger_override: Optional[logging.Logger] = None,
         prompts_dir: str = None, 
-        cache_size: int = 100
+        cache_size: int = 100,
+        cache_max_bytes: int = 32 * 1024 * 1024
     ):
         """
         [Class method intent]
@@ -121,6 +197,7 @@ class PromptManager:
             logger_override: Optional logger instance
             prompts_dir: Directory containing prompt templates (default: doc/llm/prompts)
             cache_size: Maximum number of rendered prompts to cache
+            cache_max_bytes: Maximum memory held by cached rendered prompts
         """
         self.config = config or {}
         self.logger = logger_override or logger
@@ -134,11 +211,16 @@ class PromptManager:
             
         # Initialize caching structures
         self.cache_size = cache_size
+        self.cache_max_bytes = cache_max_bytes
         self.template_cache = {}  # name -> template content
         self._template_hashes: Dict[str, str] = {}  # name -> content hash
         self._template_variables: Dict[str, Set[str]] = {}  # name -> required variables
-        self._rendered_cache: Dict[str, str] = {}  # cache_key -> rendered prompt
-        self._rendered_timestamps: Dict[str, float] = {}  # cache_key -> timestamp
+        self._compiled: Dict[str, CompiledTemplate] = {}  # name -> compiled template
+        self._template_stamps: Dict[str, Tuple[str, int, int]] = {}  # name -> (path, mtime_ns, size)
+        self._rendered_cache: "OrderedDict[Tuple, Tuple[str, int]]" = OrderedDict()  # key -> (prompt, bytes)
+        self._rendered_bytes = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
         
         # Track loaded prompt versions
         self._versions: Dict[str, str] = {}  # name -> version hash
@@ -191,8 +273,7 @@ class PromptManager:
         - Simple regex-based extraction
         
         [Implementation details]
-        - Uses regex to find all variable placeholders
-        - Returns a set of variable names
+        - Compiles the template and returns its variable names
         
         Args:
             template: Template content with variables
@@ -200,9 +281,10 @@ class PromptManager:
         Returns:
             Set[str]: Set of variable names
         """
-        return set(re.findall(self.VARIABLE_PATTERN, template))
+        return set(CompiledTemplate(template, self.VARIABLE_PATTERN).variables)
     
-    def _generate_cache_key(self, name: str, variables: Dict[str, Any]) -> str:
+    def _generate_cache_key(self, name: str, variables: Dict[str, Any],
+                            version: Optional[str] = None) -> Tuple:
         """
         [Class method intent]
         Generate a unique cache key for a rendered prompt.
@@ -210,32 +292,36 @@ class PromptManager:
         [Design principles]
         - Deterministic key generation for reliable caching
         - Include all relevant factors in key
+        - Never copy large variable values to build the key
         
         [Implementation details]
-        - Combines prompt name, version, and variable values
-        - Uses sorted keys for consistent ordering
-        - Handles different variable types
+        - Tuple of prompt name, version, and one (name, hint) pair per variable
+        - Small scalar values are hinted by type name and value, since 1, 1.0 and
+          True are equal and hash alike but render differently
+        - Large strings are hinted by length and hash(); str caches its hash, so
+          passing the same string object again costs nothing
+        - Other values fall back to their string form, as rendering needs it anyway
         
         Args:
             name: Name of the prompt template
             variables: Dictionary of variables for substitution
+            version: Template version, looked up by name if not given
             
         Returns:
-            str: Unique cache key
-        """
-        # Get template version
-        version = self._versions.get(name, "unknown")
-        
-        # Create a representation of the variables for hashing
-        var_str = "".join(
-            f"{k}:{str(v)}" for k, v in sorted(variables.items())
-        )
-        
-        # Combine name, version, and variables
-        combined = f"{name}:{version}:{var_str}"
-        
-        # Generate hash
-        return hashlib.md5(combined.encode('utf-8')).hexdigest()
+            Tuple: Hashable cache key
+        """
+        hints = []
+        for key, value in sorted(variables.items()):
+            if isinstance(value, str) and len(value) > LARGE_VALUE_THRESHOLD:
+                hint = ("str", len(value), hash(value))
+            elif isinstance(value, _KEY_SCALAR_TYPES):
+                hint = (type(value).__name__, value)
+            else:
+                hint = ("repr", str(value))
+            hints.append((key, hint))
+        if version is None:
+            version = self._versions.get(name, "unknown")
+        return (name, version, tuple(hints))
     
     def _manage_cache(self) -> None:
         """
@@ -243,30 +329,55 @@ class PromptManager:
         Manage the rendered prompt cache to prevent excessive memory usage.
         
         [Design principles]
-        - Limit cache size to configured maximum
+        - Limit cache size to configured maximum entries and bytes
         - Remove least recently used entries first
-        - Efficient cache management
+        - Constant time per evicted entry
         
         [Implementation details]
-        - Checks if cache exceeds size limit
-        - Sorts entries by timestamp
-        - Removes oldest entries until within size limit
-        """
-        # Check if cache is too large
-        if len(self._rendered_cache) <= self.cache_size:
-            return
-        
-        # Sort by timestamp (oldest first)
-        sorted_keys = sorted(
-            self._rendered_timestamps.keys(),
-            key=lambda k: self._rendered_timestamps[k]
-        )
+        - The OrderedDict keeps entries in use order, oldest first
+        - Pops oldest entries until both limits are respected
+        """
+        cache = self._rendered_cache
+        while cache and (len(cache) > self.cache_size or self._rendered_bytes > self.cache_max_bytes):
+            _, (_, size) = cache.popitem(last=False)
+            self._rendered_bytes -= size
+    
+    def _cache_rendered(self, cache_key: Tuple, rendered: str) -> None:
+        """
+        [Class method intent]
+        Store a rendered prompt in the LRU cache.
+        
+        [Implementation details]
+        - Size is the memory footprint of the string (sys.getsizeof)
+        - Prompts larger than the byte limit are not cached
         
-        # Remove oldest entries
-        to_remove = len(self._rendered_cache) - self.cache_size
-        for key in sorted_keys[:to_remove]:
-            del self._rendered_cache[key]
-            del self._rendered_timestamps[key]
+        Args:
+            cache_key: Key from _generate_cache_key
+            rendered: Rendered prompt
+        """
+        size = sys.getsizeof(rendered)
+        if size <= self.cache_max_bytes:
+            previous = self._rendered_cache.pop(cache_key, None)
+            if previous is not None:
+                self._rendered_bytes -= previous[1]
+            self._rendered_cache[cache_key] = (rendered, size)
+            self._rendered_bytes += size
+        self._manage_cache()
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        [Class method intent]
+        Get usage statistics of the rendered prompt cache.
+        
+        Returns:
+            Dict[str, int]: Entries, bytes, hits and misses
+        """
+        return {
+            "entries": len(self._rendered_cache),
+            "bytes": self._rendered_bytes,
+            "hits": self._cache_hits,
+            "misses": self._cache_misses
+        }
     
     def get_prompt_template(self, template_name: str) -> str:
         """
@@ -281,11 +392,12 @@ class PromptManager:
         - Supports multiple file extensions (.md, .txt)
         
         [Implementation details]
-        - Checks cache before file system
+        - Checks cache before file system, reloading when the file modification
+          time or size changed since it was loaded
         - Normalizes template names to handle different input formats
         - Validates template content is not empty
         - Computes hash for version tracking
-        - Extracts required variables
+        - Compiles the template and extracts required variables
         
         Args:
             template_name: The name of the template file (with or without extension).
@@ -297,8 +409,8 @@ class PromptManager:
         Raises:
             PromptNotFoundError: If the template file cannot be found or loaded.
         """
-        # Check if template is already cached
-        if template_name in self.template_cache:
+        # Check if template is already cached and unchanged on disk
+        if template_name in self.template_cache and self._is_template_current(template_name):
             return self.template_cache[template_name]
         
         # Check if in available prompts index
@@ -345,6 +457,7 @@ class PromptManager:
         try:
             self.logger.debug(f"Loading prompt template: {template_path}")
             
+            stat = os.stat(template_path)
             with open(template_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 
@@ -356,11 +469,14 @@ class PromptManager:
             self._template_hashes[template_name] = content_hash
             self._versions[template_name] = content_hash[:8]  # First 8 chars as version
             
-            # Extract required variables
-            self._template_variables[template_name] = self._extract_variables(content)
+            # Compile once and extract required variables
+            compiled = CompiledTemplate(content, self.VARIABLE_PATTERN, self._versions[template_name])
+            self._compiled[template_name] = compiled
+            self._template_variables[template_name] = compiled.variables
                 
             # Cache the template
             self.template_cache[template_name] = content
+            self._template_stamps[template_name] = (template_path, stat.st_mtime_ns, stat.st_size)
             
             self.logger.debug(f"Successfully loaded template: {template_name} ({len(content)} chars)")
             return content
@@ -372,7 +488,55 @@ class PromptManager:
             # Wrap other exceptions in our custom exception
             raise PromptError(f"Failed to load prompt template '{template_name}': {str(e)}") from e
 
-    def _render_template(self, template: str, variables: Dict[str, Any]) -> str:
+    def _is_template_current(self, name: str) -> bool:
+        """
+        [Class method intent]
+        Check whether a cached template still matches its file on disk.
+        
+        [Implementation details]
+        - Compares modification time and size recorded at load time
+        - A file that can no longer be read keeps its cached content
+        
+        Args:
+            name: Name of the cached template
+            
+        Returns:
+            bool: False if the file changed since it was loaded
+        """
+        stamp = self._template_stamps.get(name)
+        if stamp is None:
+            return True
+        path, mtime_ns, size = stamp
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return True
+        return stat.st_mtime_ns == mtime_ns and stat.st_size == size
+    
+    def _get_compiled_template(self, name: str) -> CompiledTemplate:
+        """
+        [Class method intent]
+        Get the compiled form of a prompt template, loading it if needed.
+        
+        Args:
+            name: Name of the prompt template
+            
+        Returns:
+            CompiledTemplate: Compiled template
+            
+        Raises:
+            PromptNotFoundError: If the prompt does not exist
+        """
+        content = self.get_prompt_template(name)
+        compiled = self._compiled.get(name)
+        if compiled is None or compiled.source is not content:
+            # Loaded under a normalized name (with extension)
+            version = hashlib.md5(content.encode('utf-8')).hexdigest()[:8]
+            compiled = CompiledTemplate(content, self.VARIABLE_PATTERN, version)
+            self._compiled[name] = compiled
+        return compiled
+    
+    def _render_template(self, template: Union[str, CompiledTemplate], variables: Dict[str, Any]) -> str:
         """
         [Class method intent]
         Render a template by substituting variables.
@@ -383,12 +547,12 @@ class PromptManager:
         - Type conversion for common variable types
         
         [Implementation details]
-        - Uses regex to find and replace variables
-        - Validates all required variables are provided
+        - Compiles plain string templates on the fly
+        - Substitutes all variables in one pass with a single join
         - Converts variables to strings for substitution
         
         Args:
-            template: Template content with variables
+            template: Template content with variables, or its compiled form
             variables: Dictionary of variables for substitution
             
         Returns:
@@ -398,27 +562,9 @@ class PromptManager:
             PromptRenderingError: If rendering fails
         """
         try:
-            # Extract required variables
-            required_vars = set(re.findall(self.VARIABLE_PATTERN, template))
-            
-            # Check all required variables are provided
-            missing_vars = required_vars - set(variables.keys())
-            if missing_vars:
-                raise PromptRenderingError(
-                    f"Missing required variables: {', '.join(missing_vars)}"
-                )
-            
-            # Perform substitution
-            rendered = template
-            for var_name, value in variables.items():
-                # Convert value to string
-                str_value = str(value)
-                
-                # Substitute variable
-                pattern = f"{{{{{var_name}}}}}"
-                rendered = rendered.replace(pattern, str_value)
-            
-            return rendered
+            if not isinstance(template, CompiledTemplate):
+                template = CompiledTemplate(template, self.VARIABLE_PATTERN)
+            return template.render(variables)
         except Exception as e:
             if not isinstance(e, PromptRenderingError):
                 e = PromptRenderingError(f"Failed to render template: {str(e)}")
@@ -465,8 +611,8 @@ class PromptManager:
         - Clear error messages for failures
         
         [Implementation details]
-        - Loads template if not already cached
-        - Checks cache for previously rendered prompt
+        - Loads and compiles template if not already cached
+        - Checks LRU cache for previously rendered prompt
         - Renders prompt with variables if not cached
         - Updates cache with new rendering
         
@@ -484,26 +630,24 @@ class PromptManager:
         variables = variables or {}
         
         # Load template
-        template = self.get_prompt_template(name)
+        template = self._get_compiled_template(name)
         
         # Generate cache key
-        cache_key = self._generate_cache_key(name, variables)
+        cache_key = self._generate_cache_key(name, variables, template.version)
         
         # Check if already in cache
-        if cache_key in self._rendered_cache:
-            # Update timestamp
-            self._rendered_timestamps[cache_key] = datetime.datetime.now().timestamp()
-            return self._rendered_cache[cache_key]
-        
-        # Render template
+        entry = self._rendered_cache.get(cache_key)
+        if entry is not None:
+            self._rendered_cache.move_to_end(cache_key)
+            self._cache_hits += 1
+            PROMPT_CACHE_HITS.inc()
+            return entry[0]
+        self._cache_misses += 1
+        PROMPT_CACHE_MISSES.inc()
+        
+        # Render template and update cache
         rendered = self._render_template(template, variables)
-        
-        # Update cache
-        self._rendered_cache[cache_key] = rendered
-        self._rendered_timestamps[cache_key] = datetime.datetime.now().timestamp()
-        
-        # Manage cache size
-        self._manage_cache()
+        self._cache_rendered(cache_key, rendered)
         
         return rendered
     
@@ -611,18 +755,14 @@ class PromptManager:
             del self._template_variables[name]
         if name in self._versions:
             del self._versions[name]
+        self._compiled.pop(name, None)
+        self._template_stamps.pop(name, None)
         
         # Clear rendered cache for this prompt
-        keys_to_remove = []
-        for key in self._rendered_cache.keys():
-            if key.startswith(f"{name}:"):
-                keys_to_remove.append(key)
-        
+        keys_to_remove = [key for key in self._rendered_cache if key[0] == name]
         for key in keys_to_remove:
-            if key in self._rendered_cache:
-                del self._rendered_cache[key]
-            if key in self._rendered_timestamps:
-                del self._rendered_timestamps[key]
+            _, size = self._rendered_cache.pop(key)
+            self._rendered_bytes -= size
         
         # Force reload on next access
         self.get_prompt_template(name)
@@ -648,8 +788,10 @@ class PromptManager:
         self.template_cache.clear()
         self._template_variables.clear()
         self._versions.clear()
+        self._compiled.clear()
+        self._template_stamps.clear()
         self._rendered_cache.clear()
-        self._rendered_timestamps.clear()
+        self._rendered_bytes = 0
         
         # Reload index
         self._load_prompt_index()
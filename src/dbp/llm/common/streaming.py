@@ -33,11 +33,26 @@
 # codebase:src/dbp/llm/common/exceptions.py
 # codebase:src/dbp/llm/common/base.py
 # system:asyncio
+# system:logging
 # system:typing
 ###############################################################################
 # [GenAI tool change history]
-# 2025-05-02T10:30:00Z : Initial creation for LangChain/LangGraph integration by CodeAssistant
-# * Created streaming interfaces for AsyncIO-based LLM interactions
+# 2026-10-19T04:40:00Z : Used single mode for emulated text streams by CodeAssistant
+# * EmulatedTextStreamProvider yields the complete text at once by default (StreamEmulator single mode)
+# 2026-10-18T16:40:00Z : Added incremental TextBuffer by CodeAssistant
+# * Added TextBuffer with cached join and take() of consumed text
+# * Added keep_chunks option to StreamingResponse
+# * TextStreamingResponse accumulates text in a TextBuffer
+# 2026-10-18T16:10:00Z : Added zero-latency stream emulation and chunk coalescing by CodeAssistant
+# * StreamEmulator single mode yields the complete response at once, chunking is lazy
+# * bytes responses are chunked into memoryview slices, no delay after the last chunk
+# * Added StreamCoalescer merging text deltas into frames by size and latency
+# * TextStreamingResponse.text joins each chunk only once
+# 2026-10-18T15:40:00Z : Rewrote StreamCombiner unordered mode as a bounded fair fan-in by CodeAssistant
+# * One long-lived pump task per source feeding its own bounded asyncio.Queue
+# * Round-robin service of sources, sibling cancellation and source closing on error
+# * Added TaggedChunk and tag_source option to label chunks with their source index
+# * Added the missing logging import
 ###############################################################################
 
 """
@@ -45,13 +60,111 @@ Asynchronous streaming interfaces for LLM interactions.
 """
 
 import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Dict, List, Optional, TypeVar, Generic, Any, Union, Callable
+from typing import (
+    AsyncGenerator, AsyncIterable, Dict, List, NamedTuple, Optional, TypeVar, Generic, Any, Union, Callable
+)
 
 from .exceptions import StreamingError, StreamingTimeoutError
 
 T = TypeVar('T')
 
+
+class TextBuffer:
+    """
+    [Class intent]
+    Incremental text accumulator for streamed output, replacing repeated string
+    concatenation and repeated joins of chunk lists.
+    
+    [Design principles]
+    - Amortized O(1) append, no copy of the text received so far
+    - The joined value is cached until the next append
+    - Consumed text can be released to bound memory on long generations
+    
+    [Implementation details]
+    - Appended parts are kept in a list and joined on demand; the join result
+      replaces the parts so every character is copied once per read, not once
+      per append
+    - take() returns the text appended since the previous take() and drops it
+      from the buffer
+    """
+    
+    __slots__ = ("_parts", "_value", "_length")
+    
+    def __init__(self, initial: str = ""):
+        """
+        [Class method intent]
+        Create a buffer, optionally holding initial text.
+        
+        Args:
+            initial: Initial content
+        """
+        self._parts: List[str] = [initial] if initial else []
+        self._value: Optional[str] = initial
+        self._length = len(initial)
+    
+    def append(self, text: str) -> None:
+        """
+        [Class method intent]
+        Append text to the buffer.
+        
+        Args:
+            text: Text to append
+        """
+        if text:
+            self._parts.append(text)
+            self._length += len(text)
+            self._value = None
+    
+    def getvalue(self) -> str:
+        """
+        [Class method intent]
+        Get the buffered text.
+        
+        Returns:
+            str: Concatenation of everything appended and not taken
+        """
+        if self._value is None:
+            self._value = "".join(self._parts)
+            self._parts = [self._value] if self._value else []
+        return self._value
+    
+    def take(self) -> str:
+        """
+        [Class method intent]
+        Remove and return the buffered text.
+        
+        Returns:
+            str: Text appended since the buffer was created or last taken
+        """
+        value = self.getvalue()
+        self._parts = []
+        self._value = ""
+        self._length = 0
+        return value
+    
+    def __len__(self) -> int:
+        """
+        [Class method intent]
+        Get the number of buffered characters without joining.
+        
+        Returns:
+            int: Buffered length
+        """
+        return self._length
+    
+    def __str__(self) -> str:
+        """
+        [Class method intent]
+        Get the buffered text.
+        
+        Returns:
+            str: Buffered text
+        """
+        return self.getvalue()
+
+
 class StreamingResponse(Generic[T]):
     """
     [Class intent]
@@ -66,10 +179,11 @@ class StreamingResponse(Generic[T]):
     [Implementation details]
     Implements storage of the complete response for models that don't track it
     internally. Provides a unified interface for both streaming and 
-    non-streaming LLMs.
+    non-streaming LLMs. Individual chunks can be dropped (keep_chunks=False)
+    when only the aggregated response is needed.
     """
     
-    def __init__(self):
+    def __init__(self, keep_chunks: bool = True):
         """
         [Class method intent]
         Initializes a new streaming response container.
@@ -80,8 +194,12 @@ class StreamingResponse(Generic[T]):
         
         [Implementation details]
         Initializes empty collections to store the full response.
+        
+        Args:
+            keep_chunks: Whether individual chunks are kept for the chunks property
         """
         self._finished = False
+        self._keep_chunks = keep_chunks
         self._chunks: List[T] = []
     
     @property
@@ -112,7 +230,8 @@ class StreamingResponse(Generic[T]):
         """
         if self._finished:
             raise StreamingError("Cannot append to a completed stream")
-        self._chunks.append(chunk)
+        if self._keep_chunks:
+            self._chunks.append(chunk)
     
     def mark_complete(self) -> None:
         """
@@ -138,6 +257,7 @@ class StreamingResponse(Generic[T]):
         
         [Implementation details]
         Returns a copy of the internal chunks list to prevent modification.
+        Empty when the response was created with keep_chunks=False.
         """
         return self._chunks.copy()
 
@@ -156,6 +276,31 @@ class TextStreamingResponse(StreamingResponse[str]):
     functionality like joining chunks into a complete text.
     """
     
+    def __init__(self, keep_chunks: bool = True):
+        """
+        [Class method intent]
+        Initializes a new text streaming response.
+        
+        [Implementation details]
+        Text is accumulated in a TextBuffer independently of the chunk list.
+        
+        Args:
+            keep_chunks: Whether individual chunks are kept for the chunks property
+        """
+        super().__init__(keep_chunks)
+        self._text = TextBuffer()
+    
+    def append_chunk(self, chunk: str) -> None:
+        """
+        [Class method intent]
+        Adds a new text chunk to this streaming response.
+        
+        [Implementation details]
+        Appends to the text buffer in addition to the base class handling.
+        """
+        super().append_chunk(chunk)
+        self._text.append(chunk)
+    
     @property
     def text(self) -> str:
         """
@@ -164,11 +309,12 @@ class TextStreamingResponse(StreamingResponse[str]):
         
         [Design principles]
         Provides easy access to the full text response.
+        Cheap to call repeatedly while the stream is still growing.
         
         [Implementation details]
-        Joins all text chunks into a single string.
+        Reads the text buffer, whose joined value is cached until the next chunk.
         """
-        return "".join(self.chunks)
+        return self._text.getvalue()
     
     def __str__(self) -> str:
         """
@@ -291,15 +437,17 @@ class EmulatedTextStreamProvider(AsyncTextStreamProvider):
     doesn't support streaming natively.
     
     [Implementation details]
-    Takes a complete text response and emulates streaming by yielding chunks
-    with configurable delay to simulate realistic streaming behavior.
+    Takes a complete text response and, by default, yields it as one chunk
+    without delay (StreamEmulator single mode). The chunked mode emulates
+    realistic streaming with a configurable chunk size and delay.
     """
     
     def __init__(
         self, 
         text: str, 
         chunk_size: int = 4, 
-        delay: float = 0.01
+        delay: float = 0.01,
+        mode: Optional[str] = None
     ):
         """
         [Class method intent]
@@ -313,12 +461,17 @@ class EmulatedTextStreamProvider(AsyncTextStreamProvider):
         
         Args:
             text: The complete text to stream
-            chunk_size: Number of characters per chunk
-            delay: Delay between chunks in seconds
+            chunk_size: Number of characters per chunk (chunked mode)
+            delay: Delay between chunks in seconds (chunked mode)
+            mode: StreamEmulator.MODE_SINGLE (default) or StreamEmulator.MODE_CHUNKED
         """
+        mode = mode or StreamEmulator.MODE_SINGLE
+        if mode not in (StreamEmulator.MODE_CHUNKED, StreamEmulator.MODE_SINGLE):
+            raise ValueError(f"Unknown stream emulation mode: {mode}")
         self.text = text
         self.chunk_size = chunk_size
         self.delay = delay
+        self.mode = mode
     
     async def stream(self) -> AsyncGenerator[str, None]:
         """
@@ -330,13 +483,18 @@ class EmulatedTextStreamProvider(AsyncTextStreamProvider):
         LLM doesn't support streaming.
         
         [Implementation details]
-        Splits the text into chunks and yields them with configurable delay.
+        Single mode yields the whole text at once. Chunked mode splits the text
+        into chunks and yields them with configurable delay, without delaying
+        after the last chunk.
         """
+        if self.mode == StreamEmulator.MODE_SINGLE:
+            if self.text:
+                yield self.text
+            return
         for i in range(0, len(self.text), self.chunk_size):
-            chunk = self.text[i:i + self.chunk_size]
-            yield chunk
-            if self.delay > 0:
+            if i and self.delay > 0:
                 await asyncio.sleep(self.delay)
+            yield self.text[i:i + self.chunk_size]
 
 
 class StreamEmulator:
@@ -350,18 +508,26 @@ class StreamEmulator:
     - Provide streaming interface compatibility for non-streaming models
     - Support chunk-by-chunk delivery (not token-by-token)
     - Control chunk size for optimal performance
+    - No artificial latency when the consumer does not need paced delivery
     
     [Implementation details]
     - Converts synchronous response to asynchronous chunks
-    - Uses configurable chunking strategy
+    - Uses configurable chunking strategy, chunks are produced lazily
+    - "single" mode yields the complete response as one chunk without delay
+    - bytes responses are chunked into memoryview slices, without copies
     - Returns StreamingResponse objects for consistent interface
     """
     
+    # Emulation modes
+    MODE_CHUNKED = "chunked"
+    MODE_SINGLE = "single"
+    
     def __init__(self, 
                 chunk_size: int = 100, 
                 chunk_overlap: int = 0,
                 delimiter: Optional[str] = None,
-                delay: float = 0.01):
+                delay: float = 0.01,
+                mode: str = MODE_CHUNKED):
         """
         [Class method intent]
         Initialize the stream emulator with chunking parameters.
@@ -378,42 +544,49 @@ class StreamEmulator:
             chunk_size: Target size of chunks in characters
             chunk_overlap: Number of overlapping characters between chunks
             delimiter: Optional string to use as chunk delimiter
-            delay: Delay between chunks in seconds
+            delay: Delay between chunks in seconds (0 for none)
+            mode: MODE_CHUNKED to split the response, MODE_SINGLE to yield it whole
         """
+        if mode not in (self.MODE_CHUNKED, self.MODE_SINGLE):
+            raise ValueError(f"Unknown stream emulation mode: {mode}")
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.delimiter = delimiter
         self.delay = delay
+        self.mode = mode
         self.logger = logging.getLogger(self.__class__.__name__)
     
-    async def _chunk_text(self, text: str) -> List[Dict[str, Any]]:
+    def _iter_chunks(self, text: Union[str, bytes]):
         """
         [Class method intent]
-        Split text into chunks based on configuration.
-        
-        [Design principles]
-        - Clean chunking based on size or delimiters
-        - Support different text structures
+        Lazily split text into chunk contents based on configuration.
         
         [Implementation details]
         - Uses delimiter if provided, otherwise size-based chunking
         - Handles overlap between chunks
-        - Formats chunks as dictionaries for consistency
+        - bytes input is sliced through a memoryview, whitespace-only chunks are
+          only skipped for str input
         
         Args:
             text: The text to chunk
             
-        Returns:
-            List[Dict[str, Any]]: List of chunks in dictionary format
+        Yields:
+            Union[str, memoryview]: Chunk contents
         """
-        chunks = []
-        
-        if self.delimiter:
+        if isinstance(text, (bytes, bytearray)):
+            view = memoryview(text)
+            step = self.chunk_size - self.chunk_overlap
+            for start in range(0, len(view), step):
+                yield view[start:start + self.chunk_size]
+                if start + self.chunk_size >= len(view):
+                    break
+        elif self.delimiter:
             # Delimiter-based chunking
-            parts = text.split(self.delimiter)
-            for part in parts:
+            for part in text.split(self.delimiter):
                 if part.strip():  # Skip empty parts
-                    chunks.append({"content": part, "stop_reason": None})
+                    yield part
         else:
             # Size-based chunking
             start = 0
@@ -421,8 +594,31 @@ class StreamEmulator:
                 end = min(start + self.chunk_size, len(text))
                 chunk_text = text[start:end]
                 if chunk_text.strip():  # Skip empty chunks
-                    chunks.append({"content": chunk_text, "stop_reason": None})
+                    yield chunk_text
+                if end == len(text):
+                    break
                 start = end - self.chunk_overlap
+    
+    async def _chunk_text(self, text: str) -> List[Dict[str, Any]]:
+        """
+        [Class method intent]
+        Split text into chunks based on configuration.
+        
+        [Design principles]
+        - Clean chunking based on size or delimiters
+        - Support different text structures
+        
+        [Implementation details]
+        - Collects _iter_chunks() into a list
+        - Formats chunks as dictionaries for consistency
+        
+        Args:
+            text: The text to chunk
+            
+        Returns:
+            List[Dict[str, Any]]: List of chunks in dictionary format
+        """
+        chunks = [{"content": part, "stop_reason": None} for part in self._iter_chunks(text)]
         
         # Mark last chunk with stop reason
         if chunks:
@@ -430,7 +626,7 @@ class StreamEmulator:
             
         return chunks
     
-    async def emulate_stream(self, response: str) -> AsyncGenerator[Dict[str, Any], None]:
+    async def emulate_stream(self, response: Union[str, bytes]) -> AsyncGenerator[Dict[str, Any], None]:
         """
         [Class method intent]
         Emulate a streaming response from a non-streaming model.
@@ -438,10 +634,12 @@ class StreamEmulator:
         [Design principles]
         - Convert synchronous text to streaming format
         - Follow same interface as real streaming responses
+        - Never delay the last chunk
         
         [Implementation details]
-        - Chunks the input text
-        - Yields chunks with optional delays
+        - Single mode yields the whole response immediately
+        - Chunked mode holds one chunk back to mark the last one, and sleeps
+          between chunks only when a delay is configured
         - Similar format to real streaming responses
         
         Args:
@@ -451,21 +649,162 @@ class StreamEmulator:
             Dict[str, Any]: Chunks formatted like streaming responses
         """
         try:
-            # Generate chunks from the response
-            chunks = await self._chunk_text(response)
+            if self.mode == self.MODE_SINGLE:
+                if response:
+                    yield {"content": response, "stop_reason": "end_of_text"}
+                return
             
-            # Yield chunks with delay
-            for chunk in chunks:
-                yield chunk
-                # Small delay for more realistic streaming
-                if self.delay > 0:
-                    await asyncio.sleep(self.delay)
+            previous = None
+            for part in self._iter_chunks(response):
+                if previous is not None:
+                    yield {"content": previous, "stop_reason": None}
+                    # Small delay for more realistic streaming
+                    if self.delay > 0:
+                        await asyncio.sleep(self.delay)
+                previous = part
+            if previous is not None:
+                yield {"content": previous, "stop_reason": "end_of_text"}
                     
         except Exception as e:
             self.logger.error(f"Error in stream emulation: {e}")
             raise StreamingError(f"Error emulating stream: {str(e)}") from e
 
 
+class _StreamFailure(NamedTuple):
+    """
+    [Class intent]
+    Error raised by a source stream, carried through a queue to the consumer.
+    """
+    error: BaseException
+
+
+class StreamCoalescer:
+    """
+    [Class intent]
+    Merges the tiny text deltas of real model streams into larger frames, so
+    that transports (SSE, MCP) and accumulators handle a few frames instead of
+    one object per token.
+    
+    [Design principles]
+    - A frame is emitted once it reaches min_chars, or once its first delta is
+      max_latency old, whichever comes first: fast streams get large frames,
+      slow streams keep their latency bound
+    - Order is preserved; non-text chunks are forwarded as they are, after
+      flushing the pending text
+    
+    [Implementation details]
+    - A pump task reads the source into a bounded queue, so the latency timer
+      can fire while the source is waiting for the model
+    - The timer is an asyncio.timeout around queue.get(), only armed while text
+      is pending; cancelling queue.get() never loses a chunk
+    - Frames are built with a single join of the pending deltas
+    """
+    
+    DEFAULT_MIN_CHARS = 64
+    DEFAULT_MAX_LATENCY = 0.05
+    
+    def __init__(self,
+                 min_chars: int = DEFAULT_MIN_CHARS,
+                 max_latency: float = DEFAULT_MAX_LATENCY,
+                 queue_size: int = 256):
+        """
+        [Class method intent]
+        Initialize the coalescer with its flush thresholds.
+        
+        Args:
+            min_chars: Pending text size that triggers a frame
+            max_latency: Maximum time in seconds text is held back
+            queue_size: Maximum source chunks read ahead of the consumer
+        """
+        self.min_chars = min_chars
+        self.max_latency = max_latency
+        self.queue_size = queue_size
+        self.logger = logging.getLogger(self.__class__.__name__)
+    
+    async def coalesce(self, stream: AsyncIterable[Any]) -> AsyncGenerator[Any, None]:
+        """
+        [Class method intent]
+        Coalesce a stream of text deltas into frames.
+        
+        [Design principles]
+        - Drop-in wrapper around any async stream
+        - Pending text is flushed before an error is raised
+        
+        Args:
+            stream: Source stream of str deltas (other chunk types pass through)
+            
+        Yields:
+            Any: Text frames and forwarded non-text chunks
+            
+        Raises:
+            StreamingError: If the source stream fails
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        end = object()
+        timed_out = object()
+        
+        async def pump() -> None:
+            try:
+                async for chunk in stream:
+                    await queue.put(chunk)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(_StreamFailure(e))
+            else:
+                await queue.put(end)
+        
+        loop = asyncio.get_running_loop()
+        task = asyncio.create_task(pump())
+        pending: List[str] = []
+        pending_chars = 0
+        deadline = 0.0
+        try:
+            while True:
+                if pending:
+                    remaining = deadline - loop.time()
+                    item = timed_out
+                    if remaining > 0:
+                        try:
+                            async with asyncio.timeout(remaining):
+                                item = await queue.get()
+                        except TimeoutError:
+                            pass
+                    if item is timed_out:
+                        yield "".join(pending)
+                        pending, pending_chars = [], 0
+                        continue
+                else:
+                    item = await queue.get()
+                
+                if isinstance(item, str):
+                    if not pending:
+                        deadline = loop.time() + self.max_latency
+                    pending.append(item)
+                    pending_chars += len(item)
+                    if pending_chars >= self.min_chars:
+                        yield "".join(pending)
+                        pending, pending_chars = [], 0
+                    continue
+                
+                # Anything else ends the pending frame first
+                if pending:
+                    yield "".join(pending)
+                    pending, pending_chars = [], 0
+                if item is end:
+                    return
+                if isinstance(item, _StreamFailure):
+                    error = item.error
+                    self.logger.error(f"Error in coalesced stream: {error}")
+                    if not isinstance(error, StreamingError):
+                        raise StreamingError(f"Error in coalesced stream: {str(error)}") from error
+                    raise error
+                yield item
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
 class StreamTransformer(Generic[T]):
     """
     [Class intent]
@@ -537,6 +876,21 @@ class StreamTransformer(Generic[T]):
             raise
 
 
+class TaggedChunk(NamedTuple):
+    """
+    [Class intent]
+    Chunk of a combined stream labelled with the index of the stream it came from.
+    
+    [Design principles]
+    - Lets consumers route merged chunks back to their source model or tool
+    
+    [Implementation details]
+    - source is the position of the stream in the list given to StreamCombiner.combine
+    """
+    source: int
+    chunk: Any
+
+
 class StreamCombiner(Generic[T]):
     """
     [Class intent]
@@ -547,13 +901,20 @@ class StreamCombiner(Generic[T]):
     - Support for stream composition
     - Parallel processing of multiple sources
     - Consistent ordering options
+    - Bounded memory: a slow consumer slows the sources down instead of
+      letting their chunks pile up
     
     [Implementation details]
     - Takes multiple input streams
     - Creates new async generator with combined chunks
-    - Support for different combination strategies
+    - Unordered mode runs one long-lived pump task per source, each feeding its
+      own bounded asyncio.Queue, and serves the queues round-robin
+    - Any source error cancels the other pumps and is raised to the consumer
     """
     
+    # Default number of chunks buffered per source in unordered mode
+    DEFAULT_BUFFER_SIZE = 8
+    
     def __init__(self):
         """
         [Class method intent]
@@ -568,8 +929,10 @@ class StreamCombiner(Generic[T]):
         self.logger = logging.getLogger(self.__class__.__name__)
     
     async def combine(self, 
-                     streams: List[AsyncGenerator[T, None]], 
-                     ordered: bool = False) -> AsyncGenerator[T, None]:
+                     streams: List[AsyncIterable[T]], 
+                     ordered: bool = False,
+                     tag_source: bool = False,
+                     buffer_size: int = DEFAULT_BUFFER_SIZE) -> AsyncGenerator[Union[T, TaggedChunk], None]:
         """
         [Class method intent]
         Combine multiple streams into a single stream.
@@ -578,73 +941,97 @@ class StreamCombiner(Generic[T]):
         - Support for both ordered and unordered combination
         - Clean handling of multiple async iterators
         - Error propagation from any stream
+        - Fair interleaving: a fast source cannot starve the others
         
         [Implementation details]
-        - Uses gather for parallel processing if not ordered
+        - Uses one pump task per source if not ordered
         - Uses sequential processing if ordered
-        - Propagates errors from any stream
+        - Per-source queues of buffer_size chunks provide backpressure
+        - Sources are closed when the combined stream ends, fails or is closed
         
         Args:
             streams: List of input streams
             ordered: Whether to preserve order across streams
+            tag_source: Whether to yield TaggedChunk(source, chunk) instead of bare chunks
+            buffer_size: Maximum chunks buffered per source in unordered mode
             
         Yields:
-            T: Combined stream chunks
+            Union[T, TaggedChunk]: Combined stream chunks
+            
+        Raises:
+            StreamingError: If any source stream fails
         """
+        if buffer_size < 1:
+            raise ValueError(f"buffer_size must be at least 1, got {buffer_size}")
+        
         if ordered:
             # Process streams in order (sequential)
-            for stream in streams:
+            for index, stream in enumerate(streams):
                 try:
                     async for chunk in stream:
-                        yield chunk
+                        yield TaggedChunk(index, chunk) if tag_source else chunk
                 except Exception as e:
                     self.logger.error(f"Error in ordered stream: {e}")
                     if not isinstance(e, StreamingError):
                         raise StreamingError(f"Error in ordered stream: {str(e)}") from e
                     raise
-        else:
-            # Process streams in parallel using asyncio.as_completed
-            # Create tasks for each stream
-            pending = set()
-            
-            # Helper to process a single stream
-            async def process_stream(stream):
-                try:
-                    async for chunk in stream:
-                        yield chunk
-                except Exception as e:
-                    self.logger.error(f"Error in parallel stream: {e}")
-                    if not isinstance(e, StreamingError):
-                        raise StreamingError(f"Error in parallel stream: {str(e)}") from e
-                    raise
-                    
-            # Start all streams
-            for stream in streams:
-                task = asyncio.create_task(process_stream(stream).__anext__())
-                pending.add(task)
-                
-            # Process results as they complete
-            while pending:
-                done, pending = await asyncio.wait(
-                    pending, 
-                    return_when=asyncio.FIRST_COMPLETED
-                )
-                
-                for task in done:
+            return
+        
+        count = len(streams)
+        queues = [asyncio.Queue(maxsize=buffer_size) for _ in range(count)]
+        finished = [False] * count
+        failures: List[tuple] = []  # (source index, exception)
+        ready = asyncio.Event()
+        
+        async def pump(index: int, stream: AsyncIterable[T]) -> None:
+            queue = queues[index]
+            try:
+                async for chunk in stream:
+                    await queue.put(chunk)
+                    ready.set()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                failures.append((index, e))
+            finally:
+                finished[index] = True
+                ready.set()
+                aclose = getattr(stream, "aclose", None)
+                if aclose is not None:
                     try:
-                        result = task.result()
-                        yield result
-                        
-                        # Queue up the next chunk from this stream
-                        stream_idx = streams.index(task._coro.cr_frame.f_locals['self'])
-                        next_task = asyncio.create_task(process_stream(streams[stream_idx]).__anext__())
-                        pending.add(next_task)
-                    except StopAsyncIteration:
-                        # This stream is exhausted
+                        await aclose()
+                    except Exception:
                         pass
-                    except Exception as e:
-                        # Propagate errors
-                        self.logger.error(f"Error in parallel stream: {e}")
-                        if not isinstance(e, StreamingError):
-                            raise StreamingError(f"Error in parallel stream: {str(e)}") from e
-                        raise
+        
+        pumps = [asyncio.create_task(pump(index, stream)) for index, stream in enumerate(streams)]
+        next_source = 0
+        try:
+            while True:
+                if failures:
+                    index, error = failures[0]
+                    self.logger.error(f"Error in parallel stream {index}: {error}")
+                    if not isinstance(error, StreamingError):
+                        raise StreamingError(f"Error in parallel stream {index}: {str(error)}") from error
+                    raise error
+                
+                # Round-robin over the sources with buffered chunks
+                for offset in range(count):
+                    index = (next_source + offset) % count
+                    queue = queues[index]
+                    if not queue.empty():
+                        chunk = queue.get_nowait()
+                        next_source = index + 1
+                        break
+                else:
+                    if all(finished):
+                        return
+                    # No await between the scan and clear(): no wake-up can be lost
+                    ready.clear()
+                    await ready.wait()
+                    continue
+                
+                yield TaggedChunk(index, chunk) if tag_source else chunk
+        finally:
+            for task in pumps:
+                task.cancel()
+            await asyncio.gather(*pumps, return_exceptions=True)
@@ -0,0 +1,93 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the incremental JSON parser in json_stream.py.
+###############################################################################
+# [Source file design principles]
+# - Exercise arbitrary chunk boundaries, not only whole documents
+# - Cover early emission and early failure separately
+###############################################################################
+# [Source file constraints]
+# - Must not depend on any LLM service
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/llm/common/json_stream.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T12:40:00Z : Created incremental JSON parser tests by CodeAssistant
+# * Added chunk boundary, early emission, fallback and malformed structure tests
+###############################################################################
+
+"""
+Tests for the incremental JSON parser.
+"""
+
+import json
+
+import pytest
+
+from ..exceptions import MalformedStreamError
+from ..json_stream import IncrementalJSONParser, parse_json_document
+
+
+DOCUMENT = {
+    "changes": [
+        {"context_before": "a {\"}[", "original_text": "x\\y", "replacement_text": "z\n}"},
+        {"context_before": "<<SOF>>", "original_text": "", "replacement_text": "# header\n"},
+    ],
+    "changes_summary": {"functions_updated": 1},
+    "status": "success",
+    "messages": ["done ]"],
+}
+RESPONSE = "Here is the result:\n```json\n" + json.dumps(DOCUMENT, indent=2) + "\n```\n"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64, len(RESPONSE)])
+def test_chunked_stream_yields_document(chunk_size):
+    parser = IncrementalJSONParser("changes")
+    emitted = []
+    for start in range(0, len(RESPONSE), chunk_size):
+        emitted.extend(parser.feed(RESPONSE[start:start + chunk_size]))
+
+    assert emitted == DOCUMENT["changes"]
+    assert parser.complete
+    assert parser.finish() == DOCUMENT
+    assert parser.text == RESPONSE
+
+
+def test_elements_are_emitted_before_the_document_ends():
+    text = json.dumps(DOCUMENT)
+    cut = text.index("<<SOF>>")
+    parser = IncrementalJSONParser("changes")
+
+    assert parser.feed(text[:cut]) == DOCUMENT["changes"][:1]
+    assert parser.finish() is None
+
+
+def test_mismatched_bracket_raises_immediately():
+    parser = IncrementalJSONParser("changes")
+    with pytest.raises(MalformedStreamError):
+        parser.feed('{"changes": [{"context_before": "x"]')
+
+
+def test_element_repair_is_used_for_invalid_elements():
+    parser = IncrementalJSONParser("changes", repair=lambda text: text.replace("'", '"'))
+
+    assert parser.feed("{\"changes\": [{'original_text': 'x'}]}") == [{"original_text": "x"}]
+
+
+def test_parse_json_document_returns_none_without_object():
+    assert parse_json_document("no json here", "changes") is None
+    assert parse_json_document(RESPONSE, "changes") == DOCUMENT
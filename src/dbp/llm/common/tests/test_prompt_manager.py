@@ -0,0 +1,105 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for template compilation, the rendered prompt LRU cache and template
+# reloading in prompt_manager.py.
+###############################################################################
+# [Source file design principles]
+# - Templates are written to pytest temporary directories
+# - Cache behavior is checked through get_cache_stats, not internal structures
+###############################################################################
+# [Source file constraints]
+# - Must not depend on any LLM service
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/llm/common/prompt_manager.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T01:20:00Z : Added scalar cache key test by CodeAssistant
+# * Added test rendering equal scalars of different types
+# 2026-10-18T14:20:00Z : Created prompt manager tests by CodeAssistant
+# * Added rendering, LRU eviction and modification time reload tests
+###############################################################################
+
+"""
+Tests for the prompt manager.
+"""
+
+import os
+
+import pytest
+
+from ..exceptions import PromptRenderingError
+from ..prompt_manager import PromptManager
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    (tmp_path / "review.md").write_text("Review {{path}}:\n{{content}}\nEnd of {{path}}")
+    return tmp_path
+
+
+def test_render_substitutes_in_one_pass(prompts_dir):
+    manager = PromptManager(prompts_dir=str(prompts_dir))
+
+    rendered = manager.get_prompt("review", {"path": "a.py", "content": "x = '{{path}}'"})
+
+    assert rendered == "Review a.py:\nx = '{{path}}'\nEnd of a.py"
+    assert manager.get_required_variables("review") == {"path", "content"}
+    with pytest.raises(PromptRenderingError):
+        manager.get_prompt("review", {"path": "a.py"})
+
+
+@pytest.mark.parametrize("values", [(1, True, 1.0), (0, False, 0.0)])
+def test_equal_scalars_of_different_types_do_not_share_cache_entries(prompts_dir, values):
+    manager = PromptManager(prompts_dir=str(prompts_dir))
+
+    rendered = [manager.get_prompt("review", {"path": value, "content": ""}) for value in values]
+
+    assert rendered == [f"Review {value}:\n\nEnd of {value}" for value in values]
+    assert manager.get_cache_stats()["misses"] == len(values)
+
+
+def test_cache_is_lru_bounded_by_entries_and_bytes(prompts_dir):
+    manager = PromptManager(prompts_dir=str(prompts_dir), cache_size=2)
+    large = "y" * 500_000
+
+    first = manager.get_prompt("review", {"path": "a.py", "content": large})
+    manager.get_prompt("review", {"path": "b.py", "content": "b"})
+    assert manager.get_prompt("review", {"path": "a.py", "content": large}) is first
+    manager.get_prompt("review", {"path": "c.py", "content": "c"})
+
+    # b.py was the least recently used entry
+    manager.get_prompt("review", {"path": "a.py", "content": large})
+    manager.get_prompt("review", {"path": "b.py", "content": "b"})
+    assert manager.get_cache_stats()["hits"] == 2
+    assert manager.get_cache_stats()["misses"] == 4
+
+    manager.cache_max_bytes = 100_000
+    manager.get_prompt("review", {"path": "d.py", "content": large})
+    assert manager.get_cache_stats()["bytes"] <= 100_000
+
+
+def test_template_reloads_when_file_changes(prompts_dir):
+    manager = PromptManager(prompts_dir=str(prompts_dir))
+    assert manager.get_prompt("review", {"path": "a", "content": "b"}).startswith("Review")
+
+    template = prompts_dir / "review.md"
+    template.write_text("Check {{path}}")
+    stat = template.stat()
+    os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert manager.get_prompt("review", {"path": "a", "content": "b"}) == "Check a"
+    assert manager.get_required_variables("review") == {"path"}
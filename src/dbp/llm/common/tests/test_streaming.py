@@ -0,0 +1,199 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the stream utilities in streaming.py.
+###############################################################################
+# [Source file design principles]
+# - Sources are local async generators with controlled timing
+# - Fairness and backpressure are checked on observable ordering and counts
+###############################################################################
+# [Source file constraints]
+# - Must not depend on any LLM service
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/llm/common/streaming.py
+# system:pytest
+# system:pytest_asyncio
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T04:40:00Z : Added emulated provider mode test by CodeAssistant
+# * Added EmulatedTextStreamProvider single and chunked mode test
+# 2026-10-18T16:40:00Z : Added TextBuffer tests by CodeAssistant
+# * Added TextBuffer and keep_chunks tests
+# 2026-10-18T16:10:00Z : Added stream emulation and coalescing tests by CodeAssistant
+# * Added StreamEmulator single mode and memoryview chunking tests
+# * Added StreamCoalescer and TextStreamingResponse.text tests
+# 2026-10-18T15:40:00Z : Created streaming tests by CodeAssistant
+# * Added StreamCombiner fairness, backpressure, tagging and error tests
+###############################################################################
+
+"""
+Tests for the stream utilities.
+"""
+
+import asyncio
+
+import pytest
+
+from ..exceptions import StreamingError
+from ..streaming import (
+    EmulatedTextStreamProvider,
+    StreamCoalescer,
+    StreamCombiner,
+    StreamEmulator,
+    TaggedChunk,
+    TextBuffer,
+    TextStreamingResponse,
+)
+
+
+async def _source(name, count, produced=None, delay=0.0):
+    for i in range(count):
+        if produced is not None:
+            produced.append(i)
+        if delay:
+            await asyncio.sleep(delay)
+        yield f"{name}{i}"
+
+
+@pytest.mark.asyncio
+async def test_unordered_combine_is_fair_and_tagged():
+    combiner = StreamCombiner()
+    chunks = [chunk async for chunk in combiner.combine(
+        [_source("a", 100), _source("b", 3)], tag_source=True
+    )]
+
+    assert len(chunks) == 103
+    # The short source is not starved by the long one
+    assert [chunk.source for chunk in chunks[:6]] == [0, 1, 0, 1, 0, 1]
+    assert chunks[1] == TaggedChunk(1, "b0")
+
+
+@pytest.mark.asyncio
+async def test_unordered_combine_bounds_buffering_per_source():
+    combiner = StreamCombiner()
+    produced = []
+    combined = combiner.combine([_source("a", 1000, produced)], buffer_size=4)
+
+    consumed = 0
+    async for _ in combined:
+        consumed += 1
+        await asyncio.sleep(0)
+        assert len(produced) <= consumed + 4 + 1
+        if consumed == 20:
+            break
+    await combined.aclose()
+
+
+@pytest.mark.asyncio
+async def test_error_cancels_sibling_sources():
+    combiner = StreamCombiner()
+    closed = []
+
+    async def endless():
+        try:
+            while True:
+                await asyncio.sleep(0.001)
+                yield "tick"
+        finally:
+            closed.append(True)
+
+    async def failing():
+        yield "first"
+        raise RuntimeError("model failed")
+
+    with pytest.raises(StreamingError, match="stream 1"):
+        async for _ in combiner.combine([endless(), failing()]):
+            pass
+    assert closed == [True]
+
+
+@pytest.mark.asyncio
+async def test_emulator_single_mode_yields_whole_response_without_delay():
+    emulator = StreamEmulator(delay=10, mode=StreamEmulator.MODE_SINGLE)
+
+    chunks = [chunk async for chunk in emulator.emulate_stream("complete answer")]
+
+    assert chunks == [{"content": "complete answer", "stop_reason": "end_of_text"}]
+
+
+@pytest.mark.asyncio
+async def test_emulated_provider_defaults_to_single_mode():
+    single = EmulatedTextStreamProvider("complete answer", delay=10)
+    chunked = EmulatedTextStreamProvider("abcdef", chunk_size=4, delay=0, mode=StreamEmulator.MODE_CHUNKED)
+
+    assert [chunk async for chunk in single.stream()] == ["complete answer"]
+    assert [chunk async for chunk in chunked.stream()] == ["abcd", "ef"]
+
+
+@pytest.mark.asyncio
+async def test_emulator_chunks_bytes_as_memoryviews():
+    emulator = StreamEmulator(chunk_size=4, chunk_overlap=1, delay=0)
+    payload = b"0123456789"
+
+    chunks = [chunk async for chunk in emulator.emulate_stream(payload)]
+
+    assert all(isinstance(chunk["content"], memoryview) for chunk in chunks)
+    assert [bytes(chunk["content"]) for chunk in chunks] == [b"0123", b"3456", b"6789"]
+    assert chunks[-1]["stop_reason"] == "end_of_text"
+
+
+@pytest.mark.asyncio
+async def test_coalescer_merges_deltas_by_size_and_time():
+    async def deltas():
+        for token in ["ab", "cd", "ef", "gh"]:
+            yield token
+        yield {"tool_use": "scan"}
+        yield "ij"
+        # The source stalls: pending text must not wait for the next delta
+        await asyncio.sleep(0.2)
+        yield "kl"
+
+    coalescer = StreamCoalescer(min_chars=4, max_latency=0.02)
+    frames = [frame async for frame in coalescer.coalesce(deltas())]
+
+    assert frames == ["abcd", "efgh", {"tool_use": "scan"}, "ij", "kl"]
+
+
+def test_text_response_joins_each_chunk_once():
+    response = TextStreamingResponse()
+    response.append_chunk("Hello")
+    assert response.text == "Hello"
+    response.append_chunk(", world")
+    assert response.text == "Hello, world"
+    assert response.chunks == ["Hello", ", world"]
+
+
+def test_text_buffer_caches_join_and_takes_consumed_text():
+    buffer = TextBuffer("a")
+    buffer.append("b")
+    buffer.append("")
+    assert len(buffer) == 2
+    value = buffer.getvalue()
+    assert value == "ab"
+    assert buffer.getvalue() is value
+    buffer.append("c")
+    assert buffer.take() == "abc"
+    assert len(buffer) == 0 and buffer.getvalue() == ""
+    buffer.append("d")
+    assert str(buffer) == "d"
+
+
+def test_text_response_can_discard_chunks():
+    response = TextStreamingResponse(keep_chunks=False)
+    for token in ["a", "b", "c"]:
+        response.append_chunk(token)
+    response.mark_complete()
+    assert response.text == "abc"
+    assert response.chunks == []
@@ -0,0 +1,118 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for tool execution, sampled output validation, cached schema specs and
+# latency metrics in tool_registry.py.
+###############################################################################
+# [Source file design principles]
+# - Each test uses its own ToolRegistry, never the global singleton
+###############################################################################
+# [Source file constraints]
+# - Must not depend on any LLM service
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/metrics.py
+# codebase:src/dbp/llm/common/tool_registry.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T05:30:00Z : Tested tool latency export by CodeAssistant
+# * Checked that tool work latencies are exported by the metrics registry
+# 2026-10-18T15:00:00Z : Created tool registry tests by CodeAssistant
+# * Added input passing, output sampling, schema caching and metrics tests
+###############################################################################
+
+"""
+Tests for the tool registry.
+"""
+
+import pytest
+
+from ....core.metrics import render_prometheus
+from ..exceptions import ToolExecutionError
+from ..tool_registry import ToolRegistry
+
+
+INPUT_SCHEMA = {
+    "properties": {"path": {"type": "string"}, "limit": {"type": "integer"}, "options": {"type": "object"}},
+    "required": ["path"]
+}
+PATH_SCHEMA = {"properties": {"path": {"type": "string"}}, "required": ["path"]}
+OUTPUT_SCHEMA = {"properties": {"count": {"type": "integer"}}, "required": ["count"]}
+
+
+def test_execute_passes_validated_values_without_copies():
+    registry = ToolRegistry()
+    received = {}
+
+    def tool(path, limit, options):
+        received.update(path=path, limit=limit, options=options)
+        return {"count": 1}
+
+    registry.register_tool("scan", tool, "Scan files", INPUT_SCHEMA, OUTPUT_SCHEMA)
+    options = {"recursive": True}
+
+    assert registry.execute_tool("scan", path="a", options=options) == {"count": 1}
+    assert received["limit"] is None
+    assert received["options"] == options
+    with pytest.raises(ToolExecutionError):
+        registry.execute_tool("scan", limit=3)
+
+
+def test_output_validation_is_sampled_per_tool():
+    registry = ToolRegistry()
+    registry.register_tool("always", lambda path: {"count": "many"}, "d", PATH_SCHEMA, OUTPUT_SCHEMA)
+    registry.register_tool("sampled", lambda path: {"count": "many"}, "d", PATH_SCHEMA, OUTPUT_SCHEMA,
+                           output_sample_rate=0.25)
+
+    with pytest.raises(ToolExecutionError):
+        registry.execute_tool("always", path="a")
+
+    outcomes = []
+    for _ in range(8):
+        try:
+            registry.execute_tool("sampled", path="a")
+            outcomes.append("ok")
+        except ToolExecutionError:
+            outcomes.append("invalid")
+    assert outcomes.count("invalid") == 2
+
+
+def test_schema_spec_and_langchain_tools_are_cached_until_registry_changes():
+    registry = ToolRegistry()
+    registry.register_tool("scan", lambda path: {"count": 0}, "Scan files", PATH_SCHEMA, tags=["fs"])
+
+    assert registry.get_schema_spec("scan") is registry.get_schema_spec("scan")
+    tools = registry.get_langchain_tools(["fs"])
+    assert tools[0] is registry.get_langchain_tools(["fs"])[0]
+
+    registry.register_tool("read", lambda path: {"count": 0}, "Read files", PATH_SCHEMA, tags=["fs"])
+    assert [tool.name for tool in registry.get_langchain_tools(["fs"])] == ["read", "scan"]
+
+
+def test_metrics_separate_overhead_from_work():
+    # Latency histograms are process-wide, labelled by tool name
+    registry = ToolRegistry()
+    registry.register_tool("metered_scan", lambda path: {"count": 0}, "Scan files", PATH_SCHEMA)
+
+    for _ in range(5):
+        registry.execute_tool("metered_scan", path="a")
+    with pytest.raises(ToolExecutionError):
+        registry.execute_tool("metered_scan")
+
+    metrics = registry.get_tool_metrics("metered_scan")
+    assert metrics["work"]["count"] == 6
+    assert metrics["overhead"]["count"] == 6
+    assert metrics["errors"] == 1
+    assert 'dbp_llm_tool_work_seconds_count{tool="metered_scan"} 6.0' in render_prometheus().splitlines()
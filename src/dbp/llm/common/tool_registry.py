@@ -36,6 +36,7 @@
 ###############################################################################
 # [Dependencies]
 # codebase:src/dbp/llm/common/exceptions.py
+# codebase:src/dbp/core/metrics.py
 # system:typing
 # system:threading
 # system:pydantic
@@ -44,6 +45,13 @@
 # system:langchain_core
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T05:30:00Z : Recorded tool latencies in the metrics registry by CodeAssistant
+# * Overhead and work latencies go to the dbp_llm_tool_overhead_seconds and dbp_llm_tool_work_seconds histograms exported on /metrics
+# 2026-10-18T15:00:00Z : Added fast tool execution path by CodeAssistant
+# * Input and output validators are TypeAdapters compiled at registration
+# * Validated values are passed to tools without a model_dump() round trip
+# * Output validation can be sampled per tool with output_sample_rate
+# * Schema specs and LangChain tools are cached, per-tool overhead and work latency histograms
 # 2025-05-02T11:00:00Z : Enhanced for LangChain/LangGraph integration by CodeAssistant
 # * Added schema validation for inputs and outputs
 # * Added tool execution functionality with validation
@@ -61,8 +69,9 @@ import threading
 import inspect
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional, Union, Set, TypeVar, Type
-from pydantic import BaseModel, Field, ValidationError, create_model
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, Set, TypeVar, Type
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, create_model
 
 from langchain_core.tools import BaseTool as LangChainTool
 from langchain_core.tools import Tool
@@ -74,6 +83,7 @@ from .exceptions import (
     ToolExecutionError, 
     ConfigurationError
 )
+from ...core.metrics import LLM_TOOL_OVERHEAD_SECONDS, LLM_TOOL_WORK_SECONDS
 
 
 class ToolDefinition(BaseModel):
@@ -113,8 +123,9 @@ class ToolRegistry:
     
     [Implementation details]
     Uses a thread lock to ensure consistent state during concurrent operations.
-    Implements schema validation using Pydantic models.
+    Implements schema validation using Pydantic models compiled once per tool.
     Manages tool lifecycle from registration to execution.
+    Caches schema specs and LangChain tools until the set of tools changes.
     """
     
     def __init__(self):
@@ -130,6 +141,7 @@ class ToolRegistry:
         """
         self._tools: Dict[str, Dict[str, Any]] = {}  # name -> tool metadata
         self._tags: Dict[str, Set[str]] = {}  # tag -> tool names
+        self._langchain_tools_cache: Dict[Tuple[str, ...], List[Tool]] = {}  # tags -> tools
         self._lock = threading.RLock()
         self._logger = logging.getLogger(self.__class__.__name__)
     
@@ -142,6 +154,7 @@ class ToolRegistry:
         output_schema: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
         version: Optional[str] = None,
+        output_sample_rate: float = 1.0,
         **kwargs
     ) -> None:
         """
@@ -159,6 +172,7 @@ class ToolRegistry:
         - Creates Pydantic model for input validation
         - Stores tool metadata and implementation
         - Updates tag indices for efficient lookup
+        - Output validation can be sampled to keep it off the hot path
         
         Args:
             name: Unique name for the tool
@@ -168,11 +182,18 @@ class ToolRegistry:
             output_schema: Optional JSON Schema describing the tool's output
             tags: Optional list of tags for categorization
             version: Optional version string for the tool
+            output_sample_rate: Fraction of calls whose output is validated against
+                                output_schema (1.0 every call, 0.0 never)
             **kwargs: Additional metadata for the tool
             
         Raises:
             ToolRegistrationError: If registration fails
         """
+        if not 0.0 <= output_sample_rate <= 1.0:
+            raise ToolRegistrationError(
+                f"Invalid output_sample_rate for tool '{name}': {output_sample_rate}"
+            )
+        
         with self._lock:
             # Check if tool already exists
             if name in self._tools:
@@ -188,7 +209,16 @@ class ToolRegistry:
                     output_model = self._create_output_model(name, output_schema)
                 
                 # Create wrapped function that validates input/output
-                wrapped_func = self._create_validated_function(name, func, input_model, output_model)
+                metrics = {
+                    "overhead": LLM_TOOL_OVERHEAD_SECONDS.labels(tool=name),
+                    "work": LLM_TOOL_WORK_SECONDS.labels(tool=name),
+                    "errors": 0
+                }
+                wrapped_func = self._create_validated_function(
+                    name, func, input_model, output_model,
+                    output_sample_rate=output_sample_rate,
+                    metrics=metrics
+                )
                 
                 # Store tool metadata
                 self._tools[name] = {
@@ -201,8 +231,11 @@ class ToolRegistry:
                     "output_model": output_model,
                     "tags": tags or [],
                     "version": version or "1.0.0",
+                    "output_sample_rate": output_sample_rate,
+                    "metrics": metrics,
                     **kwargs
                 }
+                self._langchain_tools_cache.clear()
                 
                 # Update tag indices
                 if tags:
@@ -338,7 +371,9 @@ class ToolRegistry:
         name: str, 
         func: Callable, 
         input_model: Type[BaseModel],
-        output_model: Optional[Type[BaseModel]]
+        output_model: Optional[Type[BaseModel]],
+        output_sample_rate: float = 1.0,
+        metrics: Optional[Dict[str, Any]] = None
     ) -> Callable:
         """
         [Class method intent]
@@ -348,11 +383,17 @@ class ToolRegistry:
         - Automatic validation of inputs and outputs
         - Clean error reporting
         - Transparent to function implementation
+        - Validation cost paid at registration where possible, not per call
         
         [Implementation details]
         - Creates wrapper around original function
-        - Validates input against input model
-        - Validates output against output model if provided
+        - Input and output validators are TypeAdapters built once here
+        - Validated field values are passed to the function as they are, without
+          a model_dump() round trip
+        - Output is validated on every call or on a sampled subset of calls; the
+          function's own result is returned once validation passes
+        - Records tool overhead (validation and wrapping) and tool work (the
+          function itself) separately in the metrics histograms
         - Propagates errors with clear messages
         
         Args:
@@ -360,42 +401,64 @@ class ToolRegistry:
             func: Original function implementing the tool
             input_model: Pydantic model for input validation
             output_model: Optional Pydantic model for output validation
+            output_sample_rate: Fraction of calls whose output is validated
+            metrics: Optional dict with "overhead" and "work" histograms and an "errors" count
             
         Returns:
             Callable: Wrapped function with validation
         """
+        validate_input = TypeAdapter(input_model).validate_python
+        validate_output = None
+        if output_model is not None and output_sample_rate > 0:
+            validate_output = TypeAdapter(output_model).validate_python
+        # Validate every Nth call, deterministic and cheaper than a random draw
+        sample_interval = max(1, round(1 / output_sample_rate)) if output_sample_rate > 0 else 0
+        call_counter = [0]
+        clock = time.perf_counter
+        
         def validated_func(**kwargs):
+            started = clock()
+            work = 0.0
             try:
                 # Validate input
                 try:
-                    validated_input = input_model(**kwargs)
+                    validated_input = validate_input(kwargs)
                 except ValidationError as e:
                     raise ToolExecutionError(f"Invalid input for tool '{name}': {str(e)}")
                 
                 # Call original function
+                work_started = clock()
                 try:
-                    result = func(**validated_input.model_dump())
+                    result = func(**vars(validated_input))
                 except Exception as e:
                     raise ToolExecutionError(f"Error executing tool '{name}': {str(e)}")
+                finally:
+                    work = clock() - work_started
                 
-                # Validate output if model provided
-                if output_model is not None:
-                    try:
-                        if isinstance(result, dict):
-                            validated_output = output_model(**result)
-                            return validated_output.model_dump()
-                        else:
+                # Validate output if model provided and this call is sampled
+                if validate_output is not None:
+                    call_counter[0] += 1
+                    if call_counter[0] % sample_interval == 0:
+                        if not isinstance(result, dict):
                             raise ToolExecutionError(
                                 f"Tool '{name}' returned {type(result).__name__}, expected dict"
                             )
-                    except ValidationError as e:
-                        raise ToolExecutionError(f"Invalid output from tool '{name}': {str(e)}")
+                        try:
+                            validate_output(result)
+                        except ValidationError as e:
+                            raise ToolExecutionError(f"Invalid output from tool '{name}': {str(e)}")
                 
                 return result
             except Exception as e:
+                if metrics is not None:
+                    metrics["errors"] += 1
                 if isinstance(e, ToolExecutionError):
                     raise e
                 raise ToolExecutionError(f"Error in tool '{name}': {str(e)}")
+            finally:
+                if metrics is not None:
+                    metrics["work"].observe(work)
+                    metrics["overhead"].observe(clock() - started - work)
         
         # Copy function metadata
         validated_func.__name__ = func.__name__
@@ -442,6 +505,7 @@ class ToolRegistry:
             
             # Remove from main registry
             del self._tools[name]
+            self._langchain_tools_cache.clear()
             
             self._logger.info(f"Unregistered tool '{name}'")
     
@@ -576,7 +640,7 @@ class ToolRegistry:
         - Clear error reporting
         
         [Implementation details]
-        - Gets tool by name
+        - Gets tool by name with a lock-free dictionary lookup
         - Executes wrapped function with validation
         - Propagates errors with clear context
         
@@ -591,8 +655,10 @@ class ToolRegistry:
             ToolNotFoundError: If the tool does not exist
             ToolExecutionError: If execution fails
         """
-        # Get tool
-        tool = self.get_tool(name)
+        # Get tool (a single dict lookup is atomic, no lock needed on the hot path)
+        tool = self._tools.get(name)
+        if tool is None:
+            raise ToolNotFoundError(f"Tool '{name}' is not registered")
         
         # Execute function
         try:
@@ -614,7 +680,8 @@ class ToolRegistry:
         
         [Implementation details]
         - Gets tool by name
-        - Creates LangChain Tool with appropriate parameters
+        - Creates LangChain Tool with appropriate parameters on first use and
+          keeps it in the tool metadata
         - Preserves description and schema information
         
         Args:
@@ -630,12 +697,16 @@ class ToolRegistry:
         tool_info = self.get_tool(name)
         
         # Convert to LangChain Tool
-        return Tool(
-            name=name,
-            description=tool_info["description"],
-            func=tool_info["func"],
-            args_schema=tool_info["input_model"]
-        )
+        langchain_tool = tool_info.get("langchain_tool")
+        if langchain_tool is None:
+            langchain_tool = Tool(
+                name=name,
+                description=tool_info["description"],
+                func=tool_info["func"],
+                args_schema=tool_info["input_model"]
+            )
+            tool_info["langchain_tool"] = langchain_tool
+        return langchain_tool
     
     def get_langchain_tools(self, tags: Optional[List[str]] = None) -> List[Tool]:
         """
@@ -651,6 +722,7 @@ class ToolRegistry:
         - Optionally filters tools by tags
         - Converts each tool to LangChain format
         - Sorts by name for consistent ordering
+        - Result is cached per tag selection until a tool is registered or removed
         
         Args:
             tags: Optional list of tags to filter tools
@@ -658,19 +730,26 @@ class ToolRegistry:
         Returns:
             List[Tool]: List of LangChain Tool instances
         """
-        # Get tool names
-        if tags:
-            # Find tools with ANY of the specified tags
-            tool_names = set()
-            for tag in tags:
-                tool_names.update(self._tags.get(tag, set()))
-            tool_names = sorted(tool_names)
-        else:
-            with self._lock:
+        cache_key = tuple(sorted(set(tags))) if tags else ()
+        with self._lock:
+            cached = self._langchain_tools_cache.get(cache_key)
+            if cached is not None:
+                return list(cached)
+            
+            # Get tool names
+            if tags:
+                # Find tools with ANY of the specified tags
+                tool_names = set()
+                for tag in tags:
+                    tool_names.update(self._tags.get(tag, set()))
+                tool_names = sorted(tool_names)
+            else:
                 tool_names = sorted(self._tools.keys())
-        
-        # Convert each tool to LangChain format
-        return [self.as_langchain_tool(name) for name in tool_names]
+            
+            # Convert each tool to LangChain format
+            tools = [self.as_langchain_tool(name) for name in tool_names]
+            self._langchain_tools_cache[cache_key] = tools
+            return list(tools)
     
     def get_schema_spec(self, name: str) -> Dict[str, Any]:
         """
@@ -686,6 +765,8 @@ class ToolRegistry:
         - Formats tool schema in OpenAPI-compatible format
         - Includes all parameters and type information
         - Compatible with LLM function calling
+        - Built once per tool and kept in the tool metadata; callers must not
+          modify the returned dictionary
         
         Args:
             name: Name of the tool to get schema for
@@ -700,14 +781,46 @@ class ToolRegistry:
         tool_info = self.get_tool(name)
         
         # Create schema spec
-        return {
-            "name": name,
-            "description": tool_info["description"],
-            "parameters": {
-                "type": "object",
-                "properties": tool_info["input_schema"].get("properties", {}),
-                "required": tool_info["input_schema"].get("required", [])
+        schema_spec = tool_info.get("schema_spec")
+        if schema_spec is None:
+            schema_spec = {
+                "name": name,
+                "description": tool_info["description"],
+                "parameters": {
+                    "type": "object",
+                    "properties": tool_info["input_schema"].get("properties", {}),
+                    "required": tool_info["input_schema"].get("required", [])
+                }
             }
+            tool_info["schema_spec"] = schema_spec
+        return schema_spec
+    
+    def get_tool_metrics(self, name: str) -> Dict[str, Any]:
+        """
+        [Class method intent]
+        Get the execution latency metrics of a tool.
+        
+        [Design principles]
+        - Separate tool overhead (validation, wrapping) from tool work
+        
+        [Implementation details]
+        - Summaries come from the tool's histograms of the process metrics
+          registry, which also exports them on /metrics
+        
+        Args:
+            name: Name of the tool
+            
+        Returns:
+            Dict[str, Any]: "overhead" and "work" histogram summaries and the error count
+            
+        Raises:
+            ToolNotFoundError: If the tool does not exist
+        """
+        metrics = self.get_tool(name)["metrics"]
+        return {
+            "overhead": metrics["overhead"].summary(),
+            "work": metrics["work"].summary(),
+            "errors": metrics["errors"]
         }
     
     def clear(self) -> None:
@@ -724,6 +837,7 @@ class ToolRegistry:
         with self._lock:
             self._tools.clear()
             self._tags.clear()
+            self._langchain_tools_cache.clear()
 
 
 class LangChainToolAdapter:
@@ -33,6 +33,7 @@
 # codebase:src/dbp/core/component.py
 # codebase:src/dbp/llm/common/base.py
 # codebase:src/dbp/llm/common/config_registry.py
+# codebase:src/dbp/llm/common/streaming.py
 # codebase:src/dbp/llm/common/tool_registry.py
 # codebase:src/dbp/llm/langgraph/builder.py
 # codebase:src/dbp/llm/langgraph/nodes.py
@@ -42,6 +43,8 @@
 # system:typing
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T16:40:00Z : Used TextBuffer for non-streaming general queries by CodeAssistant
+# * execute_general_query accumulates text deltas as they arrive without keeping the chunks
 # 2025-05-02T11:38:00Z : Initial creation for LangChain/LangGraph integration by CodeAssistant
 # * Created AgentManager component for LLM coordination
 # * Added model client management and initialization
@@ -60,6 +63,7 @@ from typing import Dict, Any, List, Optional, AsyncIterator, Union
 from src.dbp.core.component import Component
 from src.dbp.llm.common.base import ModelClientBase
 from src.dbp.llm.common.config_registry import ConfigRegistry
+from src.dbp.llm.common.streaming import TextBuffer
 from src.dbp.llm.common.tool_registry import ToolRegistry
 from src.dbp.llm.langgraph.builder import GraphBuilder
 from src.dbp.llm.langgraph.nodes import create_agent_node, create_router_node, create_tool_node
@@ -322,24 +326,20 @@ class AgentManager(Component):
                 ]):
                     yield chunk
             else:
-                # For non-streaming, collect response
-                response_chunks = []
+                # For non-streaming, accumulate the text as it arrives
+                # without keeping the chunks
+                combined_text = TextBuffer()
                 async for chunk in model_client.stream_chat([
                     {"role": "system", "content": system_message},
                     {"role": "user", "content": query}
                 ]):
-                    response_chunks.append(chunk)
-                    
-                # Combine chunks for complete response
-                combined_text = ""
-                for chunk in response_chunks:
                     if "delta" in chunk and "text" in chunk["delta"]:
-                        combined_text += chunk["delta"]["text"]
+                        combined_text.append(chunk["delta"]["text"])
                         
                 # Return complete response
                 yield {
                     "type": "complete_response",
-                    "content": combined_text
+                    "content": combined_text.getvalue()
                 }
         except ModelNotAvailableError as e:
             # Re-raise model errors
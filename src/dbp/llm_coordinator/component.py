@@ -40,6 +40,10 @@
 # system:typing
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T05:00:00Z : Kept LlmCoordinatorComponent in the critical tier by CodeAssistant
+# * Removed deferrable: the general query tool is registered by initialization and must exist once the server accepts requests
+# 2026-10-18T20:40:00Z : Declared LlmCoordinatorComponent deferrable by CodeAssistant
+# * Bedrock discovery runs in the background initialization tier
 # 2025-05-02T11:42:00Z : Initial creation for LangChain/LangGraph integration by CodeAssistant
 # * Created LlmCoordinatorComponent for LLM functionality orchestration
 # * Added integration with MCP server for external tool access
@@ -81,6 +85,10 @@ class LlmCoordinatorComponent(Component):
     - Provides clean startup and shutdown
     """
     
+    # Not deferrable: GeneralQueryTool needs the agent manager created during
+    # initialization, deferring it would leave the tool unregistered while warming up
+    deferrable = False
+    
     def __init__(
         self,
         config: Dict[str, Any] = None,
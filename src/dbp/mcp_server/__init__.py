@@ -30,6 +30,8 @@
 # codebase:- doc/design/LLM_COORDINATION.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T03:10:00Z : Imported ComponentNotInitializedError from core.exceptions by CodeAssistant
+# * component.py no longer imports the exception
 # 2025-04-27T01:43:00Z : Fixed import statements for MCPTool and MCPResource by CodeAssistant
 # * Updated import to use mcp_tool.py and mcp_resource.py instead of non-existent mcp_protocols.py
 # * Fixed ModuleNotFoundError that was preventing server startup
@@ -66,7 +68,8 @@ from .auth import AuthenticationProvider, AuthenticationError, AuthorizationErro
 from .error_handler import ErrorHandler
 from .adapter import SystemComponentAdapter, ComponentNotFoundError
 from .server import MCPServer # Placeholder server class
-from .component import MCPServerComponent, ComponentNotInitializedError
+from .component import MCPServerComponent
+from ..core.exceptions import ComponentNotInitializedError
 # Concrete resources are likely internal details, but can be exposed if needed
 # from .resources import DocumentationResource, ...
 
@@ -92,6 +95,6 @@ __all__ = [
     "AuthenticationError",
     "AuthorizationError",
     "ComponentNotFoundError", # From adapter
-    "ComponentNotInitializedError", # From component
+    "ComponentNotInitializedError", # From core.exceptions
     # Add ToolExecutionError, ResourceAccessError etc. if defined and needed
 ]
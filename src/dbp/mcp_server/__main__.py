@@ -37,6 +37,10 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T22:10:00Z : Started heartbeat monitor after initialization by CodeAssistant
+# * The heartbeat monitor replaces the initialization watchdog once components are started, stopped before shutdown
+# 2026-10-18T16:40:00Z : Added --workers option by CodeAssistant
+# * Added --workers argument forwarded to mcp_server.workers
 # 2025-04-29T07:44:00Z : Enhanced error logging to display stacktraces at CRITICAL level by CodeAssistant
 # * Added stacktrace logging for ImportError exceptions at CRITICAL log level
 # * Improved error visibility by displaying full exception context in logs
@@ -47,11 +51,6 @@
 # * Server status is now detected solely through health API checks
 # * Simplified server startup process to eliminate file-based coordination
 # * Improved reliability by removing file operation dependencies
-# 2025-04-25T15:15:00Z : Fixed missing keep_alive import causing startup failure by CodeAssistant
-# * Added explicit import for keep_alive() function in main() method
-# * Fixed UnboundLocalError during server startup
-# * Ensured proper watchdog operation during initialization
-# 2025-04-25T14:48:00Z : Modified watchdog behavior to disable after successful component initialization by CodeAssistant
 ###############################################################################
 
 import argparse
@@ -266,6 +265,7 @@ def parse_arguments() -> argparse.Namespace:
         watchdog_timeout = typed_config.initialization.watchdog_timeout
         server_host = typed_config.mcp_server.host
         server_port = typed_config.mcp_server.port
+        server_workers = typed_config.mcp_server.workers
         
     except Exception as e:
         error_msg = f"Failed to get default values from ConfigurationManager: {str(e)}"
@@ -281,6 +281,9 @@ def parse_arguments() -> argparse.Namespace:
                         help=f'Host address to bind to (default: {server_host})')
     parser.add_argument('--port', type=int, default=server_port,
                         help=f'Port number to listen on (default: {server_port})')
+    parser.add_argument('--workers', type=int, default=server_workers,
+                        help=f'Number of request worker processes, stateful components stay in the '
+                             f'coordinator process (default: {server_workers})')
     parser.add_argument('--log-level', type=str, default='info',
                         choices=['debug', 'info', 'warning', 'error'],
                         help='Logging level')
@@ -390,7 +393,7 @@ def main() -> int:
             from ..core.lifecycle import LifecycleManager
             
             # Create CLI args for the lifecycle manager
-            cli_args = []
+            cli_args = [f"--mcp_server.workers={args.workers}"]
             
             
             # Create and initialize the lifecycle manager
@@ -433,9 +436,13 @@ def main() -> int:
             logger.info("Component initialization completed successfully")
 
             # Disable the watchdog now that all components have started successfully
-            from ..core.watchdog import stop_watchdog
+            from ..core.watchdog import stop_watchdog, start_heartbeat_monitor
             stop_watchdog()
             logger.info("Watchdog disabled after successful component initialization")
+            
+            # Watch the heartbeats of the running subsystems instead
+            from ..config.config_manager import ConfigurationManager
+            heartbeat_monitor = start_heartbeat_monitor(ConfigurationManager().get_typed_config().watchdog)
                 
             # Access the MCP server component directly to start the server
             # (since LifecycleManager doesn't do that automatically)
@@ -452,7 +459,9 @@ def main() -> int:
                 return 1
             
             
-            # Wait for the server to exit (this should block until server exit)
+            # Wait for the server to exit (this should block until server exit).
+            # In multi-worker mode this forks the request workers from the fully
+            # initialized process and supervises them.
             logger.info("MCP server running...")
             try:
                 component.wait_for_server_exit()
@@ -466,6 +475,7 @@ def main() -> int:
             finally:
                 # Shutdown gracefully
                 logger.info("Shutting down MCP server...")
+                heartbeat_monitor.stop()
                 try:
                     # Re-enable watchdog for shutdown process to detect potential deadlocks
                     from ..core.watchdog import start_watchdog, keep_alive
@@ -21,8 +21,11 @@
 # - Loads API keys and permissions from the MCPServerConfig.
 # - Provides methods to authenticate a request (based on headers) and authorize
 #   an action (based on resource and action strings).
-# - Uses a dictionary for efficient API key lookup.
-# - Implements basic wildcard permission checking (*).
+# - Stores keyed digests of the API keys, never the keys: lookup by digest in a
+#   dictionary, confirmed with a constant-time comparison.
+# - Implements basic wildcard permission checking (*), with decisions cached
+#   per client and (resource, action).
+# - Nothing is logged on the successful request path.
 # - Design Decision: API Key Authentication (2025-04-15)
 #   * Rationale: Simple and common method for securing server-to-server APIs like MCP.
 #   * Alternatives considered: OAuth (more complex), No auth (insecure).
@@ -44,6 +47,12 @@
 # other:- src/dbp/mcp_server/data_models.py (MCPRequest)
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T21:40:00Z : Switched debug and info logging to lazy formatting by CodeAssistant
+# * Replaced f-string messages of debug and info calls with %-style arguments, formatted only when the level is enabled
+# 2026-10-18T19:10:00Z : Hashed key store and cached authorization by CodeAssistant
+# * API keys are stored as HMAC-SHA256 digests computed once at load time and compared in constant time
+# * Authorization decisions are cached per client and (resource, action)
+# * Removed per-request INFO and DEBUG logging from the authentication and authorization hot path
 # 2025-04-15T16:40:59Z : Updated auth to use centralized exceptions by CodeAssistant
 # * Modified imports to use AuthenticationError and AuthorizationError from exceptions module
 # * Removed local exception class definitions
@@ -51,8 +60,12 @@
 # * Implemented API key loading, authentication, and authorization logic.
 ###############################################################################
 
+import hashlib
+import hmac
 import logging
-from typing import Dict, Optional, Any, List
+import os
+import threading
+from typing import Dict, FrozenSet, Optional, Any, List, Tuple
 
 # Assuming necessary imports
 try:
@@ -71,10 +84,65 @@ except ImportError as e:
 logger = logging.getLogger(__name__)
 
 
+# Authorization decisions cached per client before its cache is reset
+DECISION_CACHE_SIZE = 4096
+
+
+class _ClientAuth:
+    """
+    Authentication entry of one API key: the key digest, the client identity
+    and its compiled permissions with cached authorization decisions.
+    """
+
+    __slots__ = ("digest", "client_id", "permissions", "_decisions", "_lock")
+
+    def __init__(self, digest: bytes, client_id: str, permissions: FrozenSet[str]):
+        self.digest = digest
+        self.client_id = client_id
+        self.permissions = permissions
+        self._decisions: Dict[Tuple[str, str, str], bool] = {}
+        self._lock = threading.Lock()
+
+    def allows(self, resource_type: str, resource_name: str, action: str) -> bool:
+        """
+        Returns the cached decision for a (resource, action) pair, evaluating
+        the permissions on first use.
+        """
+        key = (resource_type, resource_name, action)
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = permissions_allow(self.permissions, resource_type, resource_name, action)
+            with self._lock:
+                if len(self._decisions) >= DECISION_CACHE_SIZE:
+                    self._decisions.clear()
+                self._decisions[key] = decision
+        return decision
+
+
+def permissions_allow(permissions: FrozenSet[str], resource_type: str, resource_name: str, action: str) -> bool:
+    """
+    Checks a permission set against a required permission, in order of
+    specificity: exact, wildcard action, wildcard resource, wildcard resource
+    and action, global wildcard.
+    """
+    return (
+        f"{resource_type}:{resource_name}:{action}" in permissions
+        or f"{resource_type}:{resource_name}:*" in permissions
+        or f"{resource_type}:*:{action}" in permissions
+        or f"{resource_type}:*:*" in permissions
+        or "*:*:*" in permissions
+    )
+
+
 class AuthenticationProvider:
     """
     Handles authentication and authorization for MCP requests based on API keys
     defined in the configuration.
+
+    API keys are not kept: each configured key is stored as a keyed digest
+    (HMAC-SHA256 with a per-process secret), computed once at load time. A
+    request costs one digest of the presented key, a dict lookup and a
+    constant-time comparison; authorization is a cached per-client decision.
     """
 
     def __init__(self, config: MCPServerConfig, logger_override: Optional[logging.Logger] = None):
@@ -87,11 +155,17 @@ class AuthenticationProvider:
         """
         self.config = config or {} # Use empty dict if config is None
         self.logger = logger_override or logger
-        # Stores API key -> {"client_id": str, "permissions": Set[str]}
-        self._api_keys: Dict[str, Dict[str, Any]] = {}
+        self._digest_key = os.urandom(32)
+        # Stores key digest -> client entry, and client_id -> client entry
+        self._clients_by_digest: Dict[bytes, _ClientAuth] = {}
+        self._clients_by_id: Dict[str, _ClientAuth] = {}
         self._load_api_keys()
         self.logger.debug("AuthenticationProvider initialized.")
 
+    def _digest(self, api_key: str) -> bytes:
+        """Computes the keyed digest identifying an API key."""
+        return hmac.new(self._digest_key, api_key.encode("utf-8"), hashlib.sha256).digest()
+
     def _load_api_keys(self):
         """Loads and processes API keys from the configuration."""
         api_key_entries = getattr(self.config, 'api_keys', [])
@@ -107,19 +181,23 @@ class AuthenticationProvider:
              permissions = getattr(entry, 'permissions', [])
 
              if not key or not client_id:
-                  self.logger.warning(f"Skipping invalid API key entry in config: {entry}")
+                  self.logger.warning(f"Skipping invalid API key entry for client '{client_id}' in config.")
                   continue
 
-             if key in self._api_keys:
-                  self.logger.warning(f"Duplicate API key found in configuration: '{key}'. Overwriting previous entry.")
+             digest = self._digest(key)
+             if digest in self._clients_by_digest:
+                  self.logger.warning(f"Duplicate API key found in configuration for client '{client_id}'. Overwriting previous entry.")
 
-             # Store permissions as a set for efficient lookup
-             self._api_keys[key] = {
-                 "client_id": client_id,
-                 "permissions": set(permissions) if isinstance(permissions, list) else set()
-             }
+             # Store permissions as a frozen set for efficient lookup
+             client = _ClientAuth(
+                 digest,
+                 client_id,
+                 frozenset(permissions) if isinstance(permissions, list) else frozenset()
+             )
+             self._clients_by_digest[digest] = client
+             self._clients_by_id[client_id] = client
              count += 1
-        self.logger.info(f"Loaded {count} API keys from configuration.")
+        self.logger.info("Loaded %s API keys from configuration.", count)
 
     def authenticate(self, request: MCPRequest) -> Optional[Dict[str, Any]]:
         """
@@ -133,7 +211,6 @@ class AuthenticationProvider:
             if successful, otherwise None.
         """
         if not getattr(self.config, 'auth_enabled', False):
-            self.logger.debug("Authentication is disabled. Skipping check.")
             # Return a default context indicating no authentication? Or None?
             # Returning None might imply failure, let's return a default context.
             return {"client_id": "anonymous", "permissions": set(["*:*"])} # Grant all permissions if auth disabled
@@ -146,14 +223,14 @@ class AuthenticationProvider:
             self.logger.warning("Authentication failed: Missing 'X-API-Key' header.")
             return None
 
-        key_info = self._api_keys.get(api_key)
-        if not key_info:
-            self.logger.warning(f"Authentication failed: Invalid API key provided (Key ending: ...{api_key[-4:] if len(api_key) > 4 else api_key}).")
+        digest = self._digest(api_key)
+        client = self._clients_by_digest.get(digest)
+        if client is None or not hmac.compare_digest(client.digest, digest):
+            self.logger.warning("Authentication failed: Invalid API key provided.")
             return None
 
-        self.logger.info(f"Authentication successful for client: {key_info['client_id']}")
-        # Return a copy to prevent modification
-        return key_info.copy()
+        # The permissions are immutable and shared, authorize() recognizes them
+        return {"client_id": client.client_id, "permissions": client.permissions}
 
     def authorize(self, auth_context: Optional[Dict[str, Any]], resource_type: str, resource_name: str, action: str = "execute") -> bool:
         """
@@ -170,7 +247,6 @@ class AuthenticationProvider:
             True if authorized, False otherwise.
         """
         if not getattr(self.config, 'auth_enabled', False):
-            self.logger.debug("Authorization is disabled. Granting access.")
             return True # Grant access if auth is disabled
 
         if not auth_context:
@@ -178,34 +254,14 @@ class AuthenticationProvider:
             return False
 
         client_id = auth_context.get("client_id", "unknown")
-        permissions = auth_context.get("permissions", set())
-        if not isinstance(permissions, set): # Ensure it's a set
-             permissions = set(permissions)
-
-        # Construct required permission strings to check
-        required_permission = f"{resource_type}:{resource_name}:{action}"
-        wildcard_action = f"{resource_type}:{resource_name}:*"
-        wildcard_resource = f"{resource_type}:*:{action}" # Less common, but possible
-        wildcard_resource_action = f"{resource_type}:*:*"
-        global_permission = "*:*:*" # Super admin
-
-        # Check permissions in order of specificity
-        if required_permission in permissions:
-            self.logger.debug(f"Authorization granted for '{client_id}' on '{required_permission}' (exact match).")
-            return True
-        if wildcard_action in permissions:
-            self.logger.debug(f"Authorization granted for '{client_id}' on '{required_permission}' (wildcard action match: {wildcard_action}).")
-            return True
-        if wildcard_resource in permissions:
-             self.logger.debug(f"Authorization granted for '{client_id}' on '{required_permission}' (wildcard resource match: {wildcard_resource}).")
-             return True
-        if wildcard_resource_action in permissions:
-             self.logger.debug(f"Authorization granted for '{client_id}' on '{required_permission}' (wildcard resource type match: {wildcard_resource_action}).")
-             return True
-        if global_permission in permissions:
-            self.logger.debug(f"Authorization granted for '{client_id}' on '{required_permission}' (global wildcard match: {global_permission}).")
-            return True
-
-        # If no matching permission found
-        self.logger.warning(f"Authorization failed: Client '{client_id}' lacks permission for '{required_permission}'. Available: {permissions}")
-        return False
+        permissions = auth_context.get("permissions", frozenset())
+        client = self._clients_by_id.get(client_id)
+        if client is not None and permissions is client.permissions:
+            # Context issued by authenticate(): cached decision
+            allowed = client.allows(resource_type, resource_name, action)
+        else:
+            allowed = permissions_allow(frozenset(permissions), resource_type, resource_name, action)
+
+        if not allowed:
+            self.logger.warning(f"Authorization failed: Client '{client_id}' lacks permission for '{resource_type}:{resource_name}:{action}'.")
+        return allowed
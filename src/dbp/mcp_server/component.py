@@ -36,44 +36,40 @@
 # codebase:src/dbp/core/fs_utils.py
 # codebase:src/dbp/config/config_manager.py
 # codebase:src/dbp/mcp_server/server.py
+# codebase:src/dbp/mcp_server/execution.py
+# codebase:src/dbp/mcp_server/result_cache.py
 # system:fastmcp
 ###############################################################################
 # [GenAI tool change history]
-# 2025-04-27T17:26:00Z : Updated ComponentNotInitializedError import by CodeAssistant
-# * Removed local ComponentNotInitializedError class definition
-# * Added import for ComponentNotInitializedError from core.exceptions
-# * Improved code organization by using centralized exception definitions
-# 2025-04-27T00:16:00Z : Replaced homemade MCP implementation with FastMCP by CodeAssistant
-# * Completely replaced the homemade MCP implementation with FastMCP
-# * Removed register_mcp_tool and register_mcp_resource methods
-# * Modified component to use MCPServer class from server.py
-# * Added wait_for_server_exit() method for __main__.py
-# * Removed start_server() method
-# * Simplified component implementation
-# 2025-04-26T02:05:00Z : Removed _register_resources method by CodeAssistant
-# * Removed _register_resources method as resources are registered by external components
-# * Updated initialization to no longer call _register_resources
-# * Made code more compliant with the distributed MCP resource registration concept
-# 2025-04-26T02:00:00Z : Removed _register_tools method by CodeAssistant
-# * Removed _register_tools method as it's not needed - tools are registered by external components
-# * Updated initialization to no longer call _register_tools
-# * Made code more compliant with the distributed MCP tool registration concept
+# 2026-10-19T04:20:00Z : Attached stateful components to the coordinator channel by CodeAssistant
+# * fs_monitor and database register their operations on the coordinator channel before the workers are forked
+# 2026-10-19T03:10:00Z : Removed unused import by CodeAssistant
+# * Removed the unused ComponentNotInitializedError import
+# 2026-10-19T03:00:00Z : Unregistered unused result cache watches by CodeAssistant
+# * Unregistered the ResultCacheInvalidator of a path no cached result depends on
+# 2026-10-18T23:10:00Z : Passed profiler settings to MCPServer by CodeAssistant
+# * Forwarded profiler output_dir, sample_interval_ms and max_duration_seconds
 ###############################################################################
 
 import logging
 import os
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
 
 # Core component imports
 from ..core.component import Component, InitializationContext
 from ..core.fs_utils import ensure_directories_exist
-from ..core.exceptions import ComponentNotInitializedError
+from ..core.exceptions import ComponentError
 
 # Import MCPServer class
 from .server import MCPServer
+from .execution import configure_tool_executor, get_tool_executor
+from .result_cache import ResultCacheInvalidator, configure_result_cache, get_result_cache
 
 logger = logging.getLogger(__name__)
 
+# Components whose operations run in the coordinator process of a multi-worker server
+STATEFUL_COMPONENTS = ("fs_monitor", "database")
+
 class MCPServerComponent(Component):
     """
     [Class intent]
@@ -91,9 +87,14 @@ class MCPServerComponent(Component):
     - Creates and manages MCPServer instance
     - Handles component lifecycle
     - Provides methods for server management
+    - Subscribes the result cache to fs_monitor events on the files cached
+      results depend on, looked up when the first dependency is reported
+      since fs_monitor may initialize after this component
     """
     _initialized: bool = False
     _server: Optional[MCPServer] = None
+    _context: Optional[InitializationContext] = None
+    _result_cache_watches: Optional[Dict[str, Any]] = None
 
     @property
     def name(self) -> str:
@@ -180,6 +181,23 @@ class MCPServerComponent(Component):
                 self.logger.error(f"Failed to create required directories: {e}")
                 raise RuntimeError(f"Failed to create required directories: {e}") from e
 
+            # Size the pools running blocking tools before any tool is called
+            configure_tool_executor(
+                thread_workers=config.mcp_server.tool_thread_workers,
+                process_workers=config.mcp_server.tool_process_workers,
+                queue_size=config.mcp_server.tool_executor_queue_size
+            )
+            
+            # Cache of cacheable tool and resource results, created before any
+            # worker is forked
+            result_cache = configure_result_cache(
+                max_entries=config.mcp_server.result_cache_max_entries,
+                ttl_seconds=config.mcp_server.result_cache_ttl_seconds
+            )
+            self._context = context
+            self._result_cache_watches = {}
+            result_cache.set_watcher(self._watch_result_cache_paths, self._unwatch_result_cache_paths)
+            
             # Create the MCPServer instance
             self._server = MCPServer(
                 name=config.mcp_server.server_name,
@@ -187,9 +205,18 @@ class MCPServerComponent(Component):
                 version=config.mcp_server.server_version,
                 host=config.mcp_server.host,
                 port=config.mcp_server.port,
-                workers=config.mcp_server.workers
+                workers=config.mcp_server.workers,
+                keep_alive=config.mcp_server.keep_alive,
+                graceful_shutdown_timeout=config.mcp_server.graceful_shutdown_timeout,
+                event_loop_stall_seconds=config.watchdog.event_loop_stall_seconds,
+                profile_dir=config.profiler.output_dir,
+                profile_interval_ms=config.profiler.sample_interval_ms,
+                profile_max_seconds=config.profiler.max_duration_seconds
             )
             
+            if self._server.workers > 1:
+                result_cache.attach_coordinator(self._server.coordinator)
+            
             # Start the server
             self._server.start()
             
@@ -222,6 +249,9 @@ class MCPServerComponent(Component):
         [Implementation details]
         - Delegates to MCPServer.wait_for_exit()
         - Verifies component is initialized
+        - In multi-worker mode, first waits for the components initializing in
+          the background so that the forked workers inherit them, then attaches
+          the stateful components to the coordinator channel
         
         Returns:
             None
@@ -232,6 +262,15 @@ class MCPServerComponent(Component):
         if not self.is_initialized or not self._server:
             raise RuntimeError(f"Component '{self.name}' not initialized")
             
+        if self._server.workers > 1:
+            # Workers are forked from this process: the components warming up
+            # in the background must be ready before
+            from ..core.system import ComponentSystem
+            system = ComponentSystem.get_instance()
+            if system and not system.wait_for_deferred(self.config.initialization.timeout_seconds):
+                self.logger.warning("Background initialization still running, forking the workers without it")
+            self._attach_stateful_components()
+        
         self.logger.info("Waiting for MCP server to exit")
         self._server.wait_for_exit()
         self.logger.info("MCP server exited")
@@ -281,10 +320,100 @@ class MCPServerComponent(Component):
         self.logger.info(f"Shutting down component '{self.name}'...")
         if self._server:
             self._server.stop()
+        get_tool_executor().shutdown(wait=False)
+        get_result_cache().set_watcher(None)
+        for handle in (self._result_cache_watches or {}).values():
+            try:
+                handle.unregister()
+            except Exception as e:
+                self.logger.debug(f"Failed to unregister result cache watch: {e}")
+        self._result_cache_watches = None
         self._server = None
         self._initialized = False
         self.logger.info(f"Component '{self.name}' shut down.")
 
+    def _attach_stateful_components(self) -> None:
+        """
+        [Function intent]
+        Routes the operations of the stateful components of forked workers to
+        the coordinator process.
+        
+        [Design principles]
+        - fs_monitor and the database connections exist in the coordinator only
+        
+        [Implementation details]
+        - Each component registers its operations on the coordinator channel and
+          forwards the calls made in workers through it
+        - Called in the coordinator before the workers are forked
+        - Components not available are skipped with a warning
+        """
+        for name in STATEFUL_COMPONENTS:
+            try:
+                component = self._context.get_component(name) if self._context else None
+            except ComponentError as e:
+                self.logger.warning(f"Component '{name}' unavailable to the MCP server workers: {e}")
+                continue
+            if component is None:
+                continue
+            component.attach_coordinator(self._server.coordinator)
+            self.logger.debug(f"Operations of component '{name}' served by the coordinator")
+
+    def _watch_result_cache_paths(self, paths: List[str]) -> None:
+        """
+        [Function intent]
+        Subscribes the result cache to changes of new dependency paths.
+        
+        [Design principles]
+        - Caching keeps working without fs_monitor, bounded by the entry time-to-live
+        
+        [Implementation details]
+        - Registers one ResultCacheInvalidator per path with the fs_monitor component
+        - Called by the result cache in the coordinator process, off the event loop
+        
+        Args:
+            paths: Absolute file or directory paths not watched yet
+        """
+        try:
+            fs_monitor = self._context.get_component("fs_monitor") if self._context else None
+        except ComponentError as e:
+            fs_monitor = None
+            self.logger.debug(f"fs_monitor unavailable: {e}")
+        if fs_monitor is None:
+            self.logger.info("fs_monitor unavailable, cached results expire with their time-to-live only")
+            get_result_cache().set_watcher(None)
+            return
+        
+        cache = get_result_cache()
+        for path in paths:
+            try:
+                handle = fs_monitor.register_listener(ResultCacheInvalidator(cache, path))
+            except Exception as e:
+                self.logger.warning(f"Cannot watch result cache dependency '{path}': {e}")
+                continue
+            if self._result_cache_watches is not None:
+                self._result_cache_watches[path] = handle
+
+    def _unwatch_result_cache_paths(self, paths: List[str]) -> None:
+        """
+        [Function intent]
+        Unsubscribes the result cache from paths no cached result depends on.
+        
+        [Implementation details]
+        - Unregisters the ResultCacheInvalidator of each path from fs_monitor
+        - Called by the result cache in the coordinator process, off the event loop
+        
+        Args:
+            paths: Absolute file or directory paths watched so far
+        """
+        for path in paths:
+            handle = (self._result_cache_watches or {}).pop(path, None)
+            if handle is None:
+                continue
+            try:
+                handle.unregister()
+            except Exception as e:
+                self.logger.debug(f"Failed to unregister result cache watch of '{path}': {e}")
+
     @property
     def is_initialized(self) -> bool:
         """
@@ -302,6 +431,31 @@ class MCPServerComponent(Component):
         """
         return self._initialized
         
+    @property
+    def coordinator(self):
+        """
+        [Function intent]
+        Returns the channel to the stateful operations of the coordinator process.
+        
+        [Design principles]
+        - Components owning state (fs_monitor, database) register their
+          operations on it during initialization
+        - Tools call those operations through it, in any deployment mode
+        
+        [Implementation details]
+        - Returns the CoordinatorChannel of the MCPServer
+        
+        Returns:
+            CoordinatorChannel: The coordinator channel
+            
+        Raises:
+            RuntimeError: If component is not initialized
+        """
+        if not self.is_initialized or not self._server:
+            raise RuntimeError(f"Component '{self.name}' not initialized")
+            
+        return self._server.coordinator
+        
     @property
     def mcp(self):
         """
@@ -0,0 +1,308 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides the local IPC channel between the MCP server coordinator process,
+# which owns the stateful components (fs_monitor, database), and the forked
+# request worker processes of a multi-worker deployment.
+###############################################################################
+# [Source file design principles]
+# - Stateful operations are named handlers registered in the coordinator
+# - Same call API in the coordinator (direct call) and in workers (IPC round trip)
+# - Handler errors are reported to the caller, never crash the coordinator
+# - Authenticated local socket, not reachable from other hosts
+###############################################################################
+# [Source file constraints]
+# - Arguments and results of handlers must be picklable
+# - Handlers run in the coordinator on one thread per worker connection and
+#   must be thread-safe
+# - The channel must be started before workers are forked
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/mcp_server/exceptions.py
+# system:multiprocessing.connection
+# system:threading
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T01:30:00Z : Wrapped handler errors in CoordinatorError by CodeAssistant
+# * In-process calls raise CoordinatorError like worker calls instead of the raw handler exception
+# 2026-10-18T16:40:00Z : Initial implementation by CodeAssistant
+# * Added CoordinatorChannel with named handlers served over a local socket
+###############################################################################
+
+"""
+IPC channel between the MCP server coordinator and its request workers.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any, Callable, Dict, Optional
+
+from .exceptions import CoordinatorError
+
+logger = logging.getLogger(__name__)
+
+
+class CoordinatorChannel:
+    """
+    [Class intent]
+    Routes calls to stateful operations to the coordinator process, whichever
+    process the caller runs in.
+
+    [Design principles]
+    - Components register their stateful operations once, in the coordinator
+    - Tools use call()/acall() and stay unaware of the deployment mode
+    - Without started listener (single-process mode) calls are plain function calls
+
+    [Implementation details]
+    - multiprocessing.connection Listener on a Unix socket (loopback TCP where
+      Unix sockets are unavailable) with a random authentication key
+    - One serving thread per worker connection in the coordinator
+    - Workers keep one client connection per thread, so concurrent requests of a
+      worker do not interleave messages on a connection
+    """
+
+    def __init__(self):
+        """
+        [Class method intent]
+        Create a channel owned by the current process.
+        """
+        self._handlers: Dict[str, Callable[..., Any]] = {}
+        self._owner_pid = os.getpid()
+        self._listener: Optional[Listener] = None
+        self._address = None
+        self._authkey: Optional[bytes] = None
+        self._accept_thread: Optional[threading.Thread] = None
+        self._connections: list = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @property
+    def is_coordinator(self) -> bool:
+        """
+        [Class method intent]
+        Check whether the current process is the coordinator.
+
+        Returns:
+            bool: True in the process that created the channel
+        """
+        return os.getpid() == self._owner_pid
+
+    def register(self, name: str, handler: Callable[..., Any]) -> None:
+        """
+        [Class method intent]
+        Register a stateful operation callable from any worker.
+
+        Args:
+            name: Operation name, conventionally "<component>.<operation>"
+            handler: Function executed in the coordinator
+        """
+        with self._lock:
+            self._handlers[name] = handler
+
+    def unregister(self, name: str) -> None:
+        """
+        [Class method intent]
+        Remove a registered operation.
+
+        Args:
+            name: Operation name
+        """
+        with self._lock:
+            self._handlers.pop(name, None)
+
+    def start(self) -> None:
+        """
+        [Class method intent]
+        Start serving worker connections.
+
+        [Implementation details]
+        Must be called in the coordinator before the workers are forked, which
+        inherit the address and authentication key.
+        """
+        if self._listener is not None:
+            return
+        self._authkey = os.urandom(32)
+        if hasattr(socket, "AF_UNIX"):
+            self._listener = Listener(family="AF_UNIX", authkey=self._authkey)
+        else:
+            self._listener = Listener(("127.0.0.1", 0), family="AF_INET", authkey=self._authkey)
+        self._address = self._listener.address
+        self._accept_thread = threading.Thread(
+            target=self._accept_loop, name="MCPCoordinatorChannel", daemon=True
+        )
+        self._accept_thread.start()
+        logger.info(f"Coordinator channel listening on {self._address}")
+
+    def stop(self) -> None:
+        """
+        [Class method intent]
+        Stop serving and close worker connections.
+        """
+        listener = self._listener
+        if listener is None or not self.is_coordinator:
+            return
+        self._listener = None
+        try:
+            listener.close()
+        except OSError:
+            pass
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            try:
+                connection.close()
+            except OSError:
+                pass
+        logger.info("Coordinator channel stopped")
+
+    def call(self, name: str, *args, **kwargs) -> Any:
+        """
+        [Class method intent]
+        Execute a registered operation in the coordinator.
+
+        Args:
+            name: Operation name
+            *args: Positional arguments of the handler
+            **kwargs: Keyword arguments of the handler
+
+        Returns:
+            Any: Result of the handler
+
+        Raises:
+            CoordinatorError: If the operation is unknown, fails, or the
+                coordinator cannot be reached
+        """
+        if self.is_coordinator:
+            return self._dispatch(name, args, kwargs)
+        connection = self._worker_connection()
+        try:
+            connection.send((name, args, kwargs))
+            status, payload = connection.recv()
+        except (EOFError, OSError) as e:
+            self._local.connection = None
+            raise CoordinatorError(f"Coordinator unreachable calling '{name}': {e}", operation=name) from e
+        if status == "error":
+            raise CoordinatorError(payload, operation=name)
+        return payload
+
+    async def acall(self, name: str, *args, **kwargs) -> Any:
+        """
+        [Class method intent]
+        Execute a registered operation without blocking the event loop.
+
+        Args:
+            name: Operation name
+            *args: Positional arguments of the handler
+            **kwargs: Keyword arguments of the handler
+
+        Returns:
+            Any: Result of the handler
+
+        Raises:
+            CoordinatorError: As call()
+        """
+        return await asyncio.to_thread(self.call, name, *args, **kwargs)
+
+    def _dispatch(self, name: str, args: tuple, kwargs: dict) -> Any:
+        """
+        [Class method intent]
+        Run a handler in the coordinator.
+
+        [Implementation details]
+        - Handler exceptions are wrapped in CoordinatorError, so callers handle
+          the same exception type in the coordinator and in workers
+
+        Raises:
+            CoordinatorError: If no handler is registered under the name or the
+                handler fails
+        """
+        handler = self._handlers.get(name)
+        if handler is None:
+            raise CoordinatorError(f"Unknown coordinator operation '{name}'", operation=name)
+        try:
+            return handler(*args, **kwargs)
+        except Exception as e:
+            raise CoordinatorError(f"Coordinator operation '{name}' failed: {type(e).__name__}: {e}",
+                                   operation=name) from e
+
+    def _worker_connection(self) -> Connection:
+        """
+        [Class method intent]
+        Get the connection of the calling worker thread, connecting on first use.
+
+        Raises:
+            CoordinatorError: If the channel was not started before the fork
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            if self._address is None:
+                raise CoordinatorError("Coordinator channel not started")
+            try:
+                connection = Client(self._address, authkey=self._authkey)
+            except OSError as e:
+                raise CoordinatorError(f"Cannot connect to coordinator: {e}") from e
+            self._local.connection = connection
+        return connection
+
+    def _accept_loop(self) -> None:
+        """
+        [Class method intent]
+        Accept worker connections until the channel stops.
+        """
+        while self._listener is not None:
+            try:
+                connection = self._listener.accept()
+            except Exception as e:
+                if self._listener is not None:
+                    logger.warning(f"Coordinator channel rejected a connection: {e}")
+                    continue
+                return
+            with self._lock:
+                self._connections.append(connection)
+            threading.Thread(
+                target=self._serve, args=(connection,), name="MCPCoordinatorConnection", daemon=True
+            ).start()
+
+    def _serve(self, connection: Connection) -> None:
+        """
+        [Class method intent]
+        Serve the requests of one worker connection until it closes.
+        """
+        try:
+            while True:
+                try:
+                    name, args, kwargs = connection.recv()
+                except (EOFError, OSError):
+                    return
+                try:
+                    reply = ("ok", self._dispatch(name, args, kwargs))
+                except CoordinatorError as e:
+                    logger.debug(str(e), exc_info=True)
+                    reply = ("error", str(e))
+                try:
+                    connection.send(reply)
+                except OSError:
+                    return
+                except Exception:
+                    # The reply is pickled before anything is written
+                    connection.send(("error", f"Coordinator operation '{name}' returned an unpicklable result"))
+        finally:
+            with self._lock:
+                if connection in self._connections:
+                    self._connections.remove(connection)
+            connection.close()
@@ -31,6 +31,10 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T17:20:00Z : Added ToolExecutorBusyError by CodeAssistant
+# * Added ToolExecutorBusyError for saturated tool execution pools
+# 2026-10-18T16:40:00Z : Added CoordinatorError by CodeAssistant
+# * Added CoordinatorError for failed coordinator channel calls
 # 2025-04-15T16:31:15Z : Created exceptions.py file by CodeAssistant
 # * Implemented central exception definitions for MCP server
 ###############################################################################
@@ -102,3 +106,17 @@ class ConfigurationError(ValueError):
         self.message = message
         self.config_key = config_key
         super().__init__(message)
+
+class CoordinatorError(RuntimeError):
+    """Exception raised when a call to the coordinator process fails."""
+    def __init__(self, message: str, operation: str = None):
+        self.message = message
+        self.operation = operation
+        super().__init__(message)
+
+class ToolExecutorBusyError(RuntimeError):
+    """Exception raised when the executor pool of a tool execution policy is saturated."""
+    def __init__(self, policy: str, admitted: int):
+        self.policy = policy
+        self.admitted = admitted
+        super().__init__(f"Tool executor '{policy}' pool is saturated ({admitted} calls admitted)")
@@ -0,0 +1,679 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides the execution policies of MCP tools and the managed executor that
+# runs blocking tools off the server event loop, with per-tool concurrency
+# limits and queue-time/run-time metrics.
+###############################################################################
+# [Source file design principles]
+# - Tools declare a policy, their code is unchanged whatever the policy
+# - One bounded executor per policy: saturation is reported, not queued forever
+# - Same metrics for every policy: queue time (call to start) and run time
+# - Streams produced off the loop keep streaming, with backpressure
+###############################################################################
+# [Source file constraints]
+# - Process policy: the tool, its input and its results must be picklable, and
+#   streamed chunks are returned once the stream completes
+# - Executors are created lazily and recreated after a fork
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/metrics.py
+# codebase:src/dbp/mcp_server/exceptions.py
+# system:asyncio
+# system:concurrent.futures
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T05:30:00Z : Removed the duplicate tool latency histograms by CodeAssistant
+# * Queue and run times are only recorded in the metrics registry, get_metrics summarizes its histograms
+# 2026-10-19T02:10:00Z : Published tool latencies in the metrics registry by CodeAssistant
+# * Queue and run times are also recorded in the dbp_mcp_tool_queue_seconds and dbp_mcp_tool_run_seconds histograms
+# 2026-10-19T01:40:00Z : Closed tool streams on early stop by CodeAssistant
+# * Streams stopped by their consumer close the tool generator and the thread producer before returning the pool slot
+# 2026-10-18T17:20:00Z : Initial implementation by CodeAssistant
+# * Added ExecutionPolicy and ToolExecutor with thread and process pools
+# * Added per-tool concurrency limits and queue/run time histograms
+###############################################################################
+
+"""
+Execution policies and managed executor for MCP tools.
+"""
+
+import asyncio
+import inspect
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from ..core.metrics import MCP_TOOL_QUEUE_SECONDS, MCP_TOOL_RUN_SECONDS
+from .exceptions import ToolExecutorBusyError
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of chunks buffered between a stream producer thread and its consumer
+STREAM_BUFFER_SIZE = 16
+
+# Marks pool threads and pool processes: calls made from tool code already
+# running off the server loop run directly instead of taking another pool slot
+_offloaded = threading.local()
+
+
+class ExecutionPolicy(str, Enum):
+    """
+    [Class intent]
+    Where a tool runs.
+
+    [Implementation details]
+    - INLINE: on the server event loop, for tools that only await I/O
+    - THREAD: in the shared thread pool, for tools doing blocking I/O or
+      short CPU work
+    - PROCESS: in the shared process pool, for CPU-bound tools
+    """
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ToolExecutionMetrics:
+    """
+    [Class intent]
+    Execution statistics of one tool.
+
+    [Implementation details]
+    - Queue time runs from the call to the start of the tool code: concurrency
+      limit wait, pool queue and, for processes, transfer to the worker
+    - Counters are updated on the event loop
+    - Latencies are recorded in the process metrics registry, labelled by
+      tool, so that they are exported on /metrics
+    """
+
+    def __init__(self, name: str, policy: ExecutionPolicy, max_concurrency: Optional[int]):
+        """
+        [Class method intent]
+        Create empty statistics.
+
+        Args:
+            name: Name of the tool
+            policy: Execution policy of the tool
+            max_concurrency: Concurrency limit of the tool, None if unlimited
+        """
+        self.policy = policy
+        self.max_concurrency = max_concurrency
+        self.queue_time = MCP_TOOL_QUEUE_SECONDS.labels(tool=name)
+        self.run_time = MCP_TOOL_RUN_SECONDS.labels(tool=name)
+        self.in_flight = 0
+        self.rejected = 0
+        self.errors = 0
+
+    def record_queue_time(self, seconds: float) -> None:
+        """
+        [Class method intent]
+        Record the time a call waited before the tool code started.
+        """
+        self.queue_time.observe(seconds)
+
+    def record_run_time(self, seconds: float) -> None:
+        """
+        [Class method intent]
+        Record the time the tool code ran.
+        """
+        self.run_time.observe(seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        [Class method intent]
+        Get a snapshot of the statistics.
+
+        Returns:
+            Dict[str, Any]: Policy, limits, counters and histogram summaries
+        """
+        return {
+            "policy": self.policy.value,
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "queue_time": self.queue_time.summary(),
+            "run_time": self.run_time.summary(),
+        }
+
+
+def _run_to_completion(function: Callable[..., Any], args: tuple) -> Any:
+    """
+    [Function intent]
+    Call a sync or async function and return its result, outside any event loop.
+    """
+    _offloaded.active = True
+    result = function(*args)
+    if inspect.isawaitable(result):
+        async def wait():
+            return await result
+        result = asyncio.run(wait())
+    return result
+
+
+def _process_call(function: Callable[..., Any], args: tuple):
+    """
+    [Function intent]
+    Process pool entry point running a tool call.
+
+    Returns:
+        tuple: Start time, end time and result
+    """
+    started = time.monotonic()
+    result = _run_to_completion(function, args)
+    return started, time.monotonic(), result
+
+
+def _process_collect(function: Callable[..., Any], args: tuple):
+    """
+    [Function intent]
+    Process pool entry point running a tool stream to its end.
+
+    Returns:
+        tuple: Start time, end time and the list of chunks
+    """
+    started = time.monotonic()
+    _offloaded.active = True
+
+    async def collect():
+        return [chunk async for chunk in function(*args)]
+
+    chunks = asyncio.run(collect())
+    return started, time.monotonic(), chunks
+
+
+class ToolExecutor:
+    """
+    [Class intent]
+    Runs tool calls and tool streams according to their execution policy.
+
+    [Design principles]
+    - Bounded pools: at most workers + queue_size calls admitted per pool,
+      further calls fail fast with ToolExecutorBusyError
+    - Per-tool concurrency limits wait on the event loop, never in a pool slot
+    - Streams run off the loop are forwarded chunk by chunk through a bounded
+      buffer, so a slow client slows the producer down
+
+    [Implementation details]
+    - ThreadPoolExecutor and ProcessPoolExecutor (forkserver context where
+      available) created on first use
+    - Async tool code in a thread runs on a private event loop of that thread
+    - Concurrency semaphores are kept per event loop
+    """
+
+    def __init__(self, thread_workers: int = 8, process_workers: int = 2, queue_size: int = 64):
+        """
+        [Class method intent]
+        Create an executor; pools are started on first use.
+
+        Args:
+            thread_workers: Threads of the thread pool
+            process_workers: Processes of the process pool
+            queue_size: Calls admitted per pool beyond its workers
+        """
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._pools: Dict[ExecutionPolicy, Executor] = {}
+        self._admitted: Dict[ExecutionPolicy, int] = {ExecutionPolicy.THREAD: 0, ExecutionPolicy.PROCESS: 0}
+        self._metrics: Dict[str, ToolExecutionMetrics] = {}
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = \
+            weakref.WeakKeyDictionary()
+
+    def configure_tool(self, name: str, policy: ExecutionPolicy, max_concurrency: Optional[int] = None) -> None:
+        """
+        [Class method intent]
+        Declare the policy and concurrency limit of a tool.
+
+        Args:
+            name: Tool name
+            policy: Execution policy
+            max_concurrency: Maximum concurrent calls of the tool, None for no limit
+        """
+        with self._lock:
+            self._metrics[name] = ToolExecutionMetrics(name, ExecutionPolicy(policy), max_concurrency)
+            for semaphores in self._semaphores.values():
+                semaphores.pop(name, None)
+
+    async def run(self, name: str, function: Callable[..., Any], *args) -> Any:
+        """
+        [Class method intent]
+        Run one tool call according to the tool's policy.
+
+        Args:
+            name: Tool name, as declared with configure_tool()
+            function: Sync or async function implementing the call
+            *args: Arguments of the function
+
+        Returns:
+            Any: Result of the function
+
+        Raises:
+            ToolExecutorBusyError: If the pool of the policy is saturated
+        """
+        metrics = self._tool_metrics(name)
+        if getattr(_offloaded, "active", False):
+            result = function(*args)
+            return (await result) if inspect.isawaitable(result) else result
+        called = time.monotonic()
+        async with self._limit(name, metrics):
+            if metrics.policy is ExecutionPolicy.INLINE:
+                started = time.monotonic()
+                metrics.record_queue_time(started - called)
+                try:
+                    result = function(*args)
+                    if inspect.isawaitable(result):
+                        result = await result
+                    return result
+                except Exception:
+                    metrics.errors += 1
+                    raise
+                finally:
+                    metrics.record_run_time(time.monotonic() - started)
+
+            loop = asyncio.get_running_loop()
+            pool = self._admit(metrics)
+            try:
+                if metrics.policy is ExecutionPolicy.PROCESS:
+                    started, ended, result = await loop.run_in_executor(
+                        pool, _process_call, function, args
+                    )
+                else:
+                    started, ended, result = await loop.run_in_executor(
+                        pool, self._thread_call, function, args
+                    )
+                metrics.record_queue_time(max(0.0, started - called))
+                metrics.record_run_time(ended - started)
+                return result
+            except Exception:
+                metrics.errors += 1
+                raise
+            finally:
+                self._release(metrics.policy)
+
+    async def stream(self, name: str, function: Callable[..., AsyncIterator[Any]], *args) -> AsyncIterator[Any]:
+        """
+        [Class method intent]
+        Iterate over a tool stream according to the tool's policy.
+
+        Args:
+            name: Tool name, as declared with configure_tool()
+            function: Async generator function producing the chunks
+            *args: Arguments of the function
+
+        [Implementation details]
+        - When the consumer stops early, the tool stream is closed before this
+          stream ends, and a thread producer has returned its pool slot
+
+        Yields:
+            Any: Chunks of the stream
+
+        Raises:
+            ToolExecutorBusyError: If the pool of the policy is saturated
+        """
+        metrics = self._tool_metrics(name)
+        if getattr(_offloaded, "active", False):
+            async with _closing(function(*args)) as chunks:
+                async for chunk in chunks:
+                    yield chunk
+            return
+        called = time.monotonic()
+        async with self._limit(name, metrics):
+            if metrics.policy is ExecutionPolicy.INLINE:
+                started = time.monotonic()
+                metrics.record_queue_time(started - called)
+                try:
+                    async with _closing(function(*args)) as chunks:
+                        async for chunk in chunks:
+                            yield chunk
+                except Exception:
+                    metrics.errors += 1
+                    raise
+                finally:
+                    metrics.record_run_time(time.monotonic() - started)
+                return
+
+            loop = asyncio.get_running_loop()
+            pool = self._admit(metrics)
+            if metrics.policy is ExecutionPolicy.PROCESS:
+                try:
+                    started, ended, chunks = await loop.run_in_executor(
+                        pool, _process_collect, function, args
+                    )
+                except Exception:
+                    metrics.errors += 1
+                    raise
+                finally:
+                    self._release(metrics.policy)
+                metrics.record_queue_time(max(0.0, started - called))
+                metrics.record_run_time(ended - started)
+                for chunk in chunks:
+                    yield chunk
+                return
+
+            try:
+                async with _closing(self._thread_stream(pool, loop, called, metrics, function, args)) as chunks:
+                    async for chunk in chunks:
+                        yield chunk
+            finally:
+                self._release(metrics.policy)
+
+    def get_metrics(self, name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        [Class method intent]
+        Get execution statistics.
+
+        Args:
+            name: Tool name, None for all tools
+
+        Returns:
+            Dict[str, Any]: Statistics of the tool, or statistics by tool name
+            plus the pool occupancy under "_pools"
+        """
+        if name is not None:
+            metrics = self._metrics.get(name)
+            return metrics.to_dict() if metrics else {}
+        report = {tool: metrics.to_dict() for tool, metrics in list(self._metrics.items())}
+        report["_pools"] = {
+            ExecutionPolicy.THREAD.value: {"workers": self.thread_workers,
+                                           "admitted": self._admitted[ExecutionPolicy.THREAD]},
+            ExecutionPolicy.PROCESS.value: {"workers": self.process_workers,
+                                            "admitted": self._admitted[ExecutionPolicy.PROCESS]},
+            "queue_size": self.queue_size,
+        }
+        return report
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        [Class method intent]
+        Stop the pools; they are recreated if the executor is used again.
+
+        Args:
+            wait: Whether to wait for running calls to finish
+        """
+        with self._lock:
+            pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _after_fork(self) -> None:
+        """
+        [Class method intent]
+        Forget the pools inherited from the parent process, whose workers do not
+        exist in the child.
+        """
+        self._lock = threading.Lock()
+        self._pools = {}
+        self._admitted = {ExecutionPolicy.THREAD: 0, ExecutionPolicy.PROCESS: 0}
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _tool_metrics(self, name: str) -> ToolExecutionMetrics:
+        """
+        [Class method intent]
+        Get the statistics of a tool, declaring it inline if unknown.
+        """
+        metrics = self._metrics.get(name)
+        if metrics is None:
+            self.configure_tool(name, ExecutionPolicy.INLINE)
+            metrics = self._metrics[name]
+        return metrics
+
+    def _limit(self, name: str, metrics: ToolExecutionMetrics):
+        """
+        [Class method intent]
+        Get the concurrency limiter of a tool on the running event loop.
+
+        Returns:
+            Async context manager: Semaphore of the tool, or a no-op limiter
+        """
+        if not metrics.max_concurrency:
+            return _InFlight(metrics)
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._semaphores.setdefault(loop, {})
+        semaphore = semaphores.get(name)
+        if semaphore is None:
+            semaphore = semaphores.setdefault(name, asyncio.Semaphore(metrics.max_concurrency))
+        return _InFlight(metrics, semaphore)
+
+    def _admit(self, metrics: ToolExecutionMetrics) -> Executor:
+        """
+        [Class method intent]
+        Reserve a slot in the pool of a policy.
+
+        Returns:
+            Executor: The pool
+
+        Raises:
+            ToolExecutorBusyError: If all the slots of the pool are taken
+        """
+        policy = metrics.policy
+        with self._lock:
+            workers = self.thread_workers if policy is ExecutionPolicy.THREAD else self.process_workers
+            if self._admitted[policy] >= workers + self.queue_size:
+                metrics.rejected += 1
+                raise ToolExecutorBusyError(policy.value, self._admitted[policy])
+            self._admitted[policy] += 1
+            pool = self._pools.get(policy)
+            if pool is None:
+                pool = self._create_pool(policy)
+                self._pools[policy] = pool
+            return pool
+
+    def _release(self, policy: ExecutionPolicy) -> None:
+        """
+        [Class method intent]
+        Free a pool slot taken by _admit().
+        """
+        with self._lock:
+            self._admitted[policy] = max(0, self._admitted[policy] - 1)
+
+    def _create_pool(self, policy: ExecutionPolicy) -> Executor:
+        """
+        [Class method intent]
+        Create the pool of a policy, the caller holds the lock.
+        """
+        if policy is ExecutionPolicy.THREAD:
+            return ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="MCPTool")
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        return ProcessPoolExecutor(max_workers=self.process_workers, mp_context=context)
+
+    @staticmethod
+    def _thread_call(function: Callable[..., Any], args: tuple):
+        """
+        [Class method intent]
+        Thread pool entry point running a tool call.
+
+        Returns:
+            tuple: Start time, end time and result
+        """
+        started = time.monotonic()
+        result = _run_to_completion(function, args)
+        return started, time.monotonic(), result
+
+    async def _thread_stream(self, pool: Executor, loop: asyncio.AbstractEventLoop, called: float,
+                             metrics: ToolExecutionMetrics, function: Callable[..., AsyncIterator[Any]],
+                             args: tuple) -> AsyncIterator[Any]:
+        """
+        [Class method intent]
+        Run a tool stream on a pool thread and forward its chunks.
+
+        [Implementation details]
+        - The producer thread blocks on the bounded buffer when the consumer
+          lags behind
+        - When the consumer stops early the producer is told to stop and the
+          buffer is drained to release it
+        """
+        buffer: asyncio.Queue = asyncio.Queue(maxsize=STREAM_BUFFER_SIZE)
+        stop = threading.Event()
+        end = object()
+
+        def forward(item) -> bool:
+            if stop.is_set():
+                return False
+            try:
+                asyncio.run_coroutine_threadsafe(buffer.put(item), loop).result()
+            except RuntimeError:
+                # Consumer loop closed
+                return False
+            return True
+
+        def produce():
+            _offloaded.active = True
+            started = time.monotonic()
+            metrics.record_queue_time(max(0.0, started - called))
+
+            async def pump():
+                generator = function(*args)
+                try:
+                    async for chunk in generator:
+                        if not forward((None, chunk)):
+                            break
+                finally:
+                    await generator.aclose()
+
+            try:
+                asyncio.run(pump())
+                forward((end, None))
+            except BaseException as e:
+                forward((end, e))
+            finally:
+                metrics.record_run_time(time.monotonic() - started)
+
+        producer = loop.run_in_executor(pool, produce)
+        try:
+            while True:
+                marker, value = await buffer.get()
+                if marker is end:
+                    if value is not None:
+                        metrics.errors += 1
+                        raise value
+                    break
+                yield value
+        finally:
+            stop.set()
+            while not buffer.empty():
+                buffer.get_nowait()
+            await producer
+
+
+class _closing:
+    """
+    [Class intent]
+    Async context manager closing an async generator on exit, so that an early
+    stop of the consumer runs the generator's cleanup immediately rather than
+    when the event loop finalizes it.
+    """
+
+    __slots__ = ("_generator",)
+
+    def __init__(self, generator):
+        self._generator = generator
+
+    async def __aenter__(self):
+        return self._generator
+
+    async def __aexit__(self, *exc_info):
+        await self._generator.aclose()
+
+
+class _InFlight:
+    """
+    [Class intent]
+    Async context manager counting in-flight calls of a tool, optionally
+    bounded by a semaphore.
+    """
+
+    __slots__ = ("_metrics", "_semaphore")
+
+    def __init__(self, metrics: ToolExecutionMetrics, semaphore: Optional[asyncio.Semaphore] = None):
+        self._metrics = metrics
+        self._semaphore = semaphore
+
+    async def __aenter__(self):
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        self._metrics.in_flight += 1
+
+    async def __aexit__(self, *exc_info):
+        self._metrics.in_flight -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+
+_executor: Optional[ToolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_tool_executor() -> ToolExecutor:
+    """
+    [Function intent]
+    Get the process-wide tool executor, created with default sizes on first use.
+
+    Returns:
+        ToolExecutor: The shared executor
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ToolExecutor()
+    return _executor
+
+
+def configure_tool_executor(thread_workers: int, process_workers: int, queue_size: int) -> ToolExecutor:
+    """
+    [Function intent]
+    Set the pool sizes of the process-wide tool executor.
+
+    [Implementation details]
+    Tool declarations and statistics are kept; running pools are replaced on
+    their next use.
+
+    Args:
+        thread_workers: Threads of the thread pool
+        process_workers: Processes of the process pool
+        queue_size: Calls admitted per pool beyond its workers
+
+    Returns:
+        ToolExecutor: The shared executor
+    """
+    executor = get_tool_executor()
+    executor.shutdown(wait=False)
+    executor.thread_workers = thread_workers
+    executor.process_workers = process_workers
+    executor.queue_size = queue_size
+    return executor
+
+
+def _reset_after_fork() -> None:
+    """
+    [Function intent]
+    Reset the shared executor in a forked child.
+    """
+    if _executor is not None:
+        _executor._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
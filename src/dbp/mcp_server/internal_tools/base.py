@@ -31,6 +31,11 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T01:40:00Z : Removed unused execution policy by CodeAssistant
+# * Removed execution_policy, max_concurrency and execute_async(), which no caller used
+# * Internal tools run in the execution context of the calling public tool
+# 2026-10-18T17:20:00Z : Added execution policy to internal tools by CodeAssistant
+# * Added execution_policy, max_concurrency and execute_async()
 # 2025-04-16T08:55:00Z : Created base internal tools structure by CodeAssistant
 # * Defined InternalMCPTool base class
 ###############################################################################
@@ -68,6 +73,8 @@ class InternalMCPTool:
     [Design principles]
     Clear separation of concerns, internal implementation details hidden from
     public interface, consistent error handling across internal tools.
+    Internal tools run synchronously where they are called: the execution
+    policy of the calling public MCPTool decides whether that is off the event loop.
     """
     
     def __init__(self, name: str, adapter: SystemComponentAdapter, logger_override: Optional[logging.Logger] = None):
@@ -30,6 +30,10 @@
 # codebase:- doc/DESIGN.md
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T01:40:00Z : Removed unused execution policy by CodeAssistant
+# * Calling public tools declare the thread policy instead
+# 2026-10-18T17:20:00Z : Ran diagram generation in the thread pool by CodeAssistant
+# * Declared InternalMermaidDiagramTool with the thread execution policy
 # 2025-05-02T00:20:30Z : Removed doc_relationships dependencies by CodeAssistant
 # * Removed dependency on doc_relationships component
 # * Implemented standalone mermaid diagram generation
@@ -68,6 +72,8 @@ class InternalMermaidDiagramTool(InternalMCPTool):
     [Design principles]
     Follows consistent interface pattern with other internal tools,
     consistent error handling, and integration with the internal tools framework.
+    Diagram generation is string and regex work: public tools calling it
+    declare ExecutionPolicy.THREAD to keep it off the event loop.
     """
 
     def __init__(self, adapter: SystemComponentAdapter, logger_override: Optional[logging.Logger] = None):
@@ -36,8 +36,15 @@
 # system:pydantic
 # system:fastmcp
 # codebase:src/dbp/mcp_server/server.py
+# codebase:src/dbp/mcp_server/readiness.py
+# codebase:src/dbp/mcp_server/result_cache.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T20:40:00Z : Added required components by CodeAssistant
+# * Requests await the components of required_components still initializing in the background
+# 2026-10-18T18:00:00Z : Added result caching by CodeAssistant
+# * Added cacheable and cache_ttl, content of cacheable resources goes through the shared result cache
+# * Added overridable cache_key() and cache_dependencies()
 # 2025-04-27T01:50:00Z : Updated import for Resource class by CodeAssistant
 # * Changed import from fastmcp.resource to fastmcp.resources to match FastMCP v2 structure
 # 2025-04-27T01:25:00Z : Created MCPResource base class by CodeAssistant
@@ -47,11 +54,12 @@
 # * Added support for context and error handling
 ###############################################################################
 
+import json
 import logging
 from abc import ABC, abstractmethod
 from typing import (
     Any, Dict, List, Optional, Type, TypeVar, Generic, 
-    Union, get_type_hints, cast
+    Tuple, Union, get_type_hints, cast
 )
 
 from pydantic import BaseModel, Field, create_model
@@ -59,6 +67,9 @@ from pydantic import BaseModel, Field, create_model
 from fastmcp import FastMCP
 from fastmcp.resources import Resource
 
+from .readiness import await_components
+from .result_cache import get_result_cache
+
 logger = logging.getLogger(__name__)
 
 # Type variables for parameter and content models
@@ -84,8 +95,19 @@ class MCPResource(Generic[ParamType, ContentType], ABC):
     - Registers the resource with FastMCP
     - Handles content formatting and error handling
     - Provides access to context for resource access
+    - Resources set cacheable to keep their content in the shared result cache
+      by cache_key(), dropped when a file returned by cache_dependencies() changes
+    - Resources list the system components they use in required_components,
+      awaited while they initialize in the background
     """
     
+    # Result caching (cache_ttl None: cache default)
+    cacheable: bool = False
+    cache_ttl: Optional[float] = None
+    
+    # System components the resource uses, awaited while they initialize in the background
+    required_components: Tuple[str, ...] = ()
+    
     def __init__(
         self,
         name: str,
@@ -161,7 +183,8 @@ class MCPResource(Generic[ParamType, ContentType], ABC):
         Prepares context for resource access and handles exceptions.
         
         [Implementation details]
-        Calls the get method with prepared context.
+        Calls the get method with prepared context, through the result cache
+        for cacheable resources.
         
         Args:
             params: The validated parameters
@@ -173,6 +196,17 @@ class MCPResource(Generic[ParamType, ContentType], ABC):
         prepared_context = self._prepare_context(context)
         
         try:
+            await await_components(self.required_components)
+            
+            if self.cacheable:
+                return await get_result_cache().get_or_compute(
+                    self.name,
+                    self.cache_key(params, prepared_context),
+                    lambda: self.get(params, prepared_context),
+                    lambda content: self.cache_dependencies(params, prepared_context, content),
+                    self.cache_ttl
+                )
+            
             # Call the get method
             return await self.get(params, prepared_context)
             
@@ -180,6 +214,55 @@ class MCPResource(Generic[ParamType, ContentType], ABC):
             self.logger.error(f"Error accessing resource '{self.name}': {str(e)}", exc_info=True)
             raise
             
+    def cache_key(self, params: ParamType, context: Dict[str, Any]) -> Optional[str]:
+        """
+        [Function intent]
+        Returns the key identifying the content of a request in the result cache.
+        
+        [Design principles]
+        Only used by cacheable resources; identical keys must mean identical content.
+        
+        [Implementation details]
+        Default key is the canonical JSON of the parameters. Resources whose
+        content depends on the context override this method.
+        
+        Args:
+            params: The validated parameters
+            context: The prepared execution context
+            
+        Returns:
+            The cache key, or None to bypass the cache for this request
+        """
+        return json.dumps(params.dict(), sort_keys=True, default=str)
+        
+    def cache_dependencies(
+        self,
+        params: ParamType,
+        context: Dict[str, Any],
+        content: ContentType
+    ) -> Optional[List[str]]:
+        """
+        [Function intent]
+        Returns the files and directories cached content depends on.
+        
+        [Design principles]
+        A change of any returned path, reported by the file system monitor,
+        invalidates the content.
+        
+        [Implementation details]
+        Default None means unknown: the content is dropped on any invalidation
+        and otherwise expires with its time-to-live.
+        
+        Args:
+            params: The validated parameters
+            context: The prepared execution context
+            content: The formatted content
+            
+        Returns:
+            The dependency paths, None if unknown
+        """
+        return None
+        
     def _prepare_context(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         [Function intent]
@@ -37,30 +37,34 @@
 # system:pydantic
 # system:fastmcp
 # codebase:src/dbp/mcp_server/server.py
+# codebase:src/dbp/llm/common/streaming.py
+# codebase:src/dbp/mcp_server/execution.py
+# codebase:src/dbp/mcp_server/readiness.py
+# codebase:src/dbp/mcp_server/result_cache.py
 ###############################################################################
 # [GenAI tool change history]
-# 2025-04-27T02:00:00Z : Adapted MCPTool for FastMCP v2 by CodeAssistant
-# * Removed StreamingTool import and usage
-# * Updated register() method to use Tool class with stream method
-# * Simplified implementation to use single Tool instance
-# * Updated class documentation to reflect changes
-# 2025-04-27T01:50:00Z : Updated imports for Tool class by CodeAssistant
-# * Changed import from fastmcp.tool to fastmcp.tools to match FastMCP v2 structure
-# 2025-04-27T00:55:00Z : Simplified MCPTool class hierarchy by CodeAssistant
-# * Made execute() non-abstract with default implementation that collects chunks from stream()
-# * Removed SimpleMCPTool class as its functionality is now part of MCPTool
-# * Maintained backward compatibility with existing tools
-# * Simplified API by requiring only stream() method implementation
+# 2026-10-19T04:40:00Z : Coalesced streamed tool output by CodeAssistant
+# * Added stream_coalescer, the text chunks streamed to MCP and SSE clients are merged into frames
+# 2026-10-18T20:40:00Z : Added required components by CodeAssistant
+# * Calls await the components of required_components still initializing in the background
+# 2026-10-18T18:00:00Z : Added result caching by CodeAssistant
+# * Added cacheable and cache_ttl, non-streaming results of cacheable tools go through the shared result cache
+# * Added overridable cache_key() and cache_dependencies()
+# 2026-10-18T17:20:00Z : Added execution policies by CodeAssistant
+# * Added execution_policy and max_concurrency, tool code runs through the shared ToolExecutor
+# * Overridden execute() methods and streams are moved off the event loop for thread and process policies
+# * Tools drop their FastMCP registration when pickled for a process pool
 ###############################################################################
 
 import asyncio
 import inspect
+import json
 import logging
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import (
     Any, Dict, List, Optional, Type, TypeVar, Generic, 
-    AsyncGenerator, AsyncIterable, Union, get_type_hints, cast
+    AsyncGenerator, AsyncIterable, Tuple, Union, get_type_hints, cast
 )
 
 from pydantic import BaseModel, Field, create_model
@@ -68,6 +72,11 @@ from pydantic import BaseModel, Field, create_model
 from fastmcp import FastMCP
 from fastmcp.tools import Tool
 
+from ..llm.common.streaming import StreamCoalescer, TextBuffer
+from .execution import ExecutionPolicy, get_tool_executor
+from .readiness import await_components
+from .result_cache import get_result_cache
+
 logger = logging.getLogger(__name__)
 
 # Type variables for input and output models
@@ -94,8 +103,32 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
     - Registers a tool with both execute and stream methods
     - Handles conversion between streaming and non-streaming responses
     - Provides access to context for progress reporting and cancellation
+    - Runs according to its execution policy: subclasses doing blocking I/O or
+      CPU work set execution_policy (class attribute or constructor argument)
+      to THREAD or PROCESS and are moved off the event loop unchanged
+    - Deterministic tools set cacheable: non-streaming results are kept in the
+      shared result cache by cache_key() and dropped when one of the files
+      returned by cache_dependencies() changes
+    - Tools list the system components they use in required_components: calls
+      arriving while one of them initializes in the background wait for it
+    - Text chunks streamed to clients are merged into frames by stream_coalescer
+      (None streams every chunk as it is produced)
     """
     
+    # Where the tool code runs and how many calls may run at once (None: no limit)
+    execution_policy: ExecutionPolicy = ExecutionPolicy.INLINE
+    max_concurrency: Optional[int] = None
+    
+    # Result caching of non-streaming calls (cache_ttl None: cache default)
+    cacheable: bool = False
+    cache_ttl: Optional[float] = None
+    
+    # System components the tool uses, awaited while they initialize in the background
+    required_components: Tuple[str, ...] = ()
+    
+    # Merges the text deltas streamed to clients (MCP and SSE transports) into frames
+    stream_coalescer: Optional[StreamCoalescer] = StreamCoalescer()
+    
     def __init__(
         self,
         name: str,
@@ -104,6 +137,8 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
         output_model: Type[OutputType],
         chunk_model: Type[ChunkType],
         version: str = "1.0.0",
+        execution_policy: Optional[ExecutionPolicy] = None,
+        max_concurrency: Optional[int] = None,
     ):
         """
         [Class method intent]
@@ -122,6 +157,8 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
             output_model: The Pydantic model for the tool's output
             chunk_model: The Pydantic model for streaming chunks
             version: The version of the tool
+            execution_policy: Overrides the class execution policy
+            max_concurrency: Overrides the class concurrency limit
         """
         self.name = name
         self.description = description
@@ -131,9 +168,30 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
         self.version = version
         self.logger = logging.getLogger(f"dbp.mcp_server.tools.{name}")
         
+        if execution_policy is not None:
+            self.execution_policy = ExecutionPolicy(execution_policy)
+        if max_concurrency is not None:
+            self.max_concurrency = max_concurrency
+        get_tool_executor().configure_tool(self.name, self.execution_policy, self.max_concurrency)
+        
         # This will be set when the tool is registered
         self._tool = None
         
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Returns the state pickled when the tool is sent to a process pool worker.
+        
+        [Implementation details]
+        The FastMCP registration stays in the server process.
+        
+        Returns:
+            The picklable state of the tool
+        """
+        state = self.__dict__.copy()
+        state["_tool"] = None
+        return state
+        
     def register(self, mcp: FastMCP) -> None:
         """
         [Function intent]
@@ -178,7 +236,9 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
         Prepares context for tool execution and handles exceptions.
         
         [Implementation details]
-        Calls the execute method with prepared context.
+        Calls the execute method with prepared context. An overridden execute
+        method runs according to the execution policy, the default one collects
+        the stream, which does.
         
         Args:
             data: The validated input data
@@ -190,14 +250,28 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
         prepared_context = self._prepare_context(context)
         
         try:
+            await await_components(self.required_components)
+            
             # For non-streaming clients, we need to collect all chunks
             # and build the final result
             if not self._is_streaming_requested(data, context):
+                if self.cacheable:
+                    return await get_result_cache().get_or_compute(
+                        self.name,
+                        self.cache_key(data, prepared_context),
+                        lambda: self._collect_chunks_to_result(data, prepared_context),
+                        lambda result: self.cache_dependencies(data, prepared_context, result),
+                        self.cache_ttl
+                    )
                 result = await self._collect_chunks_to_result(data, prepared_context)
                 return result
             
             # For streaming clients, just call execute directly
-            return await self.execute(data, prepared_context)
+            if type(self).execute is MCPTool.execute:
+                return await self.execute(data, prepared_context)
+            return await get_tool_executor().run(
+                self.name, self._execute_with_context, data, self._offload_context(prepared_context)
+            )
             
         except Exception as e:
             self.logger.error(f"Error executing tool '{self.name}': {str(e)}", exc_info=True)
@@ -216,7 +290,8 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
         Prepares context for tool streaming and handles exceptions.
         
         [Implementation details]
-        Calls the stream method with prepared context.
+        Calls the stream method with prepared context. Text chunks are merged
+        into frames by the stream coalescer, other chunks keep their order.
         
         Args:
             data: The validated input data
@@ -228,7 +303,12 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
         prepared_context = self._prepare_context(context)
         
         try:
-            async for chunk in self.stream(data, prepared_context):
+            await await_components(self.required_components)
+            
+            stream = self._run_stream(data, prepared_context)
+            if self.stream_coalescer is not None:
+                stream = self.stream_coalescer.coalesce(stream)
+            async for chunk in stream:
                 # Convert chunk to dict if it's a Pydantic model
                 if isinstance(chunk, BaseModel):
                     yield chunk.dict()
@@ -239,6 +319,127 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
             self.logger.error(f"Error streaming from tool '{self.name}': {str(e)}", exc_info=True)
             raise
             
+    def cache_key(self, data: InputType, context: Dict[str, Any]) -> Optional[str]:
+        """
+        [Function intent]
+        Returns the key identifying the result of a call in the result cache.
+        
+        [Design principles]
+        Only used by cacheable tools; identical keys must mean identical results.
+        
+        [Implementation details]
+        Default key is the canonical JSON of the input. Tools whose result
+        depends on the context override this method.
+        
+        Args:
+            data: The validated input data
+            context: The prepared execution context
+            
+        Returns:
+            The cache key, or None to bypass the cache for this call
+        """
+        return json.dumps(data.dict(), sort_keys=True, default=str)
+        
+    def cache_dependencies(
+        self,
+        data: InputType,
+        context: Dict[str, Any],
+        result: OutputType
+    ) -> Optional[List[str]]:
+        """
+        [Function intent]
+        Returns the files and directories a cached result depends on.
+        
+        [Design principles]
+        A change of any returned path, reported by the file system monitor,
+        invalidates the result.
+        
+        [Implementation details]
+        Default None means unknown: the result is dropped on any invalidation
+        and otherwise expires with its time-to-live.
+        
+        Args:
+            data: The validated input data
+            context: The prepared execution context
+            result: The computed result
+            
+        Returns:
+            The dependency paths, None if unknown
+        """
+        return None
+        
+    def _run_stream(self, data: InputType, context: Dict[str, Any]) -> AsyncIterable[ChunkType]:
+        """
+        [Function intent]
+        Iterates over the tool's stream according to its execution policy.
+        
+        [Design principles]
+        Single entry point to the stream() method for all callers.
+        
+        [Implementation details]
+        Delegates to the shared ToolExecutor.
+        
+        Args:
+            data: The validated input data
+            context: The prepared execution context
+            
+        Returns:
+            Async iterator over the chunks
+        """
+        return get_tool_executor().stream(
+            self.name, self._stream_with_context, data, self._offload_context(context)
+        )
+        
+    def _stream_with_context(self, data: InputType, context: Dict[str, Any]) -> AsyncIterable[ChunkType]:
+        """
+        [Function intent]
+        Calls stream() wherever the executor runs it.
+        
+        [Implementation details]
+        Restores the default callbacks removed from the context sent to a process.
+        
+        Args:
+            data: The validated input data
+            context: The execution context
+            
+        Returns:
+            Async iterator over the chunks
+        """
+        return self.stream(data, self._prepare_context(context))
+        
+    async def _execute_with_context(self, data: InputType, context: Dict[str, Any]) -> OutputType:
+        """
+        [Function intent]
+        Calls an overridden execute() wherever the executor runs it.
+        
+        Args:
+            data: The validated input data
+            context: The execution context
+            
+        Returns:
+            The tool's output
+        """
+        return await self.execute(data, self._prepare_context(context))
+        
+    def _offload_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        [Function intent]
+        Gets the context to send along with a call to the executor.
+        
+        [Implementation details]
+        Callbacks cannot be sent to a process pool worker, which uses the
+        default callbacks instead.
+        
+        Args:
+            context: The prepared execution context
+            
+        Returns:
+            The context, without callables for the process policy
+        """
+        if self.execution_policy is not ExecutionPolicy.PROCESS:
+            return context
+        return {key: value for key, value in context.items() if not callable(value)}
+        
     def _prepare_context(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         [Function intent]
@@ -346,7 +547,10 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
         Converts streaming output to non-streaming output.
         
         [Implementation details]
-        Collects chunks from stream method and builds final result.
+        Collects chunks from the stream, run according to the execution policy,
+        and builds final result. Consecutive
+        text chunks are accumulated in a TextBuffer and kept as one chunk, so
+        text-producing tools do not retain one object per streamed fragment.
         
         Args:
             data: The input data
@@ -356,10 +560,18 @@ class MCPTool(Generic[InputType, OutputType, ChunkType], ABC):
             The final result
         """
         chunks = []
+        text = TextBuffer()
         
         # Collect all chunks
-        async for chunk in self.stream(data, context):
+        async for chunk in self._run_stream(data, context):
+            if isinstance(chunk, str):
+                text.append(chunk)
+                continue
+            if len(text):
+                chunks.append(text.take())
             chunks.append(chunk)
+        if len(text):
+            chunks.append(text.take())
             
         # Build the final result
         return self._build_result_from_chunks(chunks)
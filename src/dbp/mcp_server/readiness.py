@@ -0,0 +1,88 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Connects the MCP server to the readiness of the system components: reports it
+# on the health endpoint and lets tools and resources await the components
+# still initializing in the background before running.
+###############################################################################
+# [Source file design principles]
+# - Requests wait for a warming component instead of failing
+# - The event loop never blocks: waits run on the default executor
+# - Works without a component system (standalone server, benchmarks)
+###############################################################################
+# [Source file constraints]
+# - Waits are bounded by initialization.component_wait_timeout_seconds
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/system.py
+# system:asyncio
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T20:40:00Z : Initial implementation by CodeAssistant
+# * Added readiness report and awaiting of deferred components for MCP requests
+###############################################################################
+
+import asyncio
+import time
+from typing import Any, Dict, Optional, Sequence
+
+from ..core.system import ComponentSystem
+
+
+def get_readiness() -> Optional[Dict[str, Any]]:
+    """
+    [Function intent]
+    Reports the readiness of the system components.
+
+    Returns:
+        ComponentSystem.get_readiness() report, or None without a component system
+    """
+    system = ComponentSystem.get_instance()
+    return system.get_readiness() if system else None
+
+
+def _wait_for_components(system: ComponentSystem, names: Sequence[str], timeout: Optional[float]) -> None:
+    """
+    [Function intent]
+    Waits for several components under a single deadline.
+    """
+    deadline = time.monotonic() + (system.component_wait_timeout if timeout is None else timeout)
+    for name in names:
+        system.wait_for_component(name, max(0.0, deadline - time.monotonic()))
+
+
+async def await_components(names: Sequence[str], timeout: Optional[float] = None) -> None:
+    """
+    [Function intent]
+    Waits until the given components are ready to serve a request.
+
+    [Implementation details]
+    Returns at once when every component is initialized, the common case
+    once the system has warmed up. Otherwise waits on a thread of the
+    default executor.
+
+    Args:
+        names: Names of the components required by the request
+        timeout: Maximum wait in seconds, None for the configured default
+
+    Raises:
+        ComponentNotReadyError: If a component is not ready within the timeout
+        ComponentError: If a component failed to initialize or is not registered
+    """
+    system = ComponentSystem.get_instance()
+    if system is None:
+        return
+    pending = [name for name in names if not system.is_component_ready(name)]
+    if pending:
+        await asyncio.get_running_loop().run_in_executor(None, _wait_for_components, system, pending, timeout)
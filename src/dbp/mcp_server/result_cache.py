@@ -0,0 +1,720 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides the request-level result cache of MCP tools and resources: results
+# of cacheable requests are reused, concurrent identical requests share one
+# computation (single-flight), and entries are invalidated when the files
+# they depend on change.
+###############################################################################
+# [Source file design principles]
+# - Opt-in per tool or resource, which also defines the cache key
+# - Bounded memory: LRU eviction and optional time-to-live
+# - Never serve a result older than a reported change of its dependencies
+# - Same behavior in single-worker and multi-worker deployments: file system
+#   events reach the coordinator, workers pull the invalidations from it
+###############################################################################
+# [Source file constraints]
+# - Cached results are shared between callers and must not be mutated
+# - The cache must be created in the coordinator before workers are forked
+#   (the invalidation sequence lives in shared memory)
+# - Entries without declared dependencies are dropped on every invalidation
+#   and otherwise only expire with their time-to-live
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/fs_monitor/core/listener.py
+# codebase:src/dbp/mcp_server/coordinator.py
+# codebase:src/dbp/mcp_server/exceptions.py
+# system:asyncio
+# system:multiprocessing
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T03:00:00Z : Released unused dependency watches by CodeAssistant
+# * Unsubscribed from a dependency path once no entry of any process depends on it
+# * Counted the processes holding each watched path in the coordinator, released the paths of exited workers
+# * Dropped inherited entries in forked workers
+# 2026-10-19T00:10:00Z : Dispatched cache invalidations first by CodeAssistant
+# * ResultCacheInvalidator declares the high dispatch priority
+# 2026-10-18T18:00:00Z : Initial implementation by CodeAssistant
+# * Added ResultCache with LRU/TTL storage, single-flight computation and dependency invalidation
+# * Added ResultCacheInvalidator file system listener and coordinator invalidation sync
+###############################################################################
+
+"""
+Request-level result cache for MCP tools and resources.
+"""
+
+import asyncio
+import ctypes
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from ..fs_monitor.core.listener import BaseFileSystemEventListener
+from .exceptions import CoordinatorError
+
+logger = logging.getLogger(__name__)
+
+# Invalidations kept in the coordinator for workers catching up; a worker
+# further behind clears its whole cache
+INVALIDATION_LOG_SIZE = 1024
+
+_MISSING = object()
+
+
+class _Entry:
+    """
+    [Class intent]
+    A cached result with its expiry time and dependencies.
+    """
+
+    __slots__ = ("value", "expires", "paths")
+
+    def __init__(self, value: Any, expires: Optional[float], paths: Optional[Tuple[str, ...]]):
+        self.value = value
+        self.expires = expires
+        self.paths = paths
+
+
+class ResultCache:
+    """
+    [Class intent]
+    Caches the results of MCP tool calls and resource reads by request key and
+    coalesces concurrent identical requests onto one computation.
+
+    [Design principles]
+    - Keys are (namespace, key) pairs: the tool or resource name and its
+      request key, so identical inputs of different tools never collide
+    - A computation runs in its own task: a caller going away does not cancel
+      it for the other callers waiting on it
+    - A result computed while an invalidation happened is returned, not stored
+
+    [Implementation details]
+    - OrderedDict in LRU order guarded by a lock, entries carry their expiry
+    - Dependency index from path to keys; an invalidated path also invalidates
+      the entries depending on any of its parent directories
+    - In-flight computations keyed per event loop
+    - The coordinator logs invalidated paths and bumps a shared-memory sequence;
+      workers compare the sequence on each lookup and fetch the missed paths
+      through the coordinator channel
+    - A dependency path is watched while an entry of any process depends on
+      it: the coordinator counts the processes holding each path and
+      unsubscribes a path once none holds it
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0):
+        """
+        [Class method intent]
+        Create an empty cache.
+
+        Args:
+            max_entries: Maximum number of cached results, 0 disables caching
+            ttl_seconds: Default time-to-live of entries, 0 keeps entries until
+                evicted or invalidated
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+        self._by_path: Dict[str, Set[Tuple[str, Hashable]]] = {}
+        self._undeclared: Set[Tuple[str, Hashable]] = set()
+        self._in_flight: Dict[Tuple[Any, str, Hashable], asyncio.Task] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+        # Multi-worker invalidation propagation
+        self._owner_pid = os.getpid()
+        self._sequence = multiprocessing.RawValue(ctypes.c_uint64, 0)
+        self._synced_sequence = 0
+        self._log: deque = deque(maxlen=INVALIDATION_LOG_SIZE)
+        self._channel = None
+
+        # File watching of dependencies: paths this process holds a watch on,
+        # paths no entry depends on any more, and in the coordinator the
+        # processes holding each subscribed path
+        self._watcher: Optional[Callable[[List[str]], None]] = None
+        self._unwatcher: Optional[Callable[[List[str]], None]] = None
+        self._watched: Set[str] = set()
+        self._released: Set[str] = set()
+        self._holders: Dict[str, Set[int]] = {}
+        self._watch_update_lock = threading.Lock()
+        self._holders_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """
+        [Class method intent]
+        Check whether results are cached at all.
+
+        Returns:
+            bool: False when max_entries is 0
+        """
+        return self.max_entries > 0
+
+    def attach_coordinator(self, channel) -> None:
+        """
+        [Class method intent]
+        Share invalidations and watch requests with the worker processes.
+
+        [Implementation details]
+        Called in the coordinator before the workers are forked; registers the
+        operations the workers call through the channel.
+
+        Args:
+            channel: The CoordinatorChannel of the server
+        """
+        self._channel = channel
+        channel.register("result_cache.invalidations_since", self._invalidations_since)
+        channel.register("result_cache.update_watches", self._update_holders)
+
+    def set_watcher(self, watcher: Optional[Callable[[List[str]], None]],
+                    unwatcher: Optional[Callable[[List[str]], None]] = None) -> None:
+        """
+        [Class method intent]
+        Set the functions subscribing to and unsubscribing from changes of
+        dependency paths.
+
+        Args:
+            watcher: Called in the coordinator with paths not watched yet,
+                None to stop subscribing
+            unwatcher: Called in the coordinator with watched paths no cached
+                entry depends on any more
+        """
+        self._watcher = watcher
+        self._unwatcher = unwatcher
+
+    def release_process(self, pid: int) -> None:
+        """
+        [Class method intent]
+        Drop the watches held by a worker process that exited.
+
+        Args:
+            pid: Process ID of the worker
+        """
+        self._update_holders(pid, [], None)
+
+    async def get_or_compute(
+        self,
+        namespace: str,
+        key: Optional[Hashable],
+        compute: Callable[[], Awaitable[Any]],
+        dependencies: Optional[Callable[[Any], Optional[Iterable[str]]]] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> Any:
+        """
+        [Class method intent]
+        Return the cached result of a request, computing it once if missing.
+
+        [Implementation details]
+        Concurrent callers with the same key await the task of the first one.
+        A failed computation is reported to all its callers and not cached.
+
+        Args:
+            namespace: Tool or resource name
+            key: Hashable request key, None bypasses the cache
+            compute: Coroutine function producing the result
+            dependencies: Called with the result, returns the file and
+                directory paths the result depends on (None: unknown)
+            ttl_seconds: Time-to-live of this entry, overrides the default
+
+        Returns:
+            Any: The cached or computed result
+        """
+        if key is None or not self.enabled:
+            return await compute()
+
+        await self._sync()
+        cache_key = (namespace, key)
+        value = self._lookup(cache_key)
+        if value is not _MISSING:
+            return value
+
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, namespace, key)
+        task = self._in_flight.get(flight_key)
+        if task is None:
+            with self._lock:
+                self._misses += 1
+            task = loop.create_task(
+                self._compute(flight_key, cache_key, compute, dependencies, ttl_seconds)
+            )
+            # Retrieve the exception when every caller went away
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._in_flight[flight_key] = task
+        else:
+            with self._lock:
+                self._coalesced += 1
+        return await asyncio.shield(task)
+
+    def invalidate_path(self, path: str) -> int:
+        """
+        [Class method intent]
+        Drop the entries depending on a changed file or directory.
+
+        Args:
+            path: Changed path
+
+        Returns:
+            int: Number of dropped entries
+        """
+        path = os.path.abspath(path)
+        count = self._invalidate_local([path])
+        self._record(path)
+        self._update_watches()
+        return count
+
+    def invalidate_all(self) -> int:
+        """
+        [Class method intent]
+        Drop all entries, in every worker.
+
+        Returns:
+            int: Number of dropped entries in this process
+        """
+        count = self._invalidate_local(None)
+        self._record(None)
+        self._update_watches()
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        [Class method intent]
+        Get the cache statistics of this process.
+
+        [Implementation details]
+        hit_ratio counts coalesced requests as hits: they did not compute.
+
+        Returns:
+            Dict[str, Any]: Counters, size, settings and hit ratio
+        """
+        with self._lock:
+            served = self._hits + self._coalesced
+            lookups = served + self._misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._in_flight),
+                "invalidations": self._invalidations,
+                "evictions": self._evictions,
+                "watched_paths": len(self._watched),
+                "hit_ratio": served / lookups if lookups else 0.0,
+            }
+
+    def _lookup(self, cache_key: Tuple[str, Hashable]) -> Any:
+        """
+        [Class method intent]
+        Get a live entry and mark it recently used.
+
+        Returns:
+            Any: The cached value, _MISSING if absent or expired
+        """
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is None:
+                return _MISSING
+            if entry.expires is not None and entry.expires <= time.monotonic():
+                self._remove(cache_key)
+                return _MISSING
+            self._entries.move_to_end(cache_key)
+            self._hits += 1
+            return entry.value
+
+    async def _compute(
+        self,
+        flight_key: Tuple[Any, str, Hashable],
+        cache_key: Tuple[str, Hashable],
+        compute: Callable[[], Awaitable[Any]],
+        dependencies: Optional[Callable[[Any], Optional[Iterable[str]]]],
+        ttl_seconds: Optional[float],
+    ) -> Any:
+        """
+        [Class method intent]
+        Run one computation and store its result.
+
+        Returns:
+            Any: The computed result
+        """
+        generation = self._generation
+        try:
+            value = await compute()
+        finally:
+            self._in_flight.pop(flight_key, None)
+
+        paths = dependencies(value) if dependencies else None
+        if paths is not None:
+            paths = tuple(sorted({os.path.abspath(p) for p in paths}))
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            if generation != self._generation:
+                # Dependencies may have changed while computing
+                return value
+            self._remove(cache_key)
+            self._entries[cache_key] = _Entry(value, expires, paths)
+            if paths is None:
+                self._undeclared.add(cache_key)
+            else:
+                for path in paths:
+                    self._by_path.setdefault(path, set()).add(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+        if paths or self._released:
+            await self._request_watch_update(paths or ())
+        return value
+
+    def _remove(self, cache_key: Tuple[str, Hashable]) -> None:
+        """
+        [Class method intent]
+        Remove an entry and its index references, the caller holds the lock.
+        """
+        entry = self._entries.pop(cache_key, None)
+        if entry is None:
+            return
+        if entry.paths is None:
+            self._undeclared.discard(cache_key)
+            return
+        for path in entry.paths:
+            keys = self._by_path.get(path)
+            if keys is not None:
+                keys.discard(cache_key)
+                if not keys:
+                    del self._by_path[path]
+                    self._released.add(path)
+
+    def _invalidate_local(self, paths: Optional[List[str]]) -> int:
+        """
+        [Class method intent]
+        Drop the entries of this process depending on the given paths.
+
+        Args:
+            paths: Absolute changed paths, None drops everything
+
+        Returns:
+            int: Number of dropped entries
+        """
+        with self._lock:
+            self._generation += 1
+            if paths is None:
+                count = len(self._entries)
+                self._released.update(self._by_path)
+                self._entries.clear()
+                self._by_path.clear()
+                self._undeclared.clear()
+                self._invalidations += count
+                return count
+
+            keys = set(self._undeclared)
+            for path in paths:
+                # The path itself and every directory containing it
+                current = path
+                while True:
+                    keys.update(self._by_path.get(current, ()))
+                    parent = os.path.dirname(current)
+                    if parent == current:
+                        break
+                    current = parent
+            for cache_key in keys:
+                self._remove(cache_key)
+            self._invalidations += len(keys)
+            return len(keys)
+
+    def _record(self, path: Optional[str]) -> None:
+        """
+        [Class method intent]
+        Publish an invalidation of the coordinator to the workers.
+
+        Args:
+            path: Invalidated path, None for everything
+        """
+        if self._channel is None or os.getpid() != self._owner_pid:
+            return
+        with self._lock:
+            sequence = self._sequence.value + 1
+            self._log.append((sequence, path))
+            self._sequence.value = sequence
+            self._synced_sequence = sequence
+
+    def _invalidations_since(self, sequence: int) -> Tuple[int, Optional[List[str]]]:
+        """
+        [Class method intent]
+        Coordinator operation returning the invalidations a worker missed.
+
+        Args:
+            sequence: Last sequence applied by the worker
+
+        Returns:
+            Tuple[int, Optional[List[str]]]: Current sequence and the changed
+                paths, None when the worker must drop everything
+        """
+        with self._lock:
+            current = self._sequence.value
+            if not self._log or self._log[0][0] > sequence + 1:
+                return current, None
+            paths = [path for number, path in self._log if number > sequence]
+        if None in paths:
+            return current, None
+        return current, paths
+
+    async def _sync(self) -> None:
+        """
+        [Class method intent]
+        Apply the invalidations published by the coordinator since the last lookup.
+
+        [Implementation details]
+        A single shared-memory read when nothing changed. When the coordinator
+        cannot be reached the worker drops its entries rather than risk stale ones.
+        """
+        if self._channel is None or os.getpid() == self._owner_pid:
+            return
+        sequence = self._sequence.value
+        if sequence == self._synced_sequence:
+            return
+        try:
+            current, paths = await self._channel.acall(
+                "result_cache.invalidations_since", self._synced_sequence
+            )
+        except CoordinatorError as e:
+            logger.warning(f"Cannot fetch result cache invalidations, clearing the cache: {e}")
+            current, paths = sequence, None
+        self._invalidate_local(paths)
+        self._synced_sequence = max(self._synced_sequence, current)
+        if self._released:
+            await self._request_watch_update(())
+
+    async def _request_watch_update(self, paths: Iterable[str]) -> None:
+        """
+        [Class method intent]
+        Update the watches of this process off the event loop.
+
+        Args:
+            paths: Dependency paths of a new entry
+        """
+        try:
+            await asyncio.to_thread(self._update_watches, paths)
+        except Exception as e:
+            logger.debug(f"Cannot update result cache dependency watches: {e}")
+
+    def _update_watches(self, paths: Iterable[str] = ()) -> None:
+        """
+        [Class method intent]
+        Hold watches on new dependency paths and release the paths no entry
+        of this process depends on any more.
+
+        [Implementation details]
+        - Updates are serialized, so that the coordinator receives the watch
+          and release of a path in the order this process decided them
+        - Workers send their update to the coordinator, which owns the file
+          system monitor; a failed update is logged, entries still expire
+          with their time-to-live
+
+        Args:
+            paths: Dependency paths of a new entry
+        """
+        with self._watch_update_lock:
+            with self._lock:
+                watch = [path for path in paths if path not in self._watched and path in self._by_path]
+                release = [path for path in self._released if path in self._watched and path not in self._by_path]
+                self._released.clear()
+                self._watched.update(watch)
+                self._watched.difference_update(release)
+            if not watch and not release:
+                return
+            try:
+                if self._channel is not None and os.getpid() != self._owner_pid:
+                    self._channel.call("result_cache.update_watches", os.getpid(), watch, release)
+                else:
+                    self._update_holders(os.getpid(), watch, release)
+            except Exception as e:
+                logger.debug(f"Cannot update result cache dependency watches: {e}")
+
+    def _update_holders(self, pid: int, watch: List[str], release: Optional[List[str]]) -> None:
+        """
+        [Class method intent]
+        Coordinator operation recording the dependency paths a process holds
+        or released, subscribing to the first held and unsubscribing from the
+        last released paths.
+
+        Args:
+            pid: Process holding or releasing the paths
+            watch: Paths the process now depends on
+            release: Paths the process no longer depends on, None for all
+        """
+        with self._holders_lock:
+            subscribe, unsubscribe = [], []
+            for path in watch:
+                holders = self._holders.setdefault(path, set())
+                if not holders:
+                    subscribe.append(path)
+                holders.add(pid)
+            for path in (list(self._holders) if release is None else release):
+                holders = self._holders.get(path)
+                if holders is None or pid not in holders:
+                    continue
+                holders.discard(pid)
+                if not holders:
+                    del self._holders[path]
+                    unsubscribe.append(path)
+            if subscribe and self._watcher is not None:
+                self._watcher(subscribe)
+            if unsubscribe and self._unwatcher is not None:
+                self._unwatcher(unsubscribe)
+
+    def _after_fork(self) -> None:
+        """
+        [Class method intent]
+        Reset process-local state in a forked worker.
+
+        [Implementation details]
+        The inherited entries are dropped: their dependency watches are held by
+        the coordinator, not by this worker. The in-flight tasks belong to the
+        parent's event loop.
+        """
+        self._lock = threading.Lock()
+        self._watch_update_lock = threading.Lock()
+        self._holders_lock = threading.Lock()
+        self._in_flight = {}
+        self._entries.clear()
+        self._by_path.clear()
+        self._undeclared.clear()
+        self._watched = set()
+        self._released = set()
+        self._holders = {}
+        self._synced_sequence = self._sequence.value
+
+
+class ResultCacheInvalidator(BaseFileSystemEventListener):
+    """
+    [Class intent]
+    File system listener invalidating the result cache entries depending on
+    one watched file or directory.
+
+    [Implementation details]
+    A directory is watched recursively; every event type invalidates the
+    path it reports.
+    """
+
+    def __init__(self, cache: ResultCache, path: str):
+        """
+        [Class method intent]
+        Create a listener for one dependency path.
+
+        Args:
+            cache: The cache to invalidate
+            path: Absolute file or directory path
+        """
+        self._cache = cache
+        self._pattern = os.path.join(path, "**") if os.path.isdir(path) else path
+
+    @property
+    def path_pattern(self) -> str:
+        return self._pattern
+
+    @property
+    def dispatch_priority(self) -> str:
+        # Stale results are served until the invalidation runs
+        return "high"
+
+    def on_file_created(self, path: str) -> None:
+        self._cache.invalidate_path(path)
+
+    def on_file_modified(self, path: str) -> None:
+        self._cache.invalidate_path(path)
+
+    def on_file_deleted(self, path: str) -> None:
+        self._cache.invalidate_path(path)
+
+    def on_directory_created(self, path: str) -> None:
+        self._cache.invalidate_path(path)
+
+    def on_directory_deleted(self, path: str) -> None:
+        self._cache.invalidate_path(path)
+
+    def on_symlink_created(self, path: str, target: str) -> None:
+        self._cache.invalidate_path(path)
+
+    def on_symlink_deleted(self, path: str) -> None:
+        self._cache.invalidate_path(path)
+
+    def on_symlink_target_changed(self, path: str, old_target: str, new_target: str) -> None:
+        self._cache.invalidate_path(path)
+
+
+_cache: Optional[ResultCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """
+    [Function intent]
+    Get the process-wide result cache, created with default settings on first use.
+
+    Returns:
+        ResultCache: The shared cache
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResultCache()
+    return _cache
+
+
+def configure_result_cache(max_entries: int, ttl_seconds: float) -> ResultCache:
+    """
+    [Function intent]
+    Set the size and default time-to-live of the process-wide result cache.
+
+    [Implementation details]
+    Drops the cached entries, which were stored under the previous settings.
+
+    Args:
+        max_entries: Maximum number of cached results, 0 disables caching
+        ttl_seconds: Default time-to-live, 0 for no expiry
+
+    Returns:
+        ResultCache: The shared cache
+    """
+    cache = get_result_cache()
+    cache.max_entries = max_entries
+    cache.ttl_seconds = ttl_seconds
+    cache.invalidate_all()
+    return cache
+
+
+def _reset_after_fork() -> None:
+    """
+    [Function intent]
+    Reset the shared cache in a forked child.
+    """
+    if _cache is not None:
+        _cache._after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -27,63 +27,96 @@
 ###############################################################################
 # [Source file constraints]
 # - Must use FastMCP for MCP protocol implementation
+# - Multi-worker mode forks the coordinator process and is only available on
+#   platforms providing os.fork
+# - Background threads of the coordinator (fs_monitor, database) do not exist in
+#   workers: stateful operations must go through the coordinator channel
+# - /metrics of a worker reports every process through the coordinator channel:
+#   the other workers as of their last snapshot push
+# - /profile profiles the coordinator and every worker: each worker keeps one
+#   long-polling profile.poll call open to receive the profile requests
+# - Workers never use the database connections inherited from the coordinator:
+#   the pool is discarded after the fork and fs_monitor and database operations
+#   run in the coordinator (see MCPServerComponent._attach_stateful_components)
 # - Must provide clear log messages during operation
 # - Must maintain proper error handling
 # - Must support health endpoint
 ###############################################################################
 # [Dependencies]
 # system:- fastmcp
+# system:- uvicorn
 # system:- logging
+# system:- os
+# system:- signal
 # system:- threading
 # system:- time
 # system:- socket
 # system:- requests
+# codebase:- src/dbp/mcp_server/coordinator.py
+# codebase:- src/dbp/mcp_server/execution.py
+# codebase:- src/dbp/mcp_server/readiness.py
+# codebase:- src/dbp/mcp_server/result_cache.py
+# codebase:- src/dbp/core/metrics.py
+# codebase:- src/dbp/core/profiler.py
 ###############################################################################
 # [GenAI tool change history]
-# 2025-04-27T18:56:00Z : Fixed server startup to use uvicorn directly by CodeAssistant
-# * Changed server startup to use uvicorn.run() instead of FastMCP.run()
-# * Fixed issue with FastMCP.from_fastapi() integration
-# * Ensured proper FastAPI app execution
-# * Maintained FastMCP integration for MCP protocol support
-# 2025-04-27T18:48:00Z : Enhanced server availability checking with detailed logging by CodeAssistant
-# * Added detailed debug logging for health endpoint checks
-# * Improved diagnostics for server startup issues
-# * Made server availability checking more robust
-# 2025-04-27T17:42:00Z : Fixed FastMCP run method parameters by CodeAssistant
-# * Removed workers parameter from FastMCP.run() call
-# * Fixed TypeError in run_sse_async() method
-# * Simplified server startup process
-# 2025-04-27T17:38:00Z : Updated FastMCP integration to use FastAPI first by CodeAssistant
-# * Modified server to create FastAPI instance first and then hook FastMCP to it
-# * Fixed issue with accessing app attribute in FastMCP v2
-# * Used FastMCP.from_fastapi() to create FastMCP instance from FastAPI app
-# * Maintained same functionality with improved architecture
-# 2025-04-27T00:15:00Z : Replaced homemade MCP implementation with FastMCP by CodeAssistant
-# * Completely replaced the homemade MCP implementation with FastMCP
-# * Removed all code related to capability negotiation, session management, etc.
-# * Simplified the server implementation by delegating to FastMCP
-# * Added design decision about using MCPTool for validation in design principles
-# 2025-04-25T18:13:54Z : Updated MCP tool registration to use MCPTool objects by CodeAssistant
-# * Modified register_mcp_tool to accept MCPTool objects instead of handler functions
-# * Updated unregister_mcp_tool to accept either MCPTool objects or tool names
-# * Added direct import of MCPTool and MCPResource classes
-# * Enhanced FastAPI integration using MCPTool's handler method
+# 2026-10-19T05:10:00Z : Profiled every server process by CodeAssistant
+# * POST /profile starts a profile in the coordinator and every worker through the coordinator channel and returns each process's profile
+# * GET /profile reports the profile status of every process
+# * Workers receive profile requests through a long-polling profile.poll call
+# 2026-10-19T04:20:00Z : Documented coordinator-owned state by CodeAssistant
+# * Workers run fs_monitor and database operations in the coordinator instead of opening their own connections
+# 2026-10-19T03:00:00Z : Released result cache watches of exited workers by CodeAssistant
+# * Reaped workers release the dependency watches they held
+# 2026-10-19T02:10:00Z : Aggregated /metrics across processes by CodeAssistant
+# * In multi-worker mode /metrics merges the coordinator and worker snapshots through the coordinator channel, labelled by process
+# * Workers push their metric snapshot to the coordinator every METRICS_PUSH_INTERVAL seconds
+# 2026-10-19T01:30:00Z : Documented per-worker database connections by CodeAssistant
+# * Workers discard the inherited database connection pool after the fork
+# 2026-10-18T23:10:00Z : Added /profile endpoints by CodeAssistant
+# * POST /profile starts a sampling profile of the serving process, GET /profile reports it
 ###############################################################################
 
+import asyncio
+import gc
 import logging
+import os
+import signal
 import threading
 import time
 import socket
+import tempfile
 import requests
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin
 
 # FastAPI and FastMCP imports
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastmcp import FastMCP
 
+from ..core.log_utils import stop_application_logging
+from ..core.metrics import MetricFamily, get_metrics_registry, render_families, render_prometheus
+from ..core.profiler import ProfilerBusyError, get_profile_status, start_profile
+from ..core.watchdog import get_heartbeat_monitor, register_heartbeat, run_event_loop_probe
+from .coordinator import CoordinatorChannel, CoordinatorError
+from .execution import get_tool_executor
+from .readiness import get_readiness
+from .result_cache import get_result_cache
+
 logger = logging.getLogger(__name__)
 
+# Seconds between the metric snapshots sent by each worker to the coordinator
+METRICS_PUSH_INTERVAL = 10.0
+
+# Longest wait of a worker's profile.poll call for a profile request, and the
+# wait while the worker is profiling, so that its completion is reported soon
+PROFILE_POLL_SECONDS = 30.0
+PROFILE_ACTIVE_POLL_SECONDS = 0.5
+
+# Seconds /profile waits for the workers to report that they started profiling
+PROFILE_START_TIMEOUT = 5.0
+
 class MCPServer:
     """
     [Class intent]
@@ -101,9 +134,16 @@ class MCPServer:
     - Creates and manages FastMCP instance
     - Provides methods for starting and stopping the server
     - Handles server availability checking
+    - With workers > 1 the current process becomes the coordinator: it binds the
+      listening socket, keeps the stateful components, and forks the request
+      workers once all components are initialized (pre-fork: loaded models,
+      registered tools and configuration are shared copy-on-write)
     """
     
-    def __init__(self, name: str, description: str, version: str, host: str, port: int, workers: int = 1):
+    def __init__(self, name: str, description: str, version: str, host: str, port: int, workers: int = 1,
+                 keep_alive: int = 5, graceful_shutdown_timeout: int = 10,
+                 event_loop_stall_seconds: float = 2.0, profile_dir: Optional[str] = None,
+                 profile_interval_ms: int = 5, profile_max_seconds: int = 600):
         """
         [Function intent]
         Initializes a new MCPServer instance with the provided configuration.
@@ -122,7 +162,17 @@ class MCPServer:
             version: Version of the MCP server
             host: Host to bind the server to
             port: Port to bind the server to
-            workers: Number of worker processes
+            workers: Number of request worker processes, 1 serves from a thread
+                of the current process
+            keep_alive: HTTP keep-alive timeout in seconds
+            graceful_shutdown_timeout: Seconds granted to workers to finish
+                in-flight requests on shutdown
+            event_loop_stall_seconds: Event loop lag reported as a stall by
+                the heartbeat monitor
+            profile_dir: Directory of the profiles triggered through /profile,
+                None for a dbp-profiles directory of the temporary directory
+            profile_interval_ms: Milliseconds between two profiler samples
+            profile_max_seconds: Longest profile /profile accepts
         """
         self.logger = logging.getLogger("dbp.mcp_server.server")
         self.logger.info(f"Initializing MCPServer with name={name}, host={host}, port={port}")
@@ -131,13 +181,43 @@ class MCPServer:
         self.host = host
         self.port = port
         self.workers = workers
+        self.keep_alive = keep_alive
+        self.graceful_shutdown_timeout = graceful_shutdown_timeout
+        self.event_loop_stall_seconds = event_loop_stall_seconds
+        self.profile_dir = profile_dir or os.path.join(tempfile.gettempdir(), "dbp-profiles")
+        self.profile_interval_ms = profile_interval_ms
+        self.profile_max_seconds = profile_max_seconds
         self.name = name
         self.version = version
+        if self.workers > 1 and not hasattr(os, "fork"):
+            self.logger.warning("Multi-worker mode requires os.fork, serving with a single worker")
+            self.workers = 1
         
         # Server state
         self._server_thread = None
+        self._uvicorn_server = None
+        self._socket = None
+        self._worker_pids: Dict[int, int] = {}
+        self._coordinator = CoordinatorChannel()
         self._stop_event = threading.Event()
         self._server_ready = False
+        self._event_loop_probe = None
+        
+        # Metrics aggregation of multi-worker mode: index of the serving worker
+        # (None in the coordinator) and, in the coordinator, the latest metric
+        # snapshot pushed by each worker
+        self._worker_index: Optional[int] = None
+        self._worker_metrics: Dict[int, List[MetricFamily]] = {}
+        self._worker_metrics_lock = threading.Lock()
+        self._metrics_push = None
+        
+        # Profiles of multi-worker mode: generation and duration of the latest
+        # profile request and, in the coordinator, the (generation seen, profile
+        # status) last reported by each worker
+        self._profile_condition = threading.Condition()
+        self._profile_generation = 0
+        self._profile_seconds = 0.0
+        self._worker_profiles: Dict[int, Tuple[int, Dict]] = {}
         
         # Record startup time for uptime calculation
         self._startup_time = time.time()
@@ -149,6 +229,22 @@ class MCPServer:
             version=version
         )
         
+        # Event loop heartbeat of the process serving requests (each worker)
+        @self._app.on_event("startup")
+        async def start_event_loop_probe():
+            heartbeat = register_heartbeat("event_loop", self.event_loop_stall_seconds)
+            self._event_loop_probe = asyncio.ensure_future(
+                run_event_loop_probe(heartbeat, self.event_loop_stall_seconds / 4))
+            if self._worker_index is not None:
+                self._metrics_push = asyncio.ensure_future(self._push_worker_metrics())
+        
+        @self._app.on_event("shutdown")
+        async def stop_event_loop_probe():
+            if self._event_loop_probe is not None:
+                self._event_loop_probe.cancel()
+            if self._metrics_push is not None:
+                self._metrics_push.cancel()
+        
         # Add health endpoint directly to FastAPI app
         @self._app.get("/health")
         async def health_check():
@@ -157,9 +253,59 @@ class MCPServer:
                 "status": "healthy" if self._server_ready else "initializing",
                 "server": self.name,
                 "version": self.version,
-                "uptime": time.time() - self._startup_time
+                "uptime": time.time() - self._startup_time,
+                "pid": os.getpid(),
+                "workers": self.workers,
+                "components": get_readiness(),
+                "result_cache": get_result_cache().get_stats(),
+                "watchdog": get_heartbeat_monitor().get_stats()
             }
         
+        # Tool execution statistics of the process serving the request
+        @self._app.get("/tools/metrics")
+        async def tool_metrics():
+            """Queue time, run time and pool occupancy of the tools."""
+            return {"pid": os.getpid(), "tools": get_tool_executor().get_metrics()}
+        
+        # Instrumentation of the coordinator and all workers, Prometheus text format
+        @self._app.get("/metrics", response_class=PlainTextResponse)
+        async def metrics():
+            """Counters, gauges and histograms of the hot paths."""
+            if self._worker_index is None:
+                text = render_prometheus()
+            else:
+                text = render_families(await self._collect_all_metrics())
+            return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+        
+        # On-demand sampling profile of every process of the server
+        @self._app.post("/profile")
+        async def profile(seconds: float = 30.0):
+            """Sample the stacks of all threads of each server process for a number of seconds into collapsed-stack files."""
+            if not 0 < seconds <= self.profile_max_seconds:
+                return JSONResponse(status_code=400, content={
+                    "error": f"seconds must be in (0, {self.profile_max_seconds}]"})
+            if self._worker_index is None:
+                processes = {"server": self._start_local_profile(seconds)}
+            else:
+                try:
+                    processes = await self._coordinator.acall("profile.start", seconds)
+                except CoordinatorError as e:
+                    return JSONResponse(status_code=502, content={"error": str(e)})
+            if all("error" in started for started in processes.values()):
+                return JSONResponse(status_code=409, content={
+                    "error": "No server process started profiling", "processes": processes})
+            return {"seconds": seconds, "processes": processes}
+        
+        @self._app.get("/profile")
+        async def profile_status():
+            """Running and last completed profile of each server process."""
+            if self._worker_index is None:
+                return {"processes": {"server": get_profile_status()}}
+            try:
+                return {"processes": await self._coordinator.acall("profile.status")}
+            except CoordinatorError as e:
+                return JSONResponse(status_code=502, content={"error": str(e)})
+        
         # Create FastMCP instance from FastAPI app
         self._mcp = FastMCP.from_fastapi(
             self._app,
@@ -182,6 +328,8 @@ class MCPServer:
         [Implementation details]
         - Starts the server in a background thread
         - Sets up thread synchronization
+        - In multi-worker mode only binds the socket and starts the coordinator
+          channel; workers are forked by start_workers()
         
         Returns:
             None
@@ -194,14 +342,23 @@ class MCPServer:
         # Import uvicorn here to avoid circular imports
         import uvicorn
         
+        if self.workers > 1:
+            # Bind now so that port conflicts are reported during initialization
+            self._socket = self._uvicorn_config().bind_socket()
+            self._coordinator.register("metrics.push", self._store_worker_metrics)
+            self._coordinator.register("metrics.collect", self._merge_worker_metrics)
+            self._coordinator.register("profile.start", self._start_all_profiles)
+            self._coordinator.register("profile.status", self._collect_profile_status)
+            self._coordinator.register("profile.poll", self._poll_profile_request)
+            self._coordinator.start()
+            self.logger.info(f"MCP server bound to {self.host}:{self.port}, "
+                             f"{self.workers} workers start once components are initialized")
+            return
+        
         # Start the server in a background thread using uvicorn directly
+        self._uvicorn_server = uvicorn.Server(self._uvicorn_config())
         self._server_thread = threading.Thread(
-            target=lambda: uvicorn.run(
-                self._app,
-                host=self.host,
-                port=self.port,
-                log_level="info"
-            ),
+            target=self._uvicorn_server.run,
             daemon=True
         )
         self._server_thread.start()
@@ -216,6 +373,44 @@ class MCPServer:
         self._server_ready = True
         self.logger.info(f"MCP server started successfully on {self.host}:{self.port}")
     
+    def start_workers(self):
+        """
+        [Function intent]
+        Forks the request worker processes of a multi-worker deployment.
+        
+        [Design principles]
+        - Workers start from the fully initialized coordinator (pre-fork loading)
+        - Startup is verified through the health endpoint, as in single-worker mode
+        
+        [Implementation details]
+        - Freezes the garbage collector generations around the fork so that
+          collections in workers do not touch, and copy, the inherited objects
+        - No-op in single-worker mode or when the workers already run
+        
+        Returns:
+            None
+            
+        Raises:
+            RuntimeError: If the workers do not become available
+        """
+        if self.workers <= 1 or self._worker_pids:
+            return
+        self.logger.info(f"Forking {self.workers} MCP server workers")
+        gc.collect()
+        gc.freeze()
+        for index in range(self.workers):
+            self._spawn_worker(index)
+        gc.unfreeze()
+        
+        if not self._check_server_availability():
+            self.logger.error("Failed to start MCP server workers")
+            self.stop()
+            raise RuntimeError("Failed to start MCP server workers")
+        
+        self._server_ready = True
+        self.logger.info(f"MCP server started successfully on {self.host}:{self.port} "
+                         f"with workers {sorted(self._worker_pids)}")
+    
     def stop(self):
         """
         [Function intent]
@@ -227,7 +422,8 @@ class MCPServer:
         
         [Implementation details]
         - Signals the server to stop
-        - Waits for the server thread to exit
+        - Asks uvicorn or the workers to finish in-flight requests, workers still
+          running after the graceful shutdown timeout are killed
         
         Returns:
             None
@@ -237,6 +433,17 @@ class MCPServer:
         # Signal the server to stop
         self._stop_event.set()
         
+        if self._uvicorn_server is not None:
+            self._uvicorn_server.should_exit = True
+            if self._server_thread is not None and self._server_thread is not threading.current_thread():
+                self._server_thread.join(timeout=self.graceful_shutdown_timeout + 1)
+            self._uvicorn_server = None
+        self._stop_workers()
+        self._coordinator.stop()
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        
         # Reset server state
         self._server_ready = False
         
@@ -253,17 +460,374 @@ class MCPServer:
         
         [Implementation details]
         - Waits for the stop event to be set
+        - In multi-worker mode forks the workers if not done yet and replaces
+          workers that exit unexpectedly while waiting
         
         Returns:
             None
         """
         self.logger.info("Waiting for MCP server to exit")
         
-        # Wait for the stop event
-        self._stop_event.wait()
+        if self.workers > 1:
+            self.start_workers()
+            while not self._stop_event.wait(0.5):
+                self._reap_workers(respawn=True)
+        else:
+            # Wait for the stop event
+            self._stop_event.wait()
         
         self.logger.info("MCP server exited")
     
+    @property
+    def coordinator(self) -> CoordinatorChannel:
+        """
+        [Function intent]
+        Returns the channel to the stateful operations of the coordinator process.
+        
+        [Design principles]
+        - Same API in single-worker and multi-worker mode
+        
+        Returns:
+            CoordinatorChannel: The coordinator channel
+        """
+        return self._coordinator
+    
+    def _uvicorn_config(self):
+        """
+        [Function intent]
+        Builds the uvicorn configuration of the server.
+        
+        Returns:
+            uvicorn.Config: Configuration serving the FastAPI app
+        """
+        import uvicorn
+        return uvicorn.Config(
+            self._app,
+            host=self.host,
+            port=self.port,
+            log_level="info",
+            timeout_keep_alive=self.keep_alive,
+            timeout_graceful_shutdown=self.graceful_shutdown_timeout
+        )
+    
+    def _spawn_worker(self, index: int):
+        """
+        [Function intent]
+        Forks one request worker.
+        
+        [Implementation details]
+        - The child serves the inherited socket with its own uvicorn server and
+          leaves with os._exit, never returning into the coordinator's code
+        
+        Args:
+            index: Worker slot number
+            
+        Returns:
+            None
+        """
+        pid = os.fork()
+        if pid:
+            self._worker_pids[pid] = index
+            return
+        
+        exit_code = 0
+        try:
+            self._run_worker(index)
+        except BaseException as e:
+            self.logger.critical(f"MCP server worker {index} failed: {e}", exc_info=True)
+            exit_code = 1
+        finally:
+            stop_application_logging()
+            logging.shutdown()
+            os._exit(exit_code)
+    
+    def _run_worker(self, index: int):
+        """
+        [Function intent]
+        Serves requests in a forked worker until it is asked to stop.
+        
+        [Implementation details]
+        - Restores default signal handling: the coordinator's exit handlers and
+          watchdog do not apply to workers, uvicorn installs its own handlers
+        
+        Args:
+            index: Worker slot number
+            
+        Returns:
+            None
+        """
+        import uvicorn
+        for name in ("SIGTERM", "SIGINT", "SIGHUP", "SIGQUIT", "SIGUSR1", "SIGUSR2"):
+            if hasattr(signal, name):
+                signal.signal(getattr(signal, name), signal.SIG_DFL)
+        self._worker_pids = {}
+        self._worker_metrics = {}
+        self._worker_index = index
+        self._worker_profiles = {}
+        self._server_ready = True
+        threading.Thread(target=self._follow_profile_requests, name="MCPProfileRequests", daemon=True).start()
+        self.logger.info(f"MCP server worker {index} serving (pid {os.getpid()})")
+        uvicorn.Server(self._uvicorn_config()).run(sockets=[self._socket])
+    
+    def _store_worker_metrics(self, index: int, families: List[MetricFamily]) -> None:
+        """
+        [Function intent]
+        Keeps the latest metric snapshot pushed by a worker, in the coordinator.
+        
+        Args:
+            index: Worker slot number
+            families: Metric snapshot of the worker
+            
+        Returns:
+            None
+        """
+        with self._worker_metrics_lock:
+            self._worker_metrics[index] = families
+    
+    def _merge_worker_metrics(self, index: int,
+                              families: List[MetricFamily]) -> List[Tuple[str, List[MetricFamily]]]:
+        """
+        [Function intent]
+        Gathers the metrics of every process of the server, in the coordinator.
+        
+        [Implementation details]
+        - The worker serving the scrape sends its fresh snapshot, the other
+          workers are reported as of their last push
+        - A respawned worker replaces the snapshot of its slot
+        
+        Args:
+            index: Worker slot number of the caller
+            families: Current metric snapshot of the caller
+            
+        Returns:
+            List[Tuple[str, List[MetricFamily]]]: (process name, metric snapshot)
+                of the coordinator and of each worker
+        """
+        self._store_worker_metrics(index, families)
+        with self._worker_metrics_lock:
+            workers = sorted(self._worker_metrics.items())
+        sources = [("coordinator", get_metrics_registry().collect())]
+        sources.extend((f"worker-{worker}", snapshot) for worker, snapshot in workers)
+        return sources
+    
+    async def _collect_all_metrics(self) -> List[Tuple[str, List[MetricFamily]]]:
+        """
+        [Function intent]
+        Gets the metrics of every process of the server, in a worker.
+        
+        [Implementation details]
+        - Falls back to the metrics of this worker alone when the coordinator
+          cannot be reached
+        
+        Returns:
+            List[Tuple[str, List[MetricFamily]]]: (process name, metric snapshot) pairs
+        """
+        families = get_metrics_registry().collect()
+        try:
+            return await self._coordinator.acall("metrics.collect", self._worker_index, families)
+        except CoordinatorError as e:
+            self.logger.warning(f"Serving the metrics of worker {self._worker_index} only: {e}")
+            return [(f"worker-{self._worker_index}", families)]
+    
+    async def _push_worker_metrics(self):
+        """
+        [Function intent]
+        Periodically sends the metrics of this worker to the coordinator, so
+        that scrapes served by another worker include them.
+        
+        Returns:
+            None
+        """
+        while True:
+            await asyncio.sleep(METRICS_PUSH_INTERVAL)
+            try:
+                await self._coordinator.acall("metrics.push", self._worker_index,
+                                              get_metrics_registry().collect())
+            except CoordinatorError as e:
+                self.logger.debug(f"Worker {self._worker_index} metrics push failed: {e}")
+    
+    def _start_local_profile(self, seconds: float) -> Dict:
+        """
+        [Function intent]
+        Starts a profile of the current process.
+        
+        Args:
+            seconds: Duration of the profile
+            
+        Returns:
+            Dict: The started profile, or the pid and error when one is running
+        """
+        try:
+            return start_profile(seconds, self.profile_dir, self.profile_interval_ms / 1000.0)
+        except ProfilerBusyError as e:
+            return {"pid": os.getpid(), "error": str(e)}
+    
+    def _start_all_profiles(self, seconds: float) -> Dict[str, Dict]:
+        """
+        [Function intent]
+        Profiles the coordinator and every worker, in the coordinator.
+        
+        [Implementation details]
+        - Publishes a new profile request generation, which answers the pending
+          profile.poll calls of the workers
+        - Waits up to PROFILE_START_TIMEOUT for each running worker to report
+          the status of that generation
+        
+        Args:
+            seconds: Duration of the profiles
+            
+        Returns:
+            Dict[str, Dict]: Started profile, or error, by process name
+        """
+        processes = {"coordinator": self._start_local_profile(seconds)}
+        with self._profile_condition:
+            self._profile_generation += 1
+            self._profile_seconds = seconds
+            generation = self._profile_generation
+            self._profile_condition.notify_all()
+            workers = sorted(self._worker_pids.values())
+            self._profile_condition.wait_for(
+                lambda: all(self._worker_profiles.get(index, (0, None))[0] >= generation for index in workers),
+                PROFILE_START_TIMEOUT)
+            reports = {index: self._worker_profiles.get(index, (0, None)) for index in workers}
+        for index, (seen, status) in reports.items():
+            if seen < generation:
+                processes[f"worker-{index}"] = {"error": "Worker did not answer the profile request"}
+            elif "error" in status:
+                processes[f"worker-{index}"] = {"pid": status["pid"], "error": status["error"]}
+            else:
+                processes[f"worker-{index}"] = status["active"] or status["last"]
+        return processes
+    
+    def _collect_profile_status(self) -> Dict[str, Dict]:
+        """
+        [Function intent]
+        Gathers the profile status of every process, in the coordinator.
+        
+        [Implementation details]
+        - Workers are reported as of their last profile.poll call, at most
+          PROFILE_ACTIVE_POLL_SECONDS old while they are profiling
+        
+        Returns:
+            Dict[str, Dict]: Profile status by process name
+        """
+        processes = {"coordinator": get_profile_status()}
+        with self._profile_condition:
+            for index, (_, status) in sorted(self._worker_profiles.items()):
+                processes[f"worker-{index}"] = status
+        return processes
+    
+    def _poll_profile_request(self, index: int, seen: int, status: Dict, timeout: float) -> Optional[Dict]:
+        """
+        [Function intent]
+        Records the profile status of a worker and waits for a new profile
+        request, in the coordinator.
+        
+        Args:
+            index: Worker slot number
+            seen: Latest request generation the worker handled
+            status: Profile status of the worker
+            timeout: Longest wait in seconds
+            
+        Returns:
+            Optional[Dict]: The new request (generation, seconds), None on timeout
+        """
+        with self._profile_condition:
+            self._worker_profiles[index] = (seen, status)
+            self._profile_condition.notify_all()
+            if self._profile_condition.wait_for(lambda: self._profile_generation > seen, timeout):
+                return {"generation": self._profile_generation, "seconds": self._profile_seconds}
+        return None
+    
+    def _follow_profile_requests(self):
+        """
+        [Function intent]
+        Starts the profiles requested through the coordinator, in a worker.
+        
+        [Implementation details]
+        - Runs on a daemon thread with its own coordinator connection, blocked
+          in profile.poll between requests
+        - Starts from the request generation inherited at the fork, so a
+          respawned worker does not replay earlier requests
+        - Each poll reports the profile status, with the error of the last
+          request if it could not be started
+        
+        Returns:
+            None
+        """
+        seen = self._profile_generation
+        error = None
+        while True:
+            status = get_profile_status()
+            if error is not None:
+                status["error"] = error
+            timeout = PROFILE_POLL_SECONDS if status["active"] is None else PROFILE_ACTIVE_POLL_SECONDS
+            try:
+                request = self._coordinator.call("profile.poll", self._worker_index, seen, status, timeout)
+            except CoordinatorError as e:
+                self.logger.debug(f"Worker {self._worker_index} profile poll failed: {e}")
+                time.sleep(PROFILE_ACTIVE_POLL_SECONDS)
+                continue
+            if request is None:
+                continue
+            seen = request["generation"]
+            started = self._start_local_profile(request["seconds"])
+            error = started.get("error")
+    
+    def _reap_workers(self, respawn: bool) -> int:
+        """
+        [Function intent]
+        Collects the workers that exited.
+        
+        Args:
+            respawn: Whether to replace the exited workers
+            
+        Returns:
+            int: Number of workers still running
+        """
+        for pid in list(self._worker_pids):
+            try:
+                done, status = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                done, status = pid, 0
+            if not done:
+                continue
+            index = self._worker_pids.pop(pid)
+            get_result_cache().release_process(pid)
+            with self._profile_condition:
+                self._worker_profiles.pop(index, None)
+            if respawn and not self._stop_event.is_set():
+                self.logger.warning(f"MCP server worker {index} (pid {pid}) exited with status {status}, restarting")
+                self._spawn_worker(index)
+        return len(self._worker_pids)
+    
+    def _stop_workers(self):
+        """
+        [Function intent]
+        Stops all workers, gracefully first.
+        
+        Returns:
+            None
+        """
+        if not self._worker_pids:
+            return
+        for pid in self._worker_pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        deadline = time.time() + self.graceful_shutdown_timeout + 1
+        while self._reap_workers(respawn=False) and time.time() < deadline:
+            time.sleep(0.1)
+        for pid in list(self._worker_pids):
+            self.logger.warning(f"MCP server worker {pid} did not stop in time, killing it")
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+        self._worker_pids = {}
+    
     def _check_server_availability(self, timeout: int = 30) -> bool:
         """
         [Function intent]
@@ -0,0 +1,131 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the API key authentication and the permission checks of the MCP
+# server in auth.py.
+###############################################################################
+# [Source file design principles]
+# - Configuration and requests are plain objects with the attributes the
+#   provider reads
+###############################################################################
+# [Source file constraints]
+# - Must not start a server
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/mcp_server/auth.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T03:50:00Z : Created authentication tests by CodeAssistant
+# * Added key validation, permission matching and cached decision tests
+###############################################################################
+
+"""
+Tests for AuthenticationProvider.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from ..auth import AuthenticationProvider, permissions_allow
+
+
+def _provider(auth_enabled=True):
+    config = SimpleNamespace(auth_enabled=auth_enabled, api_keys=[
+        SimpleNamespace(key="admin-key", client_id="admin", permissions=["*:*:*"]),
+        SimpleNamespace(key="ide-key", client_id="ide", permissions=[
+            "tool:get_doc_relationships:execute", "resource:docs:*", "tool:*:read"]),
+    ])
+    return AuthenticationProvider(config)
+
+
+def _request(api_key=None):
+    return SimpleNamespace(headers={} if api_key is None else {"X-API-Key": api_key})
+
+
+def test_authenticate_accepts_only_configured_keys():
+    provider = _provider()
+
+    context = provider.authenticate(_request("ide-key"))
+
+    assert context["client_id"] == "ide"
+    assert "resource:docs:*" in context["permissions"]
+    assert provider.authenticate(_request("ide-key-")) is None
+    assert provider.authenticate(_request("")) is None
+    assert provider.authenticate(_request()) is None
+
+
+def test_keys_are_stored_as_digests_only():
+    provider = _provider()
+
+    stored = [client.digest for client in provider._clients_by_digest.values()]
+
+    assert all(b"ide-key" not in digest and b"admin-key" not in digest for digest in stored)
+    assert len(set(stored)) == 2
+
+
+@pytest.mark.parametrize("resource_type, resource_name, action, allowed", [
+    ("tool", "get_doc_relationships", "execute", True),
+    ("tool", "get_doc_relationships", "write", False),
+    ("tool", "get_mermaid_diagram", "execute", False),
+    ("tool", "get_mermaid_diagram", "read", True),
+    ("resource", "docs", "read", True),
+    ("resource", "docs", "write", True),
+    ("resource", "other", "read", False),
+])
+def test_resource_scoped_and_wildcard_permissions(resource_type, resource_name, action, allowed):
+    provider = _provider()
+    ide = provider.authenticate(_request("ide-key"))
+    admin = provider.authenticate(_request("admin-key"))
+
+    assert provider.authorize(ide, resource_type, resource_name, action) is allowed
+    assert provider.authorize(admin, resource_type, resource_name, action) is True
+
+
+def test_decisions_of_authenticated_clients_are_cached(monkeypatch):
+    provider = _provider()
+    context = provider.authenticate(_request("ide-key"))
+    assert provider.authorize(context, "resource", "docs", "read")
+
+    # A cached decision does not evaluate the permissions again
+    monkeypatch.setattr("dbp.mcp_server.auth.permissions_allow", lambda *args: pytest.fail("evaluated"))
+    assert provider.authorize(context, "resource", "docs", "read")
+    assert provider._clients_by_id["ide"]._decisions == {("resource", "docs", "read"): True}
+
+
+def test_foreign_context_is_checked_without_the_cache():
+    provider = _provider()
+    # Same client ID, but permissions not issued by authenticate()
+    context = {"client_id": "ide", "permissions": {"resource:docs:read"}}
+
+    assert provider.authorize(context, "resource", "docs", "read")
+    assert not provider.authorize(context, "tool", "get_doc_relationships", "execute")
+    assert provider._clients_by_id["ide"]._decisions == {}
+    assert not provider.authorize(None, "resource", "docs", "read")
+
+
+def test_disabled_authentication_allows_everything():
+    provider = _provider(auth_enabled=False)
+
+    assert provider.authenticate(_request())["client_id"] == "anonymous"
+    assert provider.authorize(None, "tool", "anything", "execute")
+
+
+def test_permissions_allow_orders_from_exact_to_global_wildcard():
+    assert permissions_allow(frozenset({"tool:a:execute"}), "tool", "a", "execute")
+    assert permissions_allow(frozenset({"tool:*:*"}), "tool", "b", "write")
+    assert not permissions_allow(frozenset({"tool:*:*"}), "resource", "b", "read")
+    assert permissions_allow(frozenset({"*:*:*"}), "resource", "b", "read")
+    assert not permissions_allow(frozenset(), "tool", "a", "execute")
@@ -0,0 +1,170 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the CoordinatorChannel between the MCP server coordinator and its
+# forked request workers.
+###############################################################################
+# [Source file design principles]
+# - Worker calls are made from a really forked process, as in production
+###############################################################################
+# [Source file constraints]
+# - IPC tests need os.fork and are skipped on other platforms
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/mcp_server/coordinator.py
+# codebase:src/dbp/database/database.py
+# codebase:src/dbp/fs_monitor/component.py
+# system:multiprocessing
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T04:20:00Z : Tested coordinator-owned database and fs_monitor by CodeAssistant
+# * Added tests running the database and fs_monitor operations of a forked worker in the coordinator
+# 2026-10-19T01:30:00Z : Created coordinator channel tests by CodeAssistant
+# * Added in-process and forked worker round trip and error reporting tests
+###############################################################################
+
+"""
+Tests for the coordinator channel.
+"""
+
+import multiprocessing
+import os
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ...database.database import DatabaseComponent
+from ...fs_monitor.component import FSMonitorComponent
+from ...fs_monitor.core.handle import WatchHandle
+from ..coordinator import CoordinatorChannel
+from ..exceptions import CoordinatorError
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+@pytest.fixture
+def channel():
+    channel = CoordinatorChannel()
+    channel.register("math.add", lambda a, b=0: a + b)
+    channel.register("math.fail", _fail)
+    yield channel
+    channel.stop()
+
+
+def _call_in_worker(channel, name, *args, **kwargs):
+    """Call an operation from a forked worker and return ("ok", result) or ("error", exception type, message)."""
+    return _run_in_worker(lambda: channel.call(name, *args, **kwargs))
+
+
+def _run_in_worker(function):
+    """Run a function in a forked worker and return ("ok", result) or ("error", exception type, message)."""
+    context = multiprocessing.get_context("fork")
+    parent_end, child_end = context.Pipe()
+
+    def worker():
+        try:
+            child_end.send(("ok", function()))
+        except Exception as e:
+            child_end.send(("error", type(e).__name__, str(e)))
+
+    process = context.Process(target=worker)
+    process.start()
+    try:
+        assert parent_end.poll(10), "worker did not answer"
+        return parent_end.recv()
+    finally:
+        process.join(10)
+
+
+def test_coordinator_calls_handlers_directly(channel):
+    assert channel.is_coordinator
+    assert channel.call("math.add", 2, b=3) == 5
+
+    with pytest.raises(CoordinatorError) as excinfo:
+        channel.call("math.fail", "boom")
+    assert excinfo.value.operation == "math.fail"
+    assert "ValueError: boom" in str(excinfo.value)
+    with pytest.raises(CoordinatorError):
+        channel.call("math.unknown")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Worker processes are forked")
+def test_worker_round_trip_and_errors(channel):
+    channel.start()
+
+    assert _call_in_worker(channel, "math.add", 2, b=3) == ("ok", 5)
+
+    status, error_type, message = _call_in_worker(channel, "math.fail", "boom")
+    assert (status, error_type) == ("error", "CoordinatorError")
+    assert "ValueError: boom" in message
+
+    # The coordinator keeps serving after a failed operation
+    assert _call_in_worker(channel, "math.add", 1) == ("ok", 1)
+
+
+class _DocumentRepository:
+    """Repository stand-in recording the process each operation runs in."""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_by_path(self, path):
+        self.calls.append((os.getpid(), path))
+        return {"path": path}
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Worker processes are forked")
+def test_worker_database_operations_run_in_coordinator(channel):
+    database = DatabaseComponent()
+    database._initialized = True
+    repository = _DocumentRepository()
+    database._repositories["DocumentRepository"] = repository
+    database.attach_coordinator(channel)
+    channel.start()
+
+    result = _run_in_worker(lambda: database.call_repository("DocumentRepository", "get_by_path", "/a.py"))
+    assert result == ("ok", {"path": "/a.py"})
+    assert repository.calls == [(os.getpid(), "/a.py")]
+
+    # Workers cannot open sessions of their own
+    status, error_type, _ = _run_in_worker(database.get_session)
+    assert (status, error_type) == ("error", "RuntimeError")
+
+    status, error_type, _ = _run_in_worker(lambda: database.call_repository("DocumentRepository", "_secret"))
+    assert (status, error_type) == ("error", "CoordinatorError")
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Worker processes are forked")
+def test_worker_listeners_are_registered_in_coordinator(channel):
+    unregistered = []
+    monitor = FSMonitorComponent()
+    monitor._watch_manager = MagicMock()
+    monitor._watch_manager.register_listener.side_effect = lambda listener: WatchHandle(
+        listener, {listener.path_pattern}, lambda: unregistered.append(listener.path_pattern))
+    monitor.attach_coordinator(channel)
+    channel.start()
+
+    def register_and_unregister():
+        handle = monitor.register_listener(SimpleNamespace(path_pattern="/src/a.py"))
+        paths = handle.list_watched_paths()
+        handle.unregister()
+        return paths
+
+    assert _run_in_worker(register_and_unregister) == ("ok", ["/src/a.py"])
+    assert unregistered == ["/src/a.py"]
+    assert monitor._remote_watches == {}
@@ -0,0 +1,149 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the ToolExecutor running MCP tools according to their execution
+# policy.
+###############################################################################
+# [Source file design principles]
+# - Each test uses its own executor, never the process-wide one
+# - Blocking tool code waits on events instead of sleeping where possible
+###############################################################################
+# [Source file constraints]
+# - Process pool tests only run picklable built-in functions
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/core/metrics.py
+# codebase:src/dbp/mcp_server/execution.py
+# system:pytest
+# system:pytest_asyncio
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T02:10:00Z : Added tool latency registry test by CodeAssistant
+# * Checked that tool calls are recorded in the dbp_mcp_tool_*_seconds histograms
+# 2026-10-19T01:40:00Z : Created tool executor tests by CodeAssistant
+# * Added concurrency limit, saturation, thread and process dispatch and stream early stop tests
+###############################################################################
+
+"""
+Tests for the tool executor.
+"""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from ...core.metrics import MCP_TOOL_QUEUE_SECONDS, MCP_TOOL_RUN_SECONDS
+from ..exceptions import ToolExecutorBusyError
+from ..execution import ExecutionPolicy, ToolExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = ToolExecutor(thread_workers=4, process_workers=1, queue_size=0)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_per_tool(executor):
+    executor.configure_tool("limited", ExecutionPolicy.THREAD, max_concurrency=2)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def work():
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.pop()
+
+    await asyncio.gather(*(executor.run("limited", work) for _ in range(6)))
+
+    assert max(peak) == 2
+    assert executor.get_metrics("limited")["run_time"]["count"] == 6
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_rejects_calls(executor):
+    executor.configure_tool("blocking", ExecutionPolicy.THREAD)
+    executor.thread_workers = 1
+    release = threading.Event()
+
+    first = asyncio.ensure_future(executor.run("blocking", release.wait, 5))
+    await asyncio.sleep(0.05)
+    with pytest.raises(ToolExecutorBusyError):
+        await executor.run("blocking", release.wait, 5)
+    release.set()
+
+    assert await first is True
+    assert executor.get_metrics("blocking")["rejected"] == 1
+    assert executor.get_metrics()["_pools"]["thread"]["admitted"] == 0
+
+
+@pytest.mark.asyncio
+async def test_policies_dispatch_off_the_loop(executor):
+    executor.configure_tool("inline", ExecutionPolicy.INLINE)
+    executor.configure_tool("thread", ExecutionPolicy.THREAD)
+    executor.configure_tool("process", ExecutionPolicy.PROCESS)
+
+    assert await executor.run("inline", threading.get_ident) == threading.get_ident()
+    assert await executor.run("thread", threading.get_ident) != threading.get_ident()
+    assert await executor.run("process", os.getpid) != os.getpid()
+    for name in ("inline", "thread", "process"):
+        assert executor.get_metrics(name)["queue_time"]["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tool_latencies_are_published_in_the_metrics_registry(executor):
+    executor.configure_tool("published", ExecutionPolicy.THREAD)
+    queued = MCP_TOOL_QUEUE_SECONDS.labels(tool="published").get()["count"]
+    ran = MCP_TOOL_RUN_SECONDS.labels(tool="published").get()["count"]
+
+    await executor.run("published", time.sleep, 0.01)
+
+    assert MCP_TOOL_QUEUE_SECONDS.labels(tool="published").get()["count"] == queued + 1
+    assert MCP_TOOL_RUN_SECONDS.labels(tool="published").get()["count"] == ran + 1
+
+
+@pytest.mark.asyncio
+async def test_thread_stream_stops_when_the_consumer_does(executor):
+    executor.configure_tool("stream", ExecutionPolicy.THREAD)
+    produced = []
+    closed = threading.Event()
+
+    async def numbers():
+        try:
+            for number in range(1000):
+                produced.append(number)
+                yield number
+        finally:
+            closed.set()
+
+    stream = executor.stream("stream", numbers)
+    received = []
+    async for chunk in stream:
+        received.append(chunk)
+        if len(received) == 3:
+            break
+    await stream.aclose()
+
+    assert received == [0, 1, 2]
+    assert closed.is_set()
+    assert len(produced) < 1000
+    assert executor.get_metrics()["_pools"]["thread"]["admitted"] == 0
@@ -0,0 +1,90 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the streaming wrapper of the MCPTool base class.
+###############################################################################
+# [Source file design principles]
+# - Tools are exercised through the wrapper FastMCP calls, without a server
+###############################################################################
+# [Source file constraints]
+# - Requires fastmcp and pytest-asyncio
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/mcp_server/mcp_tool.py
+# codebase:src/dbp/llm/common/streaming.py
+# system:pydantic
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T04:40:00Z : Created MCPTool stream wrapper tests by CodeAssistant
+# * Added text chunk coalescing tests of the stream wrapper
+###############################################################################
+
+"""
+Tests for the MCPTool stream wrapper.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from ...llm.common.streaming import StreamCoalescer
+from ..mcp_tool import MCPTool
+
+
+class _Input(BaseModel):
+    tokens: List[str]
+
+
+class _Output(BaseModel):
+    result: List[Any]
+    total_items: int
+
+
+class _Chunk(BaseModel):
+    status: str
+
+
+class _TokenTool(MCPTool[_Input, _Output, _Chunk]):
+    """Tool streaming its input tokens, then a status chunk."""
+
+    def __init__(self):
+        super().__init__("test_tokens", "Streams tokens", _Input, _Output, _Chunk)
+
+    async def stream(self, data: _Input, context: Dict[str, Any]):
+        for token in data.tokens:
+            yield token
+        yield _Chunk(status="done")
+
+
+@pytest.mark.asyncio
+async def test_stream_wrapper_coalesces_text_chunks():
+    tool = _TokenTool()
+    tool.stream_coalescer = StreamCoalescer(min_chars=4, max_latency=1.0)
+    data = _Input(tokens=["ab", "cd", "e"])
+
+    chunks = [chunk async for chunk in tool._stream_wrapper(data)]
+
+    assert chunks == ["abcd", "e", {"status": "done"}]
+
+
+@pytest.mark.asyncio
+async def test_stream_wrapper_without_coalescer_streams_every_chunk():
+    tool = _TokenTool()
+    tool.stream_coalescer = None
+
+    chunks = [chunk async for chunk in tool._stream_wrapper(_Input(tokens=["ab", "cd"]))]
+
+    assert chunks == ["ab", "cd", {"status": "done"}]
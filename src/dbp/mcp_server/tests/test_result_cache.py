@@ -0,0 +1,191 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the MCP result cache: single-flight computation, expiry and
+# invalidation by file system events, in one process and across workers.
+###############################################################################
+# [Source file design principles]
+# - Each test uses its own cache, never the process-wide one
+# - Invalidations are driven through ResultCacheInvalidator as fs_monitor does
+###############################################################################
+# [Source file constraints]
+# - The cross-process test needs os.fork and is skipped on other platforms
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/mcp_server/result_cache.py
+# codebase:src/dbp/mcp_server/coordinator.py
+# system:pytest
+# system:pytest_asyncio
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T03:00:00Z : Added watch release tests by CodeAssistant
+# * Checked that dependency paths are unwatched once no entry of any process depends on them
+# 2026-10-19T01:50:00Z : Created result cache tests by CodeAssistant
+# * Added single-flight, expiry, invalidation and coordinator invalidation tests
+###############################################################################
+
+"""
+Tests for the result cache.
+"""
+
+import asyncio
+import multiprocessing
+import os
+
+import pytest
+
+from ..coordinator import CoordinatorChannel
+from ..result_cache import ResultCache, ResultCacheInvalidator
+
+
+class Counter:
+    """Computation counting its runs and returning the run number."""
+
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    async def __call__(self):
+        self.calls += 1
+        calls = self.calls
+        await asyncio.sleep(self.delay)
+        return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_compute_once():
+    cache = ResultCache()
+    compute = Counter(delay=0.05)
+
+    results = await asyncio.gather(*(cache.get_or_compute("tool", "key", compute) for _ in range(5)))
+
+    assert results == [1] * 5
+    assert await cache.get_or_compute("tool", "key", compute) == 1
+    assert await cache.get_or_compute("other_tool", "key", compute) == 2
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (2, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_their_time_to_live():
+    cache = ResultCache(ttl_seconds=60)
+    compute = Counter()
+
+    assert await cache.get_or_compute("tool", "short", compute, ttl_seconds=0.05) == 1
+    assert await cache.get_or_compute("tool", "long", compute) == 2
+    await asyncio.sleep(0.1)
+
+    assert await cache.get_or_compute("tool", "short", compute, ttl_seconds=0.05) == 3
+    assert await cache.get_or_compute("tool", "long", compute) == 2
+
+
+@pytest.mark.asyncio
+async def test_file_events_invalidate_dependent_entries(tmp_path):
+    cache = ResultCache()
+    watched = []
+    cache.set_watcher(watched.extend)
+    source, other = tmp_path / "a.py", tmp_path / "b.py"
+    source.write_text("a")
+    other.write_text("b")
+    compute_source, compute_other = Counter(), Counter()
+
+    await cache.get_or_compute("tool", "a", compute_source, dependencies=lambda _: [str(source)])
+    await cache.get_or_compute("tool", "b", compute_other, dependencies=lambda _: [str(other)])
+    assert sorted(watched) == sorted([str(source), str(other)])
+
+    invalidator = ResultCacheInvalidator(cache, str(tmp_path))
+    assert invalidator.path_pattern == os.path.join(str(tmp_path), "**")
+    invalidator.on_file_modified(str(source))
+
+    assert await cache.get_or_compute("tool", "a", compute_source) == 2
+    assert await cache.get_or_compute("tool", "b", compute_other) == 1
+
+
+@pytest.mark.asyncio
+async def test_paths_are_unwatched_once_no_entry_depends_on_them(tmp_path):
+    cache = ResultCache(max_entries=2)
+    watched, unwatched = [], []
+    cache.set_watcher(watched.extend, unwatched.extend)
+    shared, evicted = str(tmp_path / "a.py"), str(tmp_path / "b.py")
+
+    await cache.get_or_compute("tool", "a1", Counter(), dependencies=lambda _: [shared])
+    await cache.get_or_compute("tool", "a2", Counter(), dependencies=lambda _: [shared, evicted])
+    assert (sorted(watched), unwatched) == (sorted([shared, evicted]), [])
+
+    # Evicting a1 leaves a2 depending on both paths
+    await cache.get_or_compute("tool", "c", Counter())
+    assert unwatched == []
+    # Evicting a2 releases both paths
+    await cache.get_or_compute("tool", "d", Counter())
+    assert sorted(unwatched) == sorted([shared, evicted])
+    assert cache.get_stats()["watched_paths"] == 0
+
+    # An invalidated path is released, and watched again by the next entry
+    await cache.get_or_compute("tool", "a1", Counter(), dependencies=lambda _: [shared])
+    cache.invalidate_path(shared)
+    assert unwatched.count(shared) == 2
+    await cache.get_or_compute("tool", "a1", Counter(), dependencies=lambda _: [shared])
+    assert watched.count(shared) == 3
+
+
+def test_path_stays_watched_while_a_process_holds_it():
+    cache = ResultCache()
+    watched, unwatched = [], []
+    cache.set_watcher(watched.extend, unwatched.extend)
+
+    cache._update_holders(101, ["/src/a.py", "/src/b.py"], [])
+    cache._update_holders(102, ["/src/a.py"], [])
+    cache._update_holders(101, [], ["/src/a.py"])
+    assert (watched, unwatched) == (["/src/a.py", "/src/b.py"], [])
+
+    cache.release_process(101)
+    assert unwatched == ["/src/b.py"]
+    cache.release_process(102)
+    assert unwatched == ["/src/b.py", "/src/a.py"]
+
+
+def _worker_session(cache, path, connection):
+    """Cache a result in a forked worker, then look it up again after the coordinator invalidated it."""
+    compute = Counter()
+
+    async def lookup():
+        return await cache.get_or_compute("tool", "key", compute, dependencies=lambda _: [path])
+
+    first = asyncio.run(lookup())
+    connection.send("cached")
+    connection.recv()
+    connection.send((first, asyncio.run(lookup()), compute.calls))
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Worker processes are forked")
+def test_workers_fetch_coordinator_invalidations(tmp_path):
+    cache = ResultCache()
+    channel = CoordinatorChannel()
+    cache.attach_coordinator(channel)
+    channel.start()
+    path = str(tmp_path / "a.py")
+    context = multiprocessing.get_context("fork")
+    parent_end, child_end = context.Pipe()
+    worker = context.Process(target=_worker_session, args=(cache, path, child_end))
+    worker.start()
+    try:
+        assert parent_end.poll(10) and parent_end.recv() == "cached"
+        ResultCacheInvalidator(cache, path).on_file_modified(path)
+        parent_end.send("invalidated")
+
+        assert parent_end.poll(10)
+        assert parent_end.recv() == (1, 2, 2)
+    finally:
+        worker.join(10)
+        channel.stop()
@@ -0,0 +1,100 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the profiles of a multi-worker MCP server, started in the
+# coordinator and every worker through the coordinator channel.
+###############################################################################
+# [Source file design principles]
+# - Workers are played by threads calling the coordinator handlers directly
+###############################################################################
+# [Source file constraints]
+# - The profiler itself is replaced, only the request fan-out is tested
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp/mcp_server/server.py
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-19T05:10:00Z : Created multi-worker profile tests by CodeAssistant
+# * Added tests of the profile requests sent to the coordinator and every worker
+###############################################################################
+
+"""
+Tests for the multi-worker profiles of the MCP server.
+"""
+
+import os
+import threading
+
+import pytest
+
+from .. import server as server_module
+from ..server import MCPServer
+
+
+def _started(seconds):
+    return {"pid": os.getpid(), "seconds": seconds, "output": f"/profiles/{os.getpid()}.txt"}
+
+
+@pytest.fixture
+def server(monkeypatch):
+    monkeypatch.setattr(server_module, "start_profile", lambda seconds, output_dir, interval: _started(seconds))
+    monkeypatch.setattr(server_module, "PROFILE_START_TIMEOUT", 2.0)
+    server = MCPServer("test", "Test server", "1.0", "127.0.0.1", 0, workers=2)
+    server._worker_pids = {1001: 0, 1002: 1}
+    return server
+
+
+def _worker(server, index, answer=True):
+    """Play a worker polling for a profile request and reporting the profile it started."""
+    def run():
+        request = server._poll_profile_request(index, 0, {"pid": 1001 + index, "active": None, "last": None}, 5.0)
+        if request is None:
+            return
+        if answer:
+            active = {"pid": 1001 + index, "seconds": request["seconds"], "output": f"/profiles/{1001 + index}.txt"}
+            status = {"pid": 1001 + index, "active": active, "last": None}
+        else:
+            status = {"pid": 1001 + index, "active": None, "last": None, "error": "A profile is already running"}
+        server._poll_profile_request(index, request["generation"], status, 0.01)
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_profile_starts_in_coordinator_and_every_worker(server):
+    workers = [_worker(server, 0), _worker(server, 1, answer=False)]
+    processes = server._start_all_profiles(3.0)
+    for thread in workers:
+        thread.join(5)
+
+    assert processes["coordinator"]["pid"] == os.getpid()
+    assert processes["worker-0"] == {"pid": 1001, "seconds": 3.0, "output": "/profiles/1001.txt"}
+    assert processes["worker-1"] == {"pid": 1002, "error": "A profile is already running"}
+    assert server._collect_profile_status()["worker-0"]["active"]["output"] == "/profiles/1001.txt"
+
+
+def test_profile_reports_workers_not_answering(server, monkeypatch):
+    monkeypatch.setattr(server_module, "PROFILE_START_TIMEOUT", 0.05)
+    thread = _worker(server, 0)
+    processes = server._start_all_profiles(3.0)
+    thread.join(5)
+
+    assert "output" in processes["worker-0"]
+    assert "did not answer" in processes["worker-1"]["error"]
+
+
+def test_poll_times_out_without_request(server):
+    assert server._poll_profile_request(0, server._profile_generation, {"pid": 1001, "active": None, "last": None}, 0.01) is None
+    assert server._collect_profile_status()["worker-0"]["pid"] == 1001
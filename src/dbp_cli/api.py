@@ -19,12 +19,16 @@
 ###############################################################################
 # [Source file design principles]
 # - Abstracts HTTP request/response logic for MCP communication.
-# - Uses the `requests` library for making HTTP calls.
+# - Uses the `requests` library for making HTTP calls, through one pooled
+#   keep-alive `requests.Session` per client.
+# - Remembers per server whether authentication is required, so that only the
+#   first request to a server protected by an API key can be rejected with 401.
 # - Integrates with `AuthenticationManager` to get necessary auth headers.
 # - Provides specific methods for common DBP operations (analyze, recommend, etc.),
 #   which map to corresponding MCP tool/resource calls.
 # - Handles common HTTP errors and MCP-specific errors returned by the server.
 # - Includes configurable timeout for requests.
+# - Tools producing chunks can be consumed incrementally with stream_tool().
 # - Design Decision: Dedicated API Client Class (2025-04-15)
 #   * Rationale: Encapsulates all server communication logic, making command handlers cleaner and simplifying testing of API interactions.
 #   * Alternatives considered: Making HTTP requests directly in command handlers (less reusable, mixes concerns).
@@ -43,6 +47,10 @@
 # system:- src/dbp/mcp_server/data_models.py (MCPRequest/Response/Error structure)
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T18:40:00Z : Added pooled session and streaming by CodeAssistant
+# * Requests go through one keep-alive requests.Session per client instead of module-level requests calls
+# * Authentication is sent up front when the API key is loaded or the server is known to require it, 401 retries are remembered per server
+# * Added stream_tool() yielding chunks of server-sent event or NDJSON responses, and close()/context manager support
 # 2025-05-12T19:33:00Z : Completely redesigned error handling in get_server_status() by CodeAssistant
 # * Implemented separate debug logging system to completely suppress stacktraces
 # * Created a robust nested exception handling structure to prevent any exceptions from propagating
@@ -59,8 +67,9 @@
 
 import logging
 import json
+import threading
 import uuid
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 
 # Try importing requests, handle if missing
 try:
@@ -99,6 +108,14 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Servers known to require authentication (server URL -> True), shared by all
+# clients of the process
+_AUTH_REQUIRED: Dict[str, bool] = {}
+_AUTH_REQUIRED_LOCK = threading.Lock()
+
+# Connections kept alive per client
+SESSION_POOL_SIZE = 10
+
 class MCPClientAPI:
     """API client for interacting with the DBP MCP server."""
 
@@ -120,6 +137,7 @@ class MCPClientAPI:
         self.logger = logger_override or logger
         self.server_url: Optional[str] = None
         self.timeout: int = 30
+        self._session: Optional["requests.Session"] = None
         self._initialized: bool = False
         self.logger.debug("MCPClientAPI initialized.")
 
@@ -143,9 +161,129 @@ class MCPClientAPI:
         if not self.server_url.endswith('/'):
             self.server_url += '/'
 
+        self._session = self._create_session()
         self._initialized = True
         self.logger.info(f"MCP Client initialized for server: {self.server_url}")
 
+    def _create_session(self) -> "requests.Session":
+        """
+        Creates the HTTP session reusing keep-alive connections to the server.
+
+        Returns:
+            A session with a connection pool of SESSION_POOL_SIZE connections.
+        """
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=SESSION_POOL_SIZE)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+        return session
+
+    def close(self):
+        """Closes the pooled connections of the client."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+        self._initialized = False
+
+    def __enter__(self) -> "MCPClientAPI":
+        self.initialize()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _auth_required(self) -> bool:
+        """Returns True if the server is known to require authentication."""
+        with _AUTH_REQUIRED_LOCK:
+            return _AUTH_REQUIRED.get(self.server_url, False)
+
+    def _remember_auth_required(self, required: bool) -> None:
+        """Records whether the server requires authentication."""
+        with _AUTH_REQUIRED_LOCK:
+            if required:
+                _AUTH_REQUIRED[self.server_url] = True
+            else:
+                _AUTH_REQUIRED.pop(self.server_url, None)
+
+    def _send(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+              params: Optional[Dict] = None, data: Optional[Dict] = None,
+              stream: bool = False) -> "requests.Response":
+        """
+        Sends a request through the session, authenticating when required.
+
+        The API key is sent up front when it is already loaded or when the
+        server is known to require it. Otherwise the request is sent without
+        authentication and retried once with the API key after a 401, which is
+        then remembered for the server.
+
+        Args:
+            method: HTTP method.
+            url: Absolute request URL.
+            headers: Headers added to the session defaults.
+            params: Query parameters.
+            data: JSON request body.
+            stream: Whether to defer reading the response body.
+
+        Returns:
+            The response, not checked for HTTP errors.
+
+        Raises:
+            AuthenticationError: If the server requires authentication and no API key is available.
+            requests.exceptions.RequestException: On transport errors.
+        """
+        headers = dict(headers or {})
+        authenticated = False
+        if self._auth_required() or self.auth_manager.is_authenticated():
+            try:
+                headers.update(self.auth_manager.get_auth_headers())
+                authenticated = True
+            except AuthenticationError:
+                pass
+
+        self.logger.debug(f"Making MCP request ({'authenticated' if authenticated else 'without authentication'}): {method} {url}")
+        response = self._session.request(
+            method=method.upper(),
+            url=url,
+            headers=headers,
+            params=params, # For GET requests
+            json=data,     # For POST/PUT requests
+            timeout=self.timeout,
+            stream=stream
+        )
+
+        # If we get a 401 Unauthorized, try to add authentication headers and retry
+        if response.status_code == 401 and not authenticated:
+            self.logger.debug("Received 401 Unauthorized response, retrying with authentication")
+            # Read the body so that the connection returns to the pool
+            _ = response.content
+            response.close()
+            try:
+                # Now try to get auth headers
+                headers.update(self.auth_manager.get_auth_headers())
+            except AuthenticationError as e:
+                # If we can't get auth headers, convert the original 401 to an AuthenticationError
+                self.logger.error(f"Authentication required but no API key available: {e}")
+                raise AuthenticationError(
+                    "Authentication required by server: No API key found. "
+                    "Set DBP_API_KEY environment variable, use --api-key flag, "
+                    "or configure 'mcp_server.api_key' in config file."
+                ) from e
+            self._remember_auth_required(True)
+
+            # Retry the request with authentication
+            self.logger.debug(f"Retrying MCP request with authentication: {method} {url}")
+            response = self._session.request(
+                method=method.upper(),
+                url=url,
+                headers=headers,
+                params=params,
+                json=data,
+                timeout=self.timeout,
+                stream=stream
+            )
+        return response
+
     def _check_initialized(self):
         """Raises an error if the client hasn't been initialized."""
         if not self._initialized:
@@ -178,50 +316,11 @@ class MCPClientAPI:
              raise ConfigurationError("MCP server URL is not set.")
 
         url = self.server_url + endpoint.lstrip('/') # Ensure single slash
-        headers = {"Content-Type": "application/json", "Accept": "application/json"}
-        
-        # First try without authentication
-        self.logger.debug(f"Making initial MCP request without authentication: {method} {url}")
         if data: self.logger.debug(f"Request Data: {json.dumps(data)}")
         if params: self.logger.debug(f"Request Params: {params}")
 
         try:
-            # First try the request without authentication
-            response = requests.request(
-                method=method.upper(),
-                url=url,
-                headers=headers,
-                params=params, # For GET requests
-                json=data,     # For POST/PUT requests
-                timeout=self.timeout
-            )
-            
-            # If we get a 401 Unauthorized, try to add authentication headers and retry
-            if response.status_code == 401:
-                self.logger.debug("Received 401 Unauthorized response, retrying with authentication")
-                try:
-                    # Now try to get auth headers
-                    auth_headers = self.auth_manager.get_auth_headers()
-                    headers.update(auth_headers)
-                    
-                    # Retry the request with authentication
-                    self.logger.debug(f"Retrying MCP request with authentication: {method} {url}")
-                    response = requests.request(
-                        method=method.upper(),
-                        url=url,
-                        headers=headers,
-                        params=params,
-                        json=data,
-                        timeout=self.timeout
-                    )
-                except AuthenticationError as e:
-                    # If we can't get auth headers, convert the original 401 to an AuthenticationError
-                    self.logger.error(f"Authentication required but no API key available: {e}")
-                    raise AuthenticationError(
-                        "Authentication required by server: No API key found. "
-                        "Set DBP_API_KEY environment variable, use --api-key flag, "
-                        "or configure 'mcp_server.api_key' in config file."
-                    ) from e
+            response = self._send(method, url, params=params, data=data)
 
             # Now check for HTTP errors
             response.raise_for_status()
@@ -231,46 +330,15 @@ class MCPClientAPI:
             self.logger.debug(f"Response Status: {response_data.get('status')}")
 
             # Check for MCP-level errors
-            if response_data.get("status") == "error":
-                mcp_error_data = response_data.get("error", {})
-                code = mcp_error_data.get("code", "UNKNOWN_API_ERROR")
-                message = mcp_error_data.get("message", "Unknown error from MCP server.")
-                self.logger.error(f"MCP server returned error: Code={code}, Message={message}")
-                if code == "AUTHENTICATION_FAILED":
-                    raise AuthenticationError(message)
-                elif code == "AUTHORIZATION_FAILED":
-                    raise AuthorizationError(message)
-                else:
-                    raise APIError(message, code=code)
+            self._raise_for_mcp_error(response_data)
 
             # Return the result part of the successful response
             return response_data.get("result", {})
 
-        except requests.exceptions.ConnectionError as e:
-            self.logger.error(f"Connection error contacting MCP server at {self.server_url}: {e}")
-            raise ConnectionError(f"Could not connect to MCP server at {self.server_url}.") from e
-        except requests.exceptions.Timeout as e:
-            self.logger.error(f"Request to MCP server timed out ({self.timeout}s): {e}")
-            raise TimeoutError(f"Request timed out after {self.timeout} seconds.") from e
+        except (AuthenticationError, AuthorizationError, APIError):
+            raise
         except requests.exceptions.RequestException as e:
-            # Handle other requests errors (e.g., HTTP errors handled by raise_for_status, SSL errors)
-            self.logger.error(f"HTTP request error for {method} {url}: {e}", exc_info=True)
-            # Try to get more specific info from response if available
-            error_msg = str(e)
-            if e.response is not None:
-                 try:
-                      error_detail = e.response.json().get("error", {}).get("message", e.response.text)
-                      error_msg = f"HTTP {e.response.status_code}: {error_detail}"
-                 except json.JSONDecodeError:
-                      error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
-
-            # Map common HTTP errors to specific CLI exceptions
-            if e.response is not None:
-                 if e.response.status_code == 401: raise AuthenticationError(error_msg) from e
-                 if e.response.status_code == 403: raise AuthorizationError(error_msg) from e
-                 if e.response.status_code == 404: raise APIError(error_msg, code="NOT_FOUND") from e # e.g., tool not found
-
-            raise APIError(f"MCP request failed: {error_msg}") from e
+            self._raise_for_request_exception(e, method, url)
         except json.JSONDecodeError as e:
             self.logger.error(f"Failed to decode JSON response from {url}: {e}")
             raise ClientError(f"Received invalid JSON response from server.") from e
@@ -278,6 +346,59 @@ class MCPClientAPI:
              self.logger.error(f"Unexpected error during MCP request: {e}", exc_info=True)
              raise ClientError(f"An unexpected client error occurred: {e}") from e
 
+    def _raise_for_mcp_error(self, response_data: Dict[str, Any]) -> None:
+        """
+        Raises the CLI exception matching an MCP error response.
+
+        Raises:
+            AuthenticationError, AuthorizationError, APIError: If the response reports an error.
+        """
+        if not isinstance(response_data, dict) or response_data.get("status") != "error":
+            return
+        mcp_error_data = response_data.get("error", {})
+        code = mcp_error_data.get("code", "UNKNOWN_API_ERROR")
+        message = mcp_error_data.get("message", "Unknown error from MCP server.")
+        self.logger.error(f"MCP server returned error: Code={code}, Message={message}")
+        if code == "AUTHENTICATION_FAILED":
+            raise AuthenticationError(message)
+        elif code == "AUTHORIZATION_FAILED":
+            raise AuthorizationError(message)
+        else:
+            raise APIError(message, code=code)
+
+    def _raise_for_request_exception(self, e: "requests.exceptions.RequestException", method: str, url: str) -> None:
+        """
+        Maps a requests exception to the matching CLI exception.
+
+        Raises:
+            ConnectionError, TimeoutError, AuthenticationError, AuthorizationError, APIError: Always.
+        """
+        if isinstance(e, requests.exceptions.ConnectionError):
+            self.logger.error(f"Connection error contacting MCP server at {self.server_url}: {e}")
+            raise ConnectionError(f"Could not connect to MCP server at {self.server_url}.") from e
+        if isinstance(e, requests.exceptions.Timeout):
+            self.logger.error(f"Request to MCP server timed out ({self.timeout}s): {e}")
+            raise TimeoutError(f"Request timed out after {self.timeout} seconds.") from e
+
+        # Handle other requests errors (e.g., HTTP errors handled by raise_for_status, SSL errors)
+        self.logger.error(f"HTTP request error for {method} {url}: {e}", exc_info=True)
+        # Try to get more specific info from response if available
+        error_msg = str(e)
+        if e.response is not None:
+             try:
+                  error_detail = e.response.json().get("error", {}).get("message", e.response.text)
+                  error_msg = f"HTTP {e.response.status_code}: {error_detail}"
+             except json.JSONDecodeError:
+                  error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
+
+        # Map common HTTP errors to specific CLI exceptions
+        if e.response is not None:
+             if e.response.status_code == 401: raise AuthenticationError(error_msg) from e
+             if e.response.status_code == 403: raise AuthorizationError(error_msg) from e
+             if e.response.status_code == 404: raise APIError(error_msg, code="NOT_FOUND") from e # e.g., tool not found
+
+        raise APIError(f"MCP request failed: {error_msg}") from e
+
 
     # --- Methods for specific DBP MCP Tools ---
 
@@ -292,6 +413,66 @@ class MCPClientAPI:
          }
          return self._make_request("POST", endpoint, data=request_payload)
 
+    def stream_tool(self, tool_name: str, tool_data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+         """
+         Calls an MCP tool producing chunks and yields the chunks as they arrive.
+
+         The tool input carries the streaming flag and the response is read
+         incrementally, as server-sent events ("data:" lines) or newline-delimited
+         JSON. A server answering with a single JSON document yields its result once.
+
+         Args:
+             tool_name: Name of the tool.
+             tool_data: Input data of the tool.
+
+         Yields:
+             The decoded chunks.
+
+         Raises:
+             The exceptions of _make_request(), also while iterating.
+         """
+         self._check_initialized()
+         url = self.server_url + f"mcp/tool/{tool_name}"
+         request_payload = {
+              "id": str(uuid.uuid4()),
+              "data": dict(tool_data, streaming=True)
+         }
+         headers = {"Accept": "text/event-stream, application/x-ndjson, application/json"}
+         try:
+              response = self._send("POST", url, headers=headers, data=request_payload, stream=True)
+         except requests.exceptions.RequestException as e:
+              self._raise_for_request_exception(e, "POST", url)
+
+         with response:
+              try:
+                   response.raise_for_status()
+                   content_type = response.headers.get("Content-Type", "")
+                   if "text/event-stream" not in content_type and "ndjson" not in content_type:
+                        response_data = response.json()
+                        self._raise_for_mcp_error(response_data)
+                        yield response_data.get("result", {})
+                        return
+
+                   event_stream = "text/event-stream" in content_type
+                   for line in response.iter_lines(decode_unicode=True):
+                        if not line:
+                             continue
+                        if event_stream:
+                             # Only data fields carry chunks (skip event, id and comments)
+                             if not line.startswith("data:"):
+                                  continue
+                             line = line[5:].strip()
+                        if line == "[DONE]":
+                             return
+                        chunk = json.loads(line)
+                        self._raise_for_mcp_error(chunk)
+                        yield chunk
+              except requests.exceptions.RequestException as e:
+                   self._raise_for_request_exception(e, "POST", url)
+              except json.JSONDecodeError as e:
+                   self.logger.error(f"Failed to decode streamed JSON from {url}: {e}")
+                   raise ClientError(f"Received invalid JSON chunk from server.") from e
+
     def get_resource(self, resource_uri: str, params: Optional[Dict] = None) -> Dict[str, Any]:
          """Generic method to get any MCP resource."""
          # Assume MCP server exposes resources at /mcp/resource/{uri...} via GET
@@ -451,12 +632,11 @@ class MCPClientAPI:
                 return result
 
             url = self.server_url + "health"
-            headers = {"Content-Type": "application/json", "Accept": "application/json"}
             
             # Direct try/except block around the HTTP request to completely suppress exception propagation
             try:
                 # Make direct request to health endpoint without extracting result
-                response = requests.get(url, headers=headers, timeout=self.timeout)
+                response = self._session.get(url, timeout=self.timeout)
                 response.raise_for_status()
                 
                 # Parse full JSON response without extracting a "result" key
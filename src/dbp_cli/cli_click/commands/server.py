@@ -37,35 +37,26 @@
 # system:requests
 ###############################################################################
 # [GenAI tool change history]
-# 2025-05-13T16:19:00Z : Fixed config_manager access via context by CodeAssistant
-# * Updated all instances of ctx.config_manager to ctx.obj.config_manager
-# * Fixed 'Context' object has no attribute 'config_manager' error
-# * Corrected context attribute access pattern to match AppContext class design
-# * Ensured consistent configuration access throughout the file
-# 2025-05-13T01:39:15Z : Fixed import statements for proper module resolution by CodeAssistant
-# * Changed relative imports (from ...cli_click.common) to absolute imports (from dbp_cli.cli_click.common)
-# * Fixed ImportError: attempted relative import beyond top-level package
-# 2025-05-12T20:57:05Z : Fixed restart_command implementation by CodeAssistant
-# * Fixed error when directly calling start and stop commands
-# * Improved server restart logic by properly checking server status first
-# * Used direct function calls instead of problematic invoke/callback methods
-# * Fixed parameter passing logic to avoid duplicate argument errors
-# 2025-05-12T20:47:01Z : Fixed all progress indicator usages by CodeAssistant
-# * Fixed "'ProgressIndicator' object is not callable" errors throughout the file
-# * Refactored progress indicator usage in status, stop, restart and start commands
-# * Implemented correct pattern using ctx.with_progress helper method
-# * Ensured consistent approach for showing progress during long-running operations
+# 2026-10-19T05:10:00Z : Profiled every server process by CodeAssistant
+# * dbp server profile reports and waits for the profile of each server process
+# 2026-10-18T23:10:00Z : Added profile command by CodeAssistant
+# * dbp server profile triggers the server profiler and waits for the profile file
+# 2026-10-18T22:40:00Z : Added --metrics option to status by CodeAssistant
+# * Displayed a per-series summary of the /metrics endpoint
+# 2026-10-18T16:40:00Z : Added --workers option to start and restart by CodeAssistant
+# * Forwarded --workers to python -m dbp.mcp_server
 ###############################################################################
 
 import logging
 import os
+import re
 import signal
 import socket
 import subprocess
 import sys
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 import click
 import requests
@@ -98,6 +89,8 @@ def server_group(ctx: click.Context) -> None:
 @click.option("--host", default="localhost", help="Host address to bind to")
 @click.option("--port", type=int, default=6231, help="Port to listen on")
 @click.option("--foreground", "-f", is_flag=True, help="Run in foreground (blocking)")
+@click.option("--workers", type=click.IntRange(1, 8), default=None,
+              help="Number of request worker processes (default: mcp_server.workers)")
 @click.option(
     "--log-level",
     type=click.Choice(["debug", "info", "warning", "error"]),
@@ -106,7 +99,7 @@ def server_group(ctx: click.Context) -> None:
 )
 @click.pass_context
 @catch_errors
-def start_command(ctx: click.Context, host: str, port: int, foreground: bool, log_level: str) -> None:
+def start_command(ctx: click.Context, host: str, port: int, foreground: bool, workers: Optional[int], log_level: str) -> None:
     """
     [Function intent]
     Start the MCP server as a background or foreground process.
@@ -156,6 +149,8 @@ def start_command(ctx: click.Context, host: str, port: int, foreground: bool, lo
         "--port", str(port),
         "--log-level", log_level
     ]
+    if workers is not None:
+        cmd += ["--workers", str(workers)]
 
     try:
         if foreground:
@@ -378,6 +373,8 @@ def stop_command(ctx: click.Context, timeout: int) -> None:
 @click.option("--host", default="localhost", help="Host address to bind to")
 @click.option("--port", type=int, default=6231, help="Port to listen on")
 @click.option("--foreground", "-f", is_flag=True, help="Run in foreground (blocking)")
+@click.option("--workers", type=click.IntRange(1, 8), default=None,
+              help="Number of request worker processes (default: mcp_server.workers)")
 @click.option(
     "--log-level",
     type=click.Choice(["debug", "info", "warning", "error"]),
@@ -387,7 +384,7 @@ def stop_command(ctx: click.Context, timeout: int) -> None:
 @click.option("--timeout", type=int, default=5, help="Timeout (seconds) when waiting for the server to stop")
 @click.pass_context
 @catch_errors
-def restart_command(ctx: click.Context, host: str, port: int, foreground: bool, log_level: str, timeout: int) -> None:
+def restart_command(ctx: click.Context, host: str, port: int, foreground: bool, workers: Optional[int], log_level: str, timeout: int) -> None:
     """
     [Function intent]
     Restart the MCP server with potentially new configuration settings.
@@ -506,6 +503,8 @@ def restart_command(ctx: click.Context, host: str, port: int, foreground: bool,
         "--port", str(port),
         "--log-level", log_level
     ]
+    if workers is not None:
+        cmd += ["--workers", str(workers)]
 
     try:
         if foreground:
@@ -554,9 +553,11 @@ def restart_command(ctx: click.Context, host: str, port: int, foreground: bool,
 
 
 @server_group.command("status", help="Check MCP server status")
+@click.option("--metrics", "show_metrics", is_flag=True,
+              help="Show the server metrics (/metrics) instead of the health response")
 @click.pass_context
 @catch_errors
-def status_command(ctx: click.Context) -> None:
+def status_command(ctx: click.Context, show_metrics: bool = False) -> None:
     """
     [Function intent]
     Check and display the current status of the MCP server.
@@ -571,6 +572,8 @@ def status_command(ctx: click.Context) -> None:
     Constructs server URL from host and port configuration.
     Tests API connectivity by requesting the health endpoint.
     Displays detailed status information including PID and health details.
+    With --metrics, displays a summary of the /metrics endpoint instead of
+    the health response.
     """
     # Get output adapter
     output = get_output_adapter(ctx)
@@ -619,6 +622,10 @@ def status_command(ctx: click.Context) -> None:
             if "version" in result:
                 output.info(f"Version: {result['version']}")
 
+            if show_metrics:
+                _show_metrics(ctx, server_url)
+                return
+
             # Pretty print the full health response JSON
             import json
             output.info("\nServer Health Response (JSON):")
@@ -644,8 +651,156 @@ def status_command(ctx: click.Context) -> None:
         sys.exit(1)
 
 
+@server_group.command("profile", help="Profile the running MCP server")
+@click.option("--seconds", type=click.FloatRange(0, min_open=True), default=30.0,
+              help="Duration of the profile in seconds")
+@click.option("--wait/--no-wait", default=True, help="Wait for the profile file to be written")
+@click.pass_context
+@catch_errors
+def profile_command(ctx: click.Context, seconds: float, wait: bool) -> None:
+    """
+    [Function intent]
+    Trigger the sampling profiler of the running MCP server.
+    
+    [Design principles]
+    No restart - the running server process profiles itself.
+    
+    [Implementation details]
+    Posts to the /profile endpoint, which samples the stacks of all threads
+    of each server process - the coordinator and every worker with several
+    workers - and writes one collapsed-stack file per process, the input of
+    flamegraph tools, to the profiler.output_dir directory of the server.
+    With --wait, polls /profile until every started profile is written.
+    """
+    output = get_output_adapter(ctx)
+    config = ctx.obj.config_manager.get_typed_config()
+    server_url = f"http://{config.mcp_server.host}:{config.mcp_server.port}"
+    
+    try:
+        response = requests.post(f"{server_url}/profile", params={"seconds": seconds}, timeout=15)
+    except requests.ConnectionError:
+        output.error(f"Server is not responding at {server_url}")
+        sys.exit(1)
+    if response.status_code != 200:
+        output.error(f"Profiling not started: {response.json().get('error', response.status_code)}")
+        sys.exit(1)
+    processes = response.json()["processes"]
+    started = {name: process for name, process in processes.items() if "error" not in process}
+    for name, process in processes.items():
+        if name in started:
+            output.info(f"Profiling {name} (pid {process['pid']}) for {seconds:g}s into {process['output']}")
+        else:
+            output.warning(f"Profiling not started in {name}: {process['error']}")
+    if not wait:
+        return
+    
+    def wait_for_profiles():
+        time.sleep(seconds)
+        while True:
+            response = requests.get(f"{server_url}/profile", timeout=5)
+            if response.status_code == 200:
+                statuses = response.json()["processes"]
+                # A process missing from the statuses has exited, its profile is lost
+                if all(statuses.get(name, {}).get("active") is None for name in started):
+                    return {name: (statuses[name].get("last") or {}) if name in statuses
+                            else {"error": "Process exited while profiling"}
+                            for name in started}
+            time.sleep(0.5)
+    
+    results = ctx.obj.with_progress("Profiling", wait_for_profiles)
+    failed = len(started) < len(processes)
+    for name, last in results.items():
+        if "error" in last:
+            output.error(f"Failed to write the profile of {name}: {last['error']}")
+            failed = True
+        else:
+            output.success(f"Profile of {name} written to {last.get('output', started[name]['output'])} "
+                           f"({last.get('samples', 0)} samples, {last.get('overhead_percent', 0)}% overhead)")
+    if failed:
+        sys.exit(1)
+
+
 # Helper functions (similar to the original implementation but adapted for Click context)
 
+_METRIC_SAMPLE_PATTERN = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{.*\})? (\S+)$')
+_LE_LABEL_PATTERN = re.compile(r',?le="([^"]*)"')
+
+
+def _summarize_metrics(text: str) -> List[Tuple[str, str]]:
+    """
+    [Function intent]
+    Summarize a Prometheus text exposition into one row per series.
+    
+    [Design principles]
+    Readable at a glance - histograms are reduced to count, mean and p95.
+    
+    [Implementation details]
+    Counter and gauge samples are shown as they are. Histogram buckets are
+    grouped by series; the p95 shown is the upper bound of the bucket
+    holding the 95th percentile.
+    
+    Args:
+        text: Response of the /metrics endpoint
+        
+    Returns:
+        List of (series, value) rows in exposition order
+    """
+    rows: List[Tuple[str, str]] = []
+    histograms: Dict[str, Dict] = {}
+    for line in text.splitlines():
+        match = _METRIC_SAMPLE_PATTERN.match(line)
+        if not match:
+            continue
+        name, labels, value = match.group(1), match.group(2) or "", float(match.group(3))
+        if name.endswith(("_bucket", "_sum", "_count")):
+            base, suffix = name.rsplit("_", 1)
+            le = _LE_LABEL_PATTERN.search(labels)
+            series_labels = _LE_LABEL_PATTERN.sub("", labels).replace("{,", "{")
+            series = base + ("" if series_labels == "{}" else series_labels)
+            if series not in histograms:
+                histograms[series] = {"buckets": []}
+                rows.append((series, ""))
+            if suffix == "bucket" and le:
+                histograms[series]["buckets"].append((float(le.group(1)), value))
+            else:
+                histograms[series][suffix] = value
+            continue
+        rows.append((name + labels, f"{value:g}"))
+
+    summarized = []
+    for series, value in rows:
+        histogram = histograms.get(series)
+        if histogram is not None:
+            count = histogram.get("count", 0)
+            if count:
+                p95 = next(bound for bound, cumulative in histogram["buckets"] if cumulative >= 0.95 * count)
+                value = f"count={count:g} mean={histogram.get('sum', 0) / count:.4g} p95<={p95:g}"
+            else:
+                value = "count=0"
+        summarized.append((series, value))
+    return summarized
+
+
+def _show_metrics(ctx: click.Context, server_url: str) -> None:
+    """
+    [Function intent]
+    Fetch the server metrics and display their summary.
+    
+    Args:
+        ctx: Click context
+        server_url: Base URL of the MCP server
+    """
+    output = get_output_adapter(ctx)
+    response = requests.get(f"{server_url}/metrics", timeout=5)
+    if response.status_code != 200:
+        output.error(f"Metrics endpoint returned status code: {response.status_code}")
+        sys.exit(1)
+    rows = _summarize_metrics(response.text)
+    output.info("\n=== MCP Server Metrics ===")
+    width = max((len(series) for series, _ in rows), default=0)
+    for series, value in rows:
+        output.info(f"{series:<{width}}  {value}")
+
 def _dump_server_error_logs(ctx: click.Context, stderr_log_path: Path) -> None:
     """
     [Function intent]
@@ -0,0 +1,128 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Provides a Click group whose subcommands are declared in a static table and
+# imported only when invoked, so that the CLI starts without loading the
+# dependencies of commands it does not run.
+###############################################################################
+# [Source file design principles]
+# - Command names and help texts come from the table: listing commands and
+#   rendering help import nothing
+# - A command module is imported once, on first lookup of its command
+# - Eagerly added commands keep working side by side with lazy ones
+###############################################################################
+# [Source file constraints]
+# - The help text of the table must be kept in sync with the command
+# - Import errors of a command module surface when the command is invoked
+###############################################################################
+# [Dependencies]
+# system:click
+# system:importlib
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T19:40:00Z : Initial implementation by CodeAssistant
+# * Added LazyGroup loading subcommands from a static table on invocation
+###############################################################################
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    [Class intent]
+    Click group resolving table-declared subcommands on demand.
+
+    [Implementation details]
+    lazy_commands maps a command name to (module path, attribute name, short
+    help). get_command() imports the module and registers the command in
+    self.commands; format_commands() lists unloaded commands from the table.
+
+    [Design principles]
+    Pay for a command's imports only when the command runs.
+    Same user-visible behavior as an eagerly populated group.
+    """
+
+    def __init__(self, *args, lazy_commands: Optional[Dict[str, Tuple[str, str, str]]] = None, **kwargs):
+        """
+        [Function intent]
+        Create the group with its table of lazily loaded subcommands.
+
+        Args:
+            *args: Positional arguments of click.Group
+            lazy_commands: Command name -> (module path, attribute, short help)
+            **kwargs: Keyword arguments of click.Group
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, Tuple[str, str, str]] = dict(lazy_commands or {})
+
+    def list_commands(self, ctx: Optional[click.Context]) -> List[str]:
+        """
+        [Function intent]
+        List loaded and declared subcommand names without importing anything.
+
+        Returns:
+            Sorted command names
+        """
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: Optional[click.Context], cmd_name: str) -> Optional[click.Command]:
+        """
+        [Function intent]
+        Get a subcommand, importing its module on first use.
+
+        Returns:
+            The command, or None if the name is unknown
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load(cmd_name)
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """
+        [Function intent]
+        Write the commands section of the help page from the table for
+        commands not loaded yet.
+        """
+        rows = []
+        for name in self.list_commands(ctx):
+            command = self.commands.get(name)
+            if command is None:
+                rows.append((name, self.lazy_commands[name][2]))
+            elif not command.hidden:
+                rows.append((name, command.get_short_help_str(formatter.width - 6 - len(name))))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """
+        [Function intent]
+        Import a declared command and register it under its table name.
+
+        Returns:
+            The imported command
+
+        Raises:
+            TypeError: If the table entry does not designate a Click command
+        """
+        module_path, attribute, _ = self.lazy_commands[cmd_name]
+        command = getattr(importlib.import_module(module_path), attribute)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy command '{cmd_name}' ({module_path}.{attribute}) is not a Click command")
+        self.add_command(command, cmd_name)
+        return command
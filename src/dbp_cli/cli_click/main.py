@@ -19,6 +19,8 @@
 # [Source file design principles]
 # - Acts as the main entry point for the Click-based CLI application
 # - Centralizes command registration and initialization
+# - Subcommands are declared in a static table and imported on invocation,
+#   so that `dbp --help` and `dbp version` do not load command dependencies
 # - Defines the main command group and subcommands
 # - Provides clean entry point with proper error handling
 # - Separates CLI concerns from business logic
@@ -30,9 +32,13 @@
 ###############################################################################
 # [Dependencies]
 # codebase:src/dbp_cli/cli_click/common.py
+# codebase:src/dbp_cli/cli_click/lazy_group.py
 # system:click
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T19:40:00Z : Lazy command loading by CodeAssistant
+# * Subcommands are declared in LAZY_COMMANDS and imported by LazyGroup when invoked
+# * Command suggestions include the declared commands without importing them
 # 2025-05-13T01:47:30Z : Fixed duplicate error messages for command suggestions by CodeAssistant
 # * Fixed issue where "Usage error" appeared twice in the output
 # * Improved error handling logic to avoid duplicated messages
@@ -44,8 +50,6 @@
 # * Removed import for status_command
 # * Removed status_command registration from cli command group
 # * Removed obsolete status.py file
-# 2025-05-12T17:20:50Z : Fixed decorator order by CodeAssistant
-# * Rearranged decorators to ensure @pass_context is applied before @common_options
 ###############################################################################
 
 import logging
@@ -57,20 +61,26 @@ from difflib import get_close_matches
 
 # Import common utilities and context
 from .common import AppContext, common_options, catch_errors  # Using AppContext instead of Context
-
-# Import commands
-from .commands.query import query_command
-from .commands.config import config_group
-from .commands.commit import commit_command
-from .commands.hstc_agno import hstc_agno_group
-from .commands.server import server_group
-from .commands.test import test_group
+from .lazy_group import LazyGroup
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Subcommands imported on invocation: name -> (module, attribute, short help)
+LAZY_COMMANDS = {
+    "query": ("dbp_cli.cli_click.commands.query", "query_command", "Execute a natural language query"),
+    "config": ("dbp_cli.cli_click.commands.config", "config_group", "Manage CLI configuration"),
+    "commit": ("dbp_cli.cli_click.commands.commit", "commit_command", "Generate commit messages"),
+    "hstc-agno": ("dbp_cli.cli_click.commands.hstc_agno", "hstc_agno_group",
+                  "HSTC implementation with Agno framework, using Amazon Bedrock models"),
+    "server": ("dbp_cli.cli_click.commands.server", "server_group", "Manage the MCP server"),
+    "test": ("dbp_cli.cli_click.commands.test", "test_group", "Test system components"),
+}
+
 
 @click.group(
+    cls=LazyGroup,
+    lazy_commands=LAZY_COMMANDS,
     help="Documentation-Based Programming CLI",
     context_settings={
         "help_option_names": ["--help", "-h"],
@@ -101,16 +111,7 @@ def cli(ctx: click.Context) -> None:
         ctx.obj = AppContext()
 
 
-# Register commands
-cli.add_command(query_command)
-cli.add_command(config_group)
-cli.add_command(commit_command)
-cli.add_command(hstc_agno_group)
-cli.add_command(server_group)
-cli.add_command(test_group)
-
-
-@cli.command("version")
+@cli.command("version", short_help="Display version information")
 @click.pass_context
 def version_command(ctx: click.Context) -> None:
     """
@@ -213,17 +214,15 @@ def get_command_suggestions(command: str) -> List[str]:
     Returns:
         List of command suggestions, sorted by similarity
     """
-    # Get all available commands
-    available_commands = set()
-    for cmd_name in cli.commands.keys():
-        available_commands.add(cmd_name)
+    # Get all available commands, including the ones not imported yet
+    available_commands = set(cli.commands.keys()) | set(cli.lazy_commands.keys())
         
     # Find commands that start with the given prefix (for subcommands)
     if ' ' in command:
         parts = command.split(' ')
         prefix = parts[0]
-        if prefix in cli.commands:
-            subcommand = cli.commands[prefix]
+        if prefix in available_commands:
+            subcommand = cli.commands.get(prefix) or cli.get_command(None, prefix)
             if hasattr(subcommand, 'commands'):
                 for subcmd_name in subcommand.commands.keys():
                     available_commands.add(f"{prefix} {subcmd_name}")
@@ -34,8 +34,13 @@
 # system:os
 # system:agno.agent
 # codebase:src/dbp_cli/commands/hstc_agno/utils.py
+# codebase:src/dbp/llm/bedrock/batch.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-19T01:10:00Z : Mapped agent models to Bedrock IDs in batch mode by CodeAssistant
+# * Batched prompts use resolve_batch_model_id instead of the Anthropic API model name
+# 2026-10-18T11:30:00Z : Added batch mode to run by CodeAssistant
+# * Prompts are answered from a BatchSession when batch_session is set
 # 2025-05-15T13:41:00Z : Improved throttling exception handling by CodeAssistant
 # * Suppressed verbose Agno error logs for subsequent throttling retries
 # * Only show custom throttling detection message after initial error
@@ -44,10 +49,6 @@
 # * Implemented retry logic with exponential backoff for ThrottlingException errors
 # * Added jitter to retry delays to prevent thundering herd problem
 # * Set retry parameters: 10s initial delay, 3min max delay, 10 max attempts
-# 2025-05-13T17:37:00Z : Initial implementation by CodeAssistant
-# * Created abstract base agent class
-# * Extracted common functionality from existing agents
-# * Implemented shared methods for prompt logging and state management
 ###############################################################################
 
 import json
@@ -61,6 +62,8 @@ from agno.agent import Agent
 from agno.exceptions import ModelProviderError
 from agno.utils import log as agno_log
 
+from dbp.llm.bedrock.batch import BatchRequest, BatchResponse, BatchSession, resolve_batch_model_id
+
 from .utils import log_prompt_to_file
 
 
@@ -111,6 +114,10 @@ class AbstractAgnoAgent(Agent):
         self.model_id = model_id
         self.show_prompts = show_prompts
         self.agent_name = agent_name
+        
+        # Batch mode: prompts are answered by batch jobs instead of the model
+        self.batch_session: Optional[BatchSession] = None
+        self.batch_model_id: Optional[str] = None
     
     def run(self, prompt: str, **kwargs):
         """
@@ -140,6 +147,9 @@ class AbstractAgnoAgent(Agent):
         if self.show_prompts:
             self._display_prompt(prompt)
         
+        if self.batch_session is not None:
+            return self._run_batched(prompt)
+        
         # Retry parameters for exponential backoff
         max_retries = 10
         base_delay = 10  # 10 seconds initial delay
@@ -188,6 +198,33 @@ class AbstractAgnoAgent(Agent):
                 # Re-raise the exception
                 raise e
         
+    def _run_batched(self, prompt: str) -> BatchResponse:
+        """
+        [Function intent]
+        Answer a prompt from the batch session instead of calling the model.
+        
+        [Design principles]
+        Same response interface as run() so agent methods need no batch awareness.
+        
+        [Implementation details]
+        Sends the prompt as a single-turn request: agent history and tools are not
+        available to batched prompts.
+        Agent model names of the Anthropic API are mapped to Bedrock model IDs.
+        Raises BatchPending when the prompt is queued for the next batch job.
+        
+        Args:
+            prompt: The prompt to answer
+            
+        Returns:
+            BatchResponse: Response object exposing the text as .content
+        """
+        model_id = resolve_batch_model_id(self.batch_model_id or self.model_id)
+        request = BatchRequest(model_id=model_id, prompt=prompt)
+        response = BatchResponse(self.batch_session.complete(request))
+        if self.show_prompts:
+            self._display_response(response)
+        return response
+    
     def log(self, message: str, level: str = "INFO"):
         """
         [Function intent]
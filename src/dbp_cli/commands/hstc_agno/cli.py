@@ -31,11 +31,18 @@
 # system:click
 # system:pathlib
 # codebase:src/dbp_cli/commands/hstc_agno/manager.py
+# codebase:src/dbp/llm/bedrock/batch.py
+# codebase:src/dbp/core/profiler.py
 ###############################################################################
 # [GenAI tool change history]
-# 2025-05-12T07:06:30Z : Initial implementation by CodeAssistant
-# * Created basic CLI command group structure
-# * Added update command skeleton
+# 2026-10-19T01:10:00Z : Validated --batch-model-id by CodeAssistant
+# * Resolved --batch-model-id to a Bedrock model ID before any batch job is queued
+# 2026-10-18T23:10:00Z : Added --profile option by CodeAssistant
+# * hstc_agno, update and update-dir write a collapsed-stack profile of the command
+# 2026-10-18T11:30:00Z : Added batch options to update-dir by CodeAssistant
+# * Added --batch-dir, --batch-s3-uri, --batch-role-arn, --batch-model-id, --batch-region and --batch-poll-interval
+# 2026-10-18T09:05:00Z : Added --max-workers option to update-dir by CodeAssistant
+# * Passes the worker count to HSTCManager to size the Bedrock connection pool
 ###############################################################################
 
 import click
@@ -45,10 +52,46 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from dbp.core.profiler import SamplingProfiler
+from dbp.llm.bedrock.batch import BatchInferenceError, BatchInferenceRunner, BedrockBatchTransport, resolve_batch_model_id
+
 from .manager import HSTCManager
 
 
+def _start_profile(ctx: click.Context, param: click.Parameter, value: Optional[str]) -> None:
+    """
+    [Function intent]
+    Callback of --profile: sample the command's stacks until it ends and
+    write them to the given file as collapsed stacks.
+    
+    [Implementation details]
+    The profiler stops when the context of the command closes, also when
+    the command fails. One profiler runs even if --profile is given both
+    to the group and to the command.
+    """
+    if not value or "hstc_agno.profiler" in ctx.meta:
+        return
+    profiler = ctx.meta["hstc_agno.profiler"] = SamplingProfiler()
+    profiler.start()
+    
+    def write_profile():
+        stats = profiler.stop()
+        path = profiler.write_collapsed(Path(value))
+        click.echo(f"Profile written to {path} ({stats['samples']} samples, "
+                   f"{stats['overhead_percent']}% overhead)", err=True)
+    
+    ctx.call_on_close(write_profile)
+
+
+profile_option = click.option(
+    "--profile", type=click.Path(dir_okay=False), default=None, expose_value=False,
+    callback=_start_profile,
+    help="Sample the stacks of all threads while the command runs and write them "
+         "to this file as collapsed stacks (flamegraph input)")
+
+
 @click.group()
+@profile_option
 def hstc_agno():
     """
     [Function intent]
@@ -114,6 +157,7 @@ class ProgressBar:
 
 
 @hstc_agno.command("update")
+@profile_option
 @click.argument("file_path", type=str, shell_complete=get_file_completions)
 @click.option("--output", "-o", help="Output directory for implementation plan")
 @click.option("--recursive/--no-recursive", default=False, 
@@ -182,6 +226,7 @@ def update(file_path: str, output: Optional[str], recursive: bool, verbose: bool
 
 
 @hstc_agno.command("update-dir")
+@profile_option
 @click.argument("directory_path", type=str, shell_complete=get_dir_completions)
 @click.option("--output", "-o", help="Output directory for implementation plans")
 @click.option("--recursive/--no-recursive", default=False,
@@ -194,6 +239,22 @@ def update(file_path: str, output: Optional[str], recursive: bool, verbose: bool
               help="Show detailed output")
 @click.option("--show-prompts/--hide-prompts", default=True,
               help="Show prompts and responses from LLM agents")
+@click.option("--max-workers", type=click.IntRange(1, 64), default=None,
+              help="Number of files processed in parallel")
+@click.option("--batch-dir", type=click.Path(file_okay=False), default=None,
+              help="Run LLM prompts as Bedrock batch jobs, keeping job state in this directory "
+                   "(re-run the command to resume)")
+@click.option("--batch-s3-uri", default=None,
+              help="S3 location (s3://bucket/prefix) for batch job input and output")
+@click.option("--batch-role-arn", default=None,
+              help="IAM service role Bedrock assumes to run batch jobs")
+@click.option("--batch-model-id", default=None,
+              help="Bedrock model ID answering all batched prompts (default: the Bedrock "
+                   "equivalent of each agent's model)")
+@click.option("--batch-region", default=None,
+              help="AWS region of the batch jobs")
+@click.option("--batch-poll-interval", type=click.FloatRange(1.0), default=60.0,
+              help="Seconds between batch job status checks")
 def update_directory(
     directory_path: str, 
     output: Optional[str], 
@@ -201,7 +262,14 @@ def update_directory(
     recursive_dir: bool,
     pattern: List[str],
     verbose: bool,
-    show_prompts: bool
+    show_prompts: bool,
+    max_workers: Optional[int],
+    batch_dir: Optional[str],
+    batch_s3_uri: Optional[str],
+    batch_role_arn: Optional[str],
+    batch_model_id: Optional[str],
+    batch_region: Optional[str],
+    batch_poll_interval: float
 ):
     """
     [Function intent]
@@ -222,6 +290,13 @@ def update_directory(
         recursive_dir: Whether to process subdirectories recursively
         pattern: File patterns to include (can be specified multiple times)
         verbose: Whether to show detailed output
+        max_workers: Number of files processed in parallel (also sizes the Bedrock connection pool)
+        batch_dir: Job state directory enabling batch mode
+        batch_s3_uri: S3 location for batch job input and output
+        batch_role_arn: IAM service role for batch jobs
+        batch_model_id: Bedrock model ID answering all batched prompts
+        batch_region: AWS region of the batch jobs
+        batch_poll_interval: Seconds between batch job status checks
     """
     # Initialize options dictionary
     options = {
@@ -232,9 +307,25 @@ def update_directory(
         "file_patterns": list(pattern) if pattern else ["*.py", "*.js", "*.ts", "*.java", "*.c", "*.cpp", "*.h", "*.hpp"]
     }
     
+    # Batch mode: one Bedrock batch job per pipeline step instead of per-file requests
+    if batch_dir:
+        if not batch_s3_uri or not batch_role_arn:
+            raise click.UsageError("--batch-dir requires --batch-s3-uri and --batch-role-arn")
+        if batch_model_id:
+            try:
+                batch_model_id = resolve_batch_model_id(batch_model_id)
+            except BatchInferenceError as e:
+                raise click.UsageError(str(e))
+        options["batch_runner"] = BatchInferenceRunner(
+            BedrockBatchTransport(batch_s3_uri, batch_role_arn, region_name=batch_region),
+            state_dir=Path(batch_dir),
+            poll_interval=batch_poll_interval
+        )
+        options["batch_model_id"] = batch_model_id
+    
     # Create HSTC Manager and process directory
     with ProgressBar("Initializing HSTC Manager..."):
-        manager = HSTCManager(base_dir=Path.cwd(), show_prompts=show_prompts)
+        manager = HSTCManager(base_dir=Path.cwd(), show_prompts=show_prompts, max_workers=max_workers)
     
     with ProgressBar(f"Processing directory {directory_path}..."):
         result = manager.process_directory(directory_path, options)
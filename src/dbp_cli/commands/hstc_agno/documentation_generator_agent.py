@@ -37,8 +37,11 @@
 # codebase:src/dbp_cli/commands/hstc_agno/abstract_agent.py
 # codebase:src/dbp_cli/commands/hstc_agno/models.py
 # codebase:src/dbp_cli/commands/hstc_agno/utils.py
+# codebase:src/dbp/llm/bedrock/batch.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T11:30:00Z : Queued all definition prompts in one batch wave by CodeAssistant
+# * BatchPending from one definition no longer stops the other definition prompts
 # 2025-05-15T14:05:00Z : Split from agents.py by CodeAssistant
 # * Extracted DocumentationGeneratorAgent into dedicated file
 # * Updated imports and dependencies
@@ -53,6 +56,8 @@ from pathlib import Path
 from agno.models.anthropic import Claude
 from agno.tools.reasoning import ReasoningTools
 
+from dbp.llm.bedrock.batch import BatchPending
+
 from .abstract_agent import AbstractAgnoAgent
 from .models import (
     HeaderDocumentation,
@@ -206,12 +211,19 @@ class DocumentationGeneratorAgent(AbstractAgnoAgent):
         file_header = self._generate_header_documentation(file_path, file_metadata, dependency_metadata, analysis_response)
         
         # Step 3: Generate documentation for each function/method/class
+        # In batch mode every definition prompt is queued before the wave stops
         definitions_documentation = []
+        batch_pending = None
         for definition in definitions:
-            definition_doc = self._generate_definition_documentation(
-                definition, file_metadata, dependency_metadata
-            )
-            definitions_documentation.append(definition_doc)
+            try:
+                definition_doc = self._generate_definition_documentation(
+                    definition, file_metadata, dependency_metadata
+                )
+                definitions_documentation.append(definition_doc)
+            except BatchPending as e:
+                batch_pending = e
+        if batch_pending is not None:
+            raise batch_pending
         
         # Step 4: Build the final documentation result
         result = {
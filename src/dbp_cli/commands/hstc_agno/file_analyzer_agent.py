@@ -43,6 +43,8 @@
 # codebase:src/dbp/llm/bedrock/discovery/models_capabilities.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T09:05:00Z : Used pooled Bedrock runtime client by CodeAssistant
+# * Added PooledAwsBedrock resolving the shared runtime client instead of a per-call session client
 # 2025-05-15T14:05:00Z : Split from agents.py by CodeAssistant
 # * Extracted FileAnalyzerAgent into dedicated file
 # * Updated imports and dependencies
@@ -76,6 +78,32 @@ from .utils import (
 )
 
 
+class PooledAwsBedrock(AwsBedrock):
+    """
+    [Class intent]
+    Agno AwsBedrock model that invokes Bedrock through the shared, pooled runtime
+    client of the AWS client factory.
+    
+    [Design principles]
+    All Bedrock call sites go through AWSClientFactory.
+    Client resolution stays lazy so agents can be built without AWS access.
+    
+    [Implementation details]
+    Agno creates a new client from a boto3 session on every call (new connection
+    pool and TLS handshake); this override returns the cached pooled client instead.
+    """
+    
+    def get_client(self):
+        """
+        [Function intent]
+        Returns the pooled bedrock-runtime client for the model region.
+        
+        Returns:
+            boto3.client: Shared bedrock-runtime client
+        """
+        return AWSClientFactory.get_instance().get_runtime_client(region_name=self.aws_region)
+
+
 class FileAnalyzerAgent(AbstractAgnoAgent):
     """
     [Class intent]
@@ -107,7 +135,7 @@ class FileAnalyzerAgent(AbstractAgnoAgent):
         Separates model configuration from agent functionality.
         
         [Implementation details]
-        Creates an instance of AwsBedrock with the specified model ID.
+        Creates an instance of PooledAwsBedrock with the specified model ID.
         Passes through any additional keyword arguments to the Agent constructor.
         
         Args:
@@ -129,14 +157,8 @@ class FileAnalyzerAgent(AbstractAgnoAgent):
         # Select best region if available
         region_name = best_regions[0] if best_regions else None
         
-        # Get AWS client factory to obtain boto3 session
-        client_factory = AWSClientFactory.get_instance()
-        
-        # Get session for AWS credentials with the best region
-        session = client_factory.get_session(region_name=region_name)
-        
-        # Initialize Nova model for file analysis with boto3 session
-        model = AwsBedrock(id=model_id, session=session)
+        # Initialize Nova model for file analysis with the shared runtime client
+        model = PooledAwsBedrock(id=model_id, aws_region=region_name)
         
         # Add tools to kwargs to pass to parent constructor
         if 'tools' in kwargs:
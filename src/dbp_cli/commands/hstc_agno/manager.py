@@ -34,10 +34,17 @@
 # system:os
 # system:agno
 # codebase:src/dbp_cli/commands/hstc_agno/agents.py
+# codebase:src/dbp/api_providers/aws/client_factory.py
+# codebase:src/dbp/llm/bedrock/batch.py
 # codebase:src/dbp_cli/commands/hstc_agno/models.py
 # codebase:src/dbp_cli/commands/hstc_agno/utils.py
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T11:30:00Z : Added batch inference mode to process_directory by CodeAssistant
+# * Added process_files_in_batches running the pipeline in record/replay waves
+# * batch_runner and batch_model_id options select batch mode
+# 2026-10-18T09:05:00Z : Sized Bedrock connection pool to worker count by CodeAssistant
+# * Added max_workers parameter driving both the thread pool and the runtime client pool
 # 2025-05-12T07:08:00Z : Initial implementation by CodeAssistant
 # * Created manager class skeleton
 # * Added basic initialization structure
@@ -53,6 +60,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Union
 
+from dbp.api_providers.aws.client_factory import AWSClientFactory
+from dbp.llm.bedrock.batch import BatchInferenceRunner, BatchSession
+
 from .agents import FileAnalyzerAgent, DocumentationGeneratorAgent
 from .utils import get_current_timestamp
 
@@ -73,7 +83,8 @@ class HSTCManager:
     Generates implementation plans based on processing results.
     """
     
-    def __init__(self, base_dir: Optional[Path] = None, show_prompts: bool = True):
+    def __init__(self, base_dir: Optional[Path] = None, show_prompts: bool = True,
+                 max_workers: Optional[int] = None):
         """
         [Class method intent]
         Initializes the HSTC Manager with the specified base directory.
@@ -84,11 +95,15 @@ class HSTCManager:
         
         [Implementation details]
         Sets up the base directory for file operations.
+        Sizes the shared Bedrock runtime client pool to the number of parallel
+        workers before the agents create their model clients.
         Initializes agents and state storage for processing.
         
         Args:
             base_dir: Base directory for file operations (defaults to current working directory)
             show_prompts: Whether to display prompts and responses from LLM agents
+            max_workers: Number of files processed in parallel (defaults to the
+                ThreadPoolExecutor default)
         """
         self.base_dir = base_dir or Path.cwd()
         self.file_analyzer = None
@@ -96,6 +111,10 @@ class HSTCManager:
         self.processed_files: Dict[str, Any] = {}
         self.dependency_cache: Dict[str, Any] = {}
         self.show_prompts = show_prompts
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+        
+        # One pooled connection per worker so parallel files never queue for a socket
+        AWSClientFactory.get_instance().configure_runtime_pool(self.max_workers)
         
         # Initialize agents
         self.initialize_agents()
@@ -688,7 +707,8 @@ Updated documentation:
         Maintains individual error handling for each file.
         
         [Implementation details]
-        Uses a thread pool for concurrent file processing.
+        Uses a thread pool of max_workers threads for concurrent file processing;
+        all workers share the pooled Bedrock runtime client.
         Collects results as files complete processing.
         Provides progress reporting during execution.
         
@@ -700,7 +720,7 @@ Updated documentation:
             List of processing results
         """
         results = []
-        with concurrent.futures.ThreadPoolExecutor() as executor:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             # Submit all file processing tasks
             future_to_path = {
                 executor.submit(self.safe_process_file, path, options): path
@@ -720,6 +740,44 @@ Updated documentation:
         
         return results
     
+    def process_files_in_batches(self, file_paths: List[str], options: Dict[str, Any],
+                                 batch_runner: BatchInferenceRunner) -> List[Dict[str, Any]]:
+        """
+        [Function intent]
+        Process multiple files with all LLM prompts answered by batch jobs.
+        
+        [Design principles]
+        Trades interactive latency for cost and throughput on bulk runs.
+        Restartable: prompts answered by earlier runs replay from the runner state.
+        
+        [Implementation details]
+        Runs the regular per-file pipeline in waves: each wave advances every file
+        up to its next unanswered prompt and the queued prompts of all files are
+        submitted as one job per model. The number of jobs follows the depth of
+        the pipeline, not the number of files.
+        
+        Args:
+            file_paths: List of file paths to process
+            options: Processing options (batch_model_id overrides the agents' models)
+            batch_runner: Runner submitting and tracking the batch jobs
+            
+        Returns:
+            List of processing results
+        """
+        session = BatchSession(batch_runner)
+        agents = [self.file_analyzer, self.doc_generator]
+        for agent in agents:
+            agent.batch_session = session
+            agent.batch_model_id = options.get("batch_model_id")
+        try:
+            return session.run_waves(
+                lambda: [self.process_file(path, options) for path in file_paths]
+            )
+        finally:
+            for agent in agents:
+                agent.batch_session = None
+                agent.batch_model_id = None
+    
     def process_directory(self, directory_path: str, options: Dict[str, Any]) -> Dict[str, Any]:
         """
         [Function intent]
@@ -739,6 +797,8 @@ Updated documentation:
             options: Processing options including:
                 - recursive_dir: Whether to search subdirectories
                 - file_patterns: List of file patterns to include
+                - batch_runner: Optional BatchInferenceRunner enabling batch mode
+                - batch_model_id: Optional Bedrock model ID for all batched prompts
             
         Returns:
             Dict containing processing results
@@ -758,7 +818,11 @@ Updated documentation:
             file_paths.extend(glob.glob(pattern, recursive=options.get("recursive_dir", False)))
         
         # Process all files
-        results = self.process_multiple_files(file_paths, options)
+        batch_runner = options.get("batch_runner")
+        if batch_runner is None:
+            results = self.process_multiple_files(file_paths, options)
+        else:
+            results = self.process_files_in_batches(file_paths, options, batch_runner)
         
         return {
             "directory": directory_path,
@@ -28,49 +28,50 @@
 # - File operations should be path-agnostic (work with both string and Path objects)
 ###############################################################################
 # [Dependencies]
-# system:boto3
+# codebase:src/dbp/api_providers/aws/client_factory.py
 # system:os
 # system:typing
 # system:pathlib
 ###############################################################################
 # [GenAI tool change history]
+# 2026-10-18T09:05:00Z : Routed Bedrock client creation through the runtime pool by CodeAssistant
+# * get_bedrock_client returns the pooled bedrock-runtime client of AWSClientFactory
 # 2025-05-12T07:06:00Z : Initial implementation by CodeAssistant
 # * Created utility for Bedrock client initialization
 # * Added AWS credential handling
 ###############################################################################
 
 import os
-import boto3
 from typing import Dict, List, Optional, Any, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
+from dbp.api_providers.aws.client_factory import AWSClientFactory
 
-def get_bedrock_client(region: Optional[str] = None) -> boto3.Session:
+
+def get_bedrock_client(region: Optional[str] = None) -> Any:
     """
     [Function intent]
-    Get a Bedrock client session with proper configuration.
+    Get the shared Bedrock runtime client for a region.
     
     [Design principles]
-    Uses environment variables for credential configuration with fallbacks to defaults.
-    Centralizes AWS client creation for consistent configuration.
+    Uses environment variables for region configuration with fallbacks to defaults.
+    Routes through the AWS client factory so all Bedrock calls share pooled connections.
     
     [Implementation details]
     Reads AWS region from function parameter or environment variable with default fallback.
-    Creates a boto3 session configured with the specified region.
+    Returns the pooled bedrock-runtime client of AWSClientFactory, which is thread-safe
+    and shared by all workers using the same region.
     
     Args:
         region: AWS region (optional, defaults to environment variable or 'us-west-2')
         
     Returns:
-        boto3.Session: Configured Bedrock session
+        boto3.client: Shared bedrock-runtime client
     """
     region = region or os.environ.get('AWS_REGION', 'us-west-2')
     
-    # Create a Boto3 session with the specified region
-    session = boto3.Session(region_name=region)
-    
-    return session
+    return AWSClientFactory.get_instance().get_runtime_client(region_name=region)
 
 
 # Timestamp Utility
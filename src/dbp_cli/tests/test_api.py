@@ -0,0 +1,135 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the connection reuse, authentication and streaming of MCPClientAPI.
+###############################################################################
+# [Source file design principles]
+# - A local HTTP/1.1 server counts connections and unauthenticated requests
+# - Configuration is a plain namespace, no configuration files are read
+###############################################################################
+# [Source file constraints]
+# - Must not depend on a running MCP server
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp_cli/api.py
+# codebase:src/dbp_cli/auth.py
+# system:http.server
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T18:40:00Z : Created MCPClientAPI tests by CodeAssistant
+# * Added keep-alive, remembered authentication and stream_tool tests
+###############################################################################
+
+"""
+Tests for MCPClientAPI.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from .. import api
+from ..api import MCPClientAPI
+from ..auth import AuthenticationManager
+
+API_KEY = "test-key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.stats["connections"] += 1
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body, content_type="application/json"):
+        payload = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if self.headers.get("X-API-Key") != API_KEY:
+            self.server.stats["unauthorized"] += 1
+            self._reply(401, json.dumps({"status": "error", "error": {"message": "unauthorized"}}))
+            return
+        if request["data"].get("streaming"):
+            lines = [json.dumps({"index": i}) for i in range(3)]
+            self._reply(200, "\n".join(lines) + "\n", "application/x-ndjson")
+            return
+        self._reply(200, json.dumps({"status": "success", "result": {"echo": request["data"]}}))
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.stats = {"connections": 0, "unauthorized": 0}
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def make_client(server, monkeypatch):
+    monkeypatch.delenv("DBP_API_KEY", raising=False)
+    monkeypatch.setattr(api, "_AUTH_REQUIRED", {})
+    config = SimpleNamespace(
+        mcp_server=SimpleNamespace(host="127.0.0.1", port=server.server_address[1], api_key=API_KEY),
+        server=SimpleNamespace(timeout=5),
+    )
+    clients = []
+
+    def make():
+        config_manager = MagicMock()
+        config_manager.get_typed_config.return_value = config
+        client = MCPClientAPI(AuthenticationManager(config_manager))
+        client.initialize()
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+def test_requests_reuse_one_connection_and_remember_authentication(server, make_client):
+    client = make_client()
+    for i in range(5):
+        assert client.call_tool("echo", {"n": i}) == {"echo": {"n": i}}
+    assert server.stats["unauthorized"] == 1
+    assert server.stats["connections"] == 1
+
+    # A new client of the same server authenticates up front
+    make_client().call_tool("echo", {"n": 0})
+    assert server.stats["unauthorized"] == 1
+
+
+def test_stream_tool_yields_chunks(server, make_client):
+    client = make_client()
+    assert list(client.stream_tool("echo", {})) == [{"index": 0}, {"index": 1}, {"index": 2}]
+    assert list(client.stream_tool("echo", {})) == [{"index": 0}, {"index": 1}, {"index": 2}]
+    assert server.stats["connections"] == 1
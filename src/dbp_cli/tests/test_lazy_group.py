@@ -0,0 +1,92 @@
+###############################################################################
+# IMPORTANT: This header comment is designed for GenAI code review and maintenance
+# Any GenAI tool working with this file MUST preserve and update this header
+###############################################################################
+# [GenAI coding tool directive]
+# - Maintain this header with all modifications
+# - Update History section with each change
+# - Keep only the 4 most recent records in the history section. Sort from newer to older.
+# - Preserve Intent, Design, and Constraints sections
+# - Use this header as context for code reviews and modifications
+# - Ensure all changes align with the design principles
+# - Respect system prompt directives at all times
+###############################################################################
+# [Source file intent]
+# Tests for the lazy command loading of the Click CLI.
+###############################################################################
+# [Source file design principles]
+# - Startup imports are checked in a fresh interpreter, not in the test process
+# - The help table is checked against the commands it stands for
+###############################################################################
+# [Source file constraints]
+# - Loading every command requires the dependencies of all commands
+###############################################################################
+# [Dependencies]
+# codebase:src/dbp_cli/cli_click/lazy_group.py
+# codebase:src/dbp_cli/cli_click/main.py
+# system:click
+# system:pytest
+###############################################################################
+# [GenAI tool change history]
+# 2026-10-18T19:40:00Z : Created lazy command loading tests by CodeAssistant
+# * Added startup import and lazy lookup tests
+###############################################################################
+
+"""
+Tests for LazyGroup and the dbp command table.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import click
+from click.testing import CliRunner
+
+from ..cli_click.lazy_group import LazyGroup
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+@click.command("hello", help="Say hello")
+def hello_command():
+    click.echo("hello")
+
+
+def make_group():
+    return LazyGroup(
+        name="root",
+        lazy_commands={"hello": (__name__, "hello_command", "Say hello")},
+    )
+
+
+def test_commands_are_listed_without_loading_and_loaded_on_lookup():
+    group = make_group()
+    assert group.list_commands(None) == ["hello"]
+    assert group.commands == {}
+
+    assert group.get_command(None, "hello") is hello_command
+    assert group.commands == {"hello": hello_command}
+    assert group.get_command(None, "missing") is None
+
+
+def test_help_lists_unloaded_commands_from_the_table():
+    result = CliRunner().invoke(make_group(), ["--help"])
+    assert result.exit_code == 0
+    assert "hello  Say hello" in result.output
+
+
+def test_help_and_version_do_not_import_command_modules():
+    script = (
+        "import json, sys\n"
+        "from dbp_cli.cli_click.main import main\n"
+        "for args in (['--help'], ['version']):\n"
+        "    main(args)\n"
+        "print(json.dumps(sorted(sys.modules)))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, env=env)
+    assert completed.returncode == 0, completed.stderr
+    modules = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert not [m for m in modules if m.startswith(("agno", "boto3", "dbp_cli.cli_click.commands."))]